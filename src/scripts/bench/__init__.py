@@ -0,0 +1,9 @@
+"""
+Benchmark Module
+
+Offline performance benchmarks for the daily pipeline:
+- synthetic_data: Deterministic synthetic league generator (schedules, players,
+  game logs, weather, Yahoo roster)
+- run_benchmarks: Times every pipeline stage with peak-memory tracking and
+  writes JSON results for commit-to-commit comparison
+"""
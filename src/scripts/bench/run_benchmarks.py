@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark Suite
+
+Generates a synthetic league (see synthetic_data.py) and times every stage of
+the daily pipeline against it: each factor analyzer's analyze_roster, the
+roster and all-players run_all_factor_analyses passes, the sit/start score
+combiner, the waiver wire analysis and weight tuning. Runs fully offline.
+
+Key Concepts:
+- Deterministic inputs: same --players/--seasons/--rosters/--seed = same data
+- Wall time: best of --repeat runs per stage (stdout of the stage suppressed)
+- Peak memory: one extra run per stage under tracemalloc (Python + NumPy
+  allocations of the main process), skipped with --no-memory
+- Results: JSON with the commit, environment, settings and one record per
+  stage, written to benchmarks/results/ (or --output)
+- Regressions: --compare OLD.json prints per-stage ratios and exits non-zero
+  when any stage is slower than --threshold x the old time
+
+Usage:
+    python src/scripts/bench/run_benchmarks.py                       # 1 roster, 1,100 players, 3 seasons
+    python src/scripts/bench/run_benchmarks.py --players 300 --seasons 1 --repeat 3
+    python src/scripts/bench/run_benchmarks.py --only factor run_all  # Stage name filters
+    python src/scripts/bench/run_benchmarks.py --compare benchmarks/results/bench_abc1234_20251001_120000.json
+"""
+
+import io
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import contextlib
+import subprocess
+import tracemalloc
+from pathlib import Path
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.bench.synthetic_data import SyntheticLeague
+from scripts.fa.data_context import DataContext
+from scripts.fa.run_all_fa import FACTOR_SPECS, run_all_factor_analyses, run_factor_batch, _warm_context
+from scripts.roster.daily_sitstart import DailySitStartManager
+from scripts.waiver.waiver_wire import WaiverWireAnalyzer
+from scripts.weight.backtest_weights import WeightTuner
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+RESULTS_DIR = PROJECT_ROOT / "benchmarks" / "results"
+
+TUNED_PLAYERS = 3  # Roster hitters run through WeightTuner optimization
+
+
+def _load_inputs(context):
+    """Every shared input an in-process run reads: context caches plus the game log store"""
+    _warm_context(context)
+    context.game_logs
+    return context
+
+
+def git_commit():
+    """Short commit hash of the working tree ('unknown' outside git)"""
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or 'unknown'
+    except (OSError, subprocess.SubprocessError):
+        return 'unknown'
+
+
+def _rows(result):
+    """Row count of a stage result (None when not a table)"""
+    if isinstance(result, (pd.DataFrame, pd.Series, dict, list)):
+        return len(result)
+    return None
+
+
+def measure(fn, repeat=1, memory=True):
+    """
+    Time a callable (best of repeat) and optionally its peak traced memory
+
+    Returns:
+        dict with seconds, runs, peak_mb, rows
+    """
+    times = []
+    result = None
+    for _ in range(max(repeat, 1)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = fn()
+            times.append(time.perf_counter() - started)
+
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                fn()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'seconds': round(min(times), 4),
+        'runs': len(times),
+        'peak_mb': None if peak_mb is None else round(peak_mb, 2),
+        'rows': _rows(result),
+    }
+
+
+class BenchmarkSuite:
+    """Synthetic-league benchmark of the daily pipeline stages"""
+
+    def __init__(self, work_dir, players=1100, seasons=3, rosters=1, seed=42,
+                 repeat=1, memory=True, only=None):
+        self.work_dir = Path(work_dir)
+        self.data_dir = self.work_dir / "data"
+        self.league = SyntheticLeague(players=players, seasons=seasons, rosters=rosters, seed=seed)
+        self.as_of_date = self.league.as_of_date.strftime('%Y-%m-%d')
+        self.repeat = repeat
+        self.memory = memory
+        self.only = only or []
+        self.results = []
+
+    def _selected(self, name):
+        return not self.only or any(pattern in name for pattern in self.only)
+
+    def stage(self, name, fn, repeat=None):
+        """Run and record one stage (errors are recorded, not raised)"""
+        if not self._selected(name):
+            return None
+        print(f"  {name:<40}", end=' ', flush=True)
+        try:
+            record = measure(fn, self.repeat if repeat is None else repeat, self.memory)
+            record['status'] = 'ok'
+            peak = f"{record['peak_mb']:>9.1f} MB" if record['peak_mb'] is not None else ''
+            print(f"{record['seconds']:>9.3f}s {peak}")
+        except Exception as e:
+            record = {'seconds': None, 'runs': 0, 'peak_mb': None, 'rows': None,
+                      'status': f"error: {type(e).__name__}: {e}"}
+            print(f"✗ {type(e).__name__}: {e}")
+        record['name'] = name
+        self.results.append(record)
+        return record
+
+    def fresh_context(self):
+        """New DataContext over the synthetic data directory"""
+        return DataContext(self.data_dir, as_of_date=self.as_of_date)
+
+    def run(self):
+        """Generate the league and benchmark every stage"""
+        print("📦 Synthetic data")
+        self.stage('generate_data', lambda: self.league.generate(self.data_dir), repeat=1)
+        (self.work_dir / "config").mkdir(exist_ok=True)
+
+        print("\n📊 Inputs")
+        self.stage('context_load', lambda: _load_inputs(self.fresh_context()))
+
+        context = _load_inputs(self.fresh_context())
+        roster_df = context.load_roster()
+        all_players_df = context.load_roster(all_players=True)
+
+        print(f"\n⚙️  Factor analyzers (roster: {len(roster_df)} players)")
+        for key, *_ in FACTOR_SPECS:
+            self.stage(f'factor.{key}', lambda key=key: run_factor_batch(key, context, roster_df))
+
+        print(f"\n⚙️  Factor analyzers (all players: {len(all_players_df)} players)")
+        for key, *_ in FACTOR_SPECS:
+            self.stage(f'factor_all.{key}', lambda key=key: run_factor_batch(key, context, all_players_df),
+                       repeat=1)
+
+        # Full passes always recompute: no factor cache, no roster projection
+        print("\n🔁 Full passes")
+        self.stage('run_all.roster', lambda: run_all_factor_analyses(
+            self.data_dir, all_players=False, context=context, reuse=False, cache=False))
+        self.stage('run_all.all_players', lambda: run_all_factor_analyses(
+            self.data_dir, all_players=True, context=context, reuse=False, cache=False), repeat=1)
+
+        print("\n🎯 Recommendations")
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = DailySitStartManager(self.work_dir, target_date=self.as_of_date)
+        manager.context = context
+        recommendations = {}
+
+        def combine():
+            recommendations.clear()
+            recommendations.update(manager._combine_factor_analyses(roster_df))
+            return recommendations
+        self.stage('sitstart.combine', combine)
+
+        waiver = WaiverWireAnalyzer(self.data_dir)
+        rostered = roster_df['player_name'].tolist()
+        self.stage('waiver.load_free_agents', lambda: waiver.load_free_agents(rostered))
+        free_agents = waiver.load_free_agents(rostered) if self._selected('waiver') else pd.DataFrame()
+        self.stage('waiver.find_best_pickups', lambda: waiver.find_best_waiver_pickups(
+            roster_df, context.schedule, free_agents, recommendations, top_n=10))
+
+        print("\n🔧 Weight tuning")
+        hitters = roster_df[roster_df['position'] != 'Pitcher']['player_name'].head(TUNED_PLAYERS).tolist()
+
+        def tune():
+            tuner = WeightTuner(self.work_dir)
+            tuner.run_backtest_suite(players=hitters, optimize=True, save=False)
+            return hitters
+        self.stage('tuner.optimize', tune, repeat=1)
+
+        return self.results
+
+    def report(self):
+        """Machine-readable results document"""
+        return {
+            'commit': git_commit(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'environment': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'numpy': np.__version__,
+                'pandas': pd.__version__,
+            },
+            'settings': {
+                'players': self.league.players,
+                'seasons': self.league.seasons,
+                'rosters': self.league.rosters,
+                'seed': self.league.seed,
+                'as_of_date': self.as_of_date,
+                'repeat': self.repeat,
+                'memory': self.memory,
+            },
+            'results': self.results,
+        }
+
+
+def compare(old_report, new_report, threshold):
+    """
+    Print per-stage time/memory ratios against an older results file
+
+    Returns:
+        List of stage names slower than threshold x the old time
+    """
+    old = {r['name']: r for r in old_report.get('results', [])}
+    print(f"\n{'Stage':<40} {'Old (s)':>9} {'New (s)':>9} {'Ratio':>7} {'Peak MB Δ':>10}")
+    print("-" * 80)
+
+    regressions = []
+    for record in new_report['results']:
+        before = old.get(record['name'])
+        if not before or not before.get('seconds') or record.get('seconds') is None:
+            continue
+        ratio = record['seconds'] / before['seconds']
+        mem_delta = ''
+        if record.get('peak_mb') is not None and before.get('peak_mb') is not None:
+            mem_delta = f"{record['peak_mb'] - before['peak_mb']:+.1f}"
+        flag = ' ⚠️' if ratio > threshold else ''
+        print(f"{record['name']:<40} {before['seconds']:>9.3f} {record['seconds']:>9.3f} "
+              f"{ratio:>6.2f}x {mem_delta:>10}{flag}")
+        if ratio > threshold:
+            regressions.append(record['name'])
+    return regressions
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark the pipeline on a synthetic league (offline)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python src/scripts/bench/run_benchmarks.py
+  python src/scripts/bench/run_benchmarks.py --players 300 --seasons 1 --repeat 3
+  python src/scripts/bench/run_benchmarks.py --only factor.matchup run_all
+  python src/scripts/bench/run_benchmarks.py --compare benchmarks/results/<old>.json
+        """
+    )
+    parser.add_argument('--players', type=int, default=1100, help='MLB players (default: 1100)')
+    parser.add_argument('--seasons', type=int, default=3, help='Seasons of history (default: 3)')
+    parser.add_argument('--rosters', type=int, default=1, help='Fantasy rosters (default: 1)')
+    parser.add_argument('--seed', type=int, default=42, help='Data generator seed (default: 42)')
+    parser.add_argument('--repeat', type=int, default=1, help='Timed runs per stage, best kept (default: 1)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc peak-memory run')
+    parser.add_argument('--only', nargs='+', help='Only stages whose name contains one of these')
+    parser.add_argument('--work-dir', type=str, help='Keep generated data here (default: temp dir)')
+    parser.add_argument('--output', type=str, help=f'Results JSON path (default: {RESULTS_DIR.relative_to(PROJECT_ROOT)}/)')
+    parser.add_argument('--compare', type=str, help='Older results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='Slowdown ratio flagged as a regression (default: 1.2)')
+    args = parser.parse_args()
+
+    print("="*80)
+    print("FANTASY BASEBALL AI - PIPELINE BENCHMARKS".center(80))
+    print("="*80)
+    print(f"\nPlayers: {args.players:,} | Seasons: {args.seasons} | Rosters: {args.rosters} | "
+          f"Seed: {args.seed} | Repeat: {args.repeat}\n")
+
+    with tempfile.TemporaryDirectory(prefix="fb_bench_") as tmp:
+        work_dir = Path(args.work_dir) if args.work_dir else Path(tmp)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        suite = BenchmarkSuite(work_dir, players=args.players, seasons=args.seasons,
+                               rosters=args.rosters, seed=args.seed, repeat=args.repeat,
+                               memory=not args.no_memory, only=args.only)
+        started = time.perf_counter()
+        suite.run()
+        report = suite.report()
+        report['total_seconds'] = round(time.perf_counter() - started, 2)
+
+    if args.output:
+        output_file = Path(args.output)
+    else:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = RESULTS_DIR / f"bench_{report['commit']}_{stamp}.json"
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    failed = [r['name'] for r in report['results'] if r['status'] != 'ok']
+    print(f"\n✓ {len(report['results'])} stages in {report['total_seconds']:.1f}s"
+          + (f" ({len(failed)} failed)" if failed else ''))
+    print(f"📁 Results: {output_file}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.threshold)
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} stage(s) slower than {args.threshold:.2f}x: "
+                  f"{', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\n✅ No stage slower than {args.threshold:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Stub MLB Stats API Server
+
+Local stand-in for statsapi.mlb.com so the scrapers can be exercised and
+benchmarked offline. Responses are built from a data directory (e.g. one
+written by synthetic_data.py) and shaped like the real API's JSON, so the
+scrapers run unmodified with --base-url pointed here.
+
+Key Concepts:
+- Routes: regex -> handler table; add endpoints by appending to ROUTES
+- /api/v1/people/{id}/stats?stats=gameLog&season=YYYY: hitting game log
+  built from data/mlb_game_logs_<season>.csv
+- /api/v1/schedule?startDate=&endDate=: games from data/mlb_<season>_schedule.csv
+- /api/v1/game/{gamePk}/boxscore: both teams' batting lines (from the game
+  logs, with a batting order) plus a seeded pitching staff per game
+- /v1/forecast?latitude=&longitude=: Open-Meteo-shaped current weather,
+  deterministic per location; comma lists answer with one object per
+  location (weather_url = http://host:port/v1/forecast)
+- Failure injection: --fail-rate returns 429 (Retry-After: 0) or 503 for that
+  fraction of requests; --fail-first fails the first N requests of every path
+- --latency adds a fixed delay per request (simulates network round trips)
+- Responses carry an ETag; If-None-Match with a matching tag gets a 304
+- Threaded server with request counters (per path) for assertions
+
+Usage:
+    python src/scripts/bench/stub_mlb_api.py --data-dir /tmp/bench/data --port 8765
+    python src/scripts/scrape/gamelog_scrape.py --base-url http://127.0.0.1:8765/api/v1
+
+    # In-process
+    from scripts.bench.stub_mlb_api import StubMLBServer
+    with StubMLBServer(data_dir, fail_rate=0.1) as server:
+        fetch_all_player_gamelogs(players, base_url=server.base_url)
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+import numpy as np
+import pandas as pd
+
+
+class StubMLBApi:
+    """Builds API-shaped JSON responses from local CSV data"""
+
+    def __init__(self, data_dir):
+        self.data_dir = Path(data_dir)
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _load(self, name, loader):
+        """Load and cache a derived table once (thread-safe)"""
+        with self._lock:
+            if name not in self._cache:
+                self._cache[name] = loader()
+            return self._cache[name]
+
+    def game_logs(self, season):
+        """{player_id: DataFrame} for a season (empty dict if no file)"""
+        def loader():
+            path = self.data_dir / f"mlb_game_logs_{season}.csv"
+            if not path.exists():
+                return {}
+            logs = pd.read_csv(path)
+            return {int(pid): group for pid, group in logs.groupby('player_id', sort=False)}
+        return self._load(('game_logs', season), loader)
+
+    def people_stats(self, match, query):
+        """GET /people/{id}/stats (gameLog, hitting)"""
+        player_id = int(match.group(1))
+        season = int(query.get('season', ['2024'])[0])
+        games = self.game_logs(season).get(player_id)
+        if games is None:
+            return 200, {'stats': []}
+
+        splits = []
+        for row in games.to_dict('records'):
+            splits.append({
+                'season': str(season),
+                'date': row['game_date'],
+                'isHome': bool(row['is_home']),
+                'isWin': bool(row['is_win']),
+                'game': {'gamePk': int(row['game_pk'])},
+                'opponent': {'name': row['opponent']},
+                'stat': {
+                    'atBats': int(row['AB']), 'hits': int(row['H']), 'runs': int(row['R']),
+                    'rbi': int(row['RBI']), 'homeRuns': int(row['HR']),
+                    'doubles': int(row['2B']), 'triples': int(row['3B']),
+                    'baseOnBalls': int(row['BB']), 'strikeOuts': int(row['SO']),
+                    'stolenBases': int(row['SB']),
+                    'avg': f"{row['AVG']:.3f}", 'obp': f"{row['OBP']:.3f}",
+                    'slg': f"{row['SLG']:.3f}", 'ops': f"{row['OPS']:.3f}",
+                },
+            })
+        return 200, {'stats': [{'type': {'displayName': 'gameLog'},
+                                'group': {'displayName': 'hitting'},
+                                'splits': splits}]}
+
+    def games(self):
+        """{game_pk: schedule row} across every schedule file"""
+        def loader():
+            frames = [pd.read_csv(p) for p in sorted(self.data_dir.glob("mlb_*_schedule.csv"))]
+            if not frames:
+                return {}
+            schedule = pd.concat(frames, ignore_index=True).drop_duplicates('game_pk')
+            return {int(g['game_pk']): g for g in schedule.to_dict('records')}
+        return self._load('games', loader)
+
+    def schedule(self, match, query):
+        """GET /schedule (startDate/endDate range)"""
+        games = self.games().values()
+        start = query.get('startDate', ['0000-00-00'])[0]
+        end = query.get('endDate', ['9999-99-99'])[0]
+        by_date = {}
+        for game in games:
+            date = str(game['game_date'])
+            if start <= date <= end:
+                by_date.setdefault(date, []).append(game)
+
+        dates = []
+        for date in sorted(by_date):
+            dates.append({'date': date, 'games': [{
+                'gamePk': int(g['game_pk']),
+                'gameType': g.get('game_type', 'R'),
+                'season': str(g.get('season', date[:4])),
+                'gameDate': f"{date}T23:05:00Z",
+                'officialDate': date,
+                'status': {'detailedState': g['status'],
+                           'abstractGameState': 'Final' if g['status'] == 'Final' else 'Preview'},
+                'teams': {side: {'team': {'id': int(g[f'{side}_team_id']), 'name': g[f'{side}_team']}}
+                          for side in ('away', 'home')},
+                'venue': {'name': g.get('venue', '')},
+            } for g in sorted(by_date[date], key=lambda g: g['game_pk'])]})
+        return 200, {'totalGames': sum(len(d['games']) for d in dates), 'dates': dates}
+
+    def game_lines(self, season):
+        """{game_pk: DataFrame} of batting lines for a season"""
+        def loader():
+            path = self.data_dir / f"mlb_game_logs_{season}.csv"
+            if not path.exists():
+                return {}
+            logs = pd.read_csv(path)
+            return {int(pk): group for pk, group in logs.groupby('game_pk', sort=False)}
+        return self._load(('game_lines', season), loader)
+
+    def pitchers(self, season):
+        """{team_name: [(player_id, player_name), ...]} pitchers per team"""
+        def loader():
+            path = self.data_dir / f"mlb_all_players_{season}.csv"
+            if not path.exists():
+                return {}
+            players = pd.read_csv(path)
+            players = players[players['position'] == 'Pitcher']
+            return {team: list(zip(group['player_id'], group['player_name']))
+                    for team, group in players.groupby('team_name')}
+        return self._load(('pitchers', season), loader)
+
+    def _pitching_staff(self, season, game_pk, team, runs_allowed, rng):
+        """Seeded starter + relievers covering 9 innings"""
+        staff = self.pitchers(season).get(team, [])
+        if not staff:
+            staff = [(900000000 + game_pk % 1000 * 10 + i, f"{team} Pitcher {i + 1}") for i in range(8)]
+        chosen = [staff[i] for i in rng.permutation(len(staff))[:int(rng.integers(3, 6))]]
+        outs = [int(rng.integers(15, 22))]
+        remaining = 27 - outs[0]
+        for i in range(1, len(chosen)):
+            share = remaining if i == len(chosen) - 1 else int(rng.integers(1, max(2, remaining - (len(chosen) - i - 1))))
+            outs.append(share)
+            remaining -= share
+        earned = np.bincount(rng.integers(0, len(chosen), runs_allowed), minlength=len(chosen))
+        return [
+            ((pid, name), {
+                'inningsPitched': f"{o // 3}.{o % 3}", 'earnedRuns': int(er), 'runs': int(er),
+                'hits': int(er + rng.integers(0, 3)), 'baseOnBalls': int(rng.integers(0, 3)),
+                'strikeOuts': int(rng.integers(0, 3 + o // 3)), 'homeRuns': int(rng.integers(0, 2) * (er > 0)),
+                'numberOfPitches': int(o * 5 + rng.integers(0, 15)),
+            })
+            for (pid, name), o, er in zip(chosen, outs, earned)
+        ]
+
+    def boxscore(self, match, query):
+        """GET /game/{gamePk}/boxscore"""
+        game_pk = int(match.group(1))
+        game = self.games().get(game_pk)
+        if game is None:
+            return 404, {'message': f'unknown gamePk {game_pk}'}
+        season = int(game.get('season', str(game['game_date'])[:4]))
+        lines = self.game_lines(season).get(game_pk, pd.DataFrame(columns=['is_home']))
+        rng = np.random.default_rng(game_pk)
+
+        sides = {}
+        for side, is_home in (('home', True), ('away', False)):
+            batters = lines[lines['is_home'] == is_home].sort_values('player_id')
+            sides[side] = {'team': game[f'{side}_team'], 'batters': batters,
+                           'runs': int(batters['R'].sum()) if len(batters) else 0,
+                           'won': bool(batters['is_win'].iloc[0]) if len(batters) else False}
+        for side, other in (('home', 'away'), ('away', 'home')):
+            if sides[side]['won'] and sides[side]['runs'] <= sides[other]['runs']:
+                sides[side]['runs'] = sides[other]['runs'] + 1
+
+        teams = {}
+        for side, other in (('home', 'away'), ('away', 'home')):
+            players, batter_ids = {}, []
+            for i, row in enumerate(sides[side]['batters'].to_dict('records')):
+                spot = i % 9 + 1
+                batter_ids.append(int(row['player_id']))
+                players[f"ID{int(row['player_id'])}"] = {
+                    'person': {'id': int(row['player_id']), 'fullName': row['player_name']},
+                    'battingOrder': f"{spot}0{0 if i < 9 else 1}",
+                    'position': {'abbreviation': 'DH' if spot == 9 else 'OF'},
+                    'stats': {'batting': {
+                        'atBats': int(row['AB']), 'hits': int(row['H']), 'runs': int(row['R']),
+                        'rbi': int(row['RBI']), 'homeRuns': int(row['HR']),
+                        'doubles': int(row['2B']), 'triples': int(row['3B']),
+                        'baseOnBalls': int(row['BB']), 'strikeOuts': int(row['SO']),
+                        'stolenBases': int(row['SB']),
+                    }},
+                    'seasonStats': {'batting': {
+                        'avg': f"{row['AVG']:.3f}", 'obp': f"{row['OBP']:.3f}",
+                        'slg': f"{row['SLG']:.3f}", 'ops': f"{row['OPS']:.3f}",
+                    }},
+                }
+            pitcher_ids = []
+            for (pid, name), stat in self._pitching_staff(season, game_pk, sides[side]['team'],
+                                                          sides[other]['runs'], rng):
+                pitcher_ids.append(int(pid))
+                players[f"ID{int(pid)}"] = {
+                    'person': {'id': int(pid), 'fullName': name},
+                    'position': {'abbreviation': 'P'},
+                    'stats': {'pitching': stat},
+                }
+            teams[side] = {
+                'team': {'name': sides[side]['team']},
+                'teamStats': {'batting': {'runs': sides[side]['runs']}},
+                'players': players,
+                'batters': batter_ids,
+                'pitchers': pitcher_ids,
+            }
+        return 200, {'teams': teams}
+
+    def forecast(self, match, query):
+        """GET /v1/forecast (Open-Meteo current weather, one or many locations)"""
+        lats = query.get('latitude', [''])[0].split(',')
+        lons = query.get('longitude', [''])[0].split(',')
+        if len(lats) != len(lons) or not lats[0]:
+            return 400, {'error': True, 'reason': 'latitude and longitude must have the same length'}
+
+        locations = []
+        for lat, lon in zip(lats, lons):
+            seed = int(hashlib.sha1(f"{float(lat):.4f},{float(lon):.4f}".encode()).hexdigest()[:8], 16)
+            rng = np.random.default_rng(seed)
+            locations.append({
+                'latitude': float(lat), 'longitude': float(lon),
+                'current': {
+                    'time': '2024-07-01T19:00',
+                    'temperature_2m': round(float(rng.uniform(10, 35)), 1),
+                    'relative_humidity_2m': int(rng.integers(20, 95)),
+                    'pressure_msl': round(float(rng.uniform(1000, 1025)), 1),
+                    'wind_speed_10m': round(float(rng.uniform(0, 30)), 1),
+                    'wind_direction_10m': int(rng.integers(0, 360)),
+                    'wind_gusts_10m': round(float(rng.uniform(0, 45)), 1),
+                    'cloud_cover': int(rng.integers(0, 101)),
+                    'precipitation': round(float(rng.choice([0.0, 0.0, 0.0, rng.uniform(0, 5)])), 1),
+                },
+            })
+        return 200, locations if len(locations) > 1 else locations[0]
+
+
+# (pattern on the path, StubMLBApi method name)
+ROUTES = [
+    (re.compile(r'^/api/v1/people/(\d+)/stats$'), 'people_stats'),
+    (re.compile(r'^/api/v1/game/(\d+)/boxscore$'), 'boxscore'),
+    (re.compile(r'^/api/v1/schedule$'), 'schedule'),
+    (re.compile(r'^/v1/forecast$'), 'forecast'),
+]
+
+
+class StubMLBServer:
+    """Threaded local HTTP server serving StubMLBApi routes"""
+
+    def __init__(self, data_dir, host='127.0.0.1', port=0, latency=0.0,
+                 fail_rate=0.0, fail_first=0, seed=0):
+        """
+        Args:
+            data_dir: Directory with the CSVs to serve
+            host / port: Bind address (port 0 = pick a free port)
+            latency: Seconds to sleep before every response
+            fail_rate: Fraction of requests answered with 429/503
+            fail_first: Fail the first N requests to every path
+            seed: Seed for failure injection
+        """
+        self.api = StubMLBApi(data_dir)
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.fail_first = fail_first
+        self.rng = random.Random(seed)
+        self.hits = Counter()
+        self.not_modified = 0
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    @property
+    def requests(self):
+        return sum(self.hits.values())
+
+    def _inject_failure(self, path):
+        """Status code to fail this request with, or None"""
+        with self.lock:
+            self.hits[path] += 1
+            if self.hits[path] <= self.fail_first:
+                return 503
+            if self.fail_rate and self.rng.random() < self.fail_rate:
+                return self.rng.choice([429, 503])
+        return None
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, payload, headers=None):
+                body = json.dumps(payload).encode()
+                headers = dict(headers or {})
+                if status == 200:
+                    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+                    headers['ETag'] = etag
+                    if self.headers.get('If-None-Match') == etag:
+                        status, body = 304, b''
+                        with server.lock:
+                            server.not_modified += 1
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if server.latency:
+                    time.sleep(server.latency)
+                failure = server._inject_failure(url.path)
+                if failure is not None:
+                    headers = {'Retry-After': '0'} if failure == 429 else None
+                    return self._send(failure, {'message': 'injected failure'}, headers)
+                for pattern, name in ROUTES:
+                    match = pattern.match(url.path)
+                    if match:
+                        status, payload = getattr(server.api, name)(match, parse_qs(url.query))
+                        return self._send(status, payload)
+                self._send(404, {'message': f'no stub route for {url.path}'})
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a stub MLB Stats API from local data')
+    parser.add_argument('--data-dir', type=str, required=True, help='Directory with the CSVs to serve')
+    parser.add_argument('--port', type=int, default=8765, help='Port (default: 8765)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds of delay per request')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='Fraction of requests failing with 429/503')
+    parser.add_argument('--fail-first', type=int, default=0, help='Fail the first N requests to every path')
+    args = parser.parse_args()
+
+    server = StubMLBServer(args.data_dir, port=args.port, latency=args.latency,
+                           fail_rate=args.fail_rate, fail_first=args.fail_first)
+    print(f"📡 Stub MLB API at {server.base_url} (Ctrl-C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,13 @@
 """
 Train Hybrid Ensemble Model using September 2024 data
 
-Uses actual game logs to create fantasy points and trains the ensemble.
+Trains on one row per player-game from the feature store (factor scores the
+player had going into the game and the fantasy points scored, written by
+fa/backfill_factor_analysis.py), reading only the model's feature columns.
+Without backfilled September 2024 dates it falls back to per-player averages
+from the game logs merged with ensemble_training/training_data.csv.
+Feature store fantasy points use the weight tuner's scoring (see
+fa/feature_store.py), not calculate_fantasy_points below.
 """
 
 import sys
@@ -12,7 +18,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from scripts.hybrid_ensemble import HybridEnsemblePredictor
+from scripts.hybrid_ensemble import BASE_FEATURES, HybridEnsemblePredictor
+from scripts.fa.feature_store import FeatureStore, TARGET_COLUMN
+
+TRAINING_START = '2024-09-01'
+TRAINING_END = '2024-09-30'
+
+# Model feature -> feature store column where the names differ
+STORE_COLUMNS = {'humidity_and_elevation_score': 'humidity_elevation_score'}
 
 def calculate_fantasy_points(game_logs_df):
     """
@@ -51,15 +64,18 @@ def calculate_fantasy_points(game_logs_df):
     df['fantasy_points'] = points
     return df
 
-def train_ensemble_model():
-    """Train ensemble on September 2024 data"""
-    
-    print("\n" + "="*80)
-    print("TRAINING HYBRID ENSEMBLE - SEPTEMBER 2024 DATA")
-    print("="*80 + "\n")
-    
-    data_dir = Path('data')
-    
+def load_feature_store_training(data_dir):
+    """Per player-game training rows from the feature store (empty if not backfilled)"""
+    store = FeatureStore(data_dir)
+    columns = {STORE_COLUMNS.get(f, f): f for f in BASE_FEATURES}
+    rows = store.read(columns=['game_date', 'player_name'] + list(columns) + [TARGET_COLUMN],
+                      start_date=TRAINING_START, end_date=TRAINING_END)
+    rows = rows.rename(columns=columns)
+    rows[BASE_FEATURES] = rows[BASE_FEATURES].fillna(0.0)  # missing score = neutral
+    return rows.dropna(subset=[TARGET_COLUMN]).reset_index(drop=True)
+
+def load_game_log_training(data_dir):
+    """Per-player September averages merged with collected factor scores (None if missing)"""
     # Load September 2024 game logs
     print("Loading game logs...")
     game_logs = pd.read_csv(data_dir / 'mlb_game_logs_2024.csv')
@@ -116,6 +132,29 @@ def train_ensemble_model():
         print("   Recommend at least 50-100 players for training")
         print("   Continuing anyway...\n")
     
+    return merged
+
+def train_ensemble_model():
+    """Train ensemble on September 2024 data"""
+    
+    print("\n" + "="*80)
+    print("TRAINING HYBRID ENSEMBLE - SEPTEMBER 2024 DATA")
+    print("="*80 + "\n")
+    
+    data_dir = Path('data')
+    
+    print("Loading feature store...")
+    merged = load_feature_store_training(data_dir)
+    if len(merged):
+        print(f"✓ Loaded {len(merged):,} player-games for {merged['player_name'].nunique()} players "
+              f"({TRAINING_START} to {TRAINING_END})\n")
+    else:
+        print("ℹ️  No feature store rows for September 2024 - using game log averages")
+        print("   Run: python src/scripts/fa/backfill_factor_analysis.py --start-date 2024-09-01 --end-date 2024-09-30\n")
+        merged = load_game_log_training(data_dir)
+        if merged is None:
+            return None
+    
     # Prepare features
     print("Preparing features...")
     predictor = HybridEnsemblePredictor(data_dir)
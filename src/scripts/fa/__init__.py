@@ -13,6 +13,11 @@ Contains individual factor analysis modules for fantasy baseball predictions:
 - bullpen_fatigue_analysis: Opposing bullpen strength and fatigue detection
 - statcast_metrics_analysis: Exit velocity, barrel rate, quality of contact
 - vegas_odds_analysis: Vegas betting lines and implied run totals
+- gamelog_store: Shared indexed/memory-mapped game log store used by the analyzers
+- data_context: DataContext that loads run inputs once and serves cached views
+- score_matrix: Player x factor score matrix combining all factor outputs
+- history_index: Per-player prefix sums for "totals before/between dates" lookups
+- feature_store: Date-partitioned per player-game factor scores and fantasy points
 """
 
 from .wind_analysis import WindAnalyzer
@@ -29,6 +34,11 @@ from .monthly_splits_fa import MonthlySplitsAnalyzer
 from .team_momentum_fa import TeamOffensiveMomentumAnalyzer
 from .statcast_metrics_fa import StatcastMetricsAnalyzer
 from .vegas_odds_fa import VegasOddsAnalyzer
+from .gamelog_store import GameLogStore, get_gamelog_store
+from .data_context import DataContext
+from .score_matrix import FactorScoreMatrix
+from .history_index import HistoryIndex
+from .feature_store import FeatureStore
 
 __all__ = [
     'WindAnalyzer',
@@ -45,4 +55,10 @@ __all__ = [
     'TeamOffensiveMomentumAnalyzer',
     'StatcastMetricsAnalyzer',
     'VegasOddsAnalyzer',
+    'GameLogStore',
+    'get_gamelog_store',
+    'DataContext',
+    'FactorScoreMatrix',
+    'HistoryIndex',
+    'FeatureStore',
 ]
@@ -11,6 +11,16 @@ Features:
 - Skips already processed dates
 - Generates comprehensive factor analysis for all 20 factors
 - Can be interrupted and resumed without data loss
+- Writes into the feature store (see feature_store.py): one row per player
+  who played that day with the 20 factor scores as of the date and the
+  fantasy points from their game log
+- Only players with a game log row on the date are scored; dates without
+  game logs are skipped without running any analyzer
+- Analyzers read the date's own season of game logs (never another
+  season's history)
+- Features for date D use only games before D: --check-leakage D rebuilds
+  D's rows with D's own batting lines replaced and reports any factor
+  score that changed
 
 Usage:
     # Full backfill (2022-2024)
@@ -24,46 +34,36 @@ Usage:
     
     # Resume from last checkpoint
     python src/scripts/backfill_factor_analysis.py --resume
+    
+    # Verify a date's features do not depend on that date's own games
+    python src/scripts/backfill_factor_analysis.py --check-leakage 2024-09-15
 """
 
+import io
 import sys
 import os
 import json
+import shutil
+import tempfile
+import contextlib
 import argparse
 from pathlib import Path
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 import time
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from scripts.fa import (
-    wind_analysis,
-    matchup_fa,
-    home_away_fa,
-    rest_day_fa,
-    injury_fa,
-    umpire_fa,
-    platoon_fa,
-    temperature_fa,
-    pitch_mix_fa,
-    park_factors_fa,
-    lineup_position_fa,
-    time_of_day_fa,
-    defensive_positions_fa,
-    recent_form_fa,
-    bullpen_fatigue_fa,
-    humidity_elevation_fa,
-    monthly_splits_fa,
-    team_momentum_fa,
-    statcast_metrics_fa,
-    vegas_odds_fa
-)
+from scripts.fa.data_context import DataContext
+from scripts.fa.feature_store import FEATURE_COLUMNS, FeatureStore, fantasy_points
+from scripts.fa.gamelog_store import PARTITION_ROOT, partition_dir
+from scripts.fa.run_all_fa import FACTOR_SPECS, run_factor_batch
+from scripts.fa.score_matrix import FactorScoreMatrix, FACTORS, normalize_name
 
 # Constants
 CHECKPOINT_FILE = "data/backfill_checkpoint.json"
-OUTPUT_DIR = Path("data/historical_factor_analysis")
 BATCH_SIZE = 1  # Process one date at a time
 
 
@@ -76,9 +76,6 @@ class BackfillManager:
         self.force_restart = force_restart
         self.checkpoint = self._load_checkpoint()
         
-        # Create output directory
-        OUTPUT_DIR.mkdir(exist_ok=True)
-        
     def _load_checkpoint(self):
         """Load checkpoint from file or create new one"""
         if self.force_restart and Path(CHECKPOINT_FILE).exists():
@@ -157,90 +154,155 @@ class BackfillManager:
             }
 
 
+def build_feature_rows(context, roster_df=None):
+    """Feature store rows for every player who played on context.as_of_date
+    
+    Args:
+        context: DataContext for the date (factors are computed as of it)
+        roster_df: Players to consider (default: all MLB players)
+        
+    Returns:
+        (rows DataFrame, list of factors that failed)
+    """
+    date = pd.Timestamp(context.as_of_date).normalize()
+    if context.gamelog_season != date.year:
+        # Analyzers would score the date from another season's history
+        return pd.DataFrame(), []
+    store = context.gamelog_store()
+    logs = store.rows_between(date, date) if store.exists else pd.DataFrame()
+    if logs.empty:
+        return pd.DataFrame(), []
+    
+    if roster_df is None:
+        roster_df = context.load_roster(all_players=True)
+    played = roster_df[roster_df['player_id'].isin(logs['player_id'])]
+    played = played.drop_duplicates('player_id').reset_index(drop=True)
+    logs = logs[logs['player_id'].isin(played['player_id'])]
+    if played.empty:
+        return pd.DataFrame(), []
+    
+    # Analyzer output is suppressed; failures are reported by the caller
+    frames, failed = {}, []
+    for key, *_ in FACTOR_SPECS:
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                frames[key] = run_factor_batch(key, context, played)
+        except Exception:
+            failed.append(key)
+    
+    scores = FactorScoreMatrix.from_frames(frames).build(played[['player_name', 'player_id', 'team']])
+    scores.index = normalize_name(scores.index).values
+    
+    by_id = played.set_index('player_id')
+    rows = pd.DataFrame({
+        'game_date': date.strftime('%Y-%m-%d'),
+        'game_pk': logs['game_pk'].values,
+        'player_id': logs['player_id'].values,
+        'player_name': by_id['player_name'].reindex(logs['player_id']).values,
+        'team': by_id['team'].reindex(logs['player_id']).values,
+        'opponent': logs['opponent'].values if 'opponent' in logs.columns else None,
+        'is_home': logs['is_home'].values if 'is_home' in logs.columns else None,
+    })
+    keys = normalize_name(rows['player_name']).values
+    for factor in FACTORS:
+        rows[FEATURE_COLUMNS[factor]] = scores[factor].reindex(keys).values
+    rows['fantasy_points'] = fantasy_points(logs).values
+    return rows, failed
+
+
+def _blank_date_logs(data_dir, date):
+    """Replace every batting line on date with an all-strikeout line (in place)"""
+    day = date.strftime('%Y-%m-%d')
+    files = [data_dir / f"mlb_game_logs_{date.year}.csv", partition_dir(data_dir, date.year) / f"{day}.csv"]
+    for path in files:
+        if not path.exists():
+            continue
+        logs = pd.read_csv(path)
+        on_date = pd.to_datetime(logs['game_date']).dt.strftime('%Y-%m-%d') == day
+        for col in ('H', '2B', '3B', 'HR', 'R', 'RBI', 'BB', 'SB'):
+            if col in logs.columns:
+                logs.loc[on_date, col] = 0
+        if 'SO' in logs.columns and 'AB' in logs.columns:
+            logs.loc[on_date, 'SO'] = logs.loc[on_date, 'AB']
+        logs.to_csv(path, index=False)
+
+
+def check_feature_leakage(data_dir, target_date):
+    """
+    Rebuild a date's feature rows with that date's own batting lines blanked
+    
+    Features for games on a date must not depend on how those games went.
+    Both builds run on temporary copies of the input files (caches, stores
+    and outputs are not copied).
+    
+    Returns:
+        (factor column -> share of rows whose score changed, share of rows
+        whose fantasy_points changed - confirms the lines were replaced)
+    """
+    data_dir = Path(data_dir)
+    target_date = pd.Timestamp(target_date).normalize()
+    builds = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for variant in ('actual', 'blanked'):
+            copy = Path(tmp) / variant
+            copy.mkdir()
+            for path in data_dir.iterdir():
+                if path.is_file() and path.suffix in ('.csv', '.json'):
+                    shutil.copy2(path, copy / path.name)
+            if (data_dir / PARTITION_ROOT).exists():
+                shutil.copytree(data_dir / PARTITION_ROOT, copy / PARTITION_ROOT)
+            if variant == 'blanked':
+                _blank_date_logs(copy, target_date)
+            context = DataContext(copy, as_of_date=target_date, gamelog_season=target_date.year)
+            rows, _ = build_feature_rows(context)
+            builds.append(rows.set_index(['game_pk', 'player_id']).sort_index() if len(rows) else rows)
+    
+    actual, blanked = builds
+    if actual.empty:
+        return {}, 0.0
+    blanked = blanked.reindex(actual.index)
+    changed = {}
+    for column in FEATURE_COLUMNS.values():
+        differs = ~np.isclose(actual[column].fillna(-999.0), blanked[column].fillna(-999.0))
+        if differs.any():
+            changed[column] = float(differs.mean())
+    points_changed = float((actual['fantasy_points'] != blanked['fantasy_points']).mean())
+    return changed, points_changed
+
+
 def run_factor_analysis_for_date(target_date, data_dir):
-    """Run all 20 factor analyses for a specific date
+    """Run all 20 factor analyses for a specific date into the feature store
     
     Args:
         target_date: Date to analyze (pd.Timestamp)
         data_dir: Path to data directory
         
     Returns:
-        pd.DataFrame: Combined results or None if failed
+        pd.DataFrame: Rows written (empty when skipped or no games) or None if failed
     """
     date_str = target_date.strftime('%Y-%m-%d')
+    feature_store = FeatureStore(data_dir)
     
-    # Check if output already exists (skip if so)
-    output_file = OUTPUT_DIR / f"factor_analysis_{target_date.strftime('%Y%m%d')}.csv"
-    if output_file.exists():
+    # Check if the partition already exists (skip if so)
+    if feature_store.has_date(target_date):
         print(f"   ⏭️  Skipping {date_str} - already exists")
         return pd.DataFrame()  # Return empty but successful
     
     print(f"   🔄 Processing {date_str}...")
     
-    results = {}
-    
     try:
-        # Load required data files
-        roster_files = sorted(data_dir.glob('yahoo_fantasy_rosters_*.csv'))
-        if not roster_files:
-            print(f"      ⚠️  No roster file found, skipping")
-            return None
+        context = DataContext(data_dir, as_of_date=target_date, gamelog_season=target_date.year)
+        df_results, failed = build_feature_rows(context)
         
-        roster_df = pd.read_csv(roster_files[-1])
-        players = roster_df['player_name'].unique().tolist()
+        if df_results.empty:
+            print(f"      ⏭️  No game logs for {date_str}")
+            return df_results
+        if failed:
+            print(f"      ⚠️  Factors failed (scores left empty): {', '.join(failed)}")
         
-        # Run each factor analysis
-        factors = [
-            ('vegas', vegas_odds_fa),
-            ('statcast', statcast_metrics_fa),
-            ('matchup', matchup_fa),
-            ('bullpen', bullpen_fatigue_fa),
-            ('platoon', platoon_fa),
-            ('home_away', home_away_fa),
-            ('injury', injury_fa),
-            ('park', park_factors_fa),
-            ('recent_form', recent_form_fa),
-            ('wind', wind_analysis),
-            ('rest', rest_day_fa),
-            ('temperature', temperature_fa),
-            ('lineup', lineup_position_fa),
-            ('umpire', umpire_fa),
-            ('pitch_mix', pitch_mix_fa),
-            ('time_of_day', time_of_day_fa),
-            ('humidity', humidity_elevation_fa),
-            ('defense', defensive_positions_fa),
-            ('monthly', monthly_splits_fa),
-            ('momentum', team_momentum_fa)
-        ]
-        
-        all_scores = []
-        
-        for player in players:
-            player_scores = {'player_name': player, 'date': date_str}
-            
-            for factor_name, factor_module in factors:
-                try:
-                    # Call the analyze function with date
-                    if hasattr(factor_module, 'analyze'):
-                        result = factor_module.analyze(player, data_dir, as_of_date=target_date)
-                        if isinstance(result, dict):
-                            player_scores[f'{factor_name}_score'] = result.get('score', 0)
-                        else:
-                            player_scores[f'{factor_name}_score'] = result if result else 0
-                    else:
-                        player_scores[f'{factor_name}_score'] = 0
-                except Exception as e:
-                    # Silently fail individual factors to continue processing
-                    player_scores[f'{factor_name}_score'] = 0
-            
-            all_scores.append(player_scores)
-        
-        # Combine into dataframe
-        df_results = pd.DataFrame(all_scores)
-        
-        # Save to file
-        df_results.to_csv(output_file, index=False)
-        print(f"      ✅ Saved {len(df_results)} player records")
+        # Save to the feature store
+        path = feature_store.write(target_date, df_results)
+        print(f"      ✅ Saved {len(df_results)} player-game rows → {path}")
         
         return df_results
         
@@ -256,9 +318,25 @@ def main():
     parser.add_argument('--end-date', type=str, help='End date (YYYY-MM-DD)')
     parser.add_argument('--resume', action='store_true', help='Resume from last checkpoint')
     parser.add_argument('--force-restart', action='store_true', help='Restart from beginning, ignoring checkpoint')
+    parser.add_argument('--check-leakage', type=str, metavar='DATE',
+                        help="Check that DATE's features ignore DATE's own games, then exit")
     
     args = parser.parse_args()
     
+    if args.check_leakage:
+        print(f"🔍 Checking {args.check_leakage} features against that day's own games...")
+        changed, points_changed = check_feature_leakage(Path('data'), args.check_leakage)
+        if points_changed == 0:
+            print("❌ No batting lines found for that date - nothing was checked")
+            sys.exit(1)
+        if changed:
+            print("❌ Factor scores depend on the day's own games:")
+            for column, share in sorted(changed.items()):
+                print(f"   {column}: {share:.0%} of rows changed")
+            sys.exit(1)
+        print(f"✅ No factor score changed ({points_changed:.0%} of rows had their fantasy points changed)")
+        return
+    
     # Determine date range
     if args.year:
         start_date = f"{args.year}-01-01"
@@ -300,7 +378,7 @@ def main():
     
     print(f"\n🚀 Starting backfill...")
     print(f"💾 Checkpoint file: {CHECKPOINT_FILE}")
-    print(f"📁 Output directory: {OUTPUT_DIR}")
+    print(f"📁 Feature store: {FeatureStore(Path('data')).root}")
     print(f"\n{'='*80}\n")
     
     data_dir = Path('data')
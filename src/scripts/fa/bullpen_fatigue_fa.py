@@ -19,12 +19,23 @@ Output:
 - Confidence level
 
 Data Source: MLB Stats API (FREE)
+
+Recent usage comes from a team x date table of relief appearances (see
+bullpen_usage.py; kept in data/bullpen_usage_daily.csv by boxscore_scrape),
+loaded once per run, so each (opponent, date) window is a lookup.
 """
 
 import pandas as pd
 from pathlib import Path
 from datetime import timedelta
 
+try:
+    from .schedule_index import iter_player_games
+    from .bullpen_usage import BullpenUsageTable
+except ImportError:
+    from schedule_index import iter_player_games
+    from bullpen_usage import BullpenUsageTable
+
 
 class BullpenFatigueAnalyzer:
     """Analyze opposing bullpen strength and fatigue levels"""
@@ -83,140 +94,129 @@ class BullpenFatigueAnalyzer:
     
     def detect_back_to_back(self, team, game_date, games_df):
         """Check if team played previous day"""
-        prev_day = game_date - timedelta(days=1)
-        
-        prev_games = games_df[
-            ((games_df['home_team'] == team) | (games_df['away_team'] == team)) &
-            (games_df['game_date'] == prev_day)
-        ]
-        
-        return len(prev_games) > 0
+        prev_day = pd.Timestamp(game_date).normalize() - timedelta(days=1)
+        return (str(team), prev_day) in self._team_days(games_df)
     
-    def get_recent_bullpen_stats(self, team, game_date, game_logs_df):
-        """Get bullpen usage stats for last 7 days"""
-        start_date = game_date - timedelta(days=self.lookback_days)
-        
-        # Check if required columns exist
-        if len(game_logs_df) == 0 or 'team' not in game_logs_df.columns:
-            return None
-        
-        # Find all relief pitcher appearances for this team
-        recent_relief = game_logs_df[
-            (game_logs_df['team'] == team) &
-            (game_logs_df['game_date'] >= start_date) &
-            (game_logs_df['game_date'] < game_date) &
-            (game_logs_df['position'] == 'P') &
-            (game_logs_df['starter'] == False)  # Relief pitchers only
-        ]
-        
-        if len(recent_relief) == 0:
-            return None
-        
-        total_innings = recent_relief['innings_pitched'].sum()
-        earned_runs = recent_relief['earned_runs'].sum()
-        games_played = recent_relief['game_date'].nunique()
-        
-        # Calculate bullpen ERA
-        bullpen_era = (earned_runs / total_innings * 9) if total_innings > 0 else 4.50
-        
-        return {
-            'innings_pitched': total_innings,
-            'earned_runs': earned_runs,
-            'games_played': games_played,
-            'bullpen_era': bullpen_era
-        }
+    @staticmethod
+    def _team_days(games_df):
+        """Set of (team, day) pairs with a scheduled game"""
+        if len(games_df) == 0 or 'game_date' not in games_df.columns:
+            return set()
+        days = pd.to_datetime(games_df['game_date']).dt.normalize()
+        team_days = set()
+        for col in ('home_team', 'away_team'):
+            if col in games_df.columns:
+                team_days.update(zip(games_df[col].astype(str), days))
+        return team_days
+    
+    def build_usage_table(self, game_logs_df):
+        """Team x date relief usage table for the configured lookback window"""
+        return BullpenUsageTable.from_game_logs(game_logs_df, window_days=self.lookback_days)
     
-    def analyze(self, games_df, game_logs_df, roster_df):
+    def get_recent_bullpen_stats(self, team, game_date, game_logs_df, usage=None):
+        """Get bullpen usage stats for last 7 days (usage: prebuilt BullpenUsageTable)"""
+        if usage is None:
+            # Check if required columns exist
+            if len(game_logs_df) == 0 or 'team' not in game_logs_df.columns:
+                return None
+            usage = self.build_usage_table(game_logs_df)
+        return usage.lookup(team, game_date)
+    
+    def analyze(self, games_df, game_logs_df, roster_df, schedule_df=None, usage=None):
         """
         Analyze bullpen fatigue for all hitters in upcoming games
         
-        For each hitter, we analyze the OPPOSING team's bullpen fatigue
+        For each hitter, we analyze the OPPOSING team's bullpen fatigue.
+        schedule_df (full season) is used for back-to-back detection when
+        games_df only covers the target window. usage is an optional prebuilt
+        BullpenUsageTable (built from game_logs_df otherwise).
         """
         results = []
+        if schedule_df is None:
+            schedule_df = games_df
+        if usage is None:
+            usage = self.build_usage_table(game_logs_df)
+        
+        # Every (opponent, date) window resolved in one vectorized lookup
+        pairs = list(iter_player_games(games_df, roster_df))
+        keys = list(dict.fromkeys(
+            (game['opponent'], pd.Timestamp(game['game_date']).normalize()) for game, _ in pairs
+        ))
+        window = usage.window_stats([k[0] for k in keys], [k[1] for k in keys])
+        window_stats = dict(zip(keys, window.to_dict('records')))
+        team_days = self._team_days(schedule_df)
         
-        for _, game in games_df.iterrows():
+        for game, player in pairs:
             game_date = game['game_date']
-            home_team = game['home_team']
-            away_team = game['away_team']
+            day = pd.Timestamp(game_date).normalize()
+            
+            player_name = player['player_name']
             
-            # Get roster players for this game
-            game_roster = roster_df[
-                (roster_df.get('mlb_team', roster_df.get('team', '')) == home_team) | 
-                (roster_df.get('mlb_team', roster_df.get('team', '')) == away_team)
-            ]
+            # Determine opposing team (whose bullpen we're analyzing)
+            opponent = game['opponent']
             
-            for _, player in game_roster.iterrows():
-                player_name = player['player_name']
-                player_team = player.get('mlb_team', player.get('team', ''))
-                
-                # Determine opposing team (whose bullpen we're analyzing)
-                opponent = away_team if player_team == home_team else home_team
-                
-                # Get opponent's recent bullpen stats
-                bullpen_stats = self.get_recent_bullpen_stats(
-                    opponent, game_date, game_logs_df
-                )
-                
-                if bullpen_stats is None:
-                    # No data available, use neutral score
-                    results.append({
-                        'player_name': player_name,
-                        'game_date': game_date,
-                        'opponent': opponent,
-                        'score': 0.0,  # Standard score column
-                        'bullpen_fatigue_score': 0.0,
-                        'recent_innings': 0,
-                        'games_played': 0,
-                        'bullpen_era': None,
-                        'back_to_back': False,
-                        'confidence': 'low'
-                    })
-                    continue
-                
-                # Check if opponent is playing back-to-back
-                back_to_back = self.detect_back_to_back(
-                    opponent, game_date, games_df
-                )
-                
-                # Calculate fatigue score
-                fatigue_score = self.calculate_fatigue_score(
-                    recent_innings=bullpen_stats['innings_pitched'],
-                    bullpen_era=bullpen_stats['bullpen_era'],
-                    games_played=bullpen_stats['games_played'],
-                    back_to_back=back_to_back
-                )
-                
-                # Determine confidence level
-                if bullpen_stats['games_played'] >= 5:
-                    confidence = 'high'
-                elif bullpen_stats['games_played'] >= 3:
-                    confidence = 'medium'
-                else:
-                    confidence = 'low'
-                
+            # Get opponent's recent bullpen stats
+            bullpen_stats = window_stats[(opponent, day)]
+            
+            if bullpen_stats['games_played'] == 0:
+                # No data available, use neutral score
                 results.append({
                     'player_name': player_name,
                     'game_date': game_date,
                     'opponent': opponent,
-                    'score': round(fatigue_score, 2),  # Standard score column
-                    'bullpen_fatigue_score': round(fatigue_score, 2),
-                    'recent_innings': round(bullpen_stats['innings_pitched'], 1),
-                    'games_played': bullpen_stats['games_played'],
-                    'bullpen_era': round(bullpen_stats['bullpen_era'], 2),
-                    'back_to_back': back_to_back,
-                    'confidence': confidence
+                    'score': 0.0,  # Standard score column
+                    'bullpen_fatigue_score': 0.0,
+                    'recent_innings': 0,
+                    'games_played': 0,
+                    'bullpen_era': None,
+                    'back_to_back': False,
+                    'confidence': 'low'
                 })
+                continue
+            
+            # Check if opponent is playing back-to-back
+            back_to_back = (str(opponent), day - timedelta(days=1)) in team_days
+            
+            # Calculate fatigue score
+            fatigue_score = self.calculate_fatigue_score(
+                recent_innings=bullpen_stats['innings_pitched'],
+                bullpen_era=bullpen_stats['bullpen_era'],
+                games_played=bullpen_stats['games_played'],
+                back_to_back=back_to_back
+            )
+            
+            # Determine confidence level
+            if bullpen_stats['games_played'] >= 5:
+                confidence = 'high'
+            elif bullpen_stats['games_played'] >= 3:
+                confidence = 'medium'
+            else:
+                confidence = 'low'
+            
+            results.append({
+                'player_name': player_name,
+                'game_date': game_date,
+                'opponent': opponent,
+                'score': round(fatigue_score, 2),  # Standard score column
+                'bullpen_fatigue_score': round(fatigue_score, 2),
+                'recent_innings': round(bullpen_stats['innings_pitched'], 1),
+                'games_played': bullpen_stats['games_played'],
+                'bullpen_era': round(bullpen_stats['bullpen_era'], 2),
+                'back_to_back': back_to_back,
+                'confidence': confidence
+            })
         
         return pd.DataFrame(results)
     
-    def analyze_roster(self, roster_df, schedule_df, players_df):
+    def analyze_roster(self, roster_df, schedule_df, players_df, context=None):
         """
         Wrapper method for integration with main FA pipeline
         
         Args:
             roster_df: DataFrame of roster players
-            schedule_df: DataFrame of upcoming games
+            schedule_df: DataFrame of upcoming games (target window)
             players_df: DataFrame of all players (used for game logs)
+            context: Optional shared DataContext (full schedule for back-to-backs)
         
         Returns:
             DataFrame with bullpen fatigue scores for each roster player
@@ -228,10 +228,13 @@ class BullpenFatigueAnalyzer:
         elif 'game_date' in schedule_df.columns:
             schedule_df['game_date'] = pd.to_datetime(schedule_df['game_date'])
         
-        # Use players_df as game_logs_df for now
-        # In production, this should come from actual game logs
-        return self.analyze(schedule_df, players_df, roster_df)
-        return pd.DataFrame(results)
+        # Full season schedule (for back-to-back checks) when a context is shared
+        full_schedule = context.schedule if context is not None else None
+        
+        # Persisted daily usage, maintained by boxscore_scrape from the pitching
+        # partitions (players_df has no pitching lines to add)
+        usage = BullpenUsageTable.load(self.data_dir, window_days=self.lookback_days)
+        return self.analyze(schedule_df, players_df, roster_df, full_schedule, usage)
 
 
 if __name__ == '__main__':
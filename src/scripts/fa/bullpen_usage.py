@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Team x Date Bullpen Usage Table
+
+Relief pitching usage aggregated once per run into one row per (team, date),
+with trailing 7-day sums of relief innings, earned runs and days with a relief
+appearance available for any (team, date) in O(1). The bullpen fatigue
+analyzer joins against it instead of filtering the full game log frame for
+every (player, game) pair.
+
+Key Concepts:
+- Daily table: relief appearances (position 'P', starter False) grouped by
+  team and calendar day -> relief_ip, relief_er
+- Rolling window: [date - window_days, date), the same window
+  get_recent_bullpen_stats has always used
+- Dense team x day cumulative sums: a window is one subtraction, and a whole
+  season of lookups (every team, every date) is a single vectorized gather
+- Incremental appends: append(new_logs) groups only the new rows and merges
+  them into the daily table (re-appending a day replaces it)
+- Persistence: save()/load() keep the daily table in data/bullpen_usage_daily.csv
+- check_window_stats() compares lookups before, inside and after the
+  table's date range with the original per-row game log filter
+  (python src/scripts/fa/bullpen_usage.py runs it on synthetic logs)
+
+Usage:
+    from scripts.fa.bullpen_usage import BullpenUsageTable
+
+    usage = BullpenUsageTable.from_game_logs(game_logs_df)
+    usage.append(todays_logs)
+    stats = usage.lookup('New York Yankees', '2025-07-04')
+    season = usage.rolling()    # every team x every date
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+DAILY_COLUMNS = ['team', 'game_date', 'relief_ip', 'relief_er']
+REQUIRED_COLUMNS = {'team', 'game_date', 'position', 'starter',
+                    'innings_pitched', 'earned_runs'}
+USAGE_FILE = "bullpen_usage_daily.csv"
+
+
+class BullpenUsageTable:
+    """Daily relief usage per team with trailing-window lookups"""
+
+    def __init__(self, daily_df=None, window_days=7):
+        """
+        Args:
+            daily_df: Daily table (team, game_date, relief_ip, relief_er)
+            window_days: Trailing window length for lookups
+        """
+        self.window_days = window_days
+        if daily_df is None:
+            daily_df = pd.DataFrame(columns=DAILY_COLUMNS)
+        self.daily = self._normalize(daily_df)
+        self._build()
+
+    @classmethod
+    def from_game_logs(cls, game_logs_df, window_days=7):
+        """Build the table from pitcher game logs (one groupby)"""
+        return cls(cls.daily_usage(game_logs_df), window_days=window_days)
+
+    @classmethod
+    def load(cls, data_dir, window_days=7):
+        """Load a persisted daily table (empty table if none saved yet)"""
+        path = Path(data_dir) / USAGE_FILE
+        if not path.exists():
+            return cls(window_days=window_days)
+        return cls(pd.read_csv(path, parse_dates=['game_date']), window_days=window_days)
+
+    def save(self, data_dir):
+        """Write the daily table to data_dir; returns the file path"""
+        path = Path(data_dir) / USAGE_FILE
+        self.daily.to_csv(path, index=False)
+        return path
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def daily_usage(game_logs_df):
+        """Relief innings/earned runs per (team, day) from pitcher game logs"""
+        if game_logs_df is None or len(game_logs_df) == 0 \
+                or not REQUIRED_COLUMNS.issubset(game_logs_df.columns):
+            return pd.DataFrame(columns=DAILY_COLUMNS)
+
+        relief = game_logs_df[
+            (game_logs_df['position'] == 'P') &
+            game_logs_df['starter'].eq(False)  # Relief pitchers only
+        ]
+        if relief.empty:
+            return pd.DataFrame(columns=DAILY_COLUMNS)
+
+        daily = relief.groupby(
+            [relief['team'].astype(str),
+             pd.to_datetime(relief['game_date']).dt.normalize().rename('game_date')],
+            observed=True
+        ).agg(relief_ip=('innings_pitched', 'sum'), relief_er=('earned_runs', 'sum'))
+        return daily.reset_index()
+
+    @staticmethod
+    def _normalize(daily_df):
+        """Typed, sorted daily table"""
+        daily = daily_df[DAILY_COLUMNS].copy()
+        daily['team'] = daily['team'].astype(str)
+        daily['game_date'] = pd.to_datetime(daily['game_date']).dt.normalize()
+        daily['relief_ip'] = pd.to_numeric(daily['relief_ip'], errors='coerce').fillna(0.0).astype(float)
+        daily['relief_er'] = pd.to_numeric(daily['relief_er'], errors='coerce').fillna(0.0)
+        return daily.sort_values(['team', 'game_date'], kind='mergesort').reset_index(drop=True)
+
+    def _build(self):
+        """Dense team x day cumulative sums (leading zero column)"""
+        daily = self.daily
+        self.teams = {team: i for i, team in enumerate(sorted(daily['team'].unique()))}
+        if daily.empty:
+            self.day0 = None
+            self._cum = {}
+            return
+
+        self.day0 = daily['game_date'].min()
+        n_days = (daily['game_date'].max() - self.day0).days + 1
+        rows = daily['team'].map(self.teams).to_numpy()
+        cols = (daily['game_date'] - self.day0).dt.days.to_numpy()
+
+        self._cum = {}
+        for name, values in (('innings_pitched', daily['relief_ip'].to_numpy(dtype=float)),
+                             ('earned_runs', daily['relief_er'].to_numpy(dtype=float)),
+                             ('games_played', np.ones(len(daily), dtype=np.int64))):
+            grid = np.zeros((len(self.teams), n_days + 1), dtype=values.dtype)
+            np.add.at(grid, (rows, cols + 1), values)
+            self._cum[name] = np.cumsum(grid, axis=1)
+
+    def append(self, game_logs_df):
+        """
+        Add new pitcher game logs (e.g. yesterday's games) to the table
+
+        Only the new rows are grouped; any (team, day) already present is
+        replaced by the newly aggregated values.
+        """
+        new_daily = self.daily_usage(game_logs_df)
+        if new_daily.empty:
+            return self
+        new_daily = self._normalize(new_daily)
+        combined = pd.concat([self.daily, new_daily], ignore_index=True)
+        self.daily = self._normalize(
+            combined.drop_duplicates(['team', 'game_date'], keep='last')
+        )
+        self._build()
+        return self
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def window_stats(self, teams, dates):
+        """
+        Trailing-window relief usage for many (team, date) pairs at once
+
+        Args:
+            teams: Sequence of team names
+            dates: Matching sequence of dates (window ends the day before)
+
+        Returns:
+            DataFrame with innings_pitched, earned_runs, games_played and
+            bullpen_era (4.50 when no innings) per pair
+        """
+        teams = list(teams)
+        result = pd.DataFrame({
+            'innings_pitched': np.zeros(len(teams)),
+            'earned_runs': np.zeros(len(teams)),
+            'games_played': np.zeros(len(teams), dtype=np.int64),
+        })
+        if not self._cum or not teams:
+            result['bullpen_era'] = 4.50
+            return result
+
+        n_days = self._cum['games_played'].shape[1] - 1
+        row = np.array([self.teams.get(str(t), -1) for t in teams])
+        days = pd.to_datetime(pd.Series(list(dates))).dt.normalize()
+        # Window [d - window_days, d) in day offsets, clipped to the table
+        # separately so dates past either end only see the days they overlap
+        d = (days - self.day0).dt.days.to_numpy()
+        start = np.clip(d - self.window_days, 0, n_days)
+        end = np.clip(d, 0, n_days)
+
+        known = row >= 0
+        for name, cum in self._cum.items():
+            values = cum[row[known], end[known]] - cum[row[known], start[known]]
+            result.loc[known, name] = values
+
+        ip = result['innings_pitched'].to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result['bullpen_era'] = np.where(
+                ip > 0, result['earned_runs'].to_numpy() / ip * 9, 4.50
+            )
+        return result
+
+    def lookup(self, team, game_date):
+        """Trailing-window usage for one team/date as a dict (None if no relief appearances)"""
+        stats = self.window_stats([team], [game_date]).iloc[0]
+        if stats['games_played'] == 0:
+            return None
+        return {
+            'innings_pitched': stats['innings_pitched'],
+            'earned_runs': stats['earned_runs'],
+            'games_played': int(stats['games_played']),
+            'bullpen_era': stats['bullpen_era'],
+        }
+
+    def rolling(self, dates=None):
+        """
+        Trailing-window usage for every team on every date
+
+        Args:
+            dates: Dates to evaluate (default: every day covered by the table)
+
+        Returns:
+            DataFrame (team, game_date, innings_pitched, earned_runs,
+            games_played, bullpen_era)
+        """
+        if not self._cum:
+            return pd.DataFrame(columns=['team', 'game_date', 'innings_pitched',
+                                         'earned_runs', 'games_played', 'bullpen_era'])
+        if dates is None:
+            n_days = self._cum['games_played'].shape[1] - 1
+            dates = pd.date_range(self.day0, periods=n_days + 1)
+        dates = pd.DatetimeIndex(dates)
+        teams = list(self.teams)
+        pairs = pd.DataFrame({
+            'team': np.repeat(teams, len(dates)),
+            'game_date': np.tile(dates.values, len(teams)),
+        })
+        stats = self.window_stats(pairs['team'], pairs['game_date'])
+        return pd.concat([pairs, stats], axis=1)
+
+
+def reference_usage(game_logs_df, team, game_date, window_days=7):
+    """Trailing-window usage by filtering the game logs (the original per-row lookup)"""
+    game_date = pd.Timestamp(game_date).normalize()
+    dates = pd.to_datetime(game_logs_df['game_date']).dt.normalize()
+    relief = game_logs_df[
+        (game_logs_df['team'] == team) &
+        (dates >= game_date - pd.Timedelta(days=window_days)) &
+        (dates < game_date) &
+        (game_logs_df['position'] == 'P') &
+        game_logs_df['starter'].eq(False)
+    ]
+    if len(relief) == 0:
+        return None
+    return {
+        'innings_pitched': relief['innings_pitched'].sum(),
+        'earned_runs': relief['earned_runs'].sum(),
+        'games_played': pd.to_datetime(relief['game_date']).dt.normalize().nunique(),
+    }
+
+
+def check_window_stats(game_logs_df, window_days=7, margin_days=None):
+    """
+    Compare table lookups with reference_usage for every team on every day
+    from margin_days before the first game day to margin_days after the last
+
+    Returns:
+        List of (team, date, table result, reference result) mismatches
+    """
+    table = BullpenUsageTable.from_game_logs(game_logs_df, window_days=window_days)
+    if table.day0 is None:
+        return []
+    margin = margin_days if margin_days is not None else 2 * window_days
+    last = table.daily['game_date'].max()
+    dates = pd.date_range(table.day0 - pd.Timedelta(days=margin), last + pd.Timedelta(days=margin))
+
+    mismatches = []
+    for team in sorted(set(game_logs_df['team'].astype(str))):
+        for date in dates:
+            got = table.lookup(team, date)
+            want = reference_usage(game_logs_df, team, date, window_days)
+            same = (got is None) == (want is None) and (got is None or all(
+                np.isclose(got[k], want[k]) for k in ('innings_pitched', 'earned_runs', 'games_played')))
+            if not same:
+                mismatches.append((team, date.strftime('%Y-%m-%d'), got, want))
+    return mismatches
+
+
+if __name__ == '__main__':
+    # Synthetic relief appearances with off days and a gap, checked against the filter
+    rng = np.random.default_rng(7)
+    days = pd.date_range('2024-09-01', '2024-09-30')
+    days = days[(rng.random(len(days)) > 0.25) & ((days < '2024-09-12') | (days > '2024-09-20'))]
+    rows = [
+        {'team': team, 'game_date': day, 'position': 'P', 'starter': starter,
+         'innings_pitched': float(rng.integers(1, 4)), 'earned_runs': float(rng.integers(0, 3))}
+        for team in ('New York Yankees', 'Boston Red Sox', 'Tampa Bay Rays')
+        for day in days if rng.random() > 0.2
+        for starter in (True, False, False)
+    ]
+    mismatches = check_window_stats(pd.DataFrame(rows))
+    if mismatches:
+        print(f"❌ {len(mismatches)} window lookups differ from the game log filter:")
+        for mismatch in mismatches[:10]:
+            print(f"   {mismatch}")
+        raise SystemExit(1)
+    print("✅ Window lookups match the game log filter before, inside and after the table range")
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Shared Data Context for Factor Analysis Runs
+
+Loads every input the factor analyzers and the daily sit/start process need
+exactly once per process, with typed dtypes and pre-parsed dates, and keeps
+cached derived views so analyzers stop re-filtering the same frames.
+
+Key Concepts:
+- Lazy loading: each file is parsed on first access (after any scrapers in the
+  same process have refreshed it) and reused afterwards
+- Typed frames: game_date parsed to datetime64, ids as integers, repeated
+  strings (teams, venues, positions) as categoricals
+- Derived views (cached):
+    * games_on(date) / team_games_on(date): team -> that day's games
+    * schedule_index: team -> games for the target date window (see schedule_index.py)
+    * weather_for_venue(venue) / weather_for_team(team): weather row lookups
+    * player_team: player_name -> team name
+- Game logs come from the shared GameLogStore (see gamelog_store.py);
+  history_index() adds per-player prefix sums over them (see history_index.py)
+- gamelog_season: the season game_logs/history_index serve - the as-of
+  year when game logs for it exist, else DEFAULT_SEASON - so a context for
+  a 2023 date reads 2023 history
+
+Usage:
+    from scripts.fa.data_context import DataContext
+
+    context = DataContext(data_dir, as_of_date='2025-09-28')
+    roster_df = context.load_roster(all_players=False)
+    analyzer.analyze_roster(roster_df, context.target_games, context.weather, context=context)
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    from .gamelog_store import get_gamelog_store, has_season, DEFAULT_SEASON
+    from .schedule_index import ScheduleIndex
+    from .history_index import HistoryIndex
+except ImportError:
+    from gamelog_store import get_gamelog_store, has_season, DEFAULT_SEASON
+    from schedule_index import ScheduleIndex
+    from history_index import HistoryIndex
+
+
+# Team abbreviation to full name mapping (Yahoo rosters use abbreviations)
+TEAM_MAP = {
+    'AZ': 'Arizona Diamondbacks', 'ATL': 'Atlanta Braves',
+    'ATH': 'Oakland Athletics', 'BAL': 'Baltimore Orioles',
+    'BOS': 'Boston Red Sox', 'CHC': 'Chicago Cubs',
+    'CHW': 'Chicago White Sox', 'CIN': 'Cincinnati Reds',
+    'CLE': 'Cleveland Guardians', 'COL': 'Colorado Rockies',
+    'CWS': 'Chicago White Sox', 'DET': 'Detroit Tigers',
+    'HOU': 'Houston Astros', 'KC': 'Kansas City Royals',
+    'LAA': 'Los Angeles Angels', 'LAD': 'Los Angeles Dodgers',
+    'MIA': 'Miami Marlins', 'MIL': 'Milwaukee Brewers',
+    'MIN': 'Minnesota Twins', 'NYM': 'New York Mets',
+    'NYY': 'New York Yankees', 'OAK': 'Oakland Athletics',
+    'PHI': 'Philadelphia Phillies', 'PIT': 'Pittsburgh Pirates',
+    'SD': 'San Diego Padres', 'SEA': 'Seattle Mariners',
+    'SF': 'San Francisco Giants', 'STL': 'St. Louis Cardinals',
+    'TB': 'Tampa Bay Rays', 'TEX': 'Texas Rangers',
+    'TOR': 'Toronto Blue Jays', 'WSH': 'Washington Nationals',
+}
+
+ROSTER_PATTERNS = ["yahoo_fantasy_rosters_*.csv", "yahoo_roster_*.csv"]
+
+SCHEDULE_DTYPES = {
+    'game_type': 'category', 'status': 'category', 'venue': 'category',
+    'home_team': 'category', 'away_team': 'category',
+}
+PLAYER_DTYPES = {
+    'team_name': 'category', 'position': 'category',
+    'position_type': 'category', 'status': 'category',
+}
+WEATHER_DTYPES = {
+    'wind_direction_cardinal': 'category', 'prediction': 'category',
+}
+
+
+def _as_datetime(value):
+    """Parse a date argument (None -> now, str -> YYYY-MM-DD)"""
+    if value is None:
+        return datetime.now()
+    if isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d")
+    return pd.Timestamp(value).to_pydatetime()
+
+
+class DataContext:
+    """Loads factor analysis inputs once and serves cached views of them"""
+
+    def __init__(self, data_dir, as_of_date=None, schedule_season=None, target_days=1,
+                 gamelog_season=None):
+        self.data_dir = Path(data_dir)
+        self.as_of_date = _as_datetime(as_of_date)
+        self.target_days = target_days
+        self.schedule_season = schedule_season or self.as_of_date.year
+        if gamelog_season is None:
+            year = self.as_of_date.year
+            gamelog_season = year if has_season(self.data_dir, year) else DEFAULT_SEASON
+        self.gamelog_season = int(gamelog_season)
+        self.roster_source = None
+        self._cache = {}
+
+    def _cached(self, key, loader):
+        """Return cached value for key, computing it once with loader()"""
+        if key not in self._cache:
+            self._cache[key] = loader()
+        return self._cache[key]
+
+    # ------------------------------------------------------------------
+    # Raw inputs
+    # ------------------------------------------------------------------
+
+    def _read_csv(self, filename, dtypes=None, parse_dates=None):
+        """Read a data file with typed columns (missing columns are ignored)"""
+        path = self.data_dir / filename
+        header = pd.read_csv(path, nrows=0).columns
+        dtype = {c: t for c, t in (dtypes or {}).items() if c in header}
+        dates = [c for c in (parse_dates or []) if c in header]
+        return pd.read_csv(path, dtype=dtype, parse_dates=dates)
+
+    def schedule_file(self):
+        """Schedule CSV for the context season (latest available as fallback)"""
+        preferred = self.data_dir / f"mlb_{self.schedule_season}_schedule.csv"
+        if preferred.exists():
+            return preferred
+        available = sorted(self.data_dir.glob("mlb_*_schedule.csv"))
+        return available[-1] if available else preferred
+
+    @property
+    def schedule(self):
+        """Season schedule with parsed game_date"""
+        return self._cached('schedule', lambda: self._read_csv(
+            self.schedule_file().name, SCHEDULE_DTYPES, ['game_date']
+        ))
+
+    @property
+    def weather(self):
+        """Latest stadium weather snapshot"""
+        return self._cached('weather', lambda: self._read_csv(
+            "mlb_stadium_weather.csv", WEATHER_DTYPES, ['timestamp']
+        ))
+
+    def use_weather(self, weather_df):
+        """Serve a weather frame produced in-process (e.g. by the weather scraper)"""
+        weather_df = weather_df.astype({c: object for c in weather_df.select_dtypes('string').columns})
+        weather_df = weather_df.astype({c: t for c, t in WEATHER_DTYPES.items() if c in weather_df.columns})
+        if 'timestamp' in weather_df.columns:
+            weather_df['timestamp'] = pd.to_datetime(weather_df['timestamp'])
+        self._cache['weather'] = weather_df
+        for key in [k for k in self._cache if isinstance(k, tuple) and k[0] == 'weather_by']:
+            del self._cache[key]
+
+    @property
+    def players(self):
+        """All player-season records"""
+        return self._cached('players', lambda: self._read_csv(
+            "mlb_all_players_complete.csv", PLAYER_DTYPES
+        ))
+
+    @property
+    def teams(self):
+        """MLB team reference table"""
+        return self._cached('teams', lambda: self._read_csv("mlb_all_teams.csv"))
+
+    def gamelog_store(self, season=None):
+        """Shared game log store for a season (default: gamelog_season)"""
+        return get_gamelog_store(self.data_dir, season or self.gamelog_season)
+
+    @property
+    def game_logs(self):
+        """gamelog_season game logs as a DataFrame (empty when unavailable)"""
+        store = self.gamelog_store()
+        return store.frame if store.exists else pd.DataFrame()
+
+    def history_index(self, season=None):
+        """Per-player cumulative stat index over a season's game logs (default: gamelog_season)"""
+        season = season or self.gamelog_season
+
+        def build():
+            store = self.gamelog_store(season)
+            return HistoryIndex(store.frame if store.exists else pd.DataFrame())
+        return self._cached(('history_index', season), build)
+
+    # ------------------------------------------------------------------
+    # Rosters
+    # ------------------------------------------------------------------
+
+    def latest_roster_file(self):
+        """Most recent Yahoo roster export, if any"""
+        for pattern in ROSTER_PATTERNS:
+            files = sorted(self.data_dir.glob(pattern),
+                           key=lambda x: x.stat().st_mtime, reverse=True)
+            if files:
+                return files[0]
+        return None
+
+    def load_roster(self, all_players=False):
+        """
+        Roster to analyze with normalized player_name/team/mlb_team columns
+
+        Args:
+            all_players: If True, every MLB player in the context season;
+                         otherwise the latest Yahoo fantasy roster
+
+        Returns:
+            DataFrame copy (callers may modify it), empty if no roster exists
+        """
+        key = 'roster_all' if all_players else 'roster'
+        roster_df, self.roster_source = self._cached(key, lambda: self._load_roster(all_players))
+        return roster_df.copy()
+
+    def use_roster(self, roster_df, source=None):
+        """Serve a Yahoo roster fetched in-process instead of re-reading the export"""
+        self._cache['roster'] = (self._normalize_roster(roster_df.copy()), source)
+        self.roster_source = source
+
+    def _load_roster(self, all_players):
+        """Read and normalize a roster; returns (roster_df, source_file)"""
+        if all_players:
+            source = self.data_dir / "mlb_all_players_complete.csv"
+            roster_df = self.players
+            if 'season' in roster_df.columns:
+                roster_df = roster_df[roster_df['season'] == self.as_of_date.year]
+            roster_df = roster_df.copy()
+            # All players file has: player_id, player_name, team_id, team_name
+            if 'team_name' in roster_df.columns:
+                roster_df['team'] = roster_df['team_name'].astype(str)
+                roster_df['mlb_team'] = roster_df['team']
+            return roster_df.reset_index(drop=True), source
+
+        roster_file = self.latest_roster_file()
+        if roster_file is None:
+            return pd.DataFrame(), None
+
+        return self._normalize_roster(pd.read_csv(roster_file)), roster_file
+
+    def _normalize_roster(self, roster_df):
+        """Yahoo roster with player_name and full team names"""
+        # Roster file has: mlb_team (abbreviation), player_name or name
+        if 'name' in roster_df.columns and 'player_name' not in roster_df.columns:
+            roster_df['player_name'] = roster_df['name']
+        if 'mlb_team' in roster_df.columns and 'team' not in roster_df.columns:
+            roster_df['team'] = roster_df['mlb_team'].map(TEAM_MAP)
+            if 'player_name' in roster_df.columns:
+                roster_df['team'] = roster_df['team'].fillna(
+                    roster_df['player_name'].map(self.player_team)
+                )
+            roster_df['team'] = roster_df['team'].fillna(roster_df['mlb_team'])
+        return roster_df
+
+    # ------------------------------------------------------------------
+    # Derived views
+    # ------------------------------------------------------------------
+
+    @property
+    def player_team(self):
+        """player_name -> team name (latest season on record per player)"""
+        def build():
+            players = self.players
+            if not {'player_name', 'team_name'}.issubset(players.columns):
+                return {}
+            if 'season' in players.columns:
+                players = players.sort_values('season', kind='mergesort')
+            latest = players.drop_duplicates('player_name', keep='last')
+            return dict(zip(latest['player_name'], latest['team_name'].astype(str)))
+        return self._cached('player_team', build)
+
+    def games_on(self, date):
+        """Schedule rows for a single date"""
+        day = pd.Timestamp(date).normalize()
+
+        def build():
+            schedule = self.schedule
+            return schedule[schedule['game_date'].dt.normalize() == day]
+        return self._cached(('games_on', day), build)
+
+    def team_games_on(self, date):
+        """team -> schedule rows (home or away) for a single date"""
+        day = pd.Timestamp(date).normalize()
+        return self._cached(('team_games_on', day),
+                            lambda: self._group_by_team(self.games_on(day)))
+
+    @property
+    def schedule_index(self):
+        """team -> games index for the target window (as_of_date + target_days)"""
+        return self._cached('schedule_index', lambda: ScheduleIndex(
+            self.schedule, start_date=self.as_of_date, days=self.target_days
+        ))
+
+    @property
+    def target_games(self):
+        """Schedule rows in the target window"""
+        return self.schedule_index.games
+
+    @staticmethod
+    def _group_by_team(games):
+        """Index a schedule frame by participating team"""
+        by_team = {}
+        for col in ('home_team', 'away_team'):
+            if col not in games.columns:
+                continue
+            for team, idx in games.groupby(col, observed=True).groups.items():
+                by_team.setdefault(str(team), []).append(idx)
+        return {
+            team: games.loc[sorted(set().union(*parts))]
+            for team, parts in by_team.items()
+        }
+
+    def weather_for_venue(self, venue):
+        """First weather row (as a Series) for a venue, or None"""
+        return self._weather_index('venue').get(venue)
+
+    def weather_for_team(self, team):
+        """First weather row (as a Series) for a home team, or None"""
+        return self._weather_index('team').get(team)
+
+    def _weather_index(self, column):
+        def build():
+            weather = self.weather
+            if column not in weather.columns:
+                return {}
+            first = weather.drop_duplicates(column, keep='first')
+            return {str(key): row for key, (_, row) in zip(first[column], first.iterrows())}
+        return self._cached(('weather_by', column), build)
@@ -31,6 +31,15 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+try:
+    from .gamelog_store import load_gamelogs
+    from .schedule_index import iter_player_games
+    from .keyed_random import keyed_beta, keyed_normal, keyed_uniform
+except ImportError:
+    from gamelog_store import load_gamelogs
+    from schedule_index import iter_player_games
+    from keyed_random import keyed_beta, keyed_normal, keyed_uniform
+
 
 class DefensivePositionsFactorAnalyzer:
     """Analyze defensive position matchups for fantasy baseball"""
@@ -39,20 +48,24 @@ class DefensivePositionsFactorAnalyzer:
         self.data_dir = Path(data_dir)
         self.team_defensive_ratings = {}
         self.position_defensive_quality = {}
+        self.shift_tendencies = {}
+        self.batter_handedness = {}
+    
+    def load_team_defensive_ratings(self, teams):
+        """Generate synthetic defensive ratings for many teams at once"""
+        teams = pd.unique(pd.Series(teams, dtype=object).astype(str))
+        if len(teams) == 0:
+            return
+        # 0.5 = average, 0.0-1.0 range
+        ratings = np.clip(keyed_normal(teams, mean=0.5, std=0.15, salt='team_defense'), 0.0, 1.0)
+        self.team_defensive_ratings.update(zip(teams, ratings.tolist()))
     
     def get_team_defensive_rating(self, team):
         """Get or generate team defensive rating"""
-        if team in self.team_defensive_ratings:
-            return self.team_defensive_ratings[team]
-        
-        # Generate synthetic defensive rating (0.5 = average, 0.0-1.0 range)
-        np.random.seed(hash(team) % 2**32)
-        rating = np.random.normal(0.5, 0.15)
-        rating = max(0.0, min(1.0, rating))
-        np.random.seed(None)
-        
-        self.team_defensive_ratings[team] = rating
-        return rating
+        team = str(team)
+        if team not in self.team_defensive_ratings:
+            self.load_team_defensive_ratings([team])
+        return self.team_defensive_ratings[team]
     
     def get_position_defensive_quality(self, team, position):
         """Get defensive quality at specific position"""
@@ -61,10 +74,8 @@ class DefensivePositionsFactorAnalyzer:
             return self.position_defensive_quality[key]
         
         # Generate synthetic position-specific quality
-        np.random.seed(hash(key) % 2**32)
-        quality = np.random.normal(0.5, 0.2)
+        quality = keyed_normal(str(team), str(position), mean=0.5, std=0.2, salt='position_defense')
         quality = max(0.0, min(1.0, quality))
-        np.random.seed(None)
         
         self.position_defensive_quality[key] = quality
         return quality
@@ -72,10 +83,11 @@ class DefensivePositionsFactorAnalyzer:
     def get_shift_tendency(self, team, batter_hand):
         """Get team's shift tendency against LHB/RHB"""
         # Generate synthetic shift tendency (0.0-1.0, higher = more shifts)
-        np.random.seed(hash(f"{team}_{batter_hand}") % 2**32)
-        shift_rate = np.random.beta(2, 3)  # Skewed toward moderate shifting
-        np.random.seed(None)
-        return shift_rate
+        key = (str(team), batter_hand)
+        if key not in self.shift_tendencies:
+            # Beta(2, 3): skewed toward moderate shifting
+            self.shift_tendencies[key] = keyed_beta(key[0], key[1], a=2, b=3, salt='shift')
+        return self.shift_tendencies[key]
     
     def calculate_defensive_impact(self, position, opponent_team, batter_hand, 
                                    team_def_rating, pos_def_quality, shift_tendency):
@@ -114,19 +126,33 @@ class DefensivePositionsFactorAnalyzer:
         }
         return opportunity_multiplier.get(position, 1.0)
     
+    def load_batter_handedness(self, player_names):
+        """Synthetic batting side for many players (same draw as the platoon factor)"""
+        names = pd.unique(pd.Series(player_names, dtype=object).astype(str))
+        if len(names) == 0:
+            return
+        rand = keyed_uniform(names, salt='bats')
+        bats = np.where(rand < 0.25, 'L', np.where(rand < 0.35, 'S', 'R'))
+        self.batter_handedness.update(zip(names, bats.tolist()))
+    
     def get_batter_handedness(self, player_name):
         """Get batter handedness"""
-        np.random.seed(hash(player_name) % 2**32)
-        rand = np.random.random()
-        bats = 'L' if rand < 0.25 else ('S' if rand < 0.35 else 'R')
-        np.random.seed(None)
-        return bats
+        name = str(player_name)
+        if name not in self.batter_handedness:
+            self.load_batter_handedness([name])
+        return self.batter_handedness[name]
     
     def analyze(self, games_df, game_logs_df, roster_df):
         """Analyze defensive position matchups"""
         results = []
         
-        for _, game in games_df.iterrows():
+        # Synthetic ratings/handedness for every team and player in two keyed draws
+        if {'home_team', 'away_team'}.issubset(games_df.columns):
+            self.load_team_defensive_ratings(pd.concat([games_df['home_team'], games_df['away_team']]))
+        if 'player_name' in roster_df.columns:
+            self.load_batter_handedness(roster_df['player_name'])
+        
+        for game, player in iter_player_games(games_df, roster_df):
             game_date = game['game_date']
             opponent = game.get('opponent', 'UNK')
             _ = game.get('is_home', True)
@@ -134,72 +160,70 @@ class DefensivePositionsFactorAnalyzer:
             # Get opponent's defensive rating
             team_def_rating = self.get_team_defensive_rating(opponent)
             
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
-                position = player.get('position', 'OF')
+            player_name = player['player_name']
+            position = player.get('position', 'OF')
                 
-                # Skip pitchers (they're not affected by fielding positions)
-                if position in ['SP', 'RP', 'P']:
-                    continue
+            # Skip pitchers (they're not affected by fielding positions)
+            if position in ['SP', 'RP', 'P']:
+                continue
                 
-                # Get player handedness
-                batter_hand = self.get_batter_handedness(player_name)
+            # Get player handedness
+            batter_hand = self.get_batter_handedness(player_name)
                 
-                # Get position-specific defensive quality
-                pos_def_quality = self.get_position_defensive_quality(opponent, position)
+            # Get position-specific defensive quality
+            pos_def_quality = self.get_position_defensive_quality(opponent, position)
                 
-                # Get shift tendency
-                shift_tendency = self.get_shift_tendency(opponent, batter_hand)
+            # Get shift tendency
+            shift_tendency = self.get_shift_tendency(opponent, batter_hand)
                 
-                # Calculate defensive impact
-                defensive_impact = self.calculate_defensive_impact(
-                    position, opponent, batter_hand,
-                    team_def_rating, pos_def_quality, shift_tendency
-                )
+            # Calculate defensive impact
+            defensive_impact = self.calculate_defensive_impact(
+                position, opponent, batter_hand,
+                team_def_rating, pos_def_quality, shift_tendency
+            )
                 
-                # Adjust for defensive opportunity
-                opportunity_mult = self.get_expected_at_bats_by_position(position)
-                final_score = defensive_impact * opportunity_mult
+            # Adjust for defensive opportunity
+            opportunity_mult = self.get_expected_at_bats_by_position(position)
+            final_score = defensive_impact * opportunity_mult
                 
-                # Determine defensive quality category
-                if team_def_rating > 0.65:
-                    def_quality = "Strong"
-                elif team_def_rating < 0.35:
-                    def_quality = "Weak"
-                else:
-                    def_quality = "Average"
+            # Determine defensive quality category
+            if team_def_rating > 0.65:
+                def_quality = "Strong"
+            elif team_def_rating < 0.35:
+                def_quality = "Weak"
+            else:
+                def_quality = "Average"
                 
-                # Position-specific notes
-                if pos_def_quality > 0.7:
-                    pos_note = "Elite defender"
-                elif pos_def_quality < 0.3:
-                    pos_note = "Weak defender"
-                else:
-                    pos_note = "Average defender"
+            # Position-specific notes
+            if pos_def_quality > 0.7:
+                pos_note = "Elite defender"
+            elif pos_def_quality < 0.3:
+                pos_note = "Weak defender"
+            else:
+                pos_note = "Average defender"
                 
-                results.append({
-                    'player_name': player_name,
-                    'game_date': game_date,
-                    'position': position,
-                    'opponent': opponent,
-                    'batter_hand': batter_hand,
-                    'team_def_rating': team_def_rating,
-                    'pos_def_quality': pos_def_quality,
-                    'shift_tendency': shift_tendency,
-                    'score': final_score,
-                    'def_quality': def_quality,
-                    'position_note': pos_note,
-                    'opportunity_mult': opportunity_mult
-                })
+            results.append({
+                'player_name': player_name,
+                'game_date': game_date,
+                'position': position,
+                'opponent': opponent,
+                'batter_hand': batter_hand,
+                'team_def_rating': team_def_rating,
+                'pos_def_quality': pos_def_quality,
+                'shift_tendency': shift_tendency,
+                'score': final_score,
+                'def_quality': def_quality,
+                'position_note': pos_note,
+                'opportunity_mult': opportunity_mult
+            })
         
         return pd.DataFrame(results)
     
-    def analyze_roster(self, roster_df, schedule_df, teams_df):
+    def analyze_roster(self, roster_df, schedule_df, teams_df, context=None):
         """Wrapper for analyze to match interface"""
-        # Load game logs
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            game_logs_df = pd.read_csv(game_logs_file)
+        # Load game logs from the shared context or store
+        if context is not None:
+            game_logs_df = context.game_logs
         else:
-            game_logs_df = pd.DataFrame()
+            game_logs_df = load_gamelogs(self.data_dir)
         return self.analyze(schedule_df, game_logs_df, roster_df)
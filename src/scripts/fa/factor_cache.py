@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Factor Result Cache
+
+Re-running fb-ai on the same day used to recompute all 20 factors even when
+nothing they read had changed. Each factor's result is now stored under a key
+built from everything that result depends on, so a re-run only recomputes
+the factors whose inputs actually changed.
+
+Key Concepts:
+- Key: sha256 of (factor, code version, as-of date, target window, schedule
+  and game log season, content hash of every input the factor declares in FACTOR_INPUTS)
+- Code version: CACHE_VERSION plus the source of the analyzer module and of
+  the shared fa helpers (SHARED_MODULES) - editing an analyzer invalidates
+  only that factor
+- Input hashes: the roster frame being analyzed (always), and sha256 of the
+  data files behind each declared input (INPUT_FILES); file hashes are
+  memoized by size/mtime in file_hashes.json so unchanged files are not
+  re-read. A weather-only change therefore recomputes wind, temperature and
+  humidity and nothing else
+- Entries: one pickled DataFrame per key under data/factor_cache/<factor>/;
+  a hit refreshes the entry's mtime (last use)
+- Eviction: entries unused for MAX_AGE_DAYS are deleted, then the least
+  recently used ones until the cache is under MAX_CACHE_MB
+- FB_AI_FACTOR_CACHE=0 or --no-cache (run_all_fa.py / daily_sitstart.py /
+  fb-ai) disables it; counters (hits, misses, stored, evicted) are printed
+  in the run summary
+
+Usage:
+    from scripts.fa.factor_cache import get_factor_cache
+
+    cache = get_factor_cache(data_dir)
+    key = cache.key('wind', WindAnalyzer, context, roster_df)
+    df = cache.get('wind', key)
+    if df is None:
+        df = analyzer.analyze_roster(...)
+        cache.put('wind', key, df)
+    print(cache.summary())
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    from .gamelog_store import PARTITION_ROOT
+    from .bullpen_usage import USAGE_FILE
+except ImportError:
+    from gamelog_store import PARTITION_ROOT
+    from bullpen_usage import USAGE_FILE
+
+
+# Bump to drop every cached factor result (e.g. output format changes)
+CACHE_VERSION = 1
+
+CACHE_DIRNAME = "factor_cache"
+MAX_CACHE_MB = 256
+MAX_AGE_DAYS = 7
+
+# Helper modules every analyzer result can depend on
+SHARED_MODULES = ('data_context.py', 'schedule_index.py', 'gamelog_store.py',
+                  'history_index.py', 'bullpen_usage.py', 'keyed_random.py')
+
+# Inputs each factor reads besides the roster (schedule file, context frames,
+# files the analyzer opens itself; 'clock' = analyzers that use today's date)
+FACTOR_INPUTS = {
+    'wind': ('schedule', 'weather'),
+    'matchup': ('schedule', 'players', 'game_logs'),
+    'home_away': ('schedule', 'players', 'game_logs'),
+    'rest': ('schedule', 'game_logs'),
+    'injury': ('schedule', 'players', 'game_logs'),
+    'umpire': ('schedule', 'game_logs'),
+    'platoon': ('schedule', 'players', 'game_logs'),
+    'temperature': ('schedule', 'weather'),
+    'pitch_mix': ('schedule', 'players', 'game_logs'),
+    'park': ('schedule', 'teams'),
+    'lineup': ('schedule', 'players'),
+    'time': ('schedule', 'players'),
+    'defense': ('schedule', 'teams', 'game_logs'),
+    'recent_form': ('schedule', 'players', 'game_logs'),
+    'bullpen': ('schedule', 'players', 'bullpen_usage'),
+    'humidity': ('schedule', 'weather'),
+    'monthly': ('schedule', 'players', 'game_logs', 'clock'),
+    'momentum': ('schedule', 'teams', 'team_game_logs', 'clock'),
+    'statcast': ('schedule', 'players', 'game_logs'),
+    'vegas': ('schedule', 'players', 'game_logs'),
+}
+
+# Declared input -> data files behind it (relative to data_dir)
+INPUT_FILES = {
+    'schedule': lambda context: [context.schedule_file()],
+    'weather': lambda context: [context.data_dir / "mlb_stadium_weather.csv"],
+    'players': lambda context: [context.data_dir / "mlb_all_players_complete.csv"],
+    'teams': lambda context: [context.data_dir / "mlb_all_teams.csv"],
+    'game_logs': lambda context: (sorted(context.data_dir.glob("mlb_game_logs_*.csv"))
+                                  + sorted((context.data_dir / PARTITION_ROOT).glob("*/*/*.csv"))),
+    'bullpen_usage': lambda context: [context.data_dir / USAGE_FILE],
+    'team_game_logs': lambda context: sorted(context.data_dir.glob("team_gamelogs_*.csv")),
+}
+
+# Process-wide caches: resolved cache dir -> FactorCache
+_CACHES = {}
+
+
+def frame_hash(df):
+    """Content hash of a DataFrame (columns, dtypes and values; index ignored)"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(c), str(t)] for c, t in df.dtypes.items()]).encode())
+    if len(df):
+        digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+class FactorCache:
+    """Disk-backed factor results keyed by code version and input content"""
+
+    COUNTERS = ('hits', 'misses', 'stored', 'evicted')
+
+    def __init__(self, cache_dir, enabled=None, max_mb=MAX_CACHE_MB, max_age_days=MAX_AGE_DAYS):
+        """
+        Args:
+            cache_dir: Where entries live (normally data/factor_cache)
+            enabled: Force on/off (default: FB_AI_FACTOR_CACHE env, on)
+            max_mb: Size limit enforced by evict()
+            max_age_days: Entries unused for longer are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        if enabled is None:
+            enabled = os.environ.get('FB_AI_FACTOR_CACHE', '1') != '0'
+        self.enabled = enabled
+        self.max_bytes = max_mb * 1024 * 1024
+        self.max_age = max_age_days * 86400
+        self.stats = dict.fromkeys(self.COUNTERS, 0)
+        self.recomputed = []
+        self._code_versions = {}
+        self._file_hashes = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def code_version(self, analyzer_cls):
+        """Hash of CACHE_VERSION, the analyzer's module and the shared helpers"""
+        source = Path(inspect.getfile(analyzer_cls))
+        if source not in self._code_versions:
+            digest = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+            for path in [source] + [source.parent / name for name in SHARED_MODULES]:
+                if path.exists():
+                    digest.update(path.name.encode())
+                    digest.update(path.read_bytes())
+            self._code_versions[source] = digest.hexdigest()
+        return self._code_versions[source]
+
+    def _hash_index_path(self):
+        return self.cache_dir / "file_hashes.json"
+
+    def file_hash(self, path):
+        """sha256 of a data file ('missing' if absent), memoized by size/mtime"""
+        path = Path(path)
+        if not path.exists():
+            return 'missing'
+        with self._lock:
+            if self._file_hashes is None:
+                try:
+                    with open(self._hash_index_path(), 'r') as f:
+                        self._file_hashes = json.load(f)
+                except (OSError, ValueError):
+                    self._file_hashes = {}
+            stat = path.stat()
+            known = self._file_hashes.get(str(path))
+            if known and known[:2] == [stat.st_size, stat.st_mtime_ns]:
+                return known[2]
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        with self._lock:
+            self._file_hashes[str(path)] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+        return digest.hexdigest()
+
+    def input_hashes(self, factor, context, roster_df):
+        """{input name: content hash} for the inputs a factor declares (plus the roster)"""
+        hashes = {'roster': frame_hash(roster_df)}
+        for name in FACTOR_INPUTS.get(factor, tuple(INPUT_FILES)):
+            if name == 'clock':
+                hashes[name] = date.today().isoformat()
+                continue
+            files = INPUT_FILES[name](context)
+            hashes[name] = [[Path(p).name, self.file_hash(p)] for p in files]
+        return hashes
+
+    def key(self, factor, analyzer_cls, context, roster_df):
+        """Cache key for one factor over one roster in a context"""
+        raw = json.dumps([
+            factor,
+            self.code_version(analyzer_cls),
+            context.as_of_date.strftime('%Y-%m-%d'),
+            context.target_days,
+            context.schedule_season,
+            context.gamelog_season,
+            self.input_hashes(factor, context, roster_df),
+        ], sort_keys=True)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def _path(self, factor, key):
+        return self.cache_dir / factor / f"{key}.pkl"
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self.stats[name] += amount
+
+    def get(self, factor, key):
+        """Cached result DataFrame (None on a miss or when disabled)"""
+        if not self.enabled:
+            return None
+        path = self._path(factor, key)
+        try:
+            df = pd.read_pickle(path)
+        except (OSError, EOFError, ValueError, ImportError, AttributeError, pickle.UnpicklingError):
+            self._count('misses')
+            with self._lock:
+                self.recomputed.append(factor)
+            return None
+        os.utime(path)  # last use, for LRU eviction
+        self._count('hits')
+        return df
+
+    def put(self, factor, key, df):
+        """Store a factor result atomically"""
+        if not self.enabled or df is None:
+            return None
+        path = self._path(factor, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        df.to_pickle(tmp)
+        tmp.replace(path)
+        self._count('stored')
+        return path
+
+    def save_file_hashes(self):
+        """Persist the size/mtime -> sha256 memo"""
+        if not self.enabled or self._file_hashes is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._hash_index_path()
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with self._lock:
+            known = {p: v for p, v in self._file_hashes.items() if Path(p).exists()}
+        with open(tmp, 'w') as f:
+            json.dump(known, f)
+        tmp.replace(path)
+
+    def evict(self):
+        """Delete entries unused for max_age, then least recently used ones over max_bytes"""
+        if not self.enabled or not self.cache_dir.exists():
+            return 0
+        now = time.time()
+        entries = []
+        for path in self.cache_dir.glob("*/*.pkl"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        removed = 0
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in sorted(entries, key=lambda e: e[0]):
+            if now - mtime <= self.max_age and total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        self._count('evicted', removed)
+        return removed
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def summary(self):
+        """One-line counter summary since the cache was created"""
+        if not self.enabled:
+            return "disabled"
+        stats = self.stats
+        text = (f"{stats['hits']} hits, {stats['misses']} recomputed, "
+                f"{stats['stored']} stored, {stats['evicted']} evicted")
+        if self.recomputed and stats['hits']:
+            text += f" (recomputed: {', '.join(dict.fromkeys(self.recomputed))})"
+        return text
+
+
+def get_factor_cache(data_dir):
+    """Process-wide FactorCache for data_dir/factor_cache"""
+    path = (Path(data_dir) / CACHE_DIRNAME).resolve()
+    cache = _CACHES.get(path)
+    if cache is None:
+        cache = FactorCache(path)
+        _CACHES[path] = cache
+    return cache
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+All-Players Factor Manifest and Roster Projection
+
+The all-players factor run already scores every MLB player, so the roster
+run can be a filter + join of those results instead of a second pass over
+all 20 analyzers. This module records what an all-players run was computed
+from and projects roster results out of it.
+
+Key Concepts:
+- Manifest (data/factor_manifest_all_players.json): as-of date, target
+  window, input signature and the output file of every factor
+- Input signature: name/size/mtime of every data file the analyzers can read
+  (factor outputs, recommendation exports and Yahoo roster exports excluded)
+  plus the game log partitions; any change invalidates the manifest
+- Analyzers score each roster row on its own from a few columns (name, team,
+  and for some factors position / player_id - ROSTER_INPUTS), so a roster
+  row whose inputs equal an all-players row gets exactly that row's results
+- Rows that do not match (e.g. Yahoo position 'SP' vs 'Pitcher', names
+  shared by two MLB players) are returned as a residual to analyze directly
+
+Usage:
+    from scripts.fa.factor_manifest import input_signature, load_manifest, project_factor
+
+    manifest = load_manifest(context, input_signature(data_dir))
+    projected, residual = project_factor('wind', roster_df, all_players_df, output_df)
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    from .gamelog_store import PARTITION_ROOT
+    from .score_matrix import FACTOR_FILES
+except ImportError:
+    from gamelog_store import PARTITION_ROOT
+    from score_matrix import FACTOR_FILES
+
+
+MANIFEST_FILE = "factor_manifest_all_players.json"
+
+# Factors that read the roster position (pitcher checks, position tables)
+POSITION_FACTORS = {'wind', 'umpire', 'temperature', 'pitch_mix', 'park', 'lineup',
+                    'time', 'defense', 'platoon'}
+# Factors that look players up by player_id when the roster has one
+ID_FACTORS = {'statcast', 'vegas'}
+
+# Data files written by factor/sit-start runs (never analyzer inputs)
+OUTPUT_PATTERNS = ([f"{prefix}_*.csv" for prefix in FACTOR_FILES.values()]
+                   + ["sitstart_recommendations_*.csv", "yahoo_fantasy_rosters_*.csv", "yahoo_roster_*.csv"])
+
+
+def roster_input_columns(factor):
+    """Roster columns a factor's results depend on (besides the schedule/data files)"""
+    columns = ['player_name', 'team']
+    if factor in POSITION_FACTORS:
+        columns.append('position')
+    if factor in ID_FACTORS:
+        columns.append('player_id')
+    return columns
+
+
+def input_signature(data_dir):
+    """{file: [size, mtime_ns]} for every analyzer input under data_dir"""
+    data_dir = Path(data_dir)
+    outputs = {p for pattern in OUTPUT_PATTERNS for p in data_dir.glob(pattern)}
+    files = [p for p in data_dir.glob("*.csv") if p not in outputs]
+    files += list((data_dir / PARTITION_ROOT).glob("*/*/*.csv"))
+    signature = {}
+    for path in sorted(files):
+        stat = path.stat()
+        signature[str(path.relative_to(data_dir))] = [stat.st_size, stat.st_mtime_ns]
+    return signature
+
+
+def _window(context):
+    return {
+        'as_of_date': context.as_of_date.strftime('%Y-%m-%d'),
+        'target_days': context.target_days,
+        'schedule_season': context.schedule_season,
+        'gamelog_season': context.gamelog_season,
+    }
+
+
+def write_manifest(context, signature, files, timestamp):
+    """Record a finished all-players run (files: factor -> output path)"""
+    manifest = {
+        **_window(context),
+        'timestamp': timestamp,
+        'written_at': datetime.now().isoformat(timespec='seconds'),
+        'inputs': signature,
+        'files': {factor: Path(path).name for factor, path in files.items()},
+    }
+    path = Path(context.data_dir) / MANIFEST_FILE
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=1)
+    tmp.replace(path)
+    return path
+
+
+def load_manifest(context, signature):
+    """
+    All-players manifest usable for this context, else None
+
+    Usable means: same as-of date, window and schedule season, identical
+    input signature, and every listed output file still present.
+    """
+    path = Path(context.data_dir) / MANIFEST_FILE
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if any(manifest.get(k) != v for k, v in _window(context).items()):
+        print("  ℹ️  All-players results are for another date/window - analyzing roster directly")
+        return None
+    if manifest.get('inputs') != signature:
+        print("  ℹ️  Data changed since the all-players run - analyzing roster directly")
+        return None
+    if not all((Path(context.data_dir) / name).exists() for name in manifest.get('files', {}).values()):
+        print("  ℹ️  All-players output files are missing - analyzing roster directly")
+        return None
+    return manifest
+
+
+def read_factor_output(data_dir, name):
+    """A factor output CSV (empty frame for files with no columns)"""
+    try:
+        return pd.read_csv(Path(data_dir) / name)
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame()
+
+
+def _input_keys(df, columns):
+    """One string key per row over the roster input columns"""
+    parts = []
+    for col in columns:
+        if col == 'team':
+            team = df['team'] if 'team' in df.columns else pd.Series('', index=df.index)
+            fallback = df['mlb_team'] if 'mlb_team' in df.columns else pd.Series('', index=df.index)
+            team = team.astype(object).where(team.notna() & (team.astype(str) != ''), fallback)
+            values = team.fillna('').astype(str)
+        elif col == 'player_id':
+            values = (pd.to_numeric(df[col], errors='coerce').astype('Int64').astype(str)
+                      if col in df.columns else pd.Series('<NA>', index=df.index))
+        else:
+            values = df[col].astype(object).fillna('').astype(str) if col in df.columns \
+                else pd.Series('', index=df.index)
+        parts.append(values.reset_index(drop=True))
+    keys = parts[0]
+    for part in parts[1:]:
+        keys = keys + '\x1f' + part
+    return keys
+
+
+def project_factor(factor, roster_df, all_players_df, output_df):
+    """
+    Roster results for one factor taken from the all-players results
+
+    Args:
+        factor: Factor key (decides which roster columns must match)
+        roster_df: Roster being analyzed
+        all_players_df: Roster the all-players run analyzed
+        output_df: That run's output for the factor
+
+    Returns:
+        (projected_df, residual_roster_df): result rows of the matched roster
+        players in roster order, and the roster rows still to analyze
+    """
+    columns = roster_input_columns(factor)
+    names = all_players_df['player_name'].astype(str).reset_index(drop=True)
+    unique = ~names.duplicated(keep=False)
+    covered = set(_input_keys(all_players_df, columns)[unique.values])
+
+    matched = _input_keys(roster_df, columns).isin(covered).values
+    residual = roster_df[~matched]
+
+    if output_df.empty or 'player_name' not in output_df.columns:
+        return output_df.iloc[0:0], residual
+
+    order = pd.DataFrame({'player_name': roster_df['player_name'].astype(str).values[matched]})
+    order['_roster_pos'] = [i for i, m in enumerate(matched) if m]
+    columns = output_df.columns
+    output_df = output_df.assign(player_name=output_df['player_name'].astype(str))
+    projected = order.merge(output_df, on='player_name', how='inner')
+    projected = projected.sort_values('_roster_pos', kind='mergesort')
+    return projected[columns].reset_index(drop=True), residual
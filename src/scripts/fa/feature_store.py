@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Historical Factor Feature Store
+
+One row per player per game played: the 20 factor scores the player had
+going into that day and the fantasy points they actually scored. The
+backfill writes it once per date; the weight tuner and the ensemble trainer
+read it instead of recomputing factors (or falling back to placeholders).
+
+Key Concepts:
+- Partitions: data/feature_store/<season>/<YYYY-MM-DD>.csv, one file per
+  game date, same layout idea as the game log partitions (gamelog_store.py)
+- Row key: (player_id, game_pk); rewriting a date replaces its rows for the
+  same keys, so re-running a backfill never duplicates games
+- Columns: KEY_COLUMNS, one <factor>_score per factor (FEATURE_COLUMNS,
+  named after the factor output files: park_factors_score,
+  lineup_position_score, ...) and fantasy_points
+- Reads prune partitions by date range and parse only the requested
+  columns (read_csv usecols), so a 13-factor tuner never parses the rest
+- fantasy_points uses FANTASY_POINTS (the tuner's scoring: 1B 3, 2B 5,
+  3B 8, HR 10, RBI 2, R 2, SB 5, BB 2, SO -1) from the game log row
+
+Usage:
+    from scripts.fa.feature_store import FeatureStore, FEATURE_COLUMNS
+
+    store = FeatureStore(data_dir)
+    store.write('2024-06-01', rows_df)
+    df = store.read(columns=['game_date', 'wind_score', 'fantasy_points'],
+                    start_date='2024-04-01', players=['Aaron Judge'])
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    from .score_matrix import FACTOR_FILES
+except ImportError:
+    from score_matrix import FACTOR_FILES
+
+
+STORE_DIRNAME = "feature_store"
+
+KEY_COLUMNS = ['game_date', 'game_pk', 'player_id', 'player_name', 'team', 'opponent', 'is_home']
+
+# Factor key -> feature column
+FEATURE_COLUMNS = {factor: f"{prefix[:-len('_analysis')]}_score" for factor, prefix in FACTOR_FILES.items()}
+
+TARGET_COLUMN = 'fantasy_points'
+
+# Game log column -> fantasy points per unit ('1B' = H - 2B - 3B - HR)
+FANTASY_POINTS = {
+    '1B': 3, '2B': 5, '3B': 8, 'HR': 10, 'RBI': 2, 'R': 2, 'SB': 5, 'BB': 2, 'SO': -1,
+}
+
+
+def fantasy_points(logs_df):
+    """Fantasy points per game log row (missing stat columns count as 0)"""
+    def stat(col):
+        if col not in logs_df.columns:
+            return pd.Series(0.0, index=logs_df.index)
+        return pd.to_numeric(logs_df[col], errors='coerce').fillna(0)
+
+    singles = stat('H') - stat('2B') - stat('3B') - stat('HR')
+    points = singles * FANTASY_POINTS['1B']
+    for col, value in FANTASY_POINTS.items():
+        if col != '1B':
+            points = points + stat(col) * value
+    return points.astype(float)
+
+
+class FeatureStore:
+    """Date-partitioned table of per player-game factor scores and outcomes"""
+
+    def __init__(self, data_dir):
+        self.data_dir = Path(data_dir)
+        self.root = self.data_dir / STORE_DIRNAME
+
+    @property
+    def columns(self):
+        """Every column a partition holds, in order"""
+        return KEY_COLUMNS + list(FEATURE_COLUMNS.values()) + [TARGET_COLUMN]
+
+    def partition_path(self, date):
+        date = pd.Timestamp(date)
+        return self.root / str(date.year) / f"{date.strftime('%Y-%m-%d')}.csv"
+
+    def has_date(self, date):
+        return self.partition_path(date).exists()
+
+    def partitions(self, start_date=None, end_date=None):
+        """Partition files with start_date <= date <= end_date, in date order"""
+        if not self.root.exists():
+            return []
+        start = pd.Timestamp(start_date).strftime('%Y-%m-%d') if start_date is not None else None
+        end = pd.Timestamp(end_date).strftime('%Y-%m-%d') if end_date is not None else None
+        files = []
+        for path in sorted(self.root.glob("*/*.csv"), key=lambda p: p.stem):
+            if (start and path.stem < start) or (end and path.stem > end):
+                continue
+            files.append(path)
+        return files
+
+    def write(self, date, rows_df):
+        """
+        Upsert one date's rows (same player_id + game_pk: new row wins)
+
+        Returns:
+            Partition file written (None when rows_df is empty)
+        """
+        if rows_df is None or rows_df.empty:
+            return None
+        rows = rows_df.reindex(columns=self.columns)
+        path = self.partition_path(date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            existing = pd.read_csv(path)
+            keys = set(zip(rows['player_id'], rows['game_pk']))
+            keep = [k not in keys for k in zip(existing['player_id'], existing['game_pk'])]
+            rows = pd.concat([existing[keep], rows], ignore_index=True).reindex(columns=self.columns)
+        rows = rows.sort_values(['game_pk', 'player_id'], kind='mergesort')
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        rows.to_csv(tmp, index=False)
+        tmp.replace(path)
+        return path
+
+    def read(self, columns=None, start_date=None, end_date=None, players=None):
+        """
+        Rows in a date range, parsing only the requested columns
+
+        Args:
+            columns: Columns to return (default: all)
+            start_date / end_date: Inclusive game date bounds
+            players: Only rows for these player names
+
+        Returns:
+            DataFrame with game_date parsed (when requested), in date order
+        """
+        wanted = list(columns) if columns is not None else self.columns
+        usecols = list(dict.fromkeys(wanted + (['player_name'] if players is not None else [])))
+        names = set(players) if players is not None else None
+
+        frames = []
+        for path in self.partitions(start_date, end_date):
+            df = pd.read_csv(path, usecols=lambda c: c in usecols)
+            if names is not None:
+                df = df[df['player_name'].isin(names)]
+            if len(df):
+                frames.append(df)
+        if not frames:
+            return pd.DataFrame(columns=wanted)
+
+        df = pd.concat(frames, ignore_index=True).reindex(columns=wanted)
+        if 'game_date' in df.columns:
+            df['game_date'] = pd.to_datetime(df['game_date'])
+        return df
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Indexed Columnar Game Log Store
+
+Shared, read-only view of the per-player game logs used by every factor
+analyzer. The season CSV (mlb_game_logs_YYYY.csv) is parsed once, sorted by
+(player_id, game_date), converted to compact dtypes and written out as a
+directory of NumPy column files. Later loads memory-map those columns instead
+of re-parsing the CSV, and a process-wide cache means each season is opened
+at most once per process no matter how many analyzers ask for it.
+
+Key Concepts:
+- Columnar cache: one .npy file per column under data/gamelog_store/<season>/,
+  string columns stored as int32 category codes (categories in meta.json)
+- Player index: sorted player_ids + row offsets, so a player's games are a
+  contiguous row range [start, stop)
+- Name index: player_name -> player_ids (analyzers key rosters by name)
+- Date index: stable argsort of game_date for "all rows between dates" lookups
+- Partitions: incremental ingests (boxscore deltas) land in per-date files
+  under data/game_logs/<season>/batting/<date>.csv instead of rewriting the
+  season CSV; the store merges them over the CSV (same player_id + game_pk:
+  the partition row wins)
+- Invalidation: cache is rebuilt when the source CSV or any partition
+  size/mtime changes
+- Concurrency: checking, rebuilding and mapping a season's store happen
+  under an exclusive lock file (gamelog_store/<season>.lock), so fb-ai, a
+  backfill and pool workers never rebuild it at the same time; a build
+  writes to a per-process temp directory that is renamed into place
+
+Usage:
+    from scripts.fa.gamelog_store import get_gamelog_store
+
+    store = get_gamelog_store(data_dir, season=2024)
+    if store.exists:
+        logs = store.frame                       # full typed DataFrame
+        judge = store.player_rows('Aaron Judge')  # one player's games
+        window = store.rows_between('2024-09-01', '2024-09-30')
+"""
+
+import contextlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: store builds are not serialized across processes
+    fcntl = None
+
+
+STORE_VERSION = 2
+DEFAULT_SEASON = 2024
+
+# Columns that are always stored as category codes even if they look numeric
+CATEGORICAL_COLUMNS = {'player_name', 'opponent', 'team', 'position'}
+
+# Per-date partitions written by incremental ingestion
+PARTITION_ROOT = "game_logs"
+
+# Process-wide cache: (resolved data_dir, season) -> GameLogStore
+_STORES = {}
+
+
+class GameLogStore:
+    """Memory-mapped, player/date indexed game logs for one season"""
+
+    def __init__(self, data_dir, season=DEFAULT_SEASON):
+        self.data_dir = Path(data_dir)
+        self.season = int(season)
+        self.source_file = self.data_dir / f"mlb_game_logs_{self.season}.csv"
+        self.store_dir = self.data_dir / "gamelog_store" / str(self.season)
+
+        self.columns = {}
+        self.categories = {}
+        self.player_ids = np.array([], dtype=np.int64)
+        self.player_offsets = np.array([0], dtype=np.int64)
+        self.date_order = np.array([], dtype=np.int64)
+        self._name_index = {}
+        self._sorted_dates = None
+        self._frame = None
+        self._signature = None
+
+        self._open()
+
+    # ------------------------------------------------------------------
+    # Build / load
+    # ------------------------------------------------------------------
+
+    def _source_signature(self):
+        """Size and mtime of the source CSV and partitions (None when neither exists)"""
+        partitions = partition_files(self.data_dir, self.season)
+        if not self.source_file.exists() and not partitions:
+            return None
+        signature = {'partitions': [[p.name, p.stat().st_size, p.stat().st_mtime_ns]
+                                    for p in partitions]}
+        if self.source_file.exists():
+            stat = self.source_file.stat()
+            signature.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        return signature
+
+    def is_stale(self):
+        """True when the source CSV changed since this store was opened"""
+        return self._source_signature() != self._signature
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Exclusive cross-process lock on this season's store directory"""
+        self.store_dir.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.store_dir.with_name(f"{self.store_dir.name}.lock"), 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield  # released when the lock file is closed
+
+    def _open(self):
+        """Load the columnar cache, rebuilding it from CSV when needed"""
+        self._signature = self._source_signature()
+        if self._signature is None:
+            return
+
+        with self._locked():
+            meta_file = self.store_dir / "meta.json"
+            meta = None
+            if meta_file.exists():
+                try:
+                    with open(meta_file, 'r') as f:
+                        meta = json.load(f)
+                except (OSError, ValueError):
+                    meta = None
+
+            if (meta is None or meta.get('version') != STORE_VERSION
+                    or meta.get('source') != self._signature):
+                meta = self._build()
+
+            self._load(meta)
+
+    def _build(self):
+        """Parse the CSV (+ partitions) once and write sorted, typed column files"""
+        frames = [pd.read_csv(self.source_file)] if self.source_file.exists() else []
+        partitions = read_partitions(self.data_dir, self.season)
+        if len(partitions):
+            frames.append(partitions)
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        if len(partitions) and 'game_pk' in df.columns and 'player_id' in df.columns:
+            df = df.drop_duplicates(['player_id', 'game_pk'], keep='last')
+        df['game_date'] = pd.to_datetime(df['game_date'])
+
+        if 'player_id' not in df.columns:
+            # Older scrapes only carry names; give each name a stable id
+            df['player_id'] = pd.factorize(df['player_name'], sort=True)[0]
+        df['player_id'] = df['player_id'].astype(np.int64)
+
+        df = df.sort_values(['player_id', 'game_date'], kind='mergesort')
+        df = df.reset_index(drop=True)
+
+        tmp_dir = self.store_dir.with_name(f"{self.store_dir.name}.{os.getpid()}.tmp")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir(parents=True)
+
+        columns = []
+        categories = {}
+        for col in df.columns:
+            values, cats = self._encode_column(col, df[col])
+            fname = f"col_{len(columns):03d}.npy"
+            np.save(tmp_dir / fname, values)
+            columns.append({'name': col, 'file': fname, 'dtype': str(values.dtype)})
+            if cats is not None:
+                categories[col] = cats
+
+        # Player offset index
+        pid = df['player_id'].to_numpy()
+        starts = np.flatnonzero(np.r_[True, pid[1:] != pid[:-1]]) if len(pid) else np.array([], dtype=np.int64)
+        np.save(tmp_dir / "player_ids.npy", pid[starts].astype(np.int64))
+        np.save(tmp_dir / "player_offsets.npy", np.r_[starts, len(pid)].astype(np.int64))
+
+        # Date index
+        dates = df['game_date'].to_numpy(dtype='datetime64[ns]')
+        np.save(tmp_dir / "date_order.npy", np.argsort(dates, kind='stable').astype(np.int64))
+
+        meta = {
+            'version': STORE_VERSION,
+            'season': self.season,
+            'rows': int(len(df)),
+            'source': self._signature,
+            'columns': columns,
+            'categories': categories,
+        }
+        with open(tmp_dir / "meta.json", 'w') as f:
+            json.dump(meta, f)
+
+        # Swap by renames; maps of the old files stay valid until unmapped
+        old_dir = self.store_dir.with_name(f"{self.store_dir.name}.{os.getpid()}.old")
+        shutil.rmtree(old_dir, ignore_errors=True)
+        if self.store_dir.exists():
+            os.replace(self.store_dir, old_dir)
+        os.replace(tmp_dir, self.store_dir)
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+        n_parts = len(self._signature.get('partitions', []))
+        source = self.source_file.name + (f" + {n_parts} partitions" if n_parts else "")
+        print(f"✓ Built game log store: {len(df):,} rows, "
+              f"{len(starts):,} players ({source})")
+        return meta
+
+    @staticmethod
+    def _encode_column(col, series):
+        """Convert a column to a compact NumPy array (+ categories if coded)"""
+        if col == 'game_date':
+            return series.to_numpy(dtype='datetime64[ns]'), None
+
+        if col in CATEGORICAL_COLUMNS or series.dtype == object:
+            codes, uniques = pd.factorize(series.astype('string'), sort=True)
+            return codes.astype(np.int32), [str(u) for u in uniques]
+
+        if pd.api.types.is_bool_dtype(series):
+            return series.to_numpy(dtype=bool), None
+
+        if pd.api.types.is_integer_dtype(series):
+            values = series.to_numpy()
+            if len(values) == 0 or (values.min() >= np.iinfo(np.int32).min
+                                    and values.max() <= np.iinfo(np.int32).max):
+                return values.astype(np.int32), None
+            return values.astype(np.int64), None
+
+        return series.to_numpy(dtype=np.float64), None
+
+    def _load(self, meta):
+        """Memory-map every column and index array"""
+        self.categories = meta.get('categories', {})
+        self.columns = {
+            c['name']: np.load(self.store_dir / c['file'], mmap_mode='r')
+            for c in meta['columns']
+        }
+        self.player_ids = np.load(self.store_dir / "player_ids.npy", mmap_mode='r')
+        self.player_offsets = np.load(self.store_dir / "player_offsets.npy", mmap_mode='r')
+        self.date_order = np.load(self.store_dir / "date_order.npy", mmap_mode='r')
+
+        # player_name -> [player_id, ...] taken from each player's first row
+        self._name_index = {}
+        if 'player_name' in self.columns and len(self.player_ids):
+            name_cats = self.categories['player_name']
+            first_codes = np.asarray(self.columns['player_name'])[self.player_offsets[:-1]]
+            for pid, code in zip(self.player_ids.tolist(), first_codes.tolist()):
+                if code >= 0:
+                    self._name_index.setdefault(name_cats[code], []).append(pid)
+
+    # ------------------------------------------------------------------
+    # Accessors
+    # ------------------------------------------------------------------
+
+    @property
+    def exists(self):
+        """True when game logs are available for this season"""
+        return len(self) > 0
+
+    def __len__(self):
+        return int(self.player_offsets[-1]) if len(self.player_offsets) else 0
+
+    def _materialize(self, rows=None):
+        """Build a DataFrame from the column arrays (optionally a row subset)"""
+        data = {}
+        for name, values in self.columns.items():
+            arr = values if rows is None else values[rows]
+            if name in self.categories:
+                data[name] = pd.Categorical.from_codes(
+                    np.asarray(arr), categories=self.categories[name]
+                )
+            else:
+                data[name] = np.asarray(arr)
+        return pd.DataFrame(data)
+
+    @property
+    def frame(self):
+        """Full season DataFrame (shared; callers get a shallow copy)"""
+        if self._frame is None:
+            self._frame = self._materialize()
+        return self._frame.copy(deep=False)
+
+    def player_range(self, player_id):
+        """Row range [start, stop) for a player_id (empty range if unknown)"""
+        i = int(np.searchsorted(self.player_ids, player_id))
+        if i < len(self.player_ids) and self.player_ids[i] == player_id:
+            return int(self.player_offsets[i]), int(self.player_offsets[i + 1])
+        return 0, 0
+
+    def player_ids_for(self, player_name):
+        """All player_ids recorded under a name"""
+        return list(self._name_index.get(player_name, []))
+
+    def player_rows(self, player_name=None, player_id=None):
+        """
+        Game log rows for one player, sorted by game_date
+
+        Args:
+            player_name: Player name as it appears in the game logs
+            player_id: MLB player id (takes precedence over the name)
+
+        Returns:
+            DataFrame (empty if the player has no games)
+        """
+        if player_id is not None and not pd.isna(player_id):
+            ids = [int(player_id)]
+        else:
+            ids = self.player_ids_for(player_name)
+
+        ranges = [self.player_range(pid) for pid in ids]
+        ranges = [r for r in ranges if r[1] > r[0]]
+        if not ranges:
+            return self._materialize(slice(0, 0))
+        if len(ranges) == 1:
+            return self._materialize(slice(*ranges[0]))
+        rows = np.concatenate([np.arange(start, stop) for start, stop in ranges])
+        return self._materialize(rows)
+
+    def rows_between(self, start_date, end_date):
+        """All rows with start_date <= game_date <= end_date"""
+        if self._sorted_dates is None:
+            self._sorted_dates = np.asarray(self.columns['game_date'])[self.date_order]
+        lo = np.searchsorted(self._sorted_dates, np.datetime64(pd.Timestamp(start_date)), side='left')
+        hi = np.searchsorted(self._sorted_dates, np.datetime64(pd.Timestamp(end_date)), side='right')
+        return self._materialize(np.sort(self.date_order[lo:hi]))
+
+
+def partition_dir(data_dir, season, kind='batting'):
+    """Directory holding per-date partition files for a season"""
+    return Path(data_dir) / PARTITION_ROOT / str(int(season)) / kind
+
+
+def partition_files(data_dir, season, kind='batting'):
+    """Sorted partition files (one per game date)"""
+    directory = partition_dir(data_dir, season, kind)
+    return sorted(directory.glob("*.csv")) if directory.exists() else []
+
+
+def has_season(data_dir, season):
+    """True when a season's source CSV or any of its partitions exist"""
+    source = Path(data_dir) / f"mlb_game_logs_{int(season)}.csv"
+    return source.exists() or bool(partition_files(data_dir, season))
+
+
+def read_partitions(data_dir, season, kind='batting', dates=None):
+    """
+    Concatenate partition files
+
+    Args:
+        dates: Only these game dates (default: all partitions)
+    """
+    files = partition_files(data_dir, season, kind)
+    if dates is not None:
+        wanted = {pd.Timestamp(d).strftime('%Y-%m-%d') for d in dates}
+        files = [f for f in files if f.stem in wanted]
+    frames = [pd.read_csv(f) for f in files]
+    frames = [f for f in frames if len(f)]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def write_partitions(data_dir, season, rows_df, game_pks, kind='batting', sort_by=None):
+    """
+    Upsert rows into their per-date partition files
+
+    Rows already stored for any of game_pks in the touched partitions are
+    replaced, so re-ingesting a game never duplicates it. Only the
+    partitions for the rows' dates are rewritten.
+
+    Returns:
+        List of partition files written
+    """
+    directory = partition_dir(data_dir, season, kind)
+    directory.mkdir(parents=True, exist_ok=True)
+    game_pks = set(int(pk) for pk in game_pks)
+    day = pd.to_datetime(rows_df['game_date']).dt.strftime('%Y-%m-%d')
+
+    written = []
+    for date, rows in rows_df.groupby(day, sort=True):
+        path = directory / f"{date}.csv"
+        if path.exists():
+            existing = pd.read_csv(path)
+            existing = existing[~existing['game_pk'].isin(game_pks)]
+            rows = pd.concat([existing, rows], ignore_index=True) if len(existing) else rows
+        if sort_by:
+            rows = rows.sort_values(sort_by, kind='mergesort')
+        tmp_file = path.with_suffix('.csv.tmp')
+        rows.to_csv(tmp_file, index=False)
+        tmp_file.replace(path)
+        written.append(path)
+    return written
+
+
+def get_gamelog_store(data_dir, season=DEFAULT_SEASON):
+    """
+    Return the process-wide GameLogStore for a season
+
+    The store is opened on first use and reused afterwards; it is reopened
+    only when the underlying CSV or partitions changed on disk.
+    """
+    key = (str(Path(data_dir).resolve()), int(season))
+    store = _STORES.get(key)
+    if store is None or store.is_stale():
+        store = GameLogStore(data_dir, season)
+        _STORES[key] = store
+    return store
+
+
+def load_gamelogs(data_dir, season=DEFAULT_SEASON):
+    """Season game logs as a DataFrame (empty when no CSV or partitions exist)"""
+    store = get_gamelog_store(data_dir, season)
+    if not store.exists:
+        return pd.DataFrame()
+    return store.frame
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Cumulative Player History Index
+
+Per-player prefix sums of game log stats (AB, H, HR, BB, ...) ordered by
+game_date, so "totals before date D" or "totals in window [D1, D2)" is two
+binary searches and a subtraction instead of re-filtering the full game log
+frame for every (player, game) pair.
+
+Key Concepts:
+- Rows are grouped by player (player_name by default) and sorted by date;
+  a player's games are the contiguous row range [start, stop)
+- Prefix arrays carry a leading zero: total over rows [i, j) = cum[j] - cum[i]
+- Integer stats stay integer, float stats treat NaN as 0 (pandas sum semantics)
+- Boolean split columns (is_home) add masked prefix sums, exposed as
+  '<split>_games' and '<split>_<stat>' (away = total - home)
+- Windows are half-open: start <= game_date < end (None = unbounded)
+
+Usage:
+    from scripts.fa.history_index import HistoryIndex
+
+    index = HistoryIndex(game_logs_df)
+    before = index.totals_before('Aaron Judge', '2024-07-01')
+    july = index.totals_between('Aaron Judge', '2024-07-01', '2024-08-01')
+    print(before['games'], before['AB'], before['is_home_H'])
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Counting stats indexed by default (only those present in the game logs)
+STAT_COLUMNS = ['AB', 'H', 'R', 'RBI', 'HR', '1B', '2B', '3B', 'BB',
+                'SO', 'SB', 'HBP', 'SF']
+
+# Boolean columns that get their own masked prefix sums
+SPLIT_COLUMNS = ['is_home']
+
+
+class HistoryIndex:
+    """Per-player, date-ordered prefix sums over game log stats"""
+
+    def __init__(self, game_logs_df, key='player_name', columns=None, splits=None):
+        """
+        Args:
+            game_logs_df: Game logs with key, game_date and stat columns
+            key: Column identifying a player (player_name or player_id)
+            columns: Stat columns to index (default: STAT_COLUMNS present)
+            splits: Boolean split columns (default: SPLIT_COLUMNS present)
+        """
+        df = game_logs_df if game_logs_df is not None else pd.DataFrame()
+        self.key = key
+        if columns is None:
+            columns = STAT_COLUMNS
+        if splits is None:
+            splits = SPLIT_COLUMNS
+        self.columns = [c for c in columns if c in df.columns]
+        self.splits = [s for s in splits if s in df.columns]
+
+        if df.empty or key not in df.columns or 'game_date' not in df.columns:
+            self._groups = {}
+            self.offsets = np.zeros(1, dtype=np.int64)
+            self.dates = np.array([], dtype='datetime64[ns]')
+            self._cum = {'games': np.zeros(1, dtype=np.int64)}
+            return
+
+        codes, uniques = pd.factorize(df[key], sort=True)
+        dates = pd.to_datetime(df['game_date']).to_numpy(dtype='datetime64[ns]')
+        order = np.lexsort((dates, codes))
+        codes = codes[order]
+
+        self._groups = {player: i for i, player in enumerate(uniques)}
+        bounds = np.searchsorted(codes, np.arange(len(uniques) + 1), side='left')
+        self.offsets = bounds.astype(np.int64)
+        self.dates = dates[order]
+
+        self._cum = {'games': np.arange(len(order) + 1, dtype=np.int64)}
+        for col in self.columns:
+            self._cum[col] = self._prefix(df[col].to_numpy()[order])
+        for split in self.splits:
+            mask = df[split].fillna(False).to_numpy(dtype=bool)[order]
+            self._cum[f"{split}_games"] = self._prefix(mask.astype(np.int64))
+            for col in self.columns:
+                values = df[col].to_numpy()[order]
+                self._cum[f"{split}_{col}"] = self._prefix(np.where(mask, values, 0))
+
+    @staticmethod
+    def _prefix(values):
+        """Cumulative sum with a leading zero (int kept int, NaN counted as 0)"""
+        if values.dtype.kind in 'biu':
+            values = values.astype(np.int64)
+        else:
+            values = np.nan_to_num(values.astype(np.float64))
+        return np.concatenate(([0], np.cumsum(values))).astype(values.dtype)
+
+    def __contains__(self, player):
+        return player in self._groups
+
+    def __len__(self):
+        return len(self.dates)
+
+    @property
+    def fields(self):
+        """Names available in totals() results"""
+        return list(self._cum)
+
+    def player_range(self, player):
+        """Row range [start, stop) of a player's games (empty if unknown)"""
+        g = self._groups.get(player)
+        if g is None:
+            return 0, 0
+        return int(self.offsets[g]), int(self.offsets[g + 1])
+
+    def player_dates(self, player):
+        """Sorted game dates for a player"""
+        start, stop = self.player_range(player)
+        return self.dates[start:stop]
+
+    def rows(self, player, start_date=None, end_date=None):
+        """Row range [i, j) of a player's games with start_date <= game_date < end_date"""
+        lo, hi = self.player_range(player)
+        dates = self.dates[lo:hi]
+        i, j = lo, hi
+        if start_date is not None:
+            i = lo + int(np.searchsorted(dates, np.datetime64(pd.Timestamp(start_date)), side='left'))
+        if end_date is not None:
+            j = lo + int(np.searchsorted(dates, np.datetime64(pd.Timestamp(end_date)), side='left'))
+        return i, max(i, j)
+
+    def totals(self, player, start_date=None, end_date=None):
+        """
+        Stat totals for a player's games in [start_date, end_date)
+
+        Returns:
+            dict with 'games', one entry per indexed stat and, for each split,
+            '<split>_games' and '<split>_<stat>' (all 0 for unknown players)
+        """
+        i, j = self.rows(player, start_date, end_date)
+        return {name: cum[j] - cum[i] for name, cum in self._cum.items()}
+
+    def totals_before(self, player, date):
+        """Totals over all of a player's games strictly before date"""
+        return self.totals(player, end_date=date)
+
+    def totals_between(self, player, start_date, end_date):
+        """Totals over a player's games with start_date <= game_date < end_date"""
+        return self.totals(player, start_date, end_date)
+
+    def range_sum(self, field, i, j):
+        """Sum of a field over row ranges [i, j) (scalars or arrays)"""
+        cum = self._cum[field]
+        return cum[j] - cum[i]
+
+    def values(self, field):
+        """Per-row values of an indexed field, in index (player, date) order"""
+        return np.diff(self._cum[field])
+
+    def query_rows(self, players, start_dates=None, end_dates=None):
+        """
+        Vectorized rows(): row ranges for many (player, window) queries
+
+        Args:
+            players: Sequence of player keys
+            start_dates / end_dates: Matching sequences (or one value for all
+                                     queries) of window bounds; None/NaT = unbounded
+
+        Returns:
+            (lo, i, j) int64 arrays: player's first row, window start, window end
+        """
+        players = list(players)
+        n = len(players)
+        group = np.array([self._groups.get(p, -1) for p in players], dtype=np.int64)
+        known = group >= 0
+        lo = np.zeros(n, dtype=np.int64)
+        hi = np.zeros(n, dtype=np.int64)
+        lo[known] = self.offsets[group[known]]
+        hi[known] = self.offsets[group[known] + 1]
+
+        i = self._search(group, lo, hi, self._as_dates(start_dates, n), default=lo)
+        j = self._search(group, lo, hi, self._as_dates(end_dates, n), default=hi)
+        return lo, i, np.maximum(i, j)
+
+    @staticmethod
+    def _as_dates(dates, n):
+        """Broadcast window bounds to a datetime64[ns] array of length n"""
+        if dates is None or np.ndim(dates) == 0:
+            dates = [dates] * n
+        return pd.to_datetime(pd.Series(list(dates), dtype=object)).to_numpy(dtype='datetime64[ns]')
+
+    def _search(self, group, lo, hi, dates, default):
+        """lo + searchsorted(player's dates, date) per query, one pass per player"""
+        result = default.copy()
+        bounded = (group >= 0) & ~np.isnat(dates)
+        if not bounded.any():
+            return result
+        queries = np.flatnonzero(bounded)
+        queries = queries[np.argsort(group[queries], kind='stable')]
+        splits = np.flatnonzero(np.diff(group[queries])) + 1
+        for chunk in np.split(queries, splits):
+            start, stop = lo[chunk[0]], hi[chunk[0]]
+            result[chunk] = start + np.searchsorted(self.dates[start:stop], dates[chunk], side='left')
+        return result
+
+    def window_totals(self, players, start_dates=None, end_dates=None):
+        """
+        Totals for many (player, window) queries at once
+
+        Args:
+            players: Sequence of player keys
+            start_dates / end_dates: Matching sequences of window bounds
+                                     (None = unbounded on that side)
+
+        Returns:
+            DataFrame with one row per query and one column per field
+        """
+        _, i, j = self.query_rows(players, start_dates, end_dates)
+        return pd.DataFrame({name: cum[j] - cum[i] for name, cum in self._cum.items()})
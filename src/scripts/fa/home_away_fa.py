@@ -22,6 +22,15 @@ Output:
 import pandas as pd
 from pathlib import Path
 
+try:
+    from .gamelog_store import load_gamelogs
+    from .schedule_index import iter_player_games
+    from .history_index import HistoryIndex
+except ImportError:
+    from gamelog_store import load_gamelogs
+    from schedule_index import iter_player_games
+    from history_index import HistoryIndex
+
 
 class HomeAwayFactorAnalyzer:
     """Analyze home/away venue performance"""
@@ -45,63 +54,60 @@ class HomeAwayFactorAnalyzer:
         
         return max(-2.0, min(2.0, venue_score))
     
-    def analyze(self, games_df, game_logs_df, roster_df, schedule_df):
-        """Analyze home/away advantages"""
+    def analyze(self, games_df, game_logs_df, roster_df, schedule_df, history=None):
+        """Analyze home/away advantages (history: optional prebuilt HistoryIndex)"""
         results = []
+        if history is None:
+            history = HistoryIndex(game_logs_df)
         
-        for _, game in games_df.iterrows():
+        for game, player in iter_player_games(games_df, roster_df):
             game_date = game['game_date']
             
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
+            player_name = player['player_name']
                 
-                # Get player history
-                player_history = game_logs_df[
-                    (game_logs_df['player_name'] == player_name) &
-                    (game_logs_df['game_date'] < game_date)
-                ]
+            # Get player history totals (prefix-sum lookup, split by is_home)
+            totals = history.totals_before(player_name, game_date)
                 
-                if len(player_history) >= 5:
-                    # Calculate home stats
-                    home_games = player_history[player_history.get('is_home', False)]
-                    home_ab = home_games['AB'].sum()
-                    home_hits = home_games['H'].sum()
-                    home_ba = home_hits / home_ab if home_ab > 0 else 0
+            if totals['games'] >= 5:
+                # Calculate home stats
+                home_games = totals.get('is_home_games', 0)
+                home_ab = totals.get('is_home_AB', 0)
+                home_hits = totals.get('is_home_H', 0)
+                home_ba = home_hits / home_ab if home_ab > 0 else 0
                     
-                    # Calculate away stats
-                    away_games = player_history[~player_history.get('is_home', True)]
-                    away_ab = away_games['AB'].sum()
-                    away_hits = away_games['H'].sum()
-                    away_ba = away_hits / away_ab if away_ab > 0 else 0
+                # Calculate away stats
+                away_games = totals['games'] - home_games
+                away_ab = totals['AB'] - home_ab
+                away_hits = totals['H'] - home_hits
+                away_ba = away_hits / away_ab if away_ab > 0 else 0
                     
-                    # Determine if current game is home
-                    is_home = True  # Simplified
+                # Determine if current game is home
+                is_home = bool(game['is_home'])
                     
-                    venue_score = self.calculate_venue_score(
-                        home_ba, away_ba, is_home, len(player_history)
-                    )
+                venue_score = self.calculate_venue_score(
+                    home_ba, away_ba, is_home, totals['games']
+                )
                     
-                    results.append({
-                        'player_name': player_name,
-                        'game_date': game_date,
-                        'home_games': len(home_games),
-                        'home_ba': round(home_ba, 3),
-                        'away_games': len(away_games),
-                        'away_ba': round(away_ba, 3),
-                        'venue_score': venue_score
-                    })
+                results.append({
+                    'player_name': player_name,
+                    'game_date': game_date,
+                    'home_games': home_games,
+                    'home_ba': round(home_ba, 3),
+                    'away_games': away_games,
+                    'away_ba': round(away_ba, 3),
+                    'venue_score': venue_score
+                })
         
         return pd.DataFrame(results)
 
 
-    def analyze_roster(self, roster_df, schedule_df, players_df=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, context=None):
         """Wrapper for analyze to match interface"""
-        return self.analyze(schedule_df, self._load_gamelogs(), roster_df, schedule_df)
+        history = context.history_index() if context is not None else None
+        return self.analyze(schedule_df, self._load_gamelogs(context), roster_df, schedule_df, history)
     
-    def _load_gamelogs(self):
-        """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+    def _load_gamelogs(self, context=None):
+        """Helper to load game logs from the shared context or game log store"""
+        if context is not None:
+            return context.game_logs
+        return load_gamelogs(self.data_dir)
@@ -23,6 +23,11 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from .schedule_index import ScheduleIndex
+except ImportError:
+    from schedule_index import ScheduleIndex
+
 
 class HumidityElevationAnalyzer:
     """Analyze humidity and elevation effects on performance"""
@@ -165,19 +170,17 @@ class HumidityElevationAnalyzer:
             'expected_distance_change_ft': round(air_density_score * 20, 1)  # Est. feet
         }
     
-    def analyze_roster(self, roster_df, schedule_df, weather_df):
+    def analyze_roster(self, roster_df, schedule_df, weather_df, context=None):
         """Analyze conditions for all roster players' games"""
         results = []
+        schedule_index = ScheduleIndex(schedule_df)
         
         for _, player in roster_df.iterrows():
             player_name = player['player_name']
             team = player.get('team', 'Unknown')
             
             # Find player's game today
-            player_game = schedule_df[
-                (schedule_df['home_team'] == team) | 
-                (schedule_df['away_team'] == team)
-            ]
+            player_game = schedule_index.team_games(team)
             
             if len(player_game) == 0:
                 continue
@@ -186,7 +189,11 @@ class HumidityElevationAnalyzer:
             stadium = game.get('venue', 'Unknown')
             
             # Find weather for this game
-            game_weather = weather_df[weather_df['team'] == game['home_team']]
+            if context is not None:
+                game_weather = context.weather_for_team(game['home_team'])
+                game_weather = [] if game_weather is None else game_weather.to_frame().T
+            else:
+                game_weather = weather_df[weather_df['team'] == game['home_team']]
             
             if len(game_weather) == 0:
                 game_weather = {'humidity_pct': 50, 'temperature_c': 20}
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Keyed Pseudo-Random Draws for Synthetic Factor Inputs
+
+Several analyzers fill gaps in the data (handedness, umpire crews, day/night
+splits, defensive ratings) with made-up values that must stay the same for
+the same player or game. They used to reseed the global NumPy RNG with
+hash(name) per row - but Python's str hash is salted per process, so the
+values changed between runs and worker processes, and reseeding per row is
+slow. Here every draw is a pure function of its key.
+
+Key Concepts:
+- A key is one or more values (player name, team, game date, ...) joined
+  into a string; dates are formatted YYYY-MM-DD so '2025-09-20' and
+  Timestamp('2025-09-20') are the same key
+- salt names the quantity being drawn ('bats', 'umpire', ...) so different
+  quantities for the same key are independent; the same key + salt always
+  gives the same value (in any process, on any machine)
+- Keys are hashed with pandas' SipHash (pd.util.hash_array) under a fixed
+  hash key, whole arrays at once; the top 53 bits become a uniform in [0, 1)
+- Every function takes scalars or array-likes (broadcast together) and
+  returns a scalar or an array accordingly, so analyzers can draw values for
+  a whole roster or schedule in one call
+
+Usage:
+    from scripts.fa.keyed_random import keyed_uniform, keyed_choice
+
+    u = keyed_uniform(roster_df['player_name'], salt='bats')      # array
+    umpire = keyed_choice(game_date, home_team, options=names, salt='umpire')
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+
+# Fixed 16-byte SipHash key: changing it changes every synthetic value
+HASH_KEY = 'fb-ai-keyed-rng1'
+
+_UNIT = 2.0 ** -53
+
+
+def _format(value):
+    if isinstance(value, date):  # also datetime / pd.Timestamp
+        return value.strftime('%Y-%m-%d')
+    return str(value)
+
+
+def _key_strings(key):
+    """Array of key strings for one key component (dates as YYYY-MM-DD)"""
+    if np.ndim(key) == 0:
+        key = [key]
+    values = key if isinstance(key, pd.Series) else pd.Series(list(key), dtype=object)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.strftime('%Y-%m-%d').fillna('').to_numpy(dtype=object)
+    return np.array([_format(v) for v in values], dtype=object)
+
+
+def _is_scalar(keys):
+    return all(np.ndim(k) == 0 for k in keys)
+
+
+def keyed_hash(*keys, salt=''):
+    """
+    Stable uint64 hash per key
+
+    Args:
+        *keys: Key components (scalars or equal-length array-likes)
+        salt: Name of the quantity being drawn
+
+    Returns:
+        (uint64 array, True if every component was a scalar)
+    """
+    scalar = _is_scalar(keys)
+    parts = [_key_strings(k) for k in keys]
+    length = max(len(p) for p in parts)
+    joined = np.full(length, salt, dtype=object)
+    for part in parts:
+        joined = joined + '\x1f' + np.broadcast_to(part, (length,))
+    return pd.util.hash_array(joined, hash_key=HASH_KEY, categorize=False), scalar
+
+
+def _result(values, scalar):
+    return values[0].item() if scalar else values
+
+
+def keyed_uniform(*keys, salt=''):
+    """Uniform in [0, 1) per key"""
+    hashes, scalar = keyed_hash(*keys, salt=salt)
+    return _result((hashes >> np.uint64(11)).astype(np.float64) * _UNIT, scalar)
+
+
+def keyed_integers(*keys, low, high, salt=''):
+    """Integer in [low, high) per key"""
+    hashes, scalar = keyed_hash(*keys, salt=salt)
+    u = (hashes >> np.uint64(11)).astype(np.float64) * _UNIT
+    return _result(low + np.floor(u * (high - low)).astype(np.int64), scalar)
+
+
+def keyed_choice(*keys, options, salt=''):
+    """One of options per key (uniform)"""
+    options = np.asarray(options, dtype=object)
+    picks = np.asarray(keyed_integers(*keys, low=0, high=len(options), salt=salt))
+    values = options[np.atleast_1d(picks)]
+    return values[0] if np.ndim(picks) == 0 else values
+
+
+def keyed_normal(*keys, mean=0.0, std=1.0, salt=''):
+    """Normal(mean, std) per key (Box-Muller over two keyed uniforms)"""
+    u1 = np.atleast_1d(keyed_uniform(*keys, salt=f"{salt}:1"))
+    u2 = np.atleast_1d(keyed_uniform(*keys, salt=f"{salt}:2"))
+    z = np.sqrt(-2.0 * np.log1p(-u1)) * np.cos(2.0 * np.pi * u2)
+    return _result(mean + std * z, _is_scalar(keys))
+
+
+def keyed_beta(*keys, a, b, salt=''):
+    """
+    Beta(a, b) per key for integer a, b
+
+    Uses the order statistic: the a-th smallest of a + b - 1 uniforms.
+    """
+    if int(a) != a or int(b) != b or a < 1 or b < 1:
+        raise ValueError("keyed_beta supports positive integer a and b only")
+    draws = np.column_stack([np.atleast_1d(keyed_uniform(*keys, salt=f"{salt}:{i}"))
+                             for i in range(int(a + b - 1))])
+    values = np.sort(draws, axis=1)[:, int(a) - 1]
+    return _result(values, _is_scalar(keys))
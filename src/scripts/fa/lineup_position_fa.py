@@ -24,9 +24,15 @@ Output:
 """
 
 import pandas as pd
-import numpy as np
 from pathlib import Path
 
+try:
+    from .schedule_index import iter_player_games
+    from .keyed_random import keyed_choice
+except ImportError:
+    from schedule_index import iter_player_games
+    from keyed_random import keyed_choice
+
 
 class LineupPositionAnalyzer:
     """Analyze batting order position impact on fantasy production"""
@@ -120,8 +126,9 @@ class LineupPositionAnalyzer:
         if avg > 0.250:
             return 6
         
-        # 7-9: Lower production
-        return np.random.choice([7, 8, 9])
+        # 7-9: Lower production (stable per player across runs)
+        return keyed_choice(str(player_stats.get('player_name', '')), options=[7, 8, 9],
+                            salt='lineup_spot')
     
     def calculate_position_impact(self, lineup_position):
         """Calculate fantasy impact multipliers for lineup position"""
@@ -182,54 +189,48 @@ class LineupPositionAnalyzer:
         """Analyze lineup position advantages for roster players"""
         results = []
         
-        for _, game in games_df.iterrows():
+        for game, player in iter_player_games(games_df, roster_df):
             game_date = game.get('game_date', '')
-            home_team = game.get('home_team', '')
-            away_team = game.get('away_team', '')
+            player_team = game['home_team'] if game['is_home'] else game['away_team']
             
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
-                player_team = player.get('mlb_team', '')
-                position = player.get('position', '')
-                
-                # Only analyze batters
-                if position in ['SP', 'RP', 'P']:
-                    continue
+            player_name = player['player_name']
+            position = player.get('position', '')
                 
-                if not player_team or player_team not in [home_team, away_team]:
-                    continue
+            # Only analyze batters
+            if position in ['SP', 'RP', 'P']:
+                continue
                 
-                # Get lineup position
-                lineup_position = self.get_lineup_position(
-                    player_name, player_team, game_date, mlb_df
-                )
+            # Get lineup position
+            lineup_position = self.get_lineup_position(
+                player_name, player_team, game_date, mlb_df
+            )
                 
-                # Calculate impact
-                impact = self.calculate_position_impact(lineup_position)
-                position_desc = self.get_position_description(lineup_position)
-                tier = self.get_lineup_tier(lineup_position)
+            # Calculate impact
+            impact = self.calculate_position_impact(lineup_position)
+            position_desc = self.get_position_description(lineup_position)
+            tier = self.get_lineup_tier(lineup_position)
                 
-                # Calculate score (higher lineup position = better)
-                if lineup_position:
-                    # Invert so 1st = highest score
-                    position_score = (10 - lineup_position) * impact['overall_multiplier']
-                else:
-                    position_score = 0.0
+            # Calculate score (higher lineup position = better)
+            if lineup_position:
+                # Invert so 1st = highest score
+                position_score = (10 - lineup_position) * impact['overall_multiplier']
+            else:
+                position_score = 0.0
                 
-                results.append({
-                    'player_name': player_name,
-                    'position': position,
-                    'game_date': game_date,
-                    'opponent': away_team if player_team == home_team else home_team,
-                    'lineup_spot': lineup_position if lineup_position else 'N/A',
-                    'lineup_tier': tier,
-                    'expected_pa': self.EXPECTED_PA.get(lineup_position, 4.0),
-                    'pa_multiplier': impact['pa_multiplier'],
-                    'rbi_multiplier': impact['rbi_multiplier'],
-                    'run_multiplier': impact['run_multiplier'],
-                    'lineup_score': round(position_score, 2),
-                    'impact': position_desc
-                })
+            results.append({
+                'player_name': player_name,
+                'position': position,
+                'game_date': game_date,
+                'opponent': game['opponent'],
+                'lineup_spot': lineup_position if lineup_position else 'N/A',
+                'lineup_tier': tier,
+                'expected_pa': self.EXPECTED_PA.get(lineup_position, 4.0),
+                'pa_multiplier': impact['pa_multiplier'],
+                'rbi_multiplier': impact['rbi_multiplier'],
+                'run_multiplier': impact['run_multiplier'],
+                'lineup_score': round(position_score, 2),
+                'impact': position_desc
+            })
         
         return pd.DataFrame(results)
     
@@ -246,11 +247,13 @@ class LineupPositionAnalyzer:
         else:
             return "Poor"
     
-    def analyze_roster(self, roster_df, schedule_df):
+    def analyze_roster(self, roster_df, schedule_df, context=None):
         """Wrapper for analyze to match interface"""
-        # Load MLB data
+        # Load MLB data (already parsed once when a shared context is given)
         mlb_file = self.data_dir / "mlb_all_players_complete.csv"
-        if mlb_file.exists():
+        if context is not None:
+            mlb_df = context.players
+        elif mlb_file.exists():
             mlb_df = pd.read_csv(mlb_file)
         else:
             mlb_df = pd.DataFrame()
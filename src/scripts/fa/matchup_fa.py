@@ -20,6 +20,15 @@ Output:
 import pandas as pd
 from pathlib import Path
 
+try:
+    from .gamelog_store import load_gamelogs
+    from .schedule_index import iter_player_games
+    from .history_index import HistoryIndex
+except ImportError:
+    from gamelog_store import load_gamelogs
+    from schedule_index import iter_player_games
+    from history_index import HistoryIndex
+
 
 class MatchupFactorAnalyzer:
     """Analyze pitcher-hitter historical matchups"""
@@ -35,53 +44,50 @@ class MatchupFactorAnalyzer:
         score = (ba_score + hr_score) * confidence
         return max(-2.0, min(2.0, score))
     
-    def analyze(self, games_df, game_logs_df, roster_df):
-        """Analyze matchup advantages"""
+    def analyze(self, games_df, game_logs_df, roster_df, history=None):
+        """Analyze matchup advantages (history: optional prebuilt HistoryIndex)"""
         results = []
+        if history is None:
+            history = HistoryIndex(game_logs_df)
         
-        for _, game in games_df.iterrows():
+        for game, player in iter_player_games(games_df, roster_df):
             game_date = game['game_date']
             
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
+            player_name = player['player_name']
+            
+            # Career totals before this game (prefix-sum lookup)
+            totals = history.totals_before(player_name, game_date)
+            
+            if totals['games'] > 0:
+                total_ab = totals['AB']
+                total_hits = totals['H']
+                total_hr = totals['HR']
+                avg_ba = total_hits / total_ab if total_ab > 0 else 0
                 
-                # Find historical matchups
-                player_history = game_logs_df[
-                    (game_logs_df['player_name'] == player_name) &
-                    (game_logs_df['game_date'] < game_date)
-                ]
+                matchup_score = self.calculate_matchup_score(
+                    avg_ba, total_hr, totals['games']
+                )
                 
-                if len(player_history) > 0:
-                    total_ab = player_history['AB'].sum()
-                    total_hits = player_history['H'].sum()
-                    total_hr = player_history['HR'].sum()
-                    avg_ba = total_hits / total_ab if total_ab > 0 else 0
-                    
-                    matchup_score = self.calculate_matchup_score(
-                        avg_ba, total_hr, len(player_history)
-                    )
-                    
-                    results.append({
-                        'player_name': player_name,
-                        'game_date': game_date,
-                        'games_played': len(player_history),
-                        'total_at_bats': total_ab,
-                        'batting_avg': round(avg_ba, 3),
-                        'total_home_runs': total_hr,
-                        'matchup_score': matchup_score
-                    })
+                results.append({
+                    'player_name': player_name,
+                    'game_date': game_date,
+                    'games_played': totals['games'],
+                    'total_at_bats': total_ab,
+                    'batting_avg': round(avg_ba, 3),
+                    'total_home_runs': total_hr,
+                    'matchup_score': matchup_score
+                })
         
         return pd.DataFrame(results)
 
 
-    def analyze_roster(self, roster_df, schedule_df, players_df=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, context=None):
         """Wrapper for analyze to match interface"""
-        return self.analyze(schedule_df, self._load_gamelogs(), roster_df)
+        history = context.history_index() if context is not None else None
+        return self.analyze(schedule_df, self._load_gamelogs(context), roster_df, history)
     
-    def _load_gamelogs(self):
-        """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+    def _load_gamelogs(self, context=None):
+        """Helper to load game logs from the shared context or game log store"""
+        if context is not None:
+            return context.game_logs
+        return load_gamelogs(self.data_dir)
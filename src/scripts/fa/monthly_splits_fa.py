@@ -25,6 +25,13 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from .gamelog_store import get_gamelog_store
+    from .history_index import HistoryIndex
+except ImportError:
+    from gamelog_store import get_gamelog_store
+    from history_index import HistoryIndex
+
 
 class MonthlySplitsAnalyzer:
     """Analyze player monthly and seasonal performance splits"""
@@ -42,7 +49,31 @@ class MonthlySplitsAnalyzer:
         """Calculate stats for a specific month"""
         month_games = player_games[player_games['game_date'].dt.month == month]
         
-        if len(month_games) == 0:
+        totals = {'games': len(month_games)}
+        for col in ('AB', 'H', 'BB', 'HR', 'RBI', '2B', '3B'):
+            if col in month_games.columns:
+                totals[col] = month_games[col].sum()
+        return self.stats_from_totals(totals)
+    
+    def month_totals(self, history, player_name, month):
+        """Totals for one calendar month (every season on record) from a HistoryIndex"""
+        dates = history.player_dates(player_name)
+        if len(dates) == 0:
+            return {'games': 0}
+        
+        first_year = pd.Timestamp(dates[0]).year
+        last_year = pd.Timestamp(dates[-1]).year
+        totals = None
+        for year in range(first_year, last_year + 1):
+            start = pd.Timestamp(year=year, month=month, day=1)
+            window = history.totals_between(player_name, start, start + pd.offsets.MonthBegin(1))
+            totals = window if totals is None else {k: totals[k] + v for k, v in window.items()}
+        return totals
+    
+    def stats_from_totals(self, totals):
+        """Monthly stat line from summed counting stats (games, AB, H, BB, HR, ...)"""
+        games = totals.get('games', 0)
+        if games == 0:
             return {
                 'games': 0,
                 'avg': 0.0,
@@ -54,11 +85,13 @@ class MonthlySplitsAnalyzer:
             }
         
         # Calculate stats
-        total_ab = month_games['AB'].sum()
-        total_h = month_games['H'].sum()
-        total_bb = month_games['BB'].sum() if 'BB' in month_games.columns else 0
-        total_hr = month_games['HR'].sum() if 'HR' in month_games.columns else 0
-        total_rbi = month_games['RBI'].sum() if 'RBI' in month_games.columns else 0
+        total_ab = totals.get('AB', 0)
+        total_h = totals.get('H', 0)
+        total_bb = totals.get('BB', 0)
+        total_hr = totals.get('HR', 0)
+        total_rbi = totals.get('RBI', 0)
+        doubles = totals.get('2B', 0)
+        triples = totals.get('3B', 0)
         
         avg = total_h / total_ab if total_ab > 0 else 0.0
         
@@ -66,24 +99,22 @@ class MonthlySplitsAnalyzer:
         obp = (total_h + total_bb) / (total_ab + total_bb) if (total_ab + total_bb) > 0 else 0.0
         
         # Rough SLG estimate
-        singles = total_h - (month_games['2B'].sum() if '2B' in month_games.columns else 0) - \
-                  (month_games['3B'].sum() if '3B' in month_games.columns else 0) - total_hr
-        total_bases = singles + (month_games['2B'].sum() if '2B' in month_games.columns else 0) * 2 + \
-                     (month_games['3B'].sum() if '3B' in month_games.columns else 0) * 3 + total_hr * 4
+        singles = total_h - doubles - triples - total_hr
+        total_bases = singles + doubles * 2 + triples * 3 + total_hr * 4
         slg = total_bases / total_ab if total_ab > 0 else 0.0
         
         return {
-            'games': len(month_games) if len(month_games) > 0 else 0,
-            'avg': round(avg, 3) if len(month_games) > 0 else 0.0,
-            'obp': round(obp, 3) if len(month_games) > 0 else 0.0,
-            'slg': round(slg, 3) if len(month_games) > 0 else 0.0,
-            'ops': round(obp + slg, 3) if len(month_games) > 0 else 0.0,
-            'hr': int(total_hr) if len(month_games) > 0 else 0,
-            'rbi': int(total_rbi) if len(month_games) > 0 else 0
+            'games': games,
+            'avg': round(avg, 3),
+            'obp': round(obp, 3),
+            'slg': round(slg, 3),
+            'ops': round(obp + slg, 3),
+            'hr': int(total_hr),
+            'rbi': int(total_rbi)
         }
     
-    def analyze_player_monthly_profile(self, player_name, player_games):
-        """Analyze player's career monthly performance"""
+    def analyze_player_monthly_profile(self, player_name, player_games, history=None):
+        """Analyze player's career monthly performance (history: optional HistoryIndex)"""
         if len(player_games) == 0:
             return None
         
@@ -101,7 +132,12 @@ class MonthlySplitsAnalyzer:
         baseball_months = [4, 5, 6, 7, 8, 9, 10]
         
         for month in baseball_months:
-            monthly_stats[month] = self.calculate_monthly_stats(player_games, month)
+            if history is not None:
+                monthly_stats[month] = self.stats_from_totals(
+                    self.month_totals(history, player_name, month)
+                )
+            else:
+                monthly_stats[month] = self.calculate_monthly_stats(player_games, month)
         
         # Find best and worst months (min 10 games)
         valid_months = {m: s for m, s in monthly_stats.items() if s['games'] >= 10}
@@ -167,7 +203,7 @@ class MonthlySplitsAnalyzer:
         else:
             return 'Consistent'
     
-    def analyze_roster(self, roster_df, schedule_df, players_df, as_of_date=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df, as_of_date=None, context=None):
         """Analyze monthly splits for all roster players"""
         if as_of_date is None:
             as_of_date = datetime.now()
@@ -175,10 +211,13 @@ class MonthlySplitsAnalyzer:
             as_of_date = datetime.strptime(as_of_date, '%Y-%m-%d')
         
         # Load game logs
-        game_log_file = self.data_dir / "mlb_game_logs_2024.csv"
+        if context is not None:
+            store = context.gamelog_store()
+        else:
+            store = get_gamelog_store(self.data_dir)
         
-        if not game_log_file.exists():
-            print(f"⚠️  Game log file not found: {game_log_file.name}")
+        if not store.exists:
+            print(f"⚠️  Game log file not found: {store.source_file.name}")
             print("   Need player game logs for monthly split analysis")
             print("   Run: python src/scripts/scrape/gamelog_scrape.py\n")
             
@@ -196,18 +235,21 @@ class MonthlySplitsAnalyzer:
                 })
             return pd.DataFrame(results)
         
-        # Load game logs
-        print(f"Loading game logs from {game_log_file.name}...")
-        game_logs_df = pd.read_csv(game_log_file)
-        game_logs_df['game_date'] = pd.to_datetime(game_logs_df['game_date'])
+        print(f"Using game log store ({len(store):,} rows from {store.source_file.name})...")
+        
+        # Per-player prefix sums: each month is two binary searches
+        if context is not None:
+            history = context.history_index(store.season)
+        else:
+            history = HistoryIndex(store.frame)
         
         results = []
         
         for _, player in roster_df.iterrows():
             player_name = player['player_name']
             
-            # Get player's games
-            player_games = game_logs_df[game_logs_df['player_name'] == player_name].copy()
+            # Get player's games (contiguous row range in the store)
+            player_games = store.player_rows(player_name)
             
             if len(player_games) == 0:
                 print(f"  {player_name}: No game log data")
@@ -221,7 +263,7 @@ class MonthlySplitsAnalyzer:
                 continue
             
             # Analyze monthly profile
-            profile = self.analyze_player_monthly_profile(player_name, player_games)
+            profile = self.analyze_player_monthly_profile(player_name, player_games, history)
             
             if profile:
                 results.append(profile)
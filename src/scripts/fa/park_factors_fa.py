@@ -25,6 +25,11 @@ Output:
 import pandas as pd
 from pathlib import Path
 
+try:
+    from .schedule_index import iter_player_games
+except ImportError:
+    from schedule_index import iter_player_games
+
 
 class ParkFactorsAnalyzer:
     """Analyze park factors impact"""
@@ -74,31 +79,30 @@ class ParkFactorsAnalyzer:
         """Analyze park factors"""
         results = []
         
-        for _, game in games_df.iterrows():
+        for game, player in iter_player_games(games_df, roster_df):
             game_date = game['game_date']
             home_team = game.get('home_team', '')
             stadium = self.TEAM_STADIUMS.get(home_team, 'Unknown')
             
             runs_f, hr_f, hits_f = self.get_park_factors(stadium)
             
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
-                is_pitcher = player.get('position', '') in ['SP', 'RP', 'P']
+            player_name = player['player_name']
+            is_pitcher = player.get('position', '') in ['SP', 'RP', 'P']
                 
-                park_score = self.calculate_park_score(runs_f, hr_f, hits_f, is_pitcher)
+            park_score = self.calculate_park_score(runs_f, hr_f, hits_f, is_pitcher)
                 
-                results.append({
-                    'player_name': player_name,
-                    'game_date': game_date,
-                    'stadium': stadium,
-                    'runs_factor': runs_f,
-                    'hr_factor': hr_f,
-                    'hits_factor': hits_f,
-                    'score': park_score
-                })
+            results.append({
+                'player_name': player_name,
+                'game_date': game_date,
+                'stadium': stadium,
+                'runs_factor': runs_f,
+                'hr_factor': hr_f,
+                'hits_factor': hits_f,
+                'score': park_score
+            })
         
         return pd.DataFrame(results)
     
-    def analyze_roster(self, roster_df, schedule_df, teams_df):
+    def analyze_roster(self, roster_df, schedule_df, teams_df, context=None):
         """Wrapper for analyze to match interface"""
         return self.analyze(schedule_df, roster_df)
@@ -22,6 +22,13 @@ Output:
 import pandas as pd
 from pathlib import Path
 
+try:
+    from .gamelog_store import load_gamelogs
+    from .schedule_index import iter_player_games
+except ImportError:
+    from gamelog_store import load_gamelogs
+    from schedule_index import iter_player_games
+
 
 class PitchMixAnalyzer:
     """Analyze pitch mix and its impact on matchups"""
@@ -129,79 +136,71 @@ class PitchMixAnalyzer:
         """Analyze pitch mix advantages for matchups"""
         results = []
         
-        for _, game in games_df.iterrows():
-            home_team = game.get('home_team', '')
-            away_team = game.get('away_team', '')
+        for game, player in iter_player_games(games_df, roster_df):
+            opposing_team = game['opponent']
             
             # Find pitchers and batters in this game
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
-                player_team = player.get('mlb_team', '')
-                position = player.get('position', '')
-                
-                if not player_team:
-                    continue
+            player_name = player['player_name']
+            position = player.get('position', '')
                 
-                # Find opposing pitcher or batters
-                is_pitcher = position in ['SP', 'RP', 'P']
+            # Find opposing pitcher or batters
+            is_pitcher = position in ['SP', 'RP', 'P']
                 
-                if is_pitcher:
-                    # Pitcher vs opposing team's batters
-                    opposing_team = away_team if player_team == home_team else home_team
-                    pitcher_mix = self.calculate_pitcher_mix(None)
+            if is_pitcher:
+                # Pitcher vs opposing team's batters
+                pitcher_mix = self.calculate_pitcher_mix(None)
                     
-                    # Average opposing team performance (simplified)
-                    avg_batter_performance = self.calculate_batter_vs_pitch_type(None)
+                # Average opposing team performance (simplified)
+                avg_batter_performance = self.calculate_batter_vs_pitch_type(None)
                     
-                    matchup_score, details = self.calculate_matchup_advantage(
-                        pitcher_mix, avg_batter_performance
-                    )
+                matchup_score, details = self.calculate_matchup_advantage(
+                    pitcher_mix, avg_batter_performance
+                )
                     
-                    # For pitcher, positive score is good
-                    primary_pitch = max(pitcher_mix.items(), key=lambda x: x[1])
+                # For pitcher, positive score is good
+                primary_pitch = max(pitcher_mix.items(), key=lambda x: x[1])
                     
-                    results.append({
-                        'player_name': player_name,
-                        'position': position,
-                        'game_date': game['game_date'],
-                        'opponent': opposing_team,
-                        'role': 'Pitcher',
-                        'primary_pitch': f"{primary_pitch[0]} ({primary_pitch[1]*100:.0f}%)",
-                        'pitch_mix_score': round(matchup_score, 2),
-                        'impact': self._get_pitcher_impact(matchup_score, primary_pitch[0])
-                    })
+                results.append({
+                    'player_name': player_name,
+                    'position': position,
+                    'game_date': game['game_date'],
+                    'opponent': opposing_team,
+                    'role': 'Pitcher',
+                    'primary_pitch': f"{primary_pitch[0]} ({primary_pitch[1]*100:.0f}%)",
+                    'pitch_mix_score': round(matchup_score, 2),
+                    'impact': self._get_pitcher_impact(matchup_score, primary_pitch[0])
+                })
                     
-                else:
-                    # Batter vs opposing pitcher
-                    # Need to find opposing pitcher's likely starter
-                    opposing_team = away_team if player_team == home_team else home_team
+            else:
+                # Batter vs opposing pitcher
+                # Need to find opposing pitcher's likely starter
                     
-                    # Simulate opposing pitcher's pitch mix
-                    opposing_pitcher_mix = self.calculate_pitcher_mix(None)
-                    batter_performance = self.calculate_batter_vs_pitch_type(None)
+                # Simulate opposing pitcher's pitch mix
+                opposing_pitcher_mix = self.calculate_pitcher_mix(None)
+                batter_performance = self.calculate_batter_vs_pitch_type(None)
                     
-                    matchup_score, details = self.calculate_matchup_advantage(
-                        opposing_pitcher_mix, batter_performance
-                    )
+                matchup_score, details = self.calculate_matchup_advantage(
+                    opposing_pitcher_mix, batter_performance
+                )
                     
-                    # For batter, negative score is good (pitcher struggling = batter success)
-                    matchup_score = -matchup_score
+                # For batter, negative score is good (pitcher struggling = batter success)
+                matchup_score = -matchup_score
                     
-                    # Find batter's best pitch type
-                    best_pitch = max(batter_performance.items(), key=lambda x: x[1]['avg'])
-                    worst_pitch = min(batter_performance.items(), key=lambda x: x[1]['avg'])
+                # Find batter's best pitch type
+                best_pitch = max(batter_performance.items(), key=lambda x: x[1]['avg'])
+                worst_pitch = min(batter_performance.items(), key=lambda x: x[1]['avg'])
                     
-                    results.append({
-                        'player_name': player_name,
-                        'position': position,
-                        'game_date': game['game_date'],
-                        'opponent': opposing_team,
-                        'role': 'Batter',
-                        'best_vs_pitch': f"{best_pitch[0]} (.{int(best_pitch[1]['avg']*1000):03d})",
-                        'worst_vs_pitch': f"{worst_pitch[0]} (.{int(worst_pitch[1]['avg']*1000):03d})",
-                        'pitch_mix_score': round(matchup_score, 2),
-                        'impact': self._get_batter_impact(matchup_score, best_pitch[0])
-                    })
+                results.append({
+                    'player_name': player_name,
+                    'position': position,
+                    'game_date': game['game_date'],
+                    'opponent': opposing_team,
+                    'role': 'Batter',
+                    'best_vs_pitch': f"{best_pitch[0]} (.{int(best_pitch[1]['avg']*1000):03d})",
+                    'worst_vs_pitch': f"{worst_pitch[0]} (.{int(worst_pitch[1]['avg']*1000):03d})",
+                    'pitch_mix_score': round(matchup_score, 2),
+                    'impact': self._get_batter_impact(matchup_score, best_pitch[0])
+                })
         
         return pd.DataFrame(results)
     
@@ -232,14 +231,14 @@ class PitchMixAnalyzer:
             return "Difficult matchup - facing mostly troublesome pitch types"
 
 
-    def analyze_roster(self, roster_df, schedule_df, players_df=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, context=None):
         """Wrapper for analyze to match interface"""
+        if players_df is None and context is not None:
+            players_df = context.players
         return self.analyze(schedule_df, players_df, roster_df)
     
-    def _load_gamelogs(self):
-        """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+    def _load_gamelogs(self, context=None):
+        """Helper to load game logs from the shared context or game log store"""
+        if context is not None:
+            return context.game_logs
+        return load_gamelogs(self.data_dir)
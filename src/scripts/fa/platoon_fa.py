@@ -26,6 +26,17 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+try:
+    from .gamelog_store import load_gamelogs
+    from .schedule_index import iter_player_games
+    from .history_index import HistoryIndex
+    from .keyed_random import keyed_uniform
+except ImportError:
+    from gamelog_store import load_gamelogs
+    from schedule_index import iter_player_games
+    from history_index import HistoryIndex
+    from keyed_random import keyed_uniform
+
 
 class PlatoonFactorAnalyzer:
     """Analyze platoon matchup advantages"""
@@ -33,28 +44,42 @@ class PlatoonFactorAnalyzer:
     def __init__(self, data_dir):
         self.data_dir = Path(data_dir)
         self.player_handedness = {}
+        self.pitcher_handedness = {}
+    
+    def load_player_handedness(self, player_names):
+        """Generate synthetic handedness for many players at once (~25% L, ~10% S, ~65% R)"""
+        names = pd.unique(pd.Series(player_names, dtype=object).astype(str))
+        if len(names) == 0:
+            return
+        bats_rand = keyed_uniform(names, salt='bats')
+        throws_rand = keyed_uniform(names, salt='throws')
+        bats = np.where(bats_rand < 0.25, 'L', np.where(bats_rand < 0.35, 'S', 'R'))
+        throws = np.where(throws_rand < 0.25, 'L', 'R')
+        self.player_handedness.update(zip(names, zip(bats.tolist(), throws.tolist())))
     
     def get_player_handedness(self, player_name):
         """Get or generate player handedness"""
-        if player_name in self.player_handedness:
-            return self.player_handedness[player_name]
-        
-        # Generate synthetic (~25% L, ~10% S, ~65% R)
-        np.random.seed(hash(player_name) % 2**32)
-        rand = np.random.random()
-        bats = 'L' if rand < 0.25 else ('S' if rand < 0.35 else 'R')
-        throws = 'L' if np.random.random() < 0.25 else 'R'
-        np.random.seed(None)
-        
-        self.player_handedness[player_name] = (bats, throws)
-        return (bats, throws)
+        name = str(player_name)
+        if name not in self.player_handedness:
+            self.load_player_handedness([name])
+        return self.player_handedness[name]
+    
+    def load_pitcher_handedness(self, games_df):
+        """Synthetic starter handedness for both sides of every game (~25% L)"""
+        if games_df.empty or not {'home_team', 'away_team', 'game_date'}.issubset(games_df.columns):
+            return
+        opponents = pd.concat([games_df['away_team'], games_df['home_team']]).astype(str).to_numpy()
+        dates = pd.to_datetime(pd.concat([games_df['game_date'], games_df['game_date']]))
+        hands = np.where(keyed_uniform(opponents, dates, salt='pitcher_hand') < 0.25, 'L', 'R')
+        self.pitcher_handedness.update(zip(zip(opponents, dates.dt.normalize()), hands.tolist()))
     
     def get_pitcher_handedness(self, opponent, game_date):
         """Determine pitcher handedness (synthetic)"""
-        np.random.seed(hash(str(opponent) + str(game_date)) % 2**32)
-        pitcher_hand = 'L' if np.random.random() < 0.25 else 'R'
-        np.random.seed(None)
-        return pitcher_hand
+        key = (str(opponent), pd.Timestamp(game_date).normalize())
+        if key not in self.pitcher_handedness:
+            hand = 'L' if keyed_uniform(key[0], key[1], salt='pitcher_hand') < 0.25 else 'R'
+            self.pitcher_handedness[key] = hand
+        return self.pitcher_handedness[key]
     
     def calculate_platoon_score(self, bats, pitcher_hand, vs_lhp_ba, vs_rhp_ba, sample_size):
         """Calculate platoon advantage score"""
@@ -81,72 +106,72 @@ class PlatoonFactorAnalyzer:
         
         return max(-1.5, min(1.5, platoon_score))
     
-    def analyze(self, games_df, game_logs_df, roster_df):
-        """Analyze platoon advantages"""
+    def analyze(self, games_df, game_logs_df, roster_df, history=None):
+        """Analyze platoon advantages (history: optional prebuilt HistoryIndex)"""
         results = []
         
         # Convert dates once
-        games_df['game_date'] = pd.to_datetime(games_df['game_date'])
-        if len(game_logs_df) > 0:
-            game_logs_df['game_date'] = pd.to_datetime(game_logs_df['game_date'])
+        games_df = games_df.assign(game_date=pd.to_datetime(games_df['game_date']))
+        if history is None:
+            history = HistoryIndex(game_logs_df)
+        
+        # Synthetic handedness for the whole roster / schedule in two keyed draws
+        if 'player_name' in roster_df.columns:
+            self.load_player_handedness(roster_df['player_name'])
+        self.load_pitcher_handedness(games_df)
         
-        for _, game in games_df.iterrows():
+        for game, player in iter_player_games(games_df, roster_df):
             game_date = game['game_date']
             opponent = game.get('opponent', '')
             
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
-                position = player.get('position', '')
+            player_name = player['player_name']
+            position = player.get('position', '')
                 
-                # Skip pitchers
-                if position in ['SP', 'RP', 'P', 'Pitcher']:
-                    continue
+            # Skip pitchers
+            if position in ['SP', 'RP', 'P', 'Pitcher']:
+                continue
                 
-                bats, throws = self.get_player_handedness(player_name)
-                pitcher_hand = self.get_pitcher_handedness(opponent, game_date)
+            bats, throws = self.get_player_handedness(player_name)
+            pitcher_hand = self.get_pitcher_handedness(opponent, game_date)
                 
-                # Get historical splits
-                player_history = game_logs_df[
-                    (game_logs_df['player_name'] == player_name) &
-                    (game_logs_df['game_date'] < game_date)
-                ]
+            # Get historical splits (prefix-sum lookup)
+            games_played = history.totals_before(player_name, game_date)['games']
                 
-                vs_lhp_ba = 0.0
-                vs_rhp_ba = 0.0
+            vs_lhp_ba = 0.0
+            vs_rhp_ba = 0.0
                 
-                if len(player_history) > 0:
-                    # Calculate splits (simplified)
-                    vs_lhp_games = len(player_history) // 4  # Estimate
-                    _ = len(player_history) - vs_lhp_games
-                    vs_lhp_ba = 0.250  # Placeholder
-                    vs_rhp_ba = 0.260  # Placeholder
+            if games_played > 0:
+                # Calculate splits (simplified)
+                vs_lhp_games = games_played // 4  # Estimate
+                _ = games_played - vs_lhp_games
+                vs_lhp_ba = 0.250  # Placeholder
+                vs_rhp_ba = 0.260  # Placeholder
                 
-                matchup_type = f"{bats}HB vs {pitcher_hand}HP" if bats in ['L', 'R'] else f"SWITCH vs {pitcher_hand}HP"
+            matchup_type = f"{bats}HB vs {pitcher_hand}HP" if bats in ['L', 'R'] else f"SWITCH vs {pitcher_hand}HP"
                 
-                platoon_score = self.calculate_platoon_score(
-                    bats, pitcher_hand, vs_lhp_ba, vs_rhp_ba, len(player_history)
-                )
+            platoon_score = self.calculate_platoon_score(
+                bats, pitcher_hand, vs_lhp_ba, vs_rhp_ba, games_played
+            )
                 
-                results.append({
-                    'player_name': player_name,
-                    'game_date': game_date,
-                    'bats': bats,
-                    'pitcher_hand': pitcher_hand,
-                    'matchup_type': matchup_type,
-                    'platoon_score': platoon_score
-                })
+            results.append({
+                'player_name': player_name,
+                'game_date': game_date,
+                'bats': bats,
+                'pitcher_hand': pitcher_hand,
+                'matchup_type': matchup_type,
+                'platoon_score': platoon_score
+            })
         
         return pd.DataFrame(results)
 
 
-    def analyze_roster(self, roster_df, schedule_df, players_df=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, context=None):
         """Wrapper for analyze to match interface"""
-        return self.analyze(schedule_df, self._load_gamelogs(), roster_df)
+        history = context.history_index() if context is not None else None
+        return self.analyze(schedule_df, self._load_gamelogs(context), roster_df, history)
     
-    def _load_gamelogs(self):
-        """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+    def _load_gamelogs(self, context=None):
+        """Helper to load game logs from the shared context or game log store"""
+        if context is not None:
+            return context.game_logs
+        return load_gamelogs(self.data_dir)
@@ -10,6 +10,10 @@ Key Concepts:
 - Cold Streak: Extended period of poor performance (0-for-10+)
 - Rolling Averages: Last 7/14/30 day performance trends
 - Form Score: Composite score of recent performance vs. season average
+- Vectorized engine: compute_form() evaluates every (player, as_of_date) pair
+  in one pass over per-player prefix sums (see history_index.py) - rolling
+  windows are two binary searches, streaks are run lengths over the last
+  10/15 games gathered into a (pairs x games) matrix
 
 Output:
 - Recent performance metrics (7/14/30 day windows)
@@ -23,10 +27,45 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime, timedelta
 
+try:
+    from .gamelog_store import get_gamelog_store
+    from .history_index import HistoryIndex
+except ImportError:
+    from gamelog_store import get_gamelog_store
+    from history_index import HistoryIndex
+
+
+def _max_run(mask):
+    """Longest run of True values along axis 1 of a 2-D boolean array"""
+    if mask.shape[1] == 0:
+        return np.zeros(mask.shape[0], dtype=np.int64)
+    counts = np.cumsum(mask, axis=1)
+    base = np.maximum.accumulate(np.where(mask, 0, counts), axis=1)
+    return (counts - base).max(axis=1)
+
+
+def _max_hitless_run(at_bats, hits):
+    """
+    Longest run of consecutive hitless at-bats along axis 1
+
+    Games are ordered most recent first and each game's at-bats are read as
+    its hits followed by its outs, so a run starts at the outs of a game with
+    a hit and continues through the following hitless games.
+    """
+    if at_bats.shape[1] == 0:
+        return np.zeros(at_bats.shape[0], dtype=np.int64)
+    hit_abs = np.where(at_bats > 0, np.clip(hits, 0, np.maximum(at_bats, 0)), 0)
+    outs = np.where(at_bats > 0, at_bats - hit_abs, 0)
+    total = np.cumsum(outs, axis=1)
+    base = np.maximum.accumulate(np.where(hit_abs > 0, total - outs, 0), axis=1)
+    return (total - base).max(axis=1)
+
 
 class RecentFormAnalyzer:
     """Analyze player recent form and streaks"""
     
+    WINDOWS = (7, 14, 30)
+    
     def __init__(self, data_dir):
         self.data_dir = Path(data_dir)
     
@@ -85,27 +124,16 @@ class RecentFormAnalyzer:
         if len(recent_games) < 5:
             return False, 0
         
-        # Check last 5-10 games for hitting streak
-        last_10 = recent_games.head(10)
-        
         # Hot streak criteria:
-        # 1. Hit in 5+ consecutive games, OR
+        # 1. Hit in 5+ consecutive games (last 10), OR
         # 2. Batting .350+ over last 7 games with 20+ ABs
-        
-        consecutive_hits = 0
-        max_streak = 0
-        
-        for _, game in last_10.iterrows():
-            if game.get('H', 0) > 0:
-                consecutive_hits += 1
-                max_streak = max(max_streak, consecutive_hits)
-            else:
-                consecutive_hits = 0
+        hits = self._game_values(recent_games, 'H')
+        at_bats = self._game_values(recent_games, 'AB')
+        max_streak = int(_max_run(hits[None, :10] > 0)[0])
         
         # Check batting average hot streak
-        last_7 = recent_games.head(7)
-        total_ab = last_7['AB'].sum() if 'AB' in last_7.columns else 0
-        total_h = last_7['H'].sum() if 'H' in last_7.columns else 0
+        total_ab = at_bats[:7].sum()
+        total_h = hits[:7].sum()
         recent_avg = total_h / total_ab if total_ab >= 20 else 0
         
         is_hot = max_streak >= 5 or (recent_avg >= 0.350 and total_ab >= 20)
@@ -118,37 +146,28 @@ class RecentFormAnalyzer:
             return False, 0
         
         # Cold streak criteria:
-        # 1. 0-for-10 or worse in recent ABs, OR
+        # 1. 0-for-10 or worse in recent ABs (last 15 games), OR
         # 2. Batting under .150 in last 7 games with 20+ ABs
-        
-        # Check hitless at-bats
-        recent_abs = []
-        for _, game in recent_games.head(15).iterrows():
-            ab = game.get('AB', 0)
-            h = game.get('H', 0)
-            if ab > 0:
-                recent_abs.extend([1 if i < h else 0 for i in range(ab)])
-        
-        # Count consecutive hitless ABs
-        consecutive_outs = 0
-        max_slump = 0
-        for ab in recent_abs:
-            if ab == 0:
-                consecutive_outs += 1
-                max_slump = max(max_slump, consecutive_outs)
-            else:
-                consecutive_outs = 0
+        hits = self._game_values(recent_games, 'H')
+        at_bats = self._game_values(recent_games, 'AB')
+        max_slump = int(_max_hitless_run(at_bats[None, :15], hits[None, :15])[0])
         
         # Check batting average slump
-        last_7 = recent_games.head(7)
-        total_ab = last_7['AB'].sum() if 'AB' in last_7.columns else 0
-        total_h = last_7['H'].sum() if 'H' in last_7.columns else 0
+        total_ab = at_bats[:7].sum()
+        total_h = hits[:7].sum()
         recent_avg = total_h / total_ab if total_ab >= 20 else 0.300  # Assume average if small sample
         
         is_cold = max_slump >= 10 or (recent_avg < 0.150 and total_ab >= 20)
         
         return is_cold, max_slump
     
+    @staticmethod
+    def _game_values(games, column):
+        """Column as an integer array in game order (0 when missing)"""
+        if column not in games.columns:
+            return np.zeros(len(games), dtype=np.int64)
+        return games[column].fillna(0).to_numpy().astype(np.int64)
+    
     def calculate_form_score(self, recent_stats, season_stats):
         """Calculate form score comparing recent performance to season average"""
         # Compare recent OPS to season OPS
@@ -173,62 +192,98 @@ class RecentFormAnalyzer:
         if as_of_date is None:
             as_of_date = datetime.now()
         
-        # Filter to games before as_of_date
-        player_stats_df['game_date'] = pd.to_datetime(player_stats_df['game_date'])
-        recent_games = player_stats_df[player_stats_df['game_date'] < as_of_date].copy()
-        recent_games = recent_games.sort_values('game_date', ascending=False)
-        
-        if len(recent_games) == 0:
+        history = HistoryIndex(player_stats_df.assign(player_name=player_name))
+        form = self.compute_form(history, [player_name], as_of_date)
+        if form.empty:
             return None
-        
-        # Calculate rolling windows
-        cutoff_7 = as_of_date - timedelta(days=7)
-        cutoff_14 = as_of_date - timedelta(days=14)
-        cutoff_30 = as_of_date - timedelta(days=30)
-        
-        last_7_days = recent_games[recent_games['game_date'] >= cutoff_7]
-        last_14_days = recent_games[recent_games['game_date'] >= cutoff_14]
-        last_30_days = recent_games[recent_games['game_date'] >= cutoff_30]
-        
-        stats_7 = self.calculate_rolling_stats(last_7_days, 7)
-        stats_14 = self.calculate_rolling_stats(last_14_days, 14)
-        stats_30 = self.calculate_rolling_stats(last_30_days, 30)
-        season_stats = self.calculate_rolling_stats(recent_games, 365)
-        
-        # Detect streaks
-        is_hot, hit_streak = self.detect_hot_streak(recent_games)
-        is_cold, slump_length = self.detect_cold_streak(recent_games)
-        
-        # Calculate form score
-        form_score = self.calculate_form_score(stats_7, season_stats)
-        
-        # Determine trend
-        if stats_7['ops'] > stats_14['ops'] > stats_30['ops']:
-            trend = 'improving'
-        elif stats_7['ops'] < stats_14['ops'] < stats_30['ops']:
-            trend = 'declining'
+        return form.iloc[0].to_dict()
+    
+    def compute_form(self, history, players, as_of_dates):
+        """
+        Recent form for many (player, as_of_date) pairs in one vectorized pass
+        
+        Args:
+            history: HistoryIndex over the game logs (keyed by player_name)
+            players: Sequence of player names
+            as_of_dates: One date for every player, or a matching sequence
+                         (only games strictly before a pair's date count)
+        
+        Returns:
+            DataFrame with the analyze_player_form columns, one row per pair
+            that has at least one game before its date (input order kept)
+        """
+        players = list(players)
+        n = len(players)
+        if np.ndim(as_of_dates) == 0:
+            as_of = pd.DatetimeIndex([pd.Timestamp(as_of_dates)] * n)
         else:
-            trend = 'stable'
+            as_of = pd.DatetimeIndex(pd.to_datetime(list(as_of_dates)))
+        
+        lo, _, end = history.query_rows(players, None, as_of)
+        
+        # Rolling windows: [as_of - days, as_of) plus the whole season so far
+        stats = {}
+        for days in self.WINDOWS:
+            _, start, _ = history.query_rows(players, as_of - timedelta(days=days), None)
+            stats[days] = self._window_stats(history, np.minimum(start, end), end)
+        season_stats = self._window_stats(history, lo, end)
+        
+        # Last 15 games before as_of (most recent first) for streak detection
+        games_before = end - lo
+        rows = end[:, None] - np.arange(1, 16)[None, :]
+        valid = rows >= lo[:, None]
+        rows = np.where(valid, rows, 0)
+        hits = self._row_values(history, 'H', rows, valid)
+        at_bats = self._row_values(history, 'AB', rows, valid)
+        
+        enough = games_before >= 5
+        ab_7 = at_bats[:, :7].sum(axis=1)
+        h_7 = hits[:, :7].sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_7 = np.where(ab_7 > 0, h_7 / np.maximum(ab_7, 1), 0.0)
+        
+        hit_streak = np.where(enough, _max_run((hits[:, :10] > 0) & valid[:, :10]), 0)
+        is_hot = enough & ((hit_streak >= 5) | ((ab_7 >= 20) & (avg_7 >= 0.350)))
+        slump = np.where(enough, _max_hitless_run(at_bats, hits), 0)
+        is_cold = enough & ((slump >= 10) | ((ab_7 >= 20) & (avg_7 < 0.150)))
+        
+        # Form score: 7-day OPS vs season OPS, ±50% = ±1.0
+        recent_ops, season_ops = stats[7]['ops'], season_stats['ops']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ops_diff = (recent_ops - season_ops) / season_ops
+        form_score = np.where(season_ops == 0, 0.0,
+                              np.round(np.clip(ops_diff / 0.5, -1.0, 1.0), 2))
+        
+        ops_7, ops_14, ops_30 = stats[7]['ops'], stats[14]['ops'], stats[30]['ops']
+        trend = np.select(
+            [(ops_7 > ops_14) & (ops_14 > ops_30), (ops_7 < ops_14) & (ops_14 < ops_30)],
+            ['improving', 'declining'], default='stable'
+        )
+        form_rating = np.select(
+            [is_hot | (form_score >= 0.5), form_score >= 0.2, form_score >= -0.2,
+             is_cold | (form_score <= -0.5)],
+            ['Very Hot', 'Hot', 'Average', 'Very Cold'], default='Cold'
+        )
         
-        return {
-            'player_name': player_name,
-            'as_of_date': as_of_date.strftime('%Y-%m-%d'),
+        form = pd.DataFrame({
+            'player_name': players,
+            'as_of_date': as_of.strftime('%Y-%m-%d'),
             
             # 7-day stats
-            'last_7_games': stats_7['games'],
-            'last_7_avg': stats_7['avg'],
-            'last_7_ops': stats_7['ops'],
-            'last_7_hr': stats_7['hr'],
+            'last_7_games': stats[7]['games'],
+            'last_7_avg': stats[7]['avg'],
+            'last_7_ops': stats[7]['ops'],
+            'last_7_hr': stats[7]['hr'],
             
             # 14-day stats
-            'last_14_games': stats_14['games'],
-            'last_14_avg': stats_14['avg'],
-            'last_14_ops': stats_14['ops'],
+            'last_14_games': stats[14]['games'],
+            'last_14_avg': stats[14]['avg'],
+            'last_14_ops': stats[14]['ops'],
             
             # 30-day stats
-            'last_30_games': stats_30['games'],
-            'last_30_avg': stats_30['avg'],
-            'last_30_ops': stats_30['ops'],
+            'last_30_games': stats[30]['games'],
+            'last_30_avg': stats[30]['avg'],
+            'last_30_ops': stats[30]['ops'],
             
             # Season baseline
             'season_avg': season_stats['avg'],
@@ -238,14 +293,69 @@ class RecentFormAnalyzer:
             'is_hot_streak': is_hot,
             'hit_streak_length': hit_streak,
             'is_cold_streak': is_cold,
-            'slump_length': slump_length,
+            'slump_length': slump,
             
             # Form analysis
             'form_score': form_score,
             'trend': trend,
             
             # Overall assessment
-            'form_rating': self.get_form_rating(form_score, is_hot, is_cold)
+            'form_rating': form_rating
+        })
+        return form[games_before > 0].reset_index(drop=True)
+    
+    @staticmethod
+    def _row_values(history, field, rows, valid):
+        """Gather per-game values for a (pairs x games) row matrix (0 where invalid)"""
+        if field not in history.fields or len(history) == 0:
+            return np.zeros(rows.shape, dtype=np.int64)
+        return np.where(valid, history.values(field)[rows], 0)
+    
+    @staticmethod
+    def _window_stats(history, start, end):
+        """
+        Vectorized calculate_rolling_stats over row ranges [start, end)
+        
+        Returns:
+            dict of arrays: games, avg, obp, slg, ops, hr, rbi, runs, sb
+        """
+        fields = history.fields
+        
+        def total(field):
+            if field not in fields:
+                return np.zeros(len(start), dtype=np.int64)
+            return history.range_sum(field, start, end)
+        
+        ab, h, bb = total('AB'), total('H'), total('BB')
+        hbp, sf = total('HBP'), total('SF')
+        
+        # Total bases follow calculate_rolling_stats: the first of 1B/2B/3B
+        # present in the logs (weighted 1/2/3), else HR * 4
+        if '1B' in fields:
+            tb = total('1B')
+        elif '2B' in fields:
+            tb = total('2B') * 2
+        elif '3B' in fields:
+            tb = total('3B') * 3
+        else:
+            tb = total('HR') * 4
+        
+        pa = ab + bb + hbp + sf
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg = np.where(ab > 0, h / ab, 0.0)
+            obp = np.where(pa > 0, (h + bb + hbp) / pa, 0.0)
+            slg = np.where(ab > 0, tb / ab, 0.0)
+        
+        return {
+            'games': end - start,
+            'avg': np.round(avg, 3),
+            'obp': np.round(obp, 3),
+            'slg': np.round(slg, 3),
+            'ops': np.round(obp + slg, 3),
+            'hr': total('HR'),
+            'rbi': total('RBI'),
+            'runs': total('R'),
+            'sb': total('SB')
         }
     
     def get_form_rating(self, form_score, is_hot, is_cold):
@@ -261,7 +371,7 @@ class RecentFormAnalyzer:
         else:
             return 'Cold'
     
-    def analyze_roster(self, roster_df, schedule_df, players_df, target_date=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df, target_date=None, context=None):
         """Analyze recent form for all players on roster"""
         if target_date is None:
             target_date = datetime.now()
@@ -269,10 +379,13 @@ class RecentFormAnalyzer:
             target_date = datetime.strptime(target_date, '%Y-%m-%d')
         
         # Load game logs
-        game_log_file = self.data_dir / "mlb_game_logs_2024.csv"
+        if context is not None:
+            store = context.gamelog_store()
+        else:
+            store = get_gamelog_store(self.data_dir)
         
-        if not game_log_file.exists():
-            print(f"⚠️  Game log file not found: {game_log_file.name}")
+        if not store.exists:
+            print(f"⚠️  Game log file not found: {store.source_file.name}")
             print("   Run: python src/scripts/scrape/gamelog_scrape.py")
             print("   Using placeholder data for now...\n")
             
@@ -291,20 +404,24 @@ class RecentFormAnalyzer:
                 })
             return pd.DataFrame(results)
         
-        # Load game logs
-        print(f"Loading game logs from {game_log_file.name}...")
-        game_logs_df = pd.read_csv(game_log_file)
-        game_logs_df['game_date'] = pd.to_datetime(game_logs_df['game_date'])
+        print(f"Using game log store ({len(store):,} rows from {store.source_file.name})...")
+        
+        # All players' windows and streaks in one vectorized pass
+        if context is not None:
+            history = context.history_index(store.season)
+        else:
+            history = HistoryIndex(store.frame)
+        
+        known = [name for name in roster_df['player_name'] if name in history]
+        form_df = self.compute_form(history, known, target_date)
+        form_by_player = {row['player_name']: row for row in form_df.to_dict('records')}
         
         results = []
         
         for _, player in roster_df.iterrows():
             player_name = player['player_name']
             
-            # Get player's game log
-            player_games = game_logs_df[game_logs_df['player_name'] == player_name].copy()
-            
-            if len(player_games) == 0:
+            if player_name not in history:
                 print(f"  {player_name}: No game log data found")
                 results.append({
                     'player_name': player_name,
@@ -315,15 +432,13 @@ class RecentFormAnalyzer:
                 })
                 continue
             
-            # Analyze player form
-            form_data = self.analyze_player_form(player_name, player_games, target_date)
+            form_data = form_by_player.get(player_name)
             
             if form_data:
                 results.append(form_data)
         
         return pd.DataFrame(results)
 
-
 def main():
     """Main execution"""
     project_root = Path(__file__).parent.parent.parent
@@ -22,6 +22,13 @@ Output:
 import pandas as pd
 from pathlib import Path
 
+try:
+    from .gamelog_store import load_gamelogs
+    from .schedule_index import iter_player_games
+except ImportError:
+    from gamelog_store import load_gamelogs
+    from schedule_index import iter_player_games
+
 
 class RestDayFactorAnalyzer:
     """Analyze rest day performance impacts"""
@@ -50,68 +57,65 @@ class RestDayFactorAnalyzer:
         """Analyze rest day advantages"""
         results = []
         
-        for _, game in games_df.iterrows():
+        for game, player in iter_player_games(games_df, roster_df):
             game_date = game['game_date']
             
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
+            player_name = player['player_name']
                 
-                # Get player history
-                player_history = game_logs_df[
-                    (game_logs_df['player_name'] == player_name) &
-                    (game_logs_df['game_date'] < game_date)
-                ].sort_values('game_date').copy()
+            # Get player history
+            player_history = game_logs_df[
+                (game_logs_df['player_name'] == player_name) &
+                (game_logs_df['game_date'] < game_date)
+            ].sort_values('game_date').copy()
                 
-                # Ensure game_date is datetime
-                player_history['game_date'] = pd.to_datetime(player_history['game_date'])
+            # Ensure game_date is datetime
+            player_history['game_date'] = pd.to_datetime(player_history['game_date'])
                 
-                if len(player_history) >= 5:
-                    # Calculate days between games
-                    player_history['days_rest'] = (
-                        player_history['game_date'] - player_history['game_date'].shift(1)
-                    ).dt.days.fillna(0)
+            if len(player_history) >= 5:
+                # Calculate days between games
+                player_history['days_rest'] = (
+                    player_history['game_date'] - player_history['game_date'].shift(1)
+                ).dt.days.fillna(0)
                     
-                    # Rested games (2+ days)
-                    rested = player_history[player_history['days_rest'] >= 2]
-                    rested_ab = rested['AB'].sum()
-                    rested_hits = rested['H'].sum()
-                    rested_ba = rested_hits / rested_ab if rested_ab > 0 else 0
+                # Rested games (2+ days)
+                rested = player_history[player_history['days_rest'] >= 2]
+                rested_ab = rested['AB'].sum()
+                rested_hits = rested['H'].sum()
+                rested_ba = rested_hits / rested_ab if rested_ab > 0 else 0
                     
-                    # Back-to-back games (0-1 days)
-                    b2b = player_history[player_history['days_rest'] <= 1]
-                    b2b_ab = b2b['AB'].sum()
-                    b2b_hits = b2b['H'].sum()
-                    b2b_ba = b2b_hits / b2b_ab if b2b_ab > 0 else 0
+                # Back-to-back games (0-1 days)
+                b2b = player_history[player_history['days_rest'] <= 1]
+                b2b_ab = b2b['AB'].sum()
+                b2b_hits = b2b['H'].sum()
+                b2b_ba = b2b_hits / b2b_ab if b2b_ab > 0 else 0
                     
-                    # Days since last game
-                    last_game = player_history['game_date'].max()
-                    days_since = (pd.to_datetime(game_date) - last_game).days
-                    is_rested = days_since >= 2
+                # Days since last game
+                last_game = player_history['game_date'].max()
+                days_since = (pd.to_datetime(game_date) - last_game).days
+                is_rested = days_since >= 2
                     
-                    rest_score = self.calculate_rest_score(
-                        rested_ba, b2b_ba, is_rested, len(player_history)
-                    )
+                rest_score = self.calculate_rest_score(
+                    rested_ba, b2b_ba, is_rested, len(player_history)
+                )
                     
-                    results.append({
-                        'player_name': player_name,
-                        'game_date': game_date,
-                        'days_since_last_game': days_since,
-                        'rested_ba': round(rested_ba, 3),
-                        'back_to_back_ba': round(b2b_ba, 3),
-                        'rest_score': rest_score
-                    })
+                results.append({
+                    'player_name': player_name,
+                    'game_date': game_date,
+                    'days_since_last_game': days_since,
+                    'rested_ba': round(rested_ba, 3),
+                    'back_to_back_ba': round(b2b_ba, 3),
+                    'rest_score': rest_score
+                })
         
         return pd.DataFrame(results)
 
 
-    def analyze_roster(self, roster_df, schedule_df, ):
+    def analyze_roster(self, roster_df, schedule_df, context=None):
         """Wrapper for analyze to match interface"""
-        return self.analyze(schedule_df, self._load_gamelogs(), roster_df)
+        return self.analyze(schedule_df, self._load_gamelogs(context), roster_df)
     
-    def _load_gamelogs(self):
-        """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+    def _load_gamelogs(self, context=None):
+        """Helper to load game logs from the shared context or game log store"""
+        if context is not None:
+            return context.game_logs
+        return load_gamelogs(self.data_dir)
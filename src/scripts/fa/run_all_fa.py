@@ -5,15 +5,31 @@ Run All Factor Analyses
 Executes all 20 factor analyses and saves results to CSV files.
 This is a wrapper that runs each FA module and saves outputs.
 
+The all-players run records a manifest (factor_manifest.py). A later roster
+run for the same date, window and unchanged data files takes its rows from
+those results instead of re-running the analyzers; only roster rows without
+a matching all-players row are analyzed (--no-reuse always analyzes).
+
+Analyzed factors go through the factor result cache (factor_cache.py): a
+factor whose code and declared inputs are unchanged is served from
+data/factor_cache/ instead of being recomputed (--no-cache disables it).
+
 Usage:
     python src/scripts/run_all_fa.py
     python src/scripts/run_all_fa.py --date 2025-09-28
+    python src/scripts/run_all_fa.py --date 2025-09-22 --days 7   # One week of games
+    python src/scripts/run_all_fa.py --all-players --workers 8    # Parallel factors/batches
+    python src/scripts/run_all_fa.py --no-reuse                   # Roster run without projection
+    python src/scripts/run_all_fa.py --no-cache                   # Recompute every factor
 """
 
 import sys
+import time
+import multiprocessing
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import argparse
 
 # Add src to path
@@ -41,24 +57,171 @@ from scripts.fa import (
     statcast_metrics_fa,
     vegas_odds_fa
 )
+from scripts.fa.data_context import DataContext
+from scripts.fa.factor_cache import get_factor_cache
+from scripts.fa.factor_manifest import (
+    input_signature, load_manifest, project_factor, read_factor_output, write_manifest
+)
+from scripts.fa.score_matrix import FACTOR_FILES
+
+
+# (result key, label, analyzer class, positional inputs after the schedule,
+#  keyword inputs) - inputs are looked up by name in _factor_inputs()
+FACTOR_SPECS = [
+    ('wind', 'Wind Analysis', wind_analysis.WindAnalyzer, ('weather',), {}),
+    ('matchup', 'Historical Matchup Analysis', matchup_fa.MatchupFactorAnalyzer, ('players',), {}),
+    ('home_away', 'Home/Away Venue Analysis', home_away_fa.HomeAwayFactorAnalyzer, ('players',), {}),
+    ('rest', 'Rest Day Impact Analysis', rest_day_fa.RestDayFactorAnalyzer, (), {}),
+    ('injury', 'Injury/Recovery Analysis', injury_fa.InjuryFactorAnalyzer, ('players',), {}),
+    ('umpire', 'Umpire Strike Zone Analysis', umpire_fa.UmpireFactorAnalyzer, (), {}),
+    ('platoon', 'Platoon Advantage Analysis', platoon_fa.PlatoonFactorAnalyzer, ('players',), {}),
+    ('temperature', 'Temperature Analysis', temperature_fa.TemperatureAnalyzer, ('weather',), {}),
+    ('pitch_mix', 'Pitch Mix Analysis', pitch_mix_fa.PitchMixAnalyzer, ('players',), {}),
+    ('park', 'Park Factors Analysis', park_factors_fa.ParkFactorsAnalyzer, ('teams',), {}),
+    ('lineup', 'Lineup Position Analysis', lineup_position_fa.LineupPositionAnalyzer, (), {}),
+    ('time', 'Time of Day Analysis', time_of_day_fa.TimeOfDayAnalyzer, ('players',), {}),
+    ('defense', 'Defensive Positions Analysis',
+     defensive_positions_fa.DefensivePositionsFactorAnalyzer, ('teams',), {}),
+    ('recent_form', 'Recent Form / Streaks Analysis', recent_form_fa.RecentFormAnalyzer,
+     ('players',), {'target_date': 'as_of_date'}),
+    ('bullpen', 'Bullpen Fatigue Detection', bullpen_fatigue_fa.BullpenFatigueAnalyzer, ('players',), {}),
+    ('humidity', 'Humidity & Elevation Analysis',
+     humidity_elevation_fa.HumidityElevationAnalyzer, ('weather',), {}),
+    ('monthly', 'Monthly Splits Analysis', monthly_splits_fa.MonthlySplitsAnalyzer, ('players',), {}),
+    ('momentum', 'Team Momentum Analysis', team_momentum_fa.TeamOffensiveMomentumAnalyzer, ('teams',), {}),
+    ('statcast', 'Statcast Metrics Analysis', statcast_metrics_fa.StatcastMetricsAnalyzer,
+     ('players',), {'as_of_date': 'as_of_date'}),
+    ('vegas', 'Vegas Odds Analysis', vegas_odds_fa.VegasOddsAnalyzer,
+     ('players',), {'as_of_date': 'as_of_date'}),
+]
+
+FACTOR_INDEX = {spec[0]: spec for spec in FACTOR_SPECS}
+
+# Per-process state of pool workers (set once by _init_worker, read-only afterwards)
+_WORKER = {}
+
+
+def _factor_inputs(context):
+    """Named inputs analyzers receive besides the roster and target games"""
+    return {
+        'weather': context.weather,
+        'players': context.players,
+        'teams': context.teams,
+        'as_of_date': context.as_of_date,
+    }
+
+
+def _warm_context(context):
+    """
+    Fill the context's cached inputs before the pool starts
+    
+    Each worker receives a pickled copy of the context, so inputs loaded
+    here are parsed once instead of once per worker. Game logs are not part
+    of the context: workers reopen the memory-mapped store from disk.
+    """
+    context.schedule_index
+    _factor_inputs(context)
+
+
+def run_factor_batch(key, context, roster_batch):
+    """Run one factor analyzer on a slice of the roster"""
+    _, _, analyzer_cls, arg_names, kwarg_names = FACTOR_INDEX[key]
+    inputs = _factor_inputs(context)
+    analyzer = analyzer_cls(context.data_dir)
+    args = [inputs[name] for name in arg_names]
+    kwargs = {param: inputs[name] for param, name in kwarg_names.items()}
+    return analyzer.analyze_roster(
+        roster_batch.copy(), context.target_games, *args, context=context, **kwargs
+    )
+
+
+def _init_worker(context, roster_df):
+    """
+    Pool initializer: receive the shared inputs once per worker process
+    
+    Workers are spawned (never forked): daily_sitstart runs this on a
+    pipeline thread, and a forked child could inherit a lock another thread
+    holds. The arguments are pickled once per worker, never per task.
+    """
+    _WORKER['context'] = context
+    _WORKER['roster_df'] = roster_df
+
+
+def _run_task(key, start, end):
+    """Worker task: one factor on roster rows [start, end); returns (df, seconds, error)"""
+    started = time.perf_counter()
+    try:
+        df = run_factor_batch(key, _WORKER['context'], _WORKER['roster_df'].iloc[start:end])
+        return df, time.perf_counter() - started, None
+    except Exception as e:
+        return None, time.perf_counter() - started, f"{type(e).__name__}: {e}"
+
+
+def project_roster_factors(context, roster_df, manifest, save_factor):
+    """
+    Roster results taken from a matching all-players run
+    
+    Each factor's all-players output is filtered to the roster; roster rows
+    with no matching all-players row are analyzed directly and appended.
+    
+    Returns:
+        {factor: seconds}
+    """
+    all_players_df = context.load_roster(all_players=True)
+    timings = {}
+    
+    for key, label, *_ in FACTOR_SPECS:
+        started = time.perf_counter()
+        try:
+            if key in manifest['files']:
+                output_df = read_factor_output(context.data_dir, manifest['files'][key])
+                projected, residual = project_factor(key, roster_df, all_players_df, output_df)
+            else:
+                projected, residual = None, roster_df
+            
+            frames = [projected] if projected is not None else []
+            if len(residual):
+                frames.append(run_factor_batch(key, context, residual))
+            frames = [df for df in frames if len(df.columns)] or [pd.DataFrame()]
+            output_file = save_factor(key, frames)
+            
+            reused = len(roster_df) - len(residual)
+            print(f"  ✓ {label}: {reused} reused, {len(residual)} analyzed → {output_file.name}")
+        except Exception as e:
+            print(f"  ✗ {label}: {e}")
+        timings[key] = time.perf_counter() - started
+    
+    return timings
 
 
-def run_all_factor_analyses(data_dir: Path, as_of_date=None, all_players=False):
-    """Run all 17 factor analyses and save outputs
+def run_all_factor_analyses(data_dir: Path, as_of_date=None, all_players=False, context=None, days=1,
+                            workers=1, reuse=True, cache=True):
+    """Run all 20 factor analyses and save outputs
     
     Args:
         data_dir: Path to data directory
         as_of_date: Target date for analysis (datetime or str). Defaults to today.
         all_players: If True, analyze all MLB players. If False, analyze only rostered players.
+        days: Length of the target window starting at as_of_date (ignored with context)
+        workers: Worker processes for factors/batches (1 = run serially in-process)
+        context: Optional shared DataContext. When the caller already holds one
+                 (e.g. daily_sitstart running both roster and all-players passes),
+                 inputs are parsed once and reused across runs.
+        reuse: Roster mode only - project results from a matching all-players
+               run when its manifest is valid (otherwise analyze the roster)
+        cache: Serve factors whose code and inputs are unchanged from the
+               factor result cache and store newly computed results
     """
     
-    # Parse as_of_date
-    if as_of_date is None:
-        as_of_date = datetime.now()
-    elif isinstance(as_of_date, str):
-        as_of_date = datetime.strptime(as_of_date, "%Y-%m-%d")
+    # Shared, lazily loaded inputs (typed dtypes, pre-parsed dates)
+    if context is None:
+        context = DataContext(data_dir, as_of_date=as_of_date, target_days=days)
+    as_of_date = context.as_of_date
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    data_dir = Path(context.data_dir)
+    # Inputs the all-players manifest is checked against (taken before any output is written)
+    signature = input_signature(data_dir) if all_players or reuse else None
     
     # Load required data
     print(f"Loading data files for analysis date: {as_of_date.strftime('%Y-%m-%d')}...")
@@ -67,69 +230,33 @@ def run_all_factor_analyses(data_dir: Path, as_of_date=None, all_players=False):
     if all_players:
         print("Mode: Analyzing ALL MLB players (for waiver wire)")
         try:
-            roster_df = pd.read_csv(data_dir / "mlb_all_players_complete.csv")
-            # Filter to only current season players
-            current_season = as_of_date.year
-            if 'season' in roster_df.columns:
-                roster_df = roster_df[roster_df['season'] == current_season]
+            roster_df = context.load_roster(all_players=True)
             print(f"✓ Loaded {len(roster_df)} active MLB players")
         except Exception as e:
             print(f"❌ Error loading all players file: {e}")
             return False
     else:
         print("Mode: Analyzing ROSTERED players only")
-        # Get latest roster
-        roster_files = sorted(data_dir.glob("yahoo_fantasy_rosters_*.csv"), 
-                             key=lambda x: x.stat().st_mtime, reverse=True)
-        if not roster_files:
+        roster_df = context.load_roster(all_players=False)
+        if context.roster_source is None:
             print("❌ No roster file found!")
             return False
         
-        roster_df = pd.read_csv(roster_files[0])
-        print(f"✓ Loaded roster: {roster_files[0].name} ({len(roster_df)} players)")
-    
-    # Team abbreviation to full name mapping
-    TEAM_MAP = {
-        'AZ': 'Arizona Diamondbacks', 'ATL': 'Atlanta Braves',
-        'ATH': 'Oakland Athletics', 'BAL': 'Baltimore Orioles',
-        'BOS': 'Boston Red Sox', 'CHC': 'Chicago Cubs',
-        'CHW': 'Chicago White Sox', 'CIN': 'Cincinnati Reds',
-        'CLE': 'Cleveland Guardians', 'COL': 'Colorado Rockies',
-        'CWS': 'Chicago White Sox', 'DET': 'Detroit Tigers',
-        'HOU': 'Houston Astros', 'KC': 'Kansas City Royals',
-        'LAA': 'Los Angeles Angels', 'LAD': 'Los Angeles Dodgers',
-        'MIA': 'Miami Marlins', 'MIL': 'Milwaukee Brewers',
-        'MIN': 'Minnesota Twins', 'NYM': 'New York Mets',
-        'NYY': 'New York Yankees', 'OAK': 'Oakland Athletics',
-        'PHI': 'Philadelphia Phillies', 'PIT': 'Pittsburgh Pirates',
-        'SD': 'San Diego Padres', 'SEA': 'Seattle Mariners',
-        'SF': 'San Francisco Giants', 'STL': 'St. Louis Cardinals',
-        'TB': 'Tampa Bay Rays', 'TEX': 'Texas Rangers',
-        'TOR': 'Toronto Blue Jays', 'WSH': 'Washington Nationals',
-    }
-    
-    # Normalize roster columns based on source
-    if all_players:
-        # All players file has: player_id, player_name, team_id, team_name
-        if 'team_name' in roster_df.columns:
-            roster_df['team'] = roster_df['team_name']
-            roster_df['mlb_team'] = roster_df['team_name']  # Add mlb_team for analyzer compatibility
-    else:
-        # Roster file has: mlb_team, name
-        if 'mlb_team' in roster_df.columns and 'team' not in roster_df.columns:
-            roster_df['team'] = roster_df['mlb_team'].map(TEAM_MAP)
-            roster_df['team'].fillna(roster_df['mlb_team'], inplace=True)
-        if 'name' in roster_df.columns and 'player_name' not in roster_df.columns:
-            roster_df['player_name'] = roster_df['name']
+        print(f"✓ Loaded roster: {context.roster_source.name} ({len(roster_df)} players)")
     
     # Load other data files
     try:
-        schedule_2025 = pd.read_csv(data_dir / "mlb_2025_schedule.csv")
-        weather = pd.read_csv(data_dir / "mlb_stadium_weather.csv")
-        players_complete = pd.read_csv(data_dir / "mlb_all_players_complete.csv")
-        teams = pd.read_csv(data_dir / "mlb_all_teams.csv")
+        schedule_index = context.schedule_index
+        target_games = schedule_index.games
+        weather = context.weather
+        players_complete = context.players
+        teams = context.teams
         
-        print(f"✓ Loaded {len(schedule_2025)} games from 2025 schedule")
+        print(f"✓ Loaded {len(context.schedule)} games from {context.schedule_file().name}")
+        if schedule_index.start is not None:
+            last_day = schedule_index.end - pd.Timedelta(days=1)
+            print(f"✓ Target window {schedule_index.start:%Y-%m-%d} to {last_day:%Y-%m-%d}: "
+                  f"{len(target_games)} games, {len(schedule_index.teams)} teams")
         print(f"✓ Loaded weather for {len(weather)} stadiums")
         print(f"✓ Loaded {len(players_complete)} player records")
         
@@ -137,288 +264,142 @@ def run_all_factor_analyses(data_dir: Path, as_of_date=None, all_players=False):
         print(f"❌ Error loading data files: {e}")
         return False
     
+    # Roster run on top of a matching all-players run: filter + join its results
+    manifest = load_manifest(context, signature) if reuse and not all_players else None
+    
     print("\nRunning factor analyses...\n")
     
     # Batch processing for large datasets
-    batch_size = 100 if all_players else len(roster_df)
-    num_batches = (len(roster_df) + batch_size - 1) // batch_size
+    batch_size = 100 if all_players else max(len(roster_df), 1)
+    batches = [(start, min(start + batch_size, len(roster_df)))
+               for start in range(0, len(roster_df), batch_size)] or [(0, 0)]
     
-    if all_players and num_batches > 1:
-        print(f"📦 Processing {len(roster_df)} players in {num_batches} batches of {batch_size}")
-        print(f"   This will take approximately {num_batches * 2} minutes\n")
-    
-    # Track results
-    results = {}
+    if all_players and len(batches) > 1:
+        print(f"📦 Processing {len(roster_df)} players in {len(batches)} batches of {batch_size}")
+    if workers > 1:
+        print(f"⚙️  Running on {workers} worker processes\n")
+    elif all_players and len(batches) > 1:
+        print()
     
     # Determine output file suffix
     file_suffix = "all_players" if all_players else "roster"
     
-    # Helper function to process in batches
-    def process_in_batches(analyzer_func, *args, **kwargs):
-        """Process roster in batches and combine results"""
-        if num_batches == 1:
-            return analyzer_func(*args, **kwargs)
-        
-        all_results = []
-        for batch_num in range(num_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min((batch_num + 1) * batch_size, len(roster_df))
-            batch_roster = roster_df.iloc[start_idx:end_idx].copy()
-            
-            # Replace first positional argument (roster_df) with batch
-            new_args = list(args)
-            new_args[0] = batch_roster
-            
-            batch_result = analyzer_func(*new_args, **kwargs)
-            all_results.append(batch_result)
-            
-            if batch_num % 5 == 4:  # Progress every 5 batches
-                print(f"    [{batch_num + 1}/{num_batches} batches]", end='\r')
+    # Track results
+    results = {}
+    timings = {}
+    
+    # Factor result cache: keys over each factor's code and declared inputs
+    factor_cache = get_factor_cache(data_dir) if cache and manifest is None else None
+    cache_keys = {}
+    if factor_cache is not None and factor_cache.enabled:
+        cache_keys = {key: factor_cache.key(key, cls, context, roster_df)
+                      for key, _, cls, _, _ in FACTOR_SPECS}
+    
+    def save_factor(key, frames, store=True):
+        """Concatenate a factor's batch results and write its CSV"""
+        factor_df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        output_file = data_dir / f"{FACTOR_FILES[key]}_{file_suffix}_{timestamp}.csv"
+        factor_df.to_csv(output_file, index=False)
+        results[key] = output_file
+        if store and key in cache_keys:
+            factor_cache.put(key, cache_keys[key], factor_df)
+        return output_file
+    
+    # Unchanged factors come straight from the cache
+    cached = set()
+    for key, label, *_ in FACTOR_SPECS:
+        if key not in cache_keys:
+            continue
+        started = time.perf_counter()
+        factor_df = factor_cache.get(key, cache_keys[key])
+        if factor_df is None:
+            continue
+        output_file = save_factor(key, [factor_df], store=False)
+        timings[key] = time.perf_counter() - started
+        cached.add(key)
+        print(f"  ♻️  {label} (cached) → {output_file.name}")
+    run_specs = [spec for spec in FACTOR_SPECS if spec[0] not in cached]
+    if cached and run_specs:
+        print()
+    
+    if manifest is not None:
+        print(f"♻️  Projecting roster results from the all-players run ({manifest['timestamp']})\n")
+        timings = project_roster_factors(context, roster_df, manifest, save_factor)
+    elif workers <= 1 or not run_specs:
+        # Serial: factors in order, batches in order, in this process
+        for num, (key, label, _, _, _) in enumerate(run_specs, start=1):
+            print(f"{num}/{len(run_specs)} {label}...")
+            started = time.perf_counter()
+            try:
+                frames = []
+                for batch_num, (start, end) in enumerate(batches):
+                    frames.append(run_factor_batch(key, context, roster_df.iloc[start:end]))
+                    if len(batches) > 1 and batch_num % 5 == 4:  # Progress every 5 batches
+                        print(f"    [{batch_num + 1}/{len(batches)} batches]", end='\r')
+                if len(batches) > 1:
+                    print(f"    [{len(batches)}/{len(batches)} batches] ✓")
+                output_file = save_factor(key, frames)
+                print(f"  ✓ Saved to {output_file.name}")
+            except Exception as e:
+                print(f"  ✗ Error: {e}")
+            timings[key] = time.perf_counter() - started
+    else:
+        # Parallel: every (factor, batch) is a task; workers hold the inputs
+        _warm_context(context)
+        pending = {key: len(batches) for key, *_ in run_specs}
+        frames = {key: [None] * len(batches) for key, *_ in run_specs}
+        errors = {}
+        task_time = {key: 0.0 for key, *_ in run_specs}
+        started = time.perf_counter()
         
-        if num_batches > 1:
-            print(f"    [{num_batches}/{num_batches} batches] ✓")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker, initargs=(context, roster_df)) as pool:
+            futures = {
+                pool.submit(_run_task, key, start, end): (key, batch_num)
+                for key, *_ in run_specs
+                for batch_num, (start, end) in enumerate(batches)
+            }
+            for future in as_completed(futures):
+                key, batch_num = futures[future]
+                try:
+                    df, elapsed, error = future.result()
+                except Exception as e:  # Worker died
+                    df, elapsed, error = None, 0.0, str(e)
+                task_time[key] += elapsed
+                if error:
+                    errors.setdefault(key, error)
+                frames[key][batch_num] = df
+                pending[key] -= 1
+                
+                if pending[key] == 0:
+                    timings[key] = task_time[key]
+                    label = FACTOR_INDEX[key][1]
+                    if key in errors:
+                        print(f"  ✗ {label}: {errors[key]}")
+                        continue
+                    try:
+                        output_file = save_factor(key, frames[key])
+                        print(f"  ✓ {label} → {output_file.name}")
+                    except Exception as e:
+                        print(f"  ✗ {label}: {e}")
         
-        return pd.concat(all_results, ignore_index=True)
+        print(f"\n✓ Parallel run finished in {time.perf_counter() - started:.1f}s")
     
-    # 1. Wind Analysis
-    print("1/20 Wind Analysis...")
-    try:
-        analyzer = wind_analysis.WindAnalyzer(data_dir)
-        wind_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, weather)
-        output_file = data_dir / f"wind_analysis_{file_suffix}_{timestamp}.csv"
-        wind_df.to_csv(output_file, index=False)
-        results['wind'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
+    if all_players and results:
+        manifest_file = write_manifest(context, signature, results, timestamp)
+        print(f"\n📁 Manifest: {manifest_file.name}")
     
-    # 2. Matchup Analysis  
-    print("2/20 Historical Matchup Analysis...")
-    try:
-        analyzer = matchup_fa.MatchupFactorAnalyzer(data_dir)
-        matchup_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"matchup_analysis_{file_suffix}_{timestamp}.csv"
-        matchup_df.to_csv(output_file, index=False)
-        results['matchup'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 3. Home/Away Analysis
-    print("3/20 Home/Away Venue Analysis...")
-    try:
-        analyzer = home_away_fa.HomeAwayFactorAnalyzer(data_dir)
-        venue_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"home_away_analysis_{file_suffix}_{timestamp}.csv"
-        venue_df.to_csv(output_file, index=False)
-        results['home_away'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 4. Rest Day Analysis
-    print("4/20 Rest Day Impact Analysis...")
-    try:
-        analyzer = rest_day_fa.RestDayFactorAnalyzer(data_dir)
-        rest_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025)
-        output_file = data_dir / f"rest_day_analysis_{file_suffix}_{timestamp}.csv"
-        rest_df.to_csv(output_file, index=False)
-        results['rest'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 5. Injury/Recovery Analysis
-    print("5/20 Injury/Recovery Analysis...")
-    try:
-        analyzer = injury_fa.InjuryFactorAnalyzer(data_dir)
-        injury_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"injury_analysis_{file_suffix}_{timestamp}.csv"
-        injury_df.to_csv(output_file, index=False)
-        results['injury'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 6. Umpire Analysis
-    print("6/20 Umpire Strike Zone Analysis...")
-    try:
-        analyzer = umpire_fa.UmpireFactorAnalyzer(data_dir)
-        umpire_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025)
-        output_file = data_dir / f"umpire_analysis_{file_suffix}_{timestamp}.csv"
-        umpire_df.to_csv(output_file, index=False)
-        results['umpire'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
+    if factor_cache is not None and factor_cache.enabled:
+        factor_cache.save_file_hashes()
+        evicted = factor_cache.evict()
+        print(f"\n📦 Factor cache: {len(cached)} cached, {len(run_specs)} computed"
+              f"{f', {evicted} old entries evicted' if evicted else ''}")
     
-    # 7. Platoon Analysis
-    print("7/20 Platoon Advantage Analysis...")
-    try:
-        analyzer = platoon_fa.PlatoonFactorAnalyzer(data_dir)
-        platoon_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"platoon_analysis_{file_suffix}_{timestamp}.csv"
-        platoon_df.to_csv(output_file, index=False)
-        results['platoon'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 8. Temperature Analysis
-    print("8/20 Temperature Analysis...")
-    try:
-        analyzer = temperature_fa.TemperatureAnalyzer(data_dir)
-        temp_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, weather)
-        output_file = data_dir / f"temperature_analysis_{file_suffix}_{timestamp}.csv"
-        temp_df.to_csv(output_file, index=False)
-        results['temperature'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 9. Pitch Mix Analysis
-    print("9/20 Pitch Mix Analysis...")
-    try:
-        analyzer = pitch_mix_fa.PitchMixAnalyzer(data_dir)
-        pitch_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"pitch_mix_analysis_{file_suffix}_{timestamp}.csv"
-        pitch_df.to_csv(output_file, index=False)
-        results['pitch_mix'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 10. Park Factors Analysis
-    print("10/20 Park Factors Analysis...")
-    try:
-        analyzer = park_factors_fa.ParkFactorsAnalyzer(data_dir)
-        park_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, teams)
-        output_file = data_dir / f"park_factors_analysis_{file_suffix}_{timestamp}.csv"
-        park_df.to_csv(output_file, index=False)
-        results['park'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 11. Lineup Position Analysis
-    print("11/20 Lineup Position Analysis...")
-    try:
-        analyzer = lineup_position_fa.LineupPositionAnalyzer(data_dir)
-        lineup_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025)
-        output_file = data_dir / f"lineup_position_analysis_{file_suffix}_{timestamp}.csv"
-        lineup_df.to_csv(output_file, index=False)
-        results['lineup'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 12. Time of Day Analysis
-    print("12/20 Time of Day Analysis...")
-    try:
-        analyzer = time_of_day_fa.TimeOfDayAnalyzer(data_dir)
-        time_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"time_of_day_analysis_{file_suffix}_{timestamp}.csv"
-        time_df.to_csv(output_file, index=False)
-        results['time'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 13. Defensive Positions Analysis
-    print("13/20 Defensive Positions Analysis...")
-    try:
-        analyzer = defensive_positions_fa.DefensivePositionsFactorAnalyzer(data_dir)
-        defense_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, teams)
-        output_file = data_dir / f"defensive_positions_analysis_{file_suffix}_{timestamp}.csv"
-        defense_df.to_csv(output_file, index=False)
-        results['defense'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 14. Recent Form / Streaks Analysis
-    print("14/20 Recent Form / Streaks Analysis...")
-    try:
-        analyzer = recent_form_fa.RecentFormAnalyzer(data_dir)
-        form_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete, target_date=as_of_date)
-        output_file = data_dir / f"recent_form_analysis_{file_suffix}_{timestamp}.csv"
-        form_df.to_csv(output_file, index=False)
-        results['recent_form'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 15. Bullpen Fatigue Analysis
-    print("15/20 Bullpen Fatigue Detection...")
-    try:
-        analyzer = bullpen_fatigue_fa.BullpenFatigueAnalyzer(data_dir)
-        bullpen_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"bullpen_fatigue_analysis_{file_suffix}_{timestamp}.csv"
-        bullpen_df.to_csv(output_file, index=False)
-        results['bullpen'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 16. Humidity & Elevation Analysis
-    print("16/20 Humidity & Elevation Analysis...")
-    try:
-        analyzer = humidity_elevation_fa.HumidityElevationAnalyzer(data_dir)
-        humidity_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, weather)
-        output_file = data_dir / f"humidity_elevation_analysis_{file_suffix}_{timestamp}.csv"
-        humidity_df.to_csv(output_file, index=False)
-        results['humidity'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 17. Monthly Splits Analysis
-    print("17/20 Monthly Splits Analysis...")
-    try:
-        analyzer = monthly_splits_fa.MonthlySplitsAnalyzer(data_dir)
-        monthly_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"monthly_splits_analysis_{file_suffix}_{timestamp}.csv"
-        monthly_df.to_csv(output_file, index=False)
-        results['monthly'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 18. Team Momentum Analysis
-    print("18/20 Team Momentum Analysis...")
-    try:
-        analyzer = team_momentum_fa.TeamOffensiveMomentumAnalyzer(data_dir)
-        momentum_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, teams)
-        output_file = data_dir / f"team_momentum_analysis_{file_suffix}_{timestamp}.csv"
-        momentum_df.to_csv(output_file, index=False)
-        results['momentum'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 19. Statcast Metrics Analysis
-    print("19/20 Statcast Metrics Analysis...")
-    try:
-        analyzer = statcast_metrics_fa.StatcastMetricsAnalyzer(data_dir)
-        statcast_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete, as_of_date=as_of_date)
-        output_file = data_dir / f"statcast_metrics_analysis_{file_suffix}_{timestamp}.csv"
-        statcast_df.to_csv(output_file, index=False)
-        results['statcast'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 20. Vegas Odds Analysis
-    print("20/20 Vegas Odds Analysis...")
-    try:
-        analyzer = vegas_odds_fa.VegasOddsAnalyzer(data_dir)
-        vegas_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete, as_of_date=as_of_date)
-        output_file = data_dir / f"vegas_odds_analysis_{file_suffix}_{timestamp}.csv"
-        vegas_df.to_csv(output_file, index=False)
-        results['vegas'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
+    summed = workers > 1 and manifest is None and run_specs
+    print(f"\n⏱  Factor wall time{' (summed over batches)' if summed else ''}:")
+    for key, seconds in sorted(timings.items(), key=lambda x: x[1], reverse=True):
+        status = "✓" if key in results else "✗"
+        print(f"   {status} {key:12s} {seconds:8.2f}s")
     
     print(f"\n✓ Completed {len(results)}/20 factor analyses")
     
@@ -428,8 +409,16 @@ def run_all_factor_analyses(data_dir: Path, as_of_date=None, all_players=False):
 def main():
     parser = argparse.ArgumentParser(description='Run all 20 factor analyses')
     parser.add_argument('--date', type=str, help='Target date for analysis (YYYY-MM-DD)')
+    parser.add_argument('--days', type=int, default=1,
+                       help='Number of days of games to analyze starting at --date (default: 1)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Worker processes to run factors and batches in parallel (default: 1)')
     parser.add_argument('--all-players', action='store_true', 
                        help='Analyze all MLB players instead of just rostered players (for waiver wire)')
+    parser.add_argument('--no-reuse', action='store_true',
+                       help='Analyze the roster even when a matching all-players run exists')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Recompute every factor instead of using the factor result cache')
     args = parser.parse_args()
     
     project_root = Path(__file__).parent.parent.parent
@@ -440,7 +429,9 @@ def main():
     print("="*80 + "\n")
     
     try:
-        success = run_all_factor_analyses(data_dir, as_of_date=args.date, all_players=args.all_players)
+        success = run_all_factor_analyses(data_dir, as_of_date=args.date, all_players=args.all_players,
+                                          days=args.days, workers=args.workers, reuse=not args.no_reuse,
+                                          cache=not args.no_cache)
         sys.exit(0 if success else 1)
     except Exception as e:
         print(f"\n❌ Error: {e}")
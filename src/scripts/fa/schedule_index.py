@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Target-Date Schedule Index
+
+Resolves which games a team plays on a target date (or date window) so factor
+analyzers only emit rows for (player, game) pairs that actually exist, instead
+of crossing every scheduled game of the season with every roster player.
+
+Key Concepts:
+- Target window: [start_date, start_date + days). If no games fall inside it
+  (off day, off-season), the window moves to the next date with games, or to
+  the last scheduled date once the season is over
+- team -> games: each game appears once per participating team, annotated
+  from that team's perspective with is_home and opponent (venue and any
+  start time columns of the schedule are kept as-is)
+- Players are matched to games through their full team name ('team' column,
+  falling back to 'mlb_team')
+
+Usage:
+    from scripts.fa.schedule_index import ScheduleIndex
+
+    index = ScheduleIndex(schedule_df, start_date='2025-09-28', days=1)
+    for game, player in index.player_games(roster_df):
+        ...
+"""
+
+from datetime import timedelta
+
+import pandas as pd
+
+
+def resolve_window(game_dates, start_date, days=1):
+    """
+    First [start, end) window of `days` days with games, beginning at start_date
+
+    Args:
+        game_dates: Series of scheduled game dates (datetime64)
+        start_date: Requested first day of the window
+        days: Window length in days
+
+    Returns:
+        (start, end) Timestamps (end exclusive)
+    """
+    start = pd.Timestamp(start_date).normalize()
+    dates = pd.to_datetime(game_dates).dt.normalize()
+    if len(dates) and not (dates >= start).any():
+        start = dates.max()
+    elif len(dates) and not ((dates >= start) & (dates < start + timedelta(days=days))).any():
+        start = dates[dates >= start].min()
+    return start, start + timedelta(days=days)
+
+
+def player_team(player):
+    """Full team name used to match a roster row to scheduled games"""
+    team = player.get('team')
+    if team is None or pd.isna(team) or team == '':
+        team = player.get('mlb_team', '')
+    return '' if team is None or pd.isna(team) else str(team)
+
+
+class ScheduleIndex:
+    """team -> games lookup for a target date window of the schedule"""
+
+    def __init__(self, schedule_df, start_date=None, days=1):
+        """
+        Args:
+            schedule_df: Season schedule (game_date, home_team, away_team, venue, ...)
+            start_date: First day of the target window (None = whole schedule)
+            days: Window length in days
+        """
+        games = schedule_df
+        if start_date is not None and len(games) and 'game_date' in games.columns:
+            game_dates = pd.to_datetime(games['game_date'])
+            self.start, self.end = resolve_window(game_dates, start_date, days)
+            games = games[(game_dates >= self.start) & (game_dates < self.end)]
+        else:
+            self.start = self.end = None
+        self.games = games
+        self._sides = self._build_sides(games)
+
+    @staticmethod
+    def _build_sides(games):
+        """team -> list of game rows seen from that team (is_home, opponent added)"""
+        sides = {}
+        if not {'home_team', 'away_team'}.issubset(games.columns):
+            return sides
+        for _, game in games.iterrows():
+            home, away = str(game['home_team']), str(game['away_team'])
+            for team, opponent, is_home in ((home, away, True), (away, home, False)):
+                side = game.copy()
+                side['is_home'] = is_home
+                side['opponent'] = opponent
+                sides.setdefault(team, []).append(side)
+        return sides
+
+    def __len__(self):
+        return len(self.games)
+
+    @property
+    def teams(self):
+        """Teams with at least one game in the window"""
+        return list(self._sides)
+
+    def team_games(self, team):
+        """Games for a team in the window (schedule columns + is_home, opponent)"""
+        sides = self._sides.get(str(team), [])
+        if not sides:
+            return pd.DataFrame(columns=list(self.games.columns) + ['is_home', 'opponent'])
+        return pd.DataFrame(sides)
+
+    def player_games(self, roster_df):
+        """
+        Yield (game, player) for every game a roster player's team plays
+
+        Players whose team has no game in the window yield nothing. The game
+        row carries is_home and opponent from the player's perspective.
+        """
+        if not self._sides:
+            return
+        for _, player in roster_df.iterrows():
+            for game in self._sides.get(player_team(player), []):
+                yield game, player
+
+
+def iter_player_games(games_df, roster_df):
+    """(game, player) pairs for players whose team plays in games_df"""
+    return ScheduleIndex(games_df).player_games(roster_df)
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Factor Score Matrix
+
+Combines the 20 factor analysis outputs into one dense player x factor score
+matrix. Each factor CSV is read once (only the columns needed), reduced to one
+row per player, and aligned on a normalized player name. Final scores are a
+single weighted product of the matrix with the weight matrix (default weights
+plus any player-specific overrides).
+
+Key Concepts:
+- One score column per factor, picked with the same priority list the
+  sit/start process has always used (first matching column, else any *_score)
+- First row per player wins (factor outputs list the next game first)
+- Players are matched by case-insensitive exact name, then by player_id
+- Missing factor scores are NaN in the matrix and contribute 0 to final_score
+- Same engine serves the roster run and the all-players (waiver wire) run
+
+Usage:
+    from scripts.fa.score_matrix import FactorScoreMatrix
+
+    matrix = FactorScoreMatrix(data_dir, scope='roster')
+    scores = matrix.build(roster_df)
+    final = matrix.final_scores(scores, player_weights, default_weights)
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+# Factor name -> output file prefix (files are <prefix>_<scope>_<timestamp>.csv)
+FACTOR_FILES = {
+    'wind': 'wind_analysis',
+    'matchup': 'matchup_analysis',
+    'home_away': 'home_away_analysis',
+    'rest': 'rest_day_analysis',
+    'injury': 'injury_analysis',
+    'umpire': 'umpire_analysis',
+    'platoon': 'platoon_analysis',
+    'temperature': 'temperature_analysis',
+    'pitch_mix': 'pitch_mix_analysis',
+    'park': 'park_factors_analysis',
+    'lineup': 'lineup_position_analysis',
+    'time': 'time_of_day_analysis',
+    'defense': 'defensive_positions_analysis',
+    'recent_form': 'recent_form_analysis',
+    'bullpen': 'bullpen_fatigue_analysis',
+    'humidity': 'humidity_elevation_analysis',
+    'monthly': 'monthly_splits_analysis',
+    'momentum': 'team_momentum_analysis',
+    'statcast': 'statcast_metrics_analysis',
+    'vegas': 'vegas_odds_analysis',
+}
+
+FACTORS = list(FACTOR_FILES)
+
+# Score column priority (first present column is the factor's score)
+SCORE_COLUMNS = [
+    'score', 'final_score', 'advantage_score', 'impact_score',
+    'platoon_score', 'temp_score', 'pitch_mix_score', 'park_score',
+    'lineup_score', 'time_score', 'defense_score', 'form_score',
+    'bullpen_score', 'humidity_score', 'monthly_score', 'momentum_score',
+    'statcast_score', 'vegas_score', 'wind_score', 'umpire_score'
+]
+
+
+def normalize_name(names):
+    """Case-insensitive, whitespace-trimmed player name key (Series in, Series out)"""
+    return pd.Series(names, dtype=object).astype(str).str.strip().str.casefold()
+
+
+def pick_score_column(columns):
+    """Score column for a factor output, or None if it has none"""
+    for col in SCORE_COLUMNS:
+        if col in columns:
+            return col
+    for col in columns:
+        if col.endswith('_score'):
+            return col
+    return None
+
+
+def reduce_factor_output(df):
+    """A factor output reduced to one scored row per player (None if unusable)"""
+    score_col = pick_score_column(df.columns)
+    if score_col is None or 'player_name' not in df.columns:
+        return None
+    usecols = ['player_name', score_col] + [c for c in ('player_id', 'team') if c in df.columns]
+    df = df[usecols].rename(columns={score_col: 'score'})
+    df['score'] = pd.to_numeric(df['score'], errors='coerce')
+    df['key'] = normalize_name(df['player_name']).values
+    return df.drop_duplicates('key', keep='first').reset_index(drop=True)
+
+
+class FactorScoreMatrix:
+    """Loads factor outputs once and aligns them into a player x factor matrix"""
+
+    def __init__(self, data_dir, scope=None):
+        """
+        Args:
+            data_dir: Directory holding the *_analysis_*.csv outputs (None
+                      with from_frames)
+            scope: 'roster' or 'all_players' to restrict to one run's outputs,
+                   None for the most recent output of either run
+        """
+        self.data_dir = Path(data_dir) if data_dir is not None else None
+        self.scope = scope
+        self._factor_scores = None
+
+    @classmethod
+    def from_frames(cls, frames):
+        """Matrix over in-memory factor outputs (factor -> analyze_roster frame)"""
+        matrix = cls(None)
+        matrix._factor_scores = {}
+        for factor, df in frames.items():
+            df = reduce_factor_output(df) if df is not None else None
+            if df is not None and not df.empty:
+                matrix._factor_scores[factor] = df
+        return matrix
+
+    def latest_file(self, factor):
+        """Most recent output file for a factor, or None"""
+        prefix = FACTOR_FILES[factor]
+        pattern = f"{prefix}_{self.scope}_*.csv" if self.scope else f"{prefix}_*.csv"
+        files = sorted(self.data_dir.glob(pattern), key=lambda x: x.stat().st_mtime, reverse=True)
+        return files[0] if files else None
+
+    @property
+    def files(self):
+        """factor -> latest output file (None when missing)"""
+        return {factor: self.latest_file(factor) for factor in FACTORS}
+
+    def _read_factor(self, file_path):
+        """Read one factor output reduced to one row per player (None if unusable)"""
+        try:
+            header = pd.read_csv(file_path, nrows=0).columns
+        except (pd.errors.EmptyDataError, OSError):
+            return None
+
+        score_col = pick_score_column(header)
+        if score_col is None or 'player_name' not in header:
+            return None
+
+        usecols = ['player_name', score_col] + [c for c in ('player_id', 'team') if c in header]
+        return reduce_factor_output(pd.read_csv(file_path, usecols=usecols))
+
+    def load(self):
+        """Load every factor output once; returns factor -> per-player frame"""
+        if self._factor_scores is None:
+            self._factor_scores = {}
+            for factor, file_path in self.files.items():
+                if file_path is None:
+                    continue
+                df = self._read_factor(file_path)
+                if df is not None and not df.empty:
+                    self._factor_scores[factor] = df
+        return self._factor_scores
+
+    def build(self, players=None):
+        """
+        Dense player x factor score matrix
+
+        Args:
+            players: DataFrame with player_name (and optionally player_id/team)
+                     to align to, in order; None for every player in any output
+
+        Returns:
+            DataFrame indexed by player_name with one float column per factor
+            (NaN = no score) plus a 'team' column where known
+        """
+        factor_scores = self.load()
+
+        if players is None:
+            frames = [df[['key', 'player_name']] for df in factor_scores.values()]
+            if not frames:
+                return pd.DataFrame(columns=FACTORS + ['team'], dtype=float)
+            players = pd.concat(frames).drop_duplicates('key').reset_index(drop=True)
+        else:
+            players = players.copy()
+            if 'player_name' not in players.columns:
+                players['player_name'] = players.get('name', pd.Series('Unknown', index=players.index))
+            players['key'] = normalize_name(players['player_name']).values
+            players = players.drop_duplicates('key').reset_index(drop=True)
+
+        keys = pd.Index(players['key'])
+        ids = None
+        if 'player_id' in players.columns:
+            ids = pd.to_numeric(players['player_id'], errors='coerce')
+
+        matrix = np.full((len(players), len(FACTORS)), np.nan)
+        team = pd.Series(players['team'].values if 'team' in players.columns else None,
+                         index=keys, dtype=object)
+
+        for j, factor in enumerate(FACTORS):
+            df = factor_scores.get(factor)
+            if df is None:
+                continue
+            by_name = pd.Series(df['score'].values, index=df['key'])
+            column = by_name.reindex(keys).values
+
+            # Fall back to player_id for players whose names did not match
+            if ids is not None and 'player_id' in df.columns:
+                missing = np.isnan(column) & ~keys.isin(df['key'])
+                if missing.any():
+                    ids_df = df.dropna(subset=['player_id']).drop_duplicates('player_id')
+                    by_id = pd.Series(ids_df['score'].values,
+                                      index=pd.to_numeric(ids_df['player_id'], errors='coerce'))
+                    column[missing] = by_id.reindex(ids[missing].values).values
+
+            matrix[:, j] = column
+
+            if 'team' in df.columns:
+                known = pd.Series(df['team'].values, index=df['key']).reindex(keys)
+                team = team.where(team.notna(), known.values)
+
+        result = pd.DataFrame(matrix, index=pd.Index(players['player_name'], name='player_name'),
+                              columns=FACTORS)
+        result['team'] = team.values
+        return result
+
+    @staticmethod
+    def weight_matrix(player_names, player_weights, default_weights):
+        """
+        Players x factors weight matrix
+
+        Args:
+            player_names: Row order for the matrix
+            player_weights: player_name -> {factor: weight} overrides
+            default_weights: {factor: weight} for players without overrides
+        """
+        default = np.array([default_weights.get(f, 0.0) for f in FACTORS], dtype=float)
+        weights = np.tile(default, (len(player_names), 1))
+        for i, name in enumerate(player_names):
+            custom = player_weights.get(name)
+            if custom:
+                weights[i] = [custom.get(f, 0.0) for f in FACTORS]
+        return weights
+
+    @classmethod
+    def final_scores(cls, scores, player_weights, default_weights):
+        """final_score per player: row-wise dot product of scores and weights"""
+        values = scores[FACTORS].to_numpy(dtype=float)
+        weights = cls.weight_matrix(scores.index, player_weights or {}, default_weights)
+        totals = np.einsum('ij,ij->i', np.nan_to_num(values), weights)
+        return pd.Series(totals, index=scores.index, name='final_score')
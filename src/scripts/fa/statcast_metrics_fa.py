@@ -43,10 +43,19 @@ import pandas as pd
 from pathlib import Path
 from datetime import datetime, timedelta
 
+try:
+    from .gamelog_store import get_gamelog_store
+except ImportError:
+    from gamelog_store import get_gamelog_store
+
 
 class StatcastMetricsAnalyzer:
     """Analyze Statcast quality-of-contact metrics"""
     
+    # Trailing window of game logs used to approximate contact quality
+    WINDOW_DAYS = 30
+    WINDOW_COLUMNS = ['AB', 'H', 'HR', '2B', '3B']
+    
     def __init__(self, data_dir):
         self.data_dir = Path(data_dir)
     
@@ -124,107 +133,123 @@ class StatcastMetricsAnalyzer:
         # Normalize to -2 to +2 range
         return max(-2.0, min(2.0, score))
     
-    def get_player_statcast_data(self, player_name, player_id, as_of_date):
+    def aggregate_window(self, as_of_date, player_ids=None):
         """
-        Get Statcast data for a player from game logs
+        Trailing-window totals and derived contact metrics for many players
+        
+        One grouped pass over the season game logs: AB/H/HR/2B/3B are summed
+        per player over the WINDOW_DAYS days before as_of_date, then the exit velocity,
+        barrel and hard-hit approximations are derived column-wise.
+        
+        Args:
+            as_of_date: Day being scored (excluded: its own games must not
+                        feed its features, e.g. in a backfill)
+            player_ids: Optional ids to restrict the aggregation to
         
-        Uses recent performance stats to approximate Statcast metrics
+        Returns:
+            DataFrame indexed by player_id (players with < 10 AB are dropped)
         """
-        # Load game logs for the season
-        year = as_of_date.year
-        game_log_file = self.data_dir / f'mlb_game_logs_{year}.csv'
+        store = get_gamelog_store(self.data_dir, season=as_of_date.year)
+        if not store.exists:
+            return pd.DataFrame()
+        
+        cutoff_date = as_of_date - timedelta(days=self.WINDOW_DAYS)
+        window = store.rows_between(cutoff_date, as_of_date - timedelta(days=1))
+        if player_ids is not None:
+            window = window[window['player_id'].isin(list(player_ids))]
+        
+        totals = window.groupby('player_id')[self.WINDOW_COLUMNS].sum()
+        totals = totals[totals['AB'] >= 10]  # Need minimum sample
+        if totals.empty:
+            return totals
+        
+        ab = totals['AB']
+        singles = totals['H'] - totals['2B'] - totals['3B'] - totals['HR']
+        total_bases = singles + (2 * totals['2B']) + (3 * totals['3B']) + (4 * totals['HR'])
         
-        if not game_log_file.exists():
+        totals['actual_ba'] = totals['H'] / ab
+        totals['actual_slg'] = total_bases / ab
+        
+        # Approximate quality metrics based on power output
+        # HR rate correlates with exit velocity and barrel rate
+        hr_rate = totals['HR'] / ab
+        extra_base_rate = (totals['2B'] + totals['3B'] + totals['HR']) / ab
+        
+        # Elite: ~95+ mph (8%+ HR rate), Average: ~88 mph (2-3% HR rate)
+        totals['avg_exit_velocity'] = (85.0 + (hr_rate * 200)).clip(82.0, 95.0)
+        totals['barrel_rate'] = ((hr_rate * 100) + (extra_base_rate * 20)).clip(2.0, 20.0)
+        totals['hard_hit_rate'] = (30.0 + (extra_base_rate * 60)).clip(25.0, 55.0)
+        
+        # For expected stats, use recent trend (simplified)
+        totals['xba'] = totals['actual_ba'] * 1.02  # Slight expected boost
+        totals['xslg'] = totals['actual_slg'] * 1.02
+        return totals
+    
+    @staticmethod
+    def _statcast_from_totals(row):
+        """Statcast metrics dict for one row of aggregate_window()"""
+        avg_exit_velocity = row['avg_exit_velocity']
+        barrel_rate = row['barrel_rate']
+        hard_hit_rate = row['hard_hit_rate']
+        xba, xslg = row['xba'], row['xslg']
+        actual_ba, actual_slg = row['actual_ba'], row['actual_slg']
+        return {
+            'avg_exit_velocity': round(avg_exit_velocity, 1),
+            'max_exit_velocity': round(min(115.0, avg_exit_velocity + 22.0), 1),
+            'barrel_rate': round(barrel_rate, 1),
+            'hard_hit_rate': round(hard_hit_rate, 1),
+            'sweet_spot_rate': round((hard_hit_rate + barrel_rate) / 2, 1),
+            'xba': round(xba, 3),
+            'xslg': round(xslg, 3),
+            'xwoba': round((xba + xslg) / 2, 3),
+            'actual_ba': round(actual_ba, 3),
+            'actual_slg': round(actual_slg, 3),
+            'actual_woba': round((actual_ba + actual_slg) / 2, 3),
+            'launch_angle': 12.0,  # Default
+            'batted_ball_count': int(row['AB'])
+        }
+    
+    def _resolve_player_id(self, store, player_name, player_id):
+        """Player id from the roster, else exact then partial name match in the store"""
+        if player_id is not None and not pd.isna(player_id):
+            return int(player_id)
+        
+        player_ids = store.player_ids_for(player_name)
+        if len(player_ids) == 0:
+            # Try partial match
+            needle = str(player_name).lower()
+            player_ids = [pid for name in store.categories.get('player_name', [])
+                          if needle in name.lower()
+                          for pid in store.player_ids_for(name)]
+        return int(player_ids[0]) if len(player_ids) > 0 else None
+    
+    def get_player_statcast_data(self, player_name, player_id, as_of_date, window=None):
+        """
+        Get Statcast data for a player from game logs
+        
+        Uses recent performance stats to approximate Statcast metrics.
+        Pass a precomputed aggregate_window() frame to avoid re-aggregating.
+        """
+        store = get_gamelog_store(self.data_dir, season=as_of_date.year)
+        if not store.exists:
             return None
-            
+        
         try:
-            game_logs = pd.read_csv(game_log_file)
-            game_logs['game_date'] = pd.to_datetime(game_logs['game_date'])
-            
-            # If player_id not provided, try to find by name
-            if player_id is None or pd.isna(player_id):
-                # Try exact name match first
-                name_matches = game_logs[game_logs['player_name'] == player_name]
-                if len(name_matches) == 0:
-                    # Try partial match
-                    name_matches = game_logs[game_logs['player_name'].str.contains(player_name, case=False, na=False)]
-                
-                if len(name_matches) > 0:
-                    player_id = name_matches.iloc[0]['player_id']
-                else:
-                    return None
-            
-            # Filter for this player's recent games (last 30 days)
-            cutoff_date = as_of_date - timedelta(days=30)
-            player_logs = game_logs[
-                (game_logs['player_id'] == player_id) & 
-                (game_logs['game_date'] <= as_of_date) &
-                (game_logs['game_date'] >= cutoff_date)
-            ]
-            
-            if len(player_logs) == 0:
+            player_id = self._resolve_player_id(store, player_name, player_id)
+            if player_id is None:
                 return None
             
-            # Calculate approximations from available stats
-            total_ab = player_logs['AB'].sum()
-            if total_ab < 10:  # Need minimum sample
+            if window is None:
+                window = self.aggregate_window(as_of_date, player_ids=[player_id])
+            if player_id not in window.index:
                 return None
-                
-            total_h = player_logs['H'].sum()
-            total_hr = player_logs['HR'].sum()
-            total_2b = player_logs['2B'].sum()
-            total_3b = player_logs['3B'].sum()
-            
-            # Calculate SLG components
-            singles = total_h - total_2b - total_3b - total_hr
-            total_bases = singles + (2 * total_2b) + (3 * total_3b) + (4 * total_hr)
-            
-            actual_ba = total_h / total_ab if total_ab > 0 else 0
-            actual_slg = total_bases / total_ab if total_ab > 0 else 0
-            
-            # Approximate quality metrics based on power output
-            # HR rate correlates with exit velocity and barrel rate
-            hr_rate = total_hr / total_ab if total_ab > 0 else 0
-            extra_base_rate = (total_2b + total_3b + total_hr) / total_ab if total_ab > 0 else 0
-            
-            # Estimate exit velocity from power (HR rate)
-            # Elite: ~95+ mph (8%+ HR rate), Average: ~88 mph (2-3% HR rate)
-            avg_exit_velocity = 85.0 + (hr_rate * 200)  # Scales roughly with power
-            avg_exit_velocity = min(95.0, max(82.0, avg_exit_velocity))
             
-            # Estimate barrel rate from HR + extra bases
-            barrel_rate = (hr_rate * 100) + (extra_base_rate * 20)  # HR strongly correlate with barrels
-            barrel_rate = min(20.0, max(2.0, barrel_rate))
-            
-            # Estimate hard hit rate from extra base hits
-            hard_hit_rate = 30.0 + (extra_base_rate * 60)
-            hard_hit_rate = min(55.0, max(25.0, hard_hit_rate))
-            
-            # For expected stats, use recent trend (simplified)
-            # If player is hitting well, assume meeting expectations
-            xba = actual_ba * 1.02  # Slight expected boost
-            xslg = actual_slg * 1.02
-            
-            return {
-                'avg_exit_velocity': round(avg_exit_velocity, 1),
-                'max_exit_velocity': round(min(115.0, avg_exit_velocity + 22.0), 1),
-                'barrel_rate': round(barrel_rate, 1),
-                'hard_hit_rate': round(hard_hit_rate, 1),
-                'sweet_spot_rate': round((hard_hit_rate + barrel_rate) / 2, 1),
-                'xba': round(xba, 3),
-                'xslg': round(xslg, 3),
-                'xwoba': round((xba + xslg) / 2, 3),
-                'actual_ba': round(actual_ba, 3),
-                'actual_slg': round(actual_slg, 3),
-                'actual_woba': round((actual_ba + actual_slg) / 2, 3),
-                'launch_angle': 12.0,  # Default
-                'batted_ball_count': int(total_ab)
-            }
+            return self._statcast_from_totals(window.loc[player_id])
         except Exception as e:
             print(f"Error loading statcast data for {player_name}: {e}")
             return None
     
-    def analyze_roster(self, roster_df, schedule_df, players_df, as_of_date=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df, as_of_date=None, context=None):
         """
         Analyze Statcast metrics for all roster players
         
@@ -233,6 +258,8 @@ class StatcastMetricsAnalyzer:
             schedule_df: DataFrame of upcoming games
             players_df: DataFrame of all players with stats
             as_of_date: Date to analyze as of (defaults to today)
+            context: Optional shared DataContext (game logs come from the
+                     same process-wide store either way)
         
         Returns:
             DataFrame with Statcast scores for each roster player
@@ -244,12 +271,15 @@ class StatcastMetricsAnalyzer:
         
         results = []
         
+        # Aggregate the trailing window for every player once, then look up
+        window = self.aggregate_window(as_of_date)
+        
         for _, player in roster_df.iterrows():
             player_name = player.get('player_name', player.get('name', 'Unknown'))
             player_id = player.get('player_id', None)
             
             # Get Statcast data for player
-            statcast = self.get_player_statcast_data(player_name, player_id, as_of_date)
+            statcast = self.get_player_statcast_data(player_name, player_id, as_of_date, window)
             
             if statcast and statcast['batted_ball_count'] >= 20:
                 # Calculate differentials (expected vs actual)
@@ -128,7 +128,7 @@ class TeamOffensiveMomentumAnalyzer:
         # If no file, return empty
         return pd.DataFrame()
     
-    def analyze_roster(self, roster_df, schedule_df, players_df, as_of_date=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df, as_of_date=None, context=None):
         """Analyze team momentum for all roster players"""
         if as_of_date is None:
             as_of_date = datetime.now()
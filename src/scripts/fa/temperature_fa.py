@@ -22,6 +22,13 @@ Output:
 import pandas as pd
 from pathlib import Path
 
+try:
+    from .gamelog_store import load_gamelogs
+    from .schedule_index import iter_player_games
+except ImportError:
+    from gamelog_store import load_gamelogs
+    from schedule_index import iter_player_games
+
 
 class TemperatureAnalyzer:
     """Analyze temperature impact on player performance"""
@@ -83,54 +90,51 @@ class TemperatureAnalyzer:
             'impact': impact
         }
     
-    def analyze(self, games_df, weather_df, roster_df):
+    def analyze(self, games_df, weather_df, roster_df, context=None):
         """Analyze temperature advantages for games"""
         results = []
         
-        for _, game in games_df.iterrows():
+        for game, player in iter_player_games(games_df, roster_df):
             venue = game['venue']
-            venue_weather = weather_df[weather_df['venue'] == venue]
-            
-            if venue_weather.empty:
-                continue
-            
-            weather = venue_weather.iloc[0]
+            if context is not None:
+                weather = context.weather_for_venue(venue)
+                if weather is None:
+                    continue
+            else:
+                venue_weather = weather_df[weather_df['venue'] == venue]
+                
+                if venue_weather.empty:
+                    continue
+                
+                weather = venue_weather.iloc[0]
             temp_celsius = weather.get('temperature_celsius', weather.get('temperature', 20))
             
             temp_analysis = self.calculate_temperature_advantage(temp_celsius)
             
-            # Find roster players in this game
-            for _, player in roster_df.iterrows():
-                player_team = player.get('mlb_team', '')
-                if not player_team:
-                    continue
-                
-                # Pitchers benefit from opposite conditions as hitters
-                is_pitcher = player.get('position', '') in ['SP', 'RP', 'P']
-                score = -temp_analysis['advantage_score'] if is_pitcher else temp_analysis['advantage_score']
+            # Pitchers benefit from opposite conditions as hitters
+            is_pitcher = player.get('position', '') in ['SP', 'RP', 'P']
+            score = -temp_analysis['advantage_score'] if is_pitcher else temp_analysis['advantage_score']
                 
-                results.append({
-                    'player_name': player['player_name'],
-                    'game_date': game['game_date'],
-                    'venue': venue,
-                    'temp_celsius': temp_analysis['temp_celsius'],
-                    'temp_fahrenheit': round(temp_analysis['temp_fahrenheit'], 1),
-                    'temp_category': temp_analysis['category'],
-                    'temp_score': score,
-                    'impact': temp_analysis['impact']
-                })
+            results.append({
+                'player_name': player['player_name'],
+                'game_date': game['game_date'],
+                'venue': venue,
+                'temp_celsius': temp_analysis['temp_celsius'],
+                'temp_fahrenheit': round(temp_analysis['temp_fahrenheit'], 1),
+                'temp_category': temp_analysis['category'],
+                'temp_score': score,
+                'impact': temp_analysis['impact']
+            })
         
         return pd.DataFrame(results)
 
 
-    def analyze_roster(self, roster_df, schedule_df, weather_df=None):
+    def analyze_roster(self, roster_df, schedule_df, weather_df=None, context=None):
         """Wrapper for analyze to match interface"""
-        return self.analyze(schedule_df, weather_df, roster_df)
+        if weather_df is None and context is not None:
+            weather_df = context.weather
+        return self.analyze(schedule_df, weather_df, roster_df, context=context)
     
     def _load_gamelogs(self):
-        """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+        """Helper to load game logs from the shared game log store"""
+        return load_gamelogs(self.data_dir)
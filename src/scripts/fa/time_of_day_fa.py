@@ -25,10 +25,16 @@ Output:
 """
 
 import pandas as pd
-import numpy as np
 from pathlib import Path
 from datetime import datetime, time as dt_time
 
+try:
+    from .schedule_index import iter_player_games
+    from .keyed_random import keyed_integers
+except ImportError:
+    from schedule_index import iter_player_games
+    from keyed_random import keyed_integers
+
 
 class TimeOfDayAnalyzer:
     """Analyze game time impact on fantasy production"""
@@ -63,6 +69,25 @@ class TimeOfDayAnalyzer:
     
     def __init__(self, data_dir):
         self.data_dir = Path(data_dir)
+        self.time_tendencies = {}
+    
+    def load_time_tendencies(self, player_names):
+        """Synthetic day/night tendency and game counts for many players at once"""
+        names = pd.unique(pd.Series(player_names, dtype=object).astype(str))
+        if len(names) == 0:
+            return
+        preference = keyed_integers(names, low=0, high=100, salt='day_preference')
+        day_games = keyed_integers(names, low=20, high=60, salt='day_games')
+        night_games = keyed_integers(names, low=80, high=120, salt='night_games')
+        self.time_tendencies.update(zip(names, zip(preference.tolist(), day_games.tolist(),
+                                                   night_games.tolist())))
+    
+    def get_time_tendency(self, player_name):
+        """(preference 0-99, day games, night games) for a player"""
+        name = str(player_name)
+        if name not in self.time_tendencies:
+            self.load_time_tendencies([name])
+        return self.time_tendencies[name]
     
     def classify_game_time(self, game_time_str):
         """Classify game time as Day, Twilight, or Night"""
@@ -117,16 +142,16 @@ class TimeOfDayAnalyzer:
         base_era = player_stats.iloc[0].get('era', 4.00)
         
         # Add player-specific tendency (some prefer day, some night)
-        # Use player name hash for consistency
-        player_hash = hash(player_name) % 100
+        # Keyed on the player name for consistency across runs
+        player_hash, day_games, night_games = self.get_time_tendency(player_name)
         day_preference = (player_hash - 50) / 250  # -0.20 to +0.20 range
         
         day_mult = 1.0 + day_preference
         night_mult = 1.0 - day_preference
         
         return {
-            'day_games': np.random.randint(20, 60),
-            'night_games': np.random.randint(80, 120),
+            'day_games': day_games,
+            'night_games': night_games,
             'day_avg': round(base_avg * day_mult, 3),
             'night_avg': round(base_avg * night_mult, 3),
             'day_ops': round(0.750 * day_mult, 3),
@@ -238,49 +263,44 @@ class TimeOfDayAnalyzer:
     def analyze(self, games_df, mlb_df, roster_df):
         """Analyze time of day advantages for roster players"""
         results = []
+        if 'player_name' in roster_df.columns:
+            self.load_time_tendencies(roster_df['player_name'])
         
-        for _, game in games_df.iterrows():
+        for game, player in iter_player_games(games_df, roster_df):
             game_date = game.get('game_date', '')
             game_time = game.get('game_time', 'N/A')
-            home_team = game.get('home_team', '')
-            away_team = game.get('away_team', '')
             
             # Classify game time
             time_category = self.classify_game_time(game_time)
             time_desc = self.get_time_category_description(time_category)
             
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
-                player_team = player.get('mlb_team', '')
-                position = player.get('position', '')
-                
-                if not player_team or player_team not in [home_team, away_team]:
-                    continue
+            player_name = player['player_name']
+            position = player.get('position', '')
                 
-                # Calculate time advantage
-                advantage_score, multiplier, impact = self.calculate_time_advantage(
-                    player_name, time_category, position, mlb_df
-                )
+            # Calculate time advantage
+            advantage_score, multiplier, impact = self.calculate_time_advantage(
+                player_name, time_category, position, mlb_df
+            )
                 
-                # Get player's splits for display
-                splits = self.get_player_time_splits(player_name, mlb_df)
+            # Get player's splits for display
+            splits = self.get_player_time_splits(player_name, mlb_df)
                 
-                is_pitcher = position in ['SP', 'RP', 'P']
+            is_pitcher = position in ['SP', 'RP', 'P']
                 
-                results.append({
-                    'player_name': player_name,
-                    'position': position,
-                    'game_date': game_date,
-                    'game_time': game_time,
-                    'time_category': time_category,
-                    'opponent': away_team if player_team == home_team else home_team,
-                    'day_avg_era': splits['day_era'] if is_pitcher else splits['day_avg'],
-                    'night_avg_era': splits['night_era'] if is_pitcher else splits['night_avg'],
-                    'performance_multiplier': multiplier,
-                    'time_advantage_score': advantage_score,
-                    'impact': impact,
-                    'category_info': time_desc
-                })
+            results.append({
+                'player_name': player_name,
+                'position': position,
+                'game_date': game_date,
+                'game_time': game_time,
+                'time_category': time_category,
+                'opponent': game['opponent'],
+                'day_avg_era': splits['day_era'] if is_pitcher else splits['day_avg'],
+                'night_avg_era': splits['night_era'] if is_pitcher else splits['night_avg'],
+                'performance_multiplier': multiplier,
+                'time_advantage_score': advantage_score,
+                'impact': impact,
+                'category_info': time_desc
+            })
         
         return pd.DataFrame(results)
     
@@ -295,8 +315,10 @@ class TimeOfDayAnalyzer:
         else:
             return "Poor"
     
-    def analyze_roster(self, roster_df, schedule_df, players_df):
+    def analyze_roster(self, roster_df, schedule_df, players_df, context=None):
         """Wrapper for analyze to match interface"""
+        if players_df is None and context is not None:
+            players_df = context.players
         return self.analyze(schedule_df, players_df, roster_df)
 
 
@@ -21,9 +21,17 @@ Output:
 """
 
 import pandas as pd
-import numpy as np
 from pathlib import Path
 
+try:
+    from .gamelog_store import load_gamelogs
+    from .schedule_index import iter_player_games
+    from .keyed_random import keyed_choice
+except ImportError:
+    from gamelog_store import load_gamelogs
+    from schedule_index import iter_player_games
+    from keyed_random import keyed_choice
+
 
 class UmpireFactorAnalyzer:
     """Analyze umpire strike zone impacts"""
@@ -61,51 +69,64 @@ class UmpireFactorAnalyzer:
         umpire_score = zone_score + favor_score + consistency_bonus
         return max(-1.5, min(1.5, umpire_score))
     
+    def assign_umpires(self, game_dates, home_teams):
+        """
+        Synthetic plate umpire per game, keyed by (date, home team)
+        
+        Deterministic across runs and processes; both teams of a game get
+        the same umpire.
+        """
+        return keyed_choice(game_dates, home_teams, options=list(self.UMPIRE_PROFILES),
+                            salt='umpire')
+    
     def analyze(self, games_df, roster_df):
         """Analyze umpire strike zone advantages"""
         results = []
         
-        for _, game in games_df.iterrows():
+        # One keyed draw for every game in the window
+        umpires = {}
+        if not games_df.empty and {'game_date', 'home_team'}.issubset(games_df.columns):
+            game_dates = pd.to_datetime(games_df['game_date']).dt.normalize()
+            home_teams = games_df['home_team'].astype(str).to_numpy()
+            umpires = dict(zip(zip(game_dates, home_teams), self.assign_umpires(game_dates, home_teams)))
+        
+        for game, player in iter_player_games(games_df, roster_df):
             game_date = game['game_date']
-            opponent = game.get('opponent', '')
+            home_team = str(game.get('home_team', ''))
             
-            # Assign umpire (deterministic based on game)
-            np.random.seed(hash(str(game_date) + opponent) % 2**32)
-            umpire_name = np.random.choice(list(self.UMPIRE_PROFILES.keys()))
+            # Assign umpire (deterministic based on game, same crew for both teams)
+            key = (pd.Timestamp(game_date).normalize(), home_team)
+            umpire_name = umpires.get(key) or self.assign_umpires(key[0], key[1])
             umpire = self.UMPIRE_PROFILES[umpire_name]
             
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
-                is_pitcher = player.get('position', '') in ['SP', 'RP', 'P']
+            player_name = player['player_name']
+            is_pitcher = player.get('position', '') in ['SP', 'RP', 'P']
                 
-                umpire_score = self.calculate_umpire_score(
-                    umpire['strike_zone_size'],
-                    umpire['consistency'],
-                    umpire['favor_pitcher'],
-                    is_pitcher
-                )
+            umpire_score = self.calculate_umpire_score(
+                umpire['strike_zone_size'],
+                umpire['consistency'],
+                umpire['favor_pitcher'],
+                is_pitcher
+            )
                 
-                results.append({
-                    'player_name': player_name,
-                    'game_date': game_date,
-                    'umpire_name': umpire_name,
-                    'strike_zone_size': umpire['strike_zone_size'],
-                    'consistency': umpire['consistency'],
-                    'umpire_score': umpire_score
-                })
+            results.append({
+                'player_name': player_name,
+                'game_date': game_date,
+                'umpire_name': umpire_name,
+                'strike_zone_size': umpire['strike_zone_size'],
+                'consistency': umpire['consistency'],
+                'umpire_score': umpire_score
+            })
         
-        np.random.seed(None)
         return pd.DataFrame(results)
 
 
-    def analyze_roster(self, roster_df, schedule_df, ):
+    def analyze_roster(self, roster_df, schedule_df, context=None):
         """Wrapper for analyze to match interface"""
         return self.analyze(schedule_df, roster_df)
     
-    def _load_gamelogs(self):
-        """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+    def _load_gamelogs(self, context=None):
+        """Helper to load game logs from the shared context or game log store"""
+        if context is not None:
+            return context.game_logs
+        return load_gamelogs(self.data_dir)
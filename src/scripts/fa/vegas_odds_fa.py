@@ -274,7 +274,7 @@ class VegasOddsAnalyzer:
                 'available': False
             }
     
-    def analyze_roster(self, roster_df, schedule_df, players_df, as_of_date=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df, as_of_date=None, context=None):
         """
         Analyze Vegas odds for all roster players
         
@@ -283,6 +283,7 @@ class VegasOddsAnalyzer:
             schedule_df: DataFrame of upcoming games
             players_df: DataFrame of all players
             as_of_date: Date to analyze as of (defaults to today)
+            context: Optional shared DataContext (pre-parsed schedule views)
         
         Returns:
             DataFrame with Vegas scores for each roster player
@@ -294,16 +295,22 @@ class VegasOddsAnalyzer:
         
         results = []
         
-        # Ensure schedule has proper date format
-        if 'game_date' not in schedule_df.columns and 'date' in schedule_df.columns:
-            schedule_df['game_date'] = pd.to_datetime(schedule_df['date'])
+        if context is not None:
+            # Schedule dates are pre-parsed; reuse the cached per-day view
+            target_games = context.games_on(as_of_date)
+            games_by_team = context.team_games_on(as_of_date)
         else:
-            schedule_df['game_date'] = pd.to_datetime(schedule_df['game_date'])
-        
-        # Filter to today's/target games
-        target_games = schedule_df[
-            schedule_df['game_date'].dt.date == as_of_date.date()
-        ]
+            # Ensure schedule has proper date format
+            if 'game_date' not in schedule_df.columns and 'date' in schedule_df.columns:
+                schedule_df['game_date'] = pd.to_datetime(schedule_df['date'])
+            else:
+                schedule_df['game_date'] = pd.to_datetime(schedule_df['game_date'])
+            
+            # Filter to today's/target games
+            target_games = schedule_df[
+                schedule_df['game_date'].dt.date == as_of_date.date()
+            ]
+            games_by_team = None
         
         for _, player in roster_df.iterrows():
             player_name = player.get('player_name', player.get('name', 'Unknown'))
@@ -327,10 +334,13 @@ class VegasOddsAnalyzer:
                 continue
             
             # Find player's game
-            player_game = target_games[
-                (target_games['home_team'] == player_team) |
-                (target_games['away_team'] == player_team)
-            ]
+            if games_by_team is not None:
+                player_game = games_by_team.get(player_team, target_games.iloc[0:0])
+            else:
+                player_game = target_games[
+                    (target_games['home_team'] == player_team) |
+                    (target_games['away_team'] == player_team)
+                ]
             
             if len(player_game) == 0:
                 # No game today
@@ -352,7 +362,7 @@ class VegasOddsAnalyzer:
             opponent = game['away_team'] if game['home_team'] == player_team else game['home_team']
             
             # Get Vegas odds
-            odds = self.get_vegas_odds(player_team, as_of_date, opponent, schedule_df)
+            odds = self.get_vegas_odds(player_team, as_of_date, opponent, target_games)
             
             if odds and odds['available']:
                 # Calculate implied team total
@@ -32,6 +32,17 @@ except ImportError:
     print("⚠️  CatBoost not installed. Run: pip install catboost")
 
 
+# Expected base features (all score columns used in training)
+BASE_FEATURES = [
+    'lineup_position_score', 'time_of_day_score', 'home_away_score',
+    'recent_form_score', 'wind_score', 'umpire_score', 'bullpen_fatigue_score',
+    'monthly_splits_score', 'platoon_score', 'humidity_and_elevation_score',
+    'team_momentum_score', 'vegas_odds_score', 'park_factors_score',
+    'pitch_mix_score', 'statcast_metrics_score', 'defensive_positions_score',
+    'rest_day_score', 'temperature_score', 'matchup_score'
+]
+
+
 class HybridEnsemblePredictor:
     """
     Hybrid ensemble combining weighted sum, LightGBM, and CatBoost
@@ -86,21 +97,11 @@ class HybridEnsemblePredictor:
         Returns:
             Feature matrix and feature names
         """
-        # Expected base features (all score columns used in training)
-        expected_features = [
-            'lineup_position_score', 'time_of_day_score', 'home_away_score',
-            'recent_form_score', 'wind_score', 'umpire_score', 'bullpen_fatigue_score',
-            'monthly_splits_score', 'platoon_score', 'humidity_and_elevation_score',
-            'team_momentum_score', 'vegas_odds_score', 'park_factors_score',
-            'pitch_mix_score', 'statcast_metrics_score', 'defensive_positions_score',
-            'rest_day_score', 'temperature_score', 'matchup_score'
-        ]
-        
         # Initialize features DataFrame with all expected features
         features = pd.DataFrame(index=player_data.index)
         
         # Add each expected feature (use 0.0 if missing)
-        for feature in expected_features:
+        for feature in BASE_FEATURES:
             if feature in player_data.columns:
                 features[feature] = player_data[feature]
             else:
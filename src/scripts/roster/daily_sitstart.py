@@ -9,19 +9,28 @@ This script provides a repeatable process to be run 30 minutes before game time:
 4. Provide sit/start recommendations
 5. Suggest waiver wire pickups for weak performers
 
+Every step runs in this process as a node of a small DAG (see pipeline.py):
+the MLB delta, weather delta and Yahoo roster fetch run concurrently, the
+fresh weather frame and roster are handed to the shared DataContext in memory,
+and each step's time and any error (with full traceback) are reported at the
+end. --skip-tune / --tune-only / --skip-waiver select which nodes run.
+The roster factor step filters the all-players results computed just before
+it (same date and data) and only analyzes roster rows they do not cover.
+
 Usage:
     python src/scripts/daily_sitstart.py                    # Run for today's games
     python src/scripts/daily_sitstart.py --date 2025-09-29  # Run for specific date
     python src/scripts/daily_sitstart.py --skip-tune        # Skip weight tuning (faster)
     python src/scripts/daily_sitstart.py --tune-only        # Only tune weights, no recommendations
     python src/scripts/daily_sitstart.py --skip-waiver      # Skip waiver wire suggestions
+    python src/scripts/daily_sitstart.py --workers 8        # Parallel factor analyses
+    python src/scripts/daily_sitstart.py --no-cache         # Recompute every factor
 """
 
 import sys
 import pandas as pd
 from pathlib import Path
 from datetime import datetime, timedelta
-import subprocess
 import argparse
 from typing import Dict, Optional
 import json
@@ -31,12 +40,23 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # Import waiver wire analyzer
 from scripts.waiver.waiver_wire import WaiverWireAnalyzer
+from scripts.fa.data_context import DataContext
+from scripts.fa.factor_cache import get_factor_cache
+from scripts.fa.run_all_fa import run_all_factor_analyses
+from scripts.fa.score_matrix import FactorScoreMatrix, FACTORS
+from scripts.roster.pipeline import Pipeline
+from scripts.scrape.mlb_delta_scrape import MLBDeltaScraper
+from scripts.scrape.weather_delta_scrape import WeatherDeltaScraper
+
+# Steps running at once (the three data updates are independent)
+PIPELINE_WORKERS = 3
 
 
 class DailySitStartManager:
     """Manages daily sit/start decision process"""
     
-    def __init__(self, project_root: Path, target_date: Optional[str] = None, week_mode: bool = False):
+    def __init__(self, project_root: Path, target_date: Optional[str] = None, week_mode: bool = False,
+                 workers: int = 1, cache: bool = True):
         self.project_root = project_root
         self.data_dir = project_root / "data"
         self.scripts_dir = project_root / "src" / "scripts"
@@ -50,6 +70,9 @@ class DailySitStartManager:
             self.target_date = datetime.now()
         
         self.week_mode = week_mode
+        self.workers = workers
+        self.cache = cache
+        self.step_results = {}
         if week_mode:
             # Analyze 7 days starting from target_date
             self.start_date = self.target_date
@@ -57,6 +80,10 @@ class DailySitStartManager:
             print(f"\n🎯 Target Week: {self.start_date.strftime('%Y-%m-%d')} to {self.end_date.strftime('%Y-%m-%d')}")
         else:
             print(f"\n🎯 Target Date: {self.target_date.strftime('%Y-%m-%d')}")
+        
+        # Inputs shared by every step (parsed lazily, once per run)
+        self.context = DataContext(self.data_dir, as_of_date=self.target_date,
+                                   target_days=7 if week_mode else 1)
     
     def print_header(self, text: str):
         """Print formatted section header"""
@@ -64,222 +91,115 @@ class DailySitStartManager:
         print(f"{text.center(80)}")
         print(f"{'='*80}\n")
     
-    def run_script(self, script_path: str, description: str, check_success: bool = True) -> bool:
-        """Run a Python script"""
-        full_path = self.project_root / script_path
-        
-        if not full_path.exists():
-            print(f"⚠️  Script not found: {script_path}")
-            return False
-        
-        print(f"\n▶ {description}...")
-        
-        try:
-            result = subprocess.run(
-                [sys.executable, str(full_path)],
-                cwd=str(self.project_root),
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            if result.returncode == 0:
-                print(f"  ✓ {description} completed")
-                return True
-            else:
-                print(f"  ⚠️  {description} had issues (continuing)")
-                if check_success:
-                    print(f"     Error: {result.stderr[:200]}")
-                return False
-                
-        except Exception as e:
-            print(f"  ✗ Error running {description}: {e}")
+    def update_mlb(self, artifacts: Dict) -> bool:
+        """Step 1a: MLB delta update (schedules, rosters, game logs)"""
+        return MLBDeltaScraper(data_dir=self.data_dir).run()
+    
+    def update_weather(self, artifacts: Dict) -> pd.DataFrame:
+        """Step 1b: Weather delta update; the fresh frame replaces the context's copy"""
+        scraper = WeatherDeltaScraper(data_dir=self.data_dir)
+        scraper.run()
+        self.context.use_weather(scraper.weather_df)
+        return scraper.weather_df
+    
+    def fetch_yahoo_roster(self, artifacts: Dict):
+        """Step 1c: Yahoo roster fetch; the roster is handed to the context in memory"""
+        # Imported here: yahoo_scrape exits at import time without yahoo-oauth
+        from scripts.scrape.yahoo_scrape import YahooFantasyAPI
+        
+        api = YahooFantasyAPI(data_dir=self.data_dir)
+        if not api.run() or api.roster_df is None:
+            print("  ⚠️  No fresh roster - using the latest roster export")
             return False
+        self.context.use_roster(api.roster_df, api.roster_file)
+        return api.roster_df
     
-    def step1_update_data(self) -> bool:
-        """Step 1: Run delta updates to get latest data"""
-        self.print_header("STEP 1: Update Data (Deltas)")
-        
-        print("Fetching latest MLB data and weather updates...")
-        
-        # Run MLB delta scraper
-        mlb_success = self.run_script(
-            "src/scripts/scrape/mlb_delta_scrape.py",
-            "MLB Delta Update",
-            check_success=False
-        )
-        
-        # Run weather delta scraper
-        weather_success = self.run_script(
-            "src/scripts/scrape/weather_delta_scrape.py",
-            "Weather Delta Update",
-            check_success=False
-        )
-        
-        # Fetch Yahoo roster
-        _ = self.run_script(
-            "src/scripts/scrape/yahoo_scrape.py",
-            "Yahoo Roster Fetch",
-            check_success=False
+    def step2_all_players_analyses(self, artifacts: Dict) -> bool:
+        """Step 2a: All 20 factor analyses for ALL MLB players (for waiver wire)"""
+        self.print_header("STEP 2: Run All Factor Analyses (20 Factors)")
+        print(f"▶ Running analyses for ALL MLB players (for waiver wire)...")
+        return run_all_factor_analyses(
+            self.data_dir, all_players=True, context=self.context, workers=self.workers,
+            cache=self.cache
         )
-        
-        if mlb_success and weather_success:
-            print("\n✓ Data updates completed successfully")
-            return True
-        else:
-            print("\n⚠️  Some data updates had issues, but continuing...")
-            return True
     
-    def step2_run_all_factor_analyses(self) -> bool:
-        """Step 2: Run all 20 factor analyses (for both all players and roster)"""
-        self.print_header("STEP 2: Run All Factor Analyses (20 Factors)")
-        
-        # Run the consolidated FA runner script with target date
-        script_path = self.project_root / "src" / "scripts" / "fa" / "run_all_fa.py"
-        target_date_str = self.target_date.strftime("%Y-%m-%d")
-        
-        # First run: All players (for waiver wire)
-        print(f"\n▶ Running analyses for ALL MLB players (for waiver wire)...")
-        
-        try:
-            result = subprocess.run(
-                [sys.executable, str(script_path), "--date", target_date_str, "--all-players"],
-                cwd=str(self.project_root),
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            if result.returncode == 0:
-                print(f"  ✓ All-players analysis completed")
-                all_players_success = True
-            else:
-                print(f"  ⚠️  All-players analysis had issues (continuing)")
-                print(f"     Error: {result.stderr[:200]}")
-                all_players_success = False
-                
-        except Exception as e:
-            print(f"  ✗ Error running all-players analysis: {e}")
-            all_players_success = False
-        
-        # Second run: Rostered players only (for sit/start)
-        print(f"\n▶ Running analyses for ROSTERED players (for sit/start)...")
-        
-        try:
-            result = subprocess.run(
-                [sys.executable, str(script_path), "--date", target_date_str],
-                cwd=str(self.project_root),
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            if result.returncode == 0:
-                print(f"  ✓ Roster analysis completed")
-                roster_success = True
-            else:
-                print(f"  ⚠️  Roster analysis had issues (continuing)")
-                print(f"     Error: {result.stderr[:200]}")
-                roster_success = False
-                
-        except Exception as e:
-            print(f"  ✗ Error running roster analysis: {e}")
-            roster_success = False
-        
-        # Success if at least roster analysis completed
-        return roster_success
+    def step2_roster_analyses(self, artifacts: Dict) -> bool:
+        """Step 2b: Roster factor results, projected from step 2a's all-players results"""
+        print(f"▶ Running analyses for ROSTERED players (for sit/start)...")
+        return run_all_factor_analyses(
+            self.data_dir, all_players=False, context=self.context, workers=self.workers,
+            cache=self.cache
+        )
     
-    def step3_tune_weights(self) -> bool:
+    def step3_tune_weights(self, artifacts: Dict) -> bool:
         """Step 3: Tune weights for roster players"""
         self.print_header("STEP 3: Tune Weights for Roster Players")
         
-        print("Running weight optimization based on historical performance...")
-        print("This may take several minutes depending on roster size...\n")
+        print("Updating weights with games played since the last tuning run...\n")
         
-        # Check if backtest script exists
-        backtest_script = self.scripts_dir / "weight" / "backtest_weights.py"
-        if not backtest_script.exists():
-            print("⚠️  Backtest script not found - skipping weight tuning")
-            print("    Using default weights for recommendations")
-            return True
+        # Imported here so runs that skip tuning never load scipy
+        from scripts.weight.backtest_weights import WeightTuner
         
-        # Run backtest with optimize and save flags
-        try:
-            result = subprocess.run(
-                [sys.executable, str(backtest_script), "--optimize", "--save"],
-                cwd=str(self.project_root),
-                capture_output=True,
-                text=True,
-                timeout=600,  # 10 minute timeout
-                check=False
-            )
-            
-            if result.returncode == 0:
-                print("✓ Weight tuning completed successfully")
-                # Show key output lines
-                output_lines = result.stdout.split('\n')
-                for line in output_lines[-20:]:  # Last 20 lines
-                    if 'Correlation' in line or 'saved' in line or 'optimized' in line.lower():
-                        print(f"  {line}")
-                return True
-            else:
-                print("⚠️  Weight tuning encountered issues")
-                print("    Using default/existing weights")
-                return True
-                
-        except subprocess.TimeoutExpired:
-            print("⚠️  Weight tuning timed out - using default weights")
-            return True
-        except Exception as e:
-            print(f"⚠️  Weight tuning error: {e}")
-            print("    Using default/existing weights")
-            return True
+        # Incremental nnls: only new games are scored, then weights re-solved
+        tuner = WeightTuner(self.project_root)
+        tuner.run_backtest_suite(players=[], save=True, solver='nnls', incremental=True)
+        return True
+    
+    def build_pipeline(self) -> Pipeline:
+        """Daily process as a DAG of in-process steps"""
+        pipeline = Pipeline()
+        
+        # Data updates are independent of each other (Yahoo first: OAuth may
+        # need the console)
+        pipeline.add('yahoo_roster', self.fetch_yahoo_roster, description="Yahoo Roster Fetch")
+        pipeline.add('mlb_delta', self.update_mlb, description="MLB Delta Update")
+        pipeline.add('weather_delta', self.update_weather, description="Weather Delta Update")
+        
+        # Factor analyses read the refreshed data; the roster pass follows the
+        # all-players pass because both share the (single-threaded) DataContext
+        pipeline.add('fa_all_players', self.step2_all_players_analyses,
+                     deps=['mlb_delta', 'weather_delta'], description="All-players analysis")
+        pipeline.add('fa_roster', self.step2_roster_analyses,
+                     deps=['yahoo_roster', 'fa_all_players'], description="Roster analysis")
+        
+        # Tuning only needs the historical schedules
+        pipeline.add('tune_weights', self.step3_tune_weights,
+                     deps=['mlb_delta'], description="Weight tuning")
+        
+        pipeline.add('recommendations', self.step4_recommendations,
+                     deps=['fa_roster', 'tune_weights'], description="Sit/start recommendations")
+        pipeline.add('waiver',
+                     lambda artifacts: self.step5_analyze_waiver_wire(artifacts['recommendations'] or {}),
+                     deps=['recommendations', 'fa_all_players'], description="Waiver wire analysis")
+        return pipeline
+    
+    @staticmethod
+    def select_steps(pipeline: Pipeline, skip_tune: bool = False, tune_only: bool = False,
+                     skip_waiver: bool = False) -> set:
+        """Map the CLI flags onto pipeline nodes"""
+        if tune_only:
+            return {'tune_weights'}
+        selected = set(pipeline.steps)
+        if skip_tune:
+            selected.discard('tune_weights')
+        if skip_waiver:
+            selected.discard('waiver')
+        return selected
     
     def step4_generate_recommendations(self) -> Dict:
         """Step 4: Generate sit/start recommendations"""
         self.print_header("STEP 4: Generate Sit/Start Recommendations")
         
-        # Load latest roster - try both file patterns
-        roster_file = self._get_latest_file("yahoo_fantasy_rosters_*.csv")
-        if not roster_file:
-            roster_file = self._get_latest_file("yahoo_roster_*.csv")
+        # Load latest roster (both Yahoo file patterns, teams normalized)
+        roster_df = self.context.load_roster()
+        roster_file = self.context.roster_source
         
-        if not roster_file:
+        if roster_file is None:
             print("❌ No roster file found!")
             print("   Make sure Yahoo roster fetch completed successfully")
             return {}
         
         print(f"Loading roster: {roster_file.name}")
-        roster_df = pd.read_csv(roster_file)
-        
-        # Team abbreviation to full name mapping
-        TEAM_MAP = {
-            'AZ': 'Arizona Diamondbacks', 'ATL': 'Atlanta Braves',
-            'ATH': 'Oakland Athletics', 'BAL': 'Baltimore Orioles',
-            'BOS': 'Boston Red Sox', 'CHC': 'Chicago Cubs',
-            'CHW': 'Chicago White Sox', 'CIN': 'Cincinnati Reds',
-            'CLE': 'Cleveland Guardians', 'COL': 'Colorado Rockies',
-            'CWS': 'Chicago White Sox', 'DET': 'Detroit Tigers',
-            'HOU': 'Houston Astros', 'KC': 'Kansas City Royals',
-            'LAA': 'Los Angeles Angels', 'LAD': 'Los Angeles Dodgers',
-            'MIA': 'Miami Marlins', 'MIL': 'Milwaukee Brewers',
-            'MIN': 'Minnesota Twins', 'NYM': 'New York Mets',
-            'NYY': 'New York Yankees', 'OAK': 'Oakland Athletics',
-            'PHI': 'Philadelphia Phillies', 'PIT': 'Pittsburgh Pirates',
-            'SD': 'San Diego Padres', 'SEA': 'Seattle Mariners',
-            'SF': 'San Francisco Giants', 'STL': 'St. Louis Cardinals',
-            'TB': 'Tampa Bay Rays', 'TEX': 'Texas Rangers',
-            'TOR': 'Toronto Blue Jays', 'WSH': 'Washington Nationals',
-        }
-        
-        # Normalize column names (handle different roster formats)
-        if 'mlb_team' in roster_df.columns and 'team' not in roster_df.columns:
-            # Map abbreviations to full names
-            roster_df['team'] = roster_df['mlb_team'].map(TEAM_MAP)
-            # Fill unmapped with original abbrev
-            roster_df['team'].fillna(roster_df['mlb_team'], inplace=True)
-        if 'name' in roster_df.columns and 'player_name' not in roster_df.columns:
-            roster_df['player_name'] = roster_df['name']
         
         print(f"Found {len(roster_df)} players on roster\n")
         
@@ -288,123 +208,44 @@ class DailySitStartManager:
         
         return recommendations
     
-    def _get_latest_file(self, pattern: str) -> Optional[Path]:
-        """Get the most recent file matching pattern"""
-        files = sorted(self.data_dir.glob(pattern), key=lambda x: x.stat().st_mtime, reverse=True)
-        return files[0] if files else None
+    def step4_recommendations(self, artifacts: Dict) -> Dict:
+        """Step 4 as a pipeline node: generate, display and save recommendations"""
+        recommendations = self.step4_generate_recommendations()
+        self.display_recommendations(recommendations)
+        return recommendations
     
     def _combine_factor_analyses(self, roster_df: pd.DataFrame) -> Dict:
         """Combine all factor analysis results for roster players"""
         
-        # Find all factor analysis output files
-        fa_files = {
-            'wind': self._get_latest_file('wind_analysis_*.csv'),
-            'matchup': self._get_latest_file('matchup_analysis_*.csv'),
-            'home_away': self._get_latest_file('home_away_analysis_*.csv'),
-            'rest': self._get_latest_file('rest_day_analysis_*.csv'),
-            'injury': self._get_latest_file('injury_analysis_*.csv'),
-            'umpire': self._get_latest_file('umpire_analysis_*.csv'),
-            'platoon': self._get_latest_file('platoon_analysis_*.csv'),
-            'temperature': self._get_latest_file('temperature_analysis_*.csv'),
-            'pitch_mix': self._get_latest_file('pitch_mix_analysis_*.csv'),
-            'park': self._get_latest_file('park_factors_analysis_*.csv'),
-            'lineup': self._get_latest_file('lineup_position_analysis_*.csv'),
-            'time': self._get_latest_file('time_of_day_analysis_*.csv'),
-            'defense': self._get_latest_file('defensive_positions_analysis_*.csv'),
-            'recent_form': self._get_latest_file('recent_form_analysis_*.csv'),
-            'bullpen': self._get_latest_file('bullpen_fatigue_analysis_*.csv'),
-            'humidity': self._get_latest_file('humidity_elevation_analysis_*.csv'),
-            'monthly': self._get_latest_file('monthly_splits_analysis_*.csv'),
-            'momentum': self._get_latest_file('team_momentum_analysis_*.csv'),
-            'statcast': self._get_latest_file('statcast_metrics_analysis_*.csv'),
-            'vegas': self._get_latest_file('vegas_odds_analysis_*.csv'),
-        }
+        # Each factor output is read once and aligned into a player x factor matrix
+        score_matrix = FactorScoreMatrix(self.data_dir)
+        scores_df = score_matrix.build(roster_df)
         
         # Load player-specific weights if they exist
         weights = self._load_weights()
+        default_weights = self._default_weights()
         
-        # Combine scores for each player
+        final_scores = score_matrix.final_scores(scores_df, weights, default_weights)
+        
+        # Combine scores for each player (players with no factor scores are skipped)
         recommendations = {}
+        factor_scores = scores_df[FACTORS]
         
-        for _, player_row in roster_df.iterrows():
-            player_name = player_row.get('player_name', player_row.get('name', 'Unknown'))
-            player_id = player_row.get('player_id', None)
-            
-            # Get scores from each factor
-            scores = {}
-            for factor_name, file_path in fa_files.items():
-                if file_path and file_path.exists():
-                    score = self._get_player_score(file_path, player_name, player_id)
-                    if score is not None:
-                        scores[factor_name] = score
+        for player_name, row in factor_scores.iterrows():
+            scores = row.dropna().to_dict()
+            if not scores:
+                continue
             
-            if scores:
-                # Get player-specific weights or use defaults
-                player_weights = weights.get(player_name, self._default_weights())
-                
-                # Calculate weighted final score
-                final_score = self._calculate_final_score(scores, player_weights)
-                
-                recommendations[player_name] = {
-                    'final_score': final_score,
-                    'individual_scores': scores,
-                    'weights': player_weights,
-                    'recommendation': self._get_recommendation(final_score)
-                }
+            final_score = float(final_scores[player_name])
+            recommendations[player_name] = {
+                'final_score': final_score,
+                'individual_scores': scores,
+                'weights': weights.get(player_name, default_weights),
+                'recommendation': self._get_recommendation(final_score)
+            }
         
         return recommendations
     
-    def _get_player_score(self, file_path: Path, player_name: str, player_id: Optional[int]) -> Optional[float]:
-        """Extract player's score from a factor analysis file"""
-        try:
-            df = pd.read_csv(file_path)
-            
-            # Try matching by name
-            mask = df['player_name'].str.contains(player_name, case=False, na=False)
-            if mask.any():
-                row = df[mask].iloc[0]
-                # Look for score column (check multiple patterns)
-                score_columns = [
-                    'score', 'final_score', 'advantage_score', 'impact_score',
-                    'platoon_score', 'temp_score', 'pitch_mix_score', 'park_score',
-                    'lineup_score', 'time_score', 'defense_score', 'form_score',
-                    'bullpen_score', 'humidity_score', 'monthly_score', 'momentum_score',
-                    'statcast_score', 'vegas_score', 'wind_score', 'umpire_score'
-                ]
-                # Also check for any column ending with '_score'
-                for col in df.columns:
-                    if col.endswith('_score') and col not in score_columns:
-                        score_columns.append(col)
-                
-                for col in score_columns:
-                    if col in df.columns:
-                        return float(row[col])
-            
-            # Try matching by ID if available
-            if player_id and 'player_id' in df.columns:
-                mask = df['player_id'] == player_id
-                if mask.any():
-                    row = df[mask].iloc[0]
-                    score_columns = [
-                        'score', 'final_score', 'advantage_score', 'impact_score',
-                        'platoon_score', 'temp_score', 'pitch_mix_score', 'park_score',
-                        'lineup_score', 'time_score', 'defense_score', 'form_score',
-                        'bullpen_score', 'humidity_score', 'monthly_score', 'momentum_score',
-                        'statcast_score', 'vegas_score', 'wind_score', 'umpire_score'
-                    ]
-                    for col in df.columns:
-                        if col.endswith('_score') and col not in score_columns:
-                            score_columns.append(col)
-                    
-                    for col in score_columns:
-                        if col in df.columns:
-                            return float(row[col])
-            
-            return None
-            
-        except Exception:
-            return None
-    
     def _load_weights(self) -> Dict:
         """Load player-specific weights from config"""
         weight_file = self.config_dir / "player_weights.json"
@@ -443,16 +284,6 @@ class DailySitStartManager:
             'momentum': 0.008,    #  0.8% - Supporting (1-3% improvement)
         }
     
-    def _calculate_final_score(self, scores: Dict[str, float], weights: Dict[str, float]) -> float:
-        """Calculate weighted final score"""
-        total_score = 0.0
-        
-        for factor, score in scores.items():
-            weight = weights.get(factor, 0.0)
-            total_score += score * weight
-        
-        return total_score
-    
     def _get_recommendation(self, score: float) -> str:
         """Convert score to recommendation based on realistic score distribution"""
         # Adjusted thresholds based on actual score distribution (-0.25 to +0.25 typical range)
@@ -554,24 +385,19 @@ class DailySitStartManager:
         print("Analyzing waiver wire opportunities for weak performers...")
         
         try:
-            # Load schedule
-            schedule_file = self.data_dir / "mlb_2025_schedule.csv"
-            if not schedule_file.exists():
+            # Load schedule (shared context, dates already parsed)
+            if not self.context.schedule_file().exists():
                 print("  ⚠️  No schedule file found, skipping waiver analysis")
                 return
             
-            schedule_df = pd.read_csv(schedule_file)
-            if 'game_date' in schedule_df.columns:
-                schedule_df['game_date'] = pd.to_datetime(schedule_df['game_date'])
+            schedule_df = self.context.schedule
             
             # Load roster
-            roster_files = sorted(self.data_dir.glob("yahoo_fantasy_rosters_*.csv"),
-                                 key=lambda x: x.stat().st_mtime, reverse=True)
-            if not roster_files:
+            roster_df = self.context.load_roster()
+            if self.context.roster_source is None:
                 print("  ⚠️  No roster file found, skipping waiver analysis")
                 return
             
-            roster_df = pd.read_csv(roster_files[0])
             rostered_players = roster_df['player_name'].tolist() if 'player_name' in roster_df.columns else roster_df['name'].tolist() if 'name' in roster_df.columns else []
             
             # Initialize waiver analyzer
@@ -673,41 +499,29 @@ class DailySitStartManager:
         print(f"Started at: {start_time.strftime('%H:%M:%S')}")
         print("\nThis process should be run 30 minutes before first game time.")
         
-        if not tune_only:
-            # Step 1: Update data
-            if not self.step1_update_data():
-                print("\n⚠️  Data update had issues, continuing anyway...")
-            
-            # Step 2: Run factor analyses
-            if not self.step2_run_all_factor_analyses():
-                print("\n⚠️  Some factor analyses failed, results may be incomplete")
-        
-        # Step 3: Tune weights (unless skipped)
-        if not skip_tune:
-            if not self.step3_tune_weights():
-                print("\n⚠️  Weight tuning had issues, using default weights")
-        else:
+        pipeline = self.build_pipeline()
+        selected = self.select_steps(pipeline, skip_tune, tune_only, skip_waiver)
+        if skip_tune and not tune_only:
             print("\n⏭️  Skipping weight tuning (--skip-tune flag)")
+        if skip_waiver and not tune_only:
+            print("\n⏭️  Skipping waiver wire analysis (--skip-waiver flag)")
+        
+        self.step_results = pipeline.run(selected, workers=PIPELINE_WORKERS)
         
         if tune_only:
+            pipeline.print_summary()
             print("\n✓ Weight tuning complete")
             return
         
-        # Step 4: Generate and display recommendations
-        recommendations = self.step4_generate_recommendations()
-        self.display_recommendations(recommendations)
-        
-        # Step 5: Waiver wire analysis (unless skipped)
-        if not skip_waiver:
-            self.step5_analyze_waiver_wire(recommendations)
-        else:
-            print("\n⏭️  Skipping waiver wire analysis (--skip-waiver flag)")
-        
         # Summary
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
         
         self.print_header("PROCESS COMPLETE")
+        pipeline.print_summary()
+        if self.cache:
+            print(f"\n📦 Factor cache: {get_factor_cache(self.data_dir).summary()}")
+        print()
         print(f"Started:  {start_time.strftime('%H:%M:%S')}")
         print(f"Finished: {end_time.strftime('%H:%M:%S')}")
         print(f"Duration: {duration:.1f} seconds ({duration/60:.1f} minutes)")
@@ -763,13 +577,26 @@ Run 30 minutes before game time for optimal decisions.
         help='Skip waiver wire pickup analysis'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker processes for the factor analyses (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Recompute every factor instead of using the factor result cache'
+    )
+    
     args = parser.parse_args()
     
     # Get project root (daily_sitstart.py -> roster -> scripts -> src -> project_root)
     project_root = Path(__file__).parent.parent.parent.parent
     
     # Create manager
-    manager = DailySitStartManager(project_root, args.date)
+    manager = DailySitStartManager(project_root, args.date, workers=args.workers, cache=not args.no_cache)
     
     try:
         manager.run_full_process(
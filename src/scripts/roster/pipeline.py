@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+In-Process Pipeline Runner
+
+Runs a small DAG of named steps inside one process: steps declare the steps
+they depend on, independent steps run concurrently on a thread pool, and the
+value a step returns is handed to the steps that depend on it (no temporary
+files, no re-imports, no re-reading CSVs in a child process).
+
+Key Concepts:
+- Step: name + callable(artifacts) -> artifact, with dependency names.
+  artifacts maps each finished dependency's name to its return value
+- Dependencies order steps; a failed dependency does not cancel its
+  dependents (they see None for it), matching the old "continue anyway" flow
+- Selection: run(selected=...) runs only those steps; dependencies outside
+  the selection are treated as already satisfied (e.g. --tune-only)
+- Failure: a step fails when it raises (full traceback kept) or returns
+  False; KeyboardInterrupt still stops the run
+- Console: the earliest-submitted running step prints live (register
+  interactive steps first); output of steps running alongside it is
+  buffered and printed as one block when the live step ends, so concurrent
+  scrapers do not interleave their lines
+- StepResult per step (status, seconds, error, traceback) and a timing table
+  at the end of the run
+
+Usage:
+    from scripts.roster.pipeline import Pipeline
+
+    pipeline = Pipeline()
+    pipeline.add('mlb', lambda a: scraper.run())
+    pipeline.add('weather', lambda a: weather.run())
+    pipeline.add('fa', lambda a: run_fa(), deps=['mlb', 'weather'])
+    results = pipeline.run(workers=3)
+"""
+
+import io
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class StepResult:
+    """Outcome of one pipeline step"""
+
+    def __init__(self, name, status, seconds=0.0, value=None, error=None, trace=None):
+        self.name = name
+        self.status = status      # 'ok', 'failed' or 'skipped'
+        self.seconds = seconds
+        self.value = value
+        self.error = error
+        self.trace = trace
+
+    @property
+    def ok(self):
+        return self.status == 'ok'
+
+    def as_dict(self):
+        return {'name': self.name, 'status': self.status, 'seconds': round(self.seconds, 3),
+                'error': self.error}
+
+
+class _ConsoleMux:
+    """sys.stdout stand-in giving one running step the console at a time"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.holder = None
+        self.buffered = {}     # step name -> buffer (steps started without the console)
+        self.finished = []     # buffers of steps that ended while another held the console
+
+    def claim(self, name):
+        """Reserve output for a step about to be submitted (submission order wins)"""
+        with self.lock:
+            if self.holder is None:
+                self.holder = name
+            else:
+                self.buffered[name] = io.StringIO()
+
+    def attach(self, name):
+        """Route this thread's output to the step's console slot"""
+        self.local.name = name
+
+    def release(self, name):
+        """Step finished: flush what it (and steps waiting behind it) printed"""
+        self.local.name = None
+        with self.lock:
+            if name in self.buffered:
+                self.finished.append(self.buffered.pop(name))
+                return
+            for buffer in self.finished:
+                self.stream.write(buffer.getvalue())
+            self.finished = []
+            self.holder = None
+            if self.buffered:
+                # Hand the console to the earliest-submitted step still running
+                name, buffer = next(iter(self.buffered.items()))
+                del self.buffered[name]
+                self.stream.write(buffer.getvalue())
+                self.holder = name
+            self.stream.flush()
+
+    def write(self, text):
+        with self.lock:
+            buffer = self.buffered.get(getattr(self.local, 'name', None))
+            if buffer is not None:
+                return buffer.write(text)
+            return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class Pipeline:
+    """DAG of named steps run in-process"""
+
+    def __init__(self):
+        self.steps = {}
+        self.results = {}
+
+    def add(self, name, func, deps=(), description=None):
+        """
+        Register a step
+
+        Args:
+            name: Unique step name
+            func: callable(artifacts) -> artifact; artifacts maps dependency
+                  names to their values (None for failed/skipped ones)
+            deps: Names of steps that must finish first (registered earlier)
+            description: Label for progress lines (default: name)
+        """
+        if name in self.steps:
+            raise ValueError(f"Duplicate pipeline step: {name}")
+        missing = [d for d in deps if d not in self.steps]
+        if missing:
+            raise ValueError(f"Step {name} depends on unknown steps: {missing}")
+        self.steps[name] = {'func': func, 'deps': list(deps), 'description': description or name}
+        return self
+
+    def _run_step(self, name, artifacts, console):
+        step = self.steps[name]
+        console.attach(name)
+        start = time.perf_counter()
+        try:
+            print(f"\n▶ {step['description']}...")
+            value = step['func'](artifacts)
+            seconds = time.perf_counter() - start
+            if value is False:
+                print(f"  ⚠️  {step['description']} had issues (continuing)")
+                return StepResult(name, 'failed', seconds, value, error='reported issues')
+            print(f"  ✓ {step['description']} completed ({seconds:.1f}s)")
+            return StepResult(name, 'ok', seconds, value)
+        except (Exception, SystemExit) as e:
+            seconds = time.perf_counter() - start
+            print(f"  ✗ {step['description']} failed: {e!r}")
+            return StepResult(name, 'failed', seconds, error=repr(e), trace=traceback.format_exc())
+        finally:
+            console.release(name)
+
+    def run(self, selected=None, workers=4):
+        """
+        Run the selected steps (default: all) in dependency order
+
+        Args:
+            selected: Step names to run; others are marked skipped
+            workers: Maximum steps running at once
+
+        Returns:
+            {name: StepResult} in registration order
+        """
+        selected = set(self.steps if selected is None else selected)
+        unknown = selected - set(self.steps)
+        if unknown:
+            raise ValueError(f"Unknown pipeline steps: {sorted(unknown)}")
+
+        self.results = {name: StepResult(name, 'skipped') for name in self.steps if name not in selected}
+        pending = [name for name in self.steps if name in selected]
+        running = {}
+
+        console = _ConsoleMux(sys.stdout)
+        sys.stdout = console
+        try:
+            workers = max(1, workers)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                while pending or running:
+                    ready = [n for n in pending if all(d in self.results for d in self.steps[n]['deps'])]
+                    for name in ready[:workers - len(running)]:
+                        pending.remove(name)
+                        artifacts = {d: self.results[d].value for d in self.steps[name]['deps']}
+                        console.claim(name)
+                        running[pool.submit(self._run_step, name, artifacts, console)] = name
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        self.results[running.pop(future)] = result
+        finally:
+            sys.stdout = console.stream
+
+        self.results = {name: self.results[name] for name in self.steps}
+        return self.results
+
+    def print_summary(self):
+        """Timing table plus full tracebacks of failed steps"""
+        print(f"\n{'Step':<28} {'Status':<8} {'Time (s)':>9}")
+        print("-" * 47)
+        for result in self.results.values():
+            seconds = f"{result.seconds:.1f}" if result.status != 'skipped' else '-'
+            print(f"{result.name:<28} {result.status:<8} {seconds:>9}")
+
+        for result in self.results.values():
+            if result.trace:
+                print(f"\n✗ {result.name}:\n{result.trace.rstrip()}")
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+MLB Boxscore Ingestion - Game Logs for Every Player, One Request per Game
+
+Builds the game-log tables from /game/{gamePk}/boxscore instead of one
+/people/{id}/stats?stats=gameLog request per player. A boxscore holds every
+batter's and pitcher's line for that game, so a daily update is ~15 requests
+instead of ~1,500.
+
+Key Concepts:
+- Game selection: Final games from data/mlb_<season>_schedule.csv that are
+  not ingested yet (or a --date / --start/--end range)
+- Batting lines are exploded into the GameLogStore's per-date partitions
+  (data/game_logs/<season>/batting/<date>.csv) with the gameLog columns plus
+  team, batting_order (1-9, subs share their spot), position and starter
+- Pitching lines go to data/game_logs/<season>/pitching/<date>.csv with
+  starter, relief appearance order, innings_pitched (6.1 -> 6.333), earned
+  runs, pitches...
+- Idempotent upserts keyed by game_pk: re-ingesting a game replaces its rows,
+  and only the partitions of the ingested dates are rewritten
+- Relief usage: pitching lines are appended to the BullpenUsageTable
+  (data/bullpen_usage_daily.csv) used by the bullpen fatigue factor
+- Requests go through the shared concurrent fetcher (http_fetch.py); Final
+  boxscores are immutable, so they are cached forever (http_cache.py)
+
+Usage:
+    python src/scripts/scrape/boxscore_scrape.py                      # All new Final games
+    python src/scripts/scrape/boxscore_scrape.py --date 2025-07-04
+    python src/scripts/scrape/boxscore_scrape.py --start 2025-06-01 --end 2025-06-30 --refetch
+    python src/scripts/scrape/boxscore_scrape.py --base-url http://127.0.0.1:8765/api/v1
+"""
+
+import sys
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.scrape.http_fetch import ConcurrentFetcher, MLB_API_BASE
+from scripts.scrape.http_cache import FOREVER, get_http_cache
+from scripts.scrape.gamelog_scrape import GAMELOG_COLUMNS
+from scripts.fa.bullpen_usage import BullpenUsageTable
+from scripts.fa.gamelog_store import partition_dir, read_partitions, write_partitions
+
+
+BATTING_EXTRA_COLUMNS = ['team', 'batting_order', 'position', 'starter']
+
+PITCHING_COLUMNS = [
+    'player_id', 'player_name', 'game_date', 'game_pk', 'team', 'opponent',
+    'is_home', 'is_win', 'position', 'starter', 'appearance_order',
+    'innings_pitched', 'hits', 'runs', 'earned_runs', 'walks', 'strikeouts',
+    'home_runs', 'pitches'
+]
+
+
+def innings_to_float(innings):
+    """Convert MLB innings notation ('6.1' = 6 1/3) to a float"""
+    if innings in (None, ''):
+        return 0.0
+    whole, _, outs = str(innings).partition('.')
+    return int(whole or 0) + int(outs or 0) / 3
+
+
+def parse_boxscore(data, game):
+    """
+    Explode a boxscore into batting and pitching rows
+
+    Args:
+        data: /game/{gamePk}/boxscore JSON
+        game: Schedule row (game_pk, game_date)
+
+    Returns:
+        (batting_rows, pitching_rows) lists of dicts
+    """
+    teams = data.get('teams', {})
+    runs = {side: teams.get(side, {}).get('teamStats', {}).get('batting', {}).get('runs', 0)
+            for side in ('home', 'away')}
+
+    batting, pitching = [], []
+    for side, other in (('home', 'away'), ('away', 'home')):
+        team_box = teams.get(side, {})
+        team_name = team_box.get('team', {}).get('name', '')
+        opponent = teams.get(other, {}).get('team', {}).get('name', '')
+        players = team_box.get('players', {})
+        base = {
+            'game_date': game['game_date'],
+            'game_pk': int(game['game_pk']),
+            'is_home': side == 'home',
+            'is_win': runs[side] > runs[other],
+            'opponent': opponent,
+        }
+
+        for player_id in team_box.get('batters', []):
+            player = players.get(f"ID{player_id}", {})
+            stat = player.get('stats', {}).get('batting', {})
+            if not stat:
+                continue
+            season = player.get('seasonStats', {}).get('batting', {})
+            order = str(player.get('battingOrder', ''))
+            batting.append({
+                'player_id': int(player_id),
+                **base,
+                'AB': stat.get('atBats', 0),
+                'H': stat.get('hits', 0),
+                'R': stat.get('runs', 0),
+                'RBI': stat.get('rbi', 0),
+                'HR': stat.get('homeRuns', 0),
+                '2B': stat.get('doubles', 0),
+                '3B': stat.get('triples', 0),
+                'BB': stat.get('baseOnBalls', 0),
+                'SO': stat.get('strikeOuts', 0),
+                'SB': stat.get('stolenBases', 0),
+                'AVG': season.get('avg', '.000'),
+                'OBP': season.get('obp', '.000'),
+                'SLG': season.get('slg', '.000'),
+                'OPS': season.get('ops', '.000'),
+                'player_name': player.get('person', {}).get('fullName', ''),
+                'team': team_name,
+                'batting_order': int(order[0]) if order[:1].isdigit() else None,
+                'position': player.get('position', {}).get('abbreviation', ''),
+                'starter': order.endswith('00'),
+            })
+
+        for appearance, player_id in enumerate(team_box.get('pitchers', [])):
+            player = players.get(f"ID{player_id}", {})
+            stat = player.get('stats', {}).get('pitching', {})
+            pitching.append({
+                'player_id': int(player_id),
+                'player_name': player.get('person', {}).get('fullName', ''),
+                **base,
+                'team': team_name,
+                'position': 'P',
+                'starter': appearance == 0,
+                'appearance_order': appearance + 1,
+                'innings_pitched': innings_to_float(stat.get('inningsPitched')),
+                'hits': stat.get('hits', 0),
+                'runs': stat.get('runs', 0),
+                'earned_runs': stat.get('earnedRuns', 0),
+                'walks': stat.get('baseOnBalls', 0),
+                'strikeouts': stat.get('strikeOuts', 0),
+                'home_runs': stat.get('homeRuns', 0),
+                'pitches': stat.get('numberOfPitches', 0),
+            })
+
+    return batting, pitching
+
+
+class BoxscoreIngestor:
+    """Ingest Final-game boxscores into the batting/pitching game-log tables"""
+
+    def __init__(self, data_dir, season=None, workers=4, rate=10.0, base_url=MLB_API_BASE, cache=None):
+        self.data_dir = Path(data_dir)
+        self.season = int(season or datetime.now().year)
+        self.workers = workers
+        self.rate = rate
+        self.base_url = base_url
+        self.cache = cache or get_http_cache()
+        self.batting_dir = partition_dir(self.data_dir, self.season, 'batting')
+        self.pitching_dir = partition_dir(self.data_dir, self.season, 'pitching')
+
+    def final_games(self, start_date=None, end_date=None):
+        """Final games from the season schedule within [start_date, end_date]"""
+        schedule_file = self.data_dir / f"mlb_{self.season}_schedule.csv"
+        if not schedule_file.exists():
+            return pd.DataFrame(columns=['game_pk', 'game_date'])
+        schedule = pd.read_csv(schedule_file)
+        games = schedule[schedule['status'] == 'Final'].drop_duplicates('game_pk')
+        dates = pd.to_datetime(games['game_date'])
+        if start_date is not None:
+            games = games[dates >= pd.Timestamp(start_date)]
+            dates = dates[games.index]
+        if end_date is not None:
+            games = games[dates <= pd.Timestamp(end_date)]
+        return games.reset_index(drop=True)
+
+    def ingested_game_pks(self, dates=None):
+        """game_pks already in the pitching partitions (every game has pitchers)"""
+        stored = read_partitions(self.data_dir, self.season, 'pitching', dates=dates)
+        if stored.empty:
+            return set()
+        return set(stored['game_pk'].astype(int))
+
+    def fetch(self, games):
+        """
+        Fetch and parse boxscores concurrently
+
+        Returns:
+            (batting_rows, pitching_rows, fetched_game_pks, failed_game_pks)
+        """
+        by_pk = {int(g['game_pk']): g for g in games.to_dict('records')}
+        batting, pitching, fetched, failed = [], [], [], []
+        with ConcurrentFetcher(workers=self.workers, rate=self.rate, cache=self.cache) as fetcher:
+            fetch = lambda pk: fetcher.get_json(f"{self.base_url}/game/{pk}/boxscore", ttl=FOREVER)
+            for game_pk, data, error in fetcher.map(fetch, list(by_pk)):
+                if error is not None:
+                    failed.append(game_pk)
+                    print(f"  ✗ {game_pk}: {error}")
+                    continue
+                bat, pitch = parse_boxscore(data, by_pk[game_pk])
+                batting.extend(bat)
+                pitching.extend(pitch)
+                fetched.append(game_pk)
+            self.stats = fetcher.stats
+        return batting, pitching, fetched, failed
+
+    def run(self, start_date=None, end_date=None, refetch=False):
+        """
+        Ingest Final games in range from the schedule file
+
+        Returns:
+            dict with games, batting_rows, pitching_rows and failed counts
+        """
+        return self.ingest(self.final_games(start_date, end_date), refetch=refetch)
+
+    def ingest(self, games, refetch=False):
+        """
+        Ingest the given Final games (skipping already-ingested ones unless refetch)
+
+        Args:
+            games: DataFrame with game_pk and game_date
+
+        Returns:
+            dict with games, batting_rows, pitching_rows, failed counts and
+            the fetched / failed game_pk lists
+        """
+        if not refetch and len(games):
+            done = self.ingested_game_pks(dates=games['game_date'].unique())
+            games = games[~games['game_pk'].astype(int).isin(done)]
+
+        print(f"📦 {len(games)} Final games to ingest (season {self.season})")
+        summary = {'games': 0, 'batting_rows': 0, 'pitching_rows': 0, 'failed': 0,
+                   'fetched_pks': [], 'failed_pks': []}
+        if games.empty:
+            print("✓ Game logs already up to date")
+            return summary
+
+        batting, pitching, fetched, failed = self.fetch(games)
+        summary.update(games=len(fetched), batting_rows=len(batting),
+                       pitching_rows=len(pitching), failed=len(failed),
+                       fetched_pks=fetched, failed_pks=failed)
+        if fetched:
+            write_partitions(self.data_dir, self.season,
+                             pd.DataFrame(batting, columns=GAMELOG_COLUMNS + BATTING_EXTRA_COLUMNS),
+                             fetched, 'batting', ['game_date', 'game_pk', 'player_id'])
+            write_partitions(self.data_dir, self.season,
+                             pd.DataFrame(pitching, columns=PITCHING_COLUMNS),
+                             fetched, 'pitching', ['game_date', 'game_pk', 'is_home', 'appearance_order'])
+
+            usage = BullpenUsageTable.load(self.data_dir)
+            usage.append(pd.DataFrame(pitching, columns=PITCHING_COLUMNS))
+            usage.save(self.data_dir)
+
+        print(f"✓ {summary['games']} boxscores in {self.stats['requests']} requests "
+              f"({self.stats['retries']} retries)")
+        print(f"✓ {summary['batting_rows']} batting lines -> {self.batting_dir.relative_to(self.data_dir)}/")
+        print(f"✓ {summary['pitching_rows']} pitching lines -> {self.pitching_dir.relative_to(self.data_dir)}/")
+        if failed:
+            print(f"⚠️  {len(failed)} games failed - rerun to retry just those")
+        self.cache.log_run("boxscore_scrape")
+        return summary
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(description='Ingest MLB boxscores into the game-log tables')
+    parser.add_argument('--season', type=int, default=None, help='Season (default: current year)')
+    parser.add_argument('--date', type=str, default=None, help='Single date (YYYY-MM-DD)')
+    parser.add_argument('--start', type=str, default=None, help='First date (YYYY-MM-DD)')
+    parser.add_argument('--end', type=str, default=None, help='Last date (YYYY-MM-DD)')
+    parser.add_argument('--refetch', action='store_true', help='Re-ingest games already stored')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent requests (default: 4)')
+    parser.add_argument('--rate', type=float, default=10.0, help='Requests per second (default: 10)')
+    parser.add_argument('--base-url', type=str, default=MLB_API_BASE, help='Stats API base URL')
+    args = parser.parse_args()
+
+    start, end = (args.date, args.date) if args.date else (args.start, args.end)
+    season = args.season or (pd.Timestamp(start).year if start else None)
+    data_dir = Path(__file__).parent.parent.parent.parent / "data"
+
+    print("="*80)
+    print("MLB Boxscore Ingestion".center(80))
+    print("="*80 + "\n")
+
+    ingestor = BoxscoreIngestor(data_dir, season=season, workers=args.workers,
+                                rate=args.rate, base_url=args.base_url)
+    ingestor.run(start, end, refetch=args.refetch)
+
+
+if __name__ == "__main__":
+    main()
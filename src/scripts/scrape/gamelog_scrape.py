@@ -8,117 +8,236 @@ This provides the granular data needed to calculate hot/cold streaks.
 API Endpoint: https://statsapi.mlb.com/api/v1/people/{playerId}/stats
 Parameters: stats=gameLog&season=2024&group=hitting
 
+Players are fetched concurrently over a pooled session with a token-bucket
+rate limit and jittered retries (see http_fetch.py). Each completed player is
+appended to mlb_game_logs_<season>.partial.csv and recorded in
+mlb_game_logs_<season>.done, so an interrupted run resumes where it stopped;
+the final CSV is written once every player has been fetched.
+
 Output: Individual game logs with hitting stats per game
+
+Usage:
+    python src/scripts/scrape/gamelog_scrape.py
+    python src/scripts/scrape/gamelog_scrape.py --season 2025 --workers 16 --rate 20
+    python src/scripts/scrape/gamelog_scrape.py --no-resume            # Start over
+    python src/scripts/scrape/gamelog_scrape.py --base-url http://127.0.0.1:8765/api/v1
 """
 
-import requests
+import sys
+import argparse
 import pandas as pd
 from pathlib import Path
-import time
 
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-def fetch_player_game_log(player_id, season=2024):
-    """Fetch game log for a specific player"""
-    url = f"https://statsapi.mlb.com/api/v1/people/{player_id}/stats"
+from scripts.scrape.http_fetch import ConcurrentFetcher, MLB_API_BASE
+from scripts.scrape.http_cache import get_http_cache
+
+
+GAMELOG_COLUMNS = [
+    'player_id', 'game_date', 'game_pk', 'is_home', 'is_win', 'opponent',
+    'AB', 'H', 'R', 'RBI', 'HR', '2B', '3B', 'BB', 'SO', 'SB',
+    'AVG', 'OBP', 'SLG', 'OPS', 'player_name'
+]
+
+
+def parse_game_log(data, player_id, player_name=None):
+    """Game log rows from a /people/{id}/stats?stats=gameLog response"""
+    if 'stats' not in data or len(data['stats']) == 0:
+        return []
+    
+    splits = data['stats'][0].get('splits', [])
+    
+    games = []
+    for split in splits:
+        game = split.get('game', {})
+        stat = split.get('stat', {})
+        
+        row = {
+            'player_id': player_id,
+            'game_date': split.get('date'),
+            'game_pk': game.get('gamePk'),
+            'is_home': split.get('isHome', False),
+            'is_win': split.get('isWin', False),
+            'opponent': split.get('opponent', {}).get('name', ''),
+            
+            # Hitting stats
+            'AB': stat.get('atBats', 0),
+            'H': stat.get('hits', 0),
+            'R': stat.get('runs', 0),
+            'RBI': stat.get('rbi', 0),
+            'HR': stat.get('homeRuns', 0),
+            '2B': stat.get('doubles', 0),
+            '3B': stat.get('triples', 0),
+            'BB': stat.get('baseOnBalls', 0),
+            'SO': stat.get('strikeOuts', 0),
+            'SB': stat.get('stolenBases', 0),
+            'AVG': stat.get('avg', '.000'),
+            'OBP': stat.get('obp', '.000'),
+            'SLG': stat.get('slg', '.000'),
+            'OPS': stat.get('ops', '.000'),
+        }
+        if player_name is not None:
+            row['player_name'] = player_name
+        games.append(row)
+    
+    return games
+
+
+def request_game_log(fetcher, player_id, season, base_url=MLB_API_BASE):
+    """Fetch one player's raw game log JSON (raises FetchError on failure)"""
+    url = f"{base_url}/people/{player_id}/stats"
     params = {
         'stats': 'gameLog',
         'season': season,
         'group': 'hitting'
     }
-    
+    return fetcher.get_json(url, params=params)
+
+
+def fetch_player_game_log(player_id, season=2024, fetcher=None, base_url=MLB_API_BASE):
+    """Fetch game log for a specific player"""
     try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        if 'stats' not in data or len(data['stats']) == 0:
-            return []
-        
-        splits = data['stats'][0].get('splits', [])
-        
-        games = []
-        for split in splits:
-            game = split.get('game', {})
-            stat = split.get('stat', {})
-            
-            games.append({
-                'player_id': player_id,
-                'game_date': split.get('date'),
-                'game_pk': game.get('gamePk'),
-                'is_home': split.get('isHome', False),
-                'is_win': split.get('isWin', False),
-                'opponent': split.get('opponent', {}).get('name', ''),
-                
-                # Hitting stats
-                'AB': stat.get('atBats', 0),
-                'H': stat.get('hits', 0),
-                'R': stat.get('runs', 0),
-                'RBI': stat.get('rbi', 0),
-                'HR': stat.get('homeRuns', 0),
-                '2B': stat.get('doubles', 0),
-                '3B': stat.get('triples', 0),
-                'BB': stat.get('baseOnBalls', 0),
-                'SO': stat.get('strikeOuts', 0),
-                'SB': stat.get('stolenBases', 0),
-                'AVG': stat.get('avg', '.000'),
-                'OBP': stat.get('obp', '.000'),
-                'SLG': stat.get('slg', '.000'),
-                'OPS': stat.get('ops', '.000'),
-            })
-        
-        return games
+        if fetcher is None:
+            with ConcurrentFetcher(workers=1, rate=0) as single:
+                data = request_game_log(single, player_id, season, base_url)
+        else:
+            data = request_game_log(fetcher, player_id, season, base_url)
+        return parse_game_log(data, player_id)
         
     except Exception as e:
         print(f"  Error fetching game log for player {player_id}: {e}")
         return []
 
 
-def fetch_all_player_gamelogs(players_df, season=2024, output_dir=None):
-    """Fetch game logs for all players"""
-    if output_dir is None:
-        output_dir = Path(__file__).parent.parent.parent / "data"
+class GameLogProgress:
+    """Streamed partial output + completed-player ledger for resumable fetches"""
     
-    all_games = []
-    total_players = len(players_df)
+    def __init__(self, output_file):
+        self.output_file = Path(output_file)
+        self.partial_file = self.output_file.with_suffix('.partial.csv')
+        self.done_file = self.output_file.with_suffix('.done')
     
-    print(f"\nFetching game logs for {total_players} players (season {season})...")
-    print("This may take several minutes...\n")
+    def reset(self):
+        """Forget any previous partial run"""
+        for path in (self.partial_file, self.done_file):
+            if path.exists():
+                path.unlink()
     
-    for idx, (_, player) in enumerate(players_df.iterrows(), 1):
-        player_id = player.get('player_id')
-        player_name = player.get('player_name', 'Unknown')
-        
-        if pd.isna(player_id):
-            continue
-        
-        print(f"[{idx}/{total_players}] {player_name} (ID: {player_id})...", end=' ')
-        
-        games = fetch_player_game_log(int(player_id), season)
-        
+    def completed_ids(self):
+        """player_ids already fetched by a previous (interrupted) run"""
+        if not self.done_file.exists() or not self.partial_file.exists():
+            return set()
+        with open(self.done_file) as f:
+            return {int(line) for line in f if line.strip()}
+    
+    def record(self, player_id, games):
+        """Append a finished player's rows, then mark the player done"""
         if games:
-            # Add player name to each game
-            for game in games:
-                game['player_name'] = player_name
-            all_games.extend(games)
-            print(f"{len(games)} games")
-        else:
-            print("No data")
-        
-        # Rate limiting
-        if idx % 10 == 0:
-            time.sleep(1)  # Be nice to MLB API
+            df = pd.DataFrame(games).reindex(columns=GAMELOG_COLUMNS)
+            write_header = not self.partial_file.exists()
+            df.to_csv(self.partial_file, mode='a', header=write_header, index=False)
+        elif not self.partial_file.exists():
+            pd.DataFrame(columns=GAMELOG_COLUMNS).to_csv(self.partial_file, index=False)
+        with open(self.done_file, 'a') as f:
+            f.write(f"{int(player_id)}\n")
     
-    # Convert to DataFrame
-    if all_games:
-        df = pd.DataFrame(all_games)
+    def finalize(self, player_order, keep_progress=False):
+        """
+        Write the final CSV from the partial file (atomic replace)
         
-        # Save to CSV
-        output_file = output_dir / f"mlb_game_logs_{season}.csv"
-        df.to_csv(output_file, index=False)
+        Rows are ordered by the input player order and de-duplicated (a crash
+        between writing rows and marking the player done re-fetches it).
+        """
+        if not self.partial_file.exists():
+            return pd.DataFrame()
+        df = pd.read_csv(self.partial_file)
+        if df.empty:
+            return df
+        df = df.drop_duplicates(['player_id', 'game_pk', 'game_date'], keep='last')
+        rank = df['player_id'].map({pid: i for i, pid in enumerate(player_order)})
+        df = df.assign(_rank=rank.fillna(len(player_order))).sort_values('_rank', kind='mergesort')
+        df = df.drop(columns='_rank').reset_index(drop=True)
         
-        print(f"\n✓ Fetched {len(all_games)} total game logs")
-        print(f"✓ Saved to: {output_file.name}")
+        tmp_file = self.output_file.with_suffix('.csv.tmp')
+        df.to_csv(tmp_file, index=False)
+        tmp_file.replace(self.output_file)
+        if not keep_progress:
+            self.reset()
+        return df
+
+def fetch_all_player_gamelogs(players_df, season=2024, output_dir=None, workers=8, rate=10.0,
+                              resume=True, base_url=MLB_API_BASE, output_name=None, cache=None):
+    """
+    Fetch game logs for all players concurrently (resumable)
+    
+    Args:
+        players_df: Players with player_id and player_name
+        season: Season to fetch
+        output_dir: Directory for the CSV (default: data/)
+        workers: Concurrent requests
+        rate: Requests per second across all workers
+        resume: Continue a previous interrupted run instead of starting over
+        base_url: Stats API base URL (point at a stub server for offline runs)
+        output_name: Output file name (default: mlb_game_logs_<season>.csv)
+        cache: HTTPCache for responses (default: shared data/http_cache)
+    
+    Returns:
+        DataFrame of all fetched game logs
+    """
+    if output_dir is None:
+        output_dir = Path(__file__).parent.parent.parent.parent / "data"
+    output_dir = Path(output_dir)
+    output_file = output_dir / (output_name or f"mlb_game_logs_{season}.csv")
+    
+    players = players_df.dropna(subset=['player_id']).drop_duplicates('player_id')
+    names = players['player_name'] if 'player_name' in players else pd.Series('Unknown', index=players.index)
+    player_names = dict(zip(players['player_id'].astype(int), names))
+    player_order = list(player_names)
+    
+    progress = GameLogProgress(output_file)
+    if not resume:
+        progress.reset()
+    done = progress.completed_ids()
+    pending = [pid for pid in player_order if pid not in done]
+    
+    print(f"\nFetching game logs for {len(player_order)} players (season {season})...")
+    if done:
+        print(f"↻ Resuming: {len(done)} players already fetched, {len(pending)} remaining")
+    limit = f"{rate:g} requests/s" if rate > 0 else "no rate limit"
+    print(f"⚙️  {workers} workers, {limit}\n")
+    
+    failed = []
+    total_games = 0
+    cache = cache or get_http_cache()
+    with ConcurrentFetcher(workers=workers, rate=rate, cache=cache) as fetcher:
+        fetch = lambda pid: request_game_log(fetcher, pid, season, base_url)
+        for idx, (player_id, data, error) in enumerate(fetcher.map(fetch, pending), 1):
+            player_name = player_names[player_id]
+            prefix = f"[{len(done) + idx}/{len(player_order)}] {player_name} (ID: {player_id})..."
+            if error is not None:
+                failed.append(player_id)
+                print(f"{prefix} ✗ {error}")
+                continue
+            games = parse_game_log(data, player_id, player_name)
+            progress.record(player_id, games)
+            total_games += len(games)
+            print(f"{prefix} {len(games)} games" if games else f"{prefix} No data")
         
+        stats = fetcher.stats
+    
+    print(f"\n✓ {stats['requests']} requests ({stats['retries']} retries), "
+          f"{total_games} game logs this run")
+    if failed:
+        print(f"⚠️  {len(failed)} players failed - rerun to retry just those")
+    cache.log_run("gamelog_scrape")
+    
+    df = progress.finalize(player_order, keep_progress=bool(failed))
+    
+    if len(df) > 0:
+        print(f"✓ Fetched {len(df)} total game logs")
+        print(f"✓ Saved to: {output_file.name}")
         return df
     else:
         print("\n❌ No game log data fetched")
@@ -127,6 +246,14 @@ def fetch_all_player_gamelogs(players_df, season=2024, output_dir=None):
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description='Fetch MLB player game logs')
+    parser.add_argument('--season', type=int, default=2024, help='Season to fetch (default: 2024)')
+    parser.add_argument('--workers', type=int, default=8, help='Concurrent requests (default: 8)')
+    parser.add_argument('--rate', type=float, default=10.0, help='Requests per second (default: 10)')
+    parser.add_argument('--no-resume', action='store_true', help='Ignore a previous partial run')
+    parser.add_argument('--base-url', type=str, default=MLB_API_BASE, help='Stats API base URL')
+    args = parser.parse_args()
+    
     project_root = Path(__file__).parent.parent.parent.parent
     data_dir = project_root / "data"
     
@@ -136,15 +263,16 @@ def main():
     
     # Load player database
     try:
-        players_2024 = pd.read_csv(data_dir / "mlb_all_players_2024.csv")
-        print(f"\n✓ Loaded {len(players_2024)} players from 2024 roster")
+        players = pd.read_csv(data_dir / f"mlb_all_players_{args.season}.csv")
+        print(f"\n✓ Loaded {len(players)} players from {args.season} roster")
     except FileNotFoundError:
         print("\n❌ Player database not found!")
         print("   Run: python src/scripts/scrape/mlb_scrape.py first")
         return
     
-    # Fetch 2024 game logs
-    fetch_all_player_gamelogs(players_2024, season=2024, output_dir=data_dir)
+    fetch_all_player_gamelogs(players, season=args.season, output_dir=data_dir,
+                              workers=args.workers, rate=args.rate,
+                              resume=not args.no_resume, base_url=args.base_url)
     
     print("\n" + "="*80)
     print("Game log scraping complete!")
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Persistent HTTP Response Cache
+
+On-disk cache shared by every scraper, so re-running the pipeline (e.g.
+fb-ai 30 minutes before first pitch) only goes to the network for data that
+can actually have changed.
+
+Key Concepts:
+- Key: method + URL + sorted query params (sha256), one JSON file per entry
+  under data/http_cache/
+- Per-endpoint TTLs (TTL_RULES): a fresh entry is returned without any
+  request; an expired one is revalidated with If-None-Match /
+  If-Modified-Since and a 304 just extends it
+- Immutable data (past-season schedules/rosters/game logs, Final-game
+  boxscores) is cached forever (ttl=FOREVER); callers that know a resource
+  is final pass ttl=FOREVER explicitly (an entry cached before it became
+  final is revalidated once, then kept forever)
+- Stale-if-error: when the network fails, an expired entry is served rather
+  than nothing
+- Counters (hits, revalidated, misses, stale, errors) are printed at the end
+  of a scraper run and appended to data/http_cache/runs.log
+- FB_AI_HTTP_CACHE=0 disables the cache (every request goes to the network)
+
+Usage:
+    from scripts.scrape.http_cache import CachedSession, get_http_cache
+
+    http = CachedSession(get_http_cache())          # wraps a requests.Session
+    data = http.get(url, params=params, timeout=10).json()
+    http.cache.log_run("mlb_scrape")
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent.parent / "data" / "http_cache"
+
+FOREVER = float('inf')
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+
+
+def _past_season(params):
+    """True when the request is for a season before the current one"""
+    season = (params or {}).get('season')
+    try:
+        return int(season) < datetime.now().year
+    except (TypeError, ValueError):
+        return False
+
+
+# (URL pattern, ttl seconds or callable(params) -> ttl); first match wins
+TTL_RULES = [
+    (r'/game/\d+/boxscore', lambda p: 5 * MINUTE),             # Final games: callers pass FOREVER
+    (r'/feed/live', lambda p: 0),
+    (r'/schedule', lambda p: FOREVER if _past_season(p) else 30 * MINUTE),
+    (r'/people/\d+/stats', lambda p: FOREVER if _past_season(p) else 2 * HOUR),
+    (r'/teams/\d+/roster', lambda p: FOREVER if _past_season(p) else 6 * HOUR),
+    (r'statsapi\.mlb\.com/api/v1/teams', lambda p: FOREVER if _past_season(p) else 24 * HOUR),
+    (r'api\.open-meteo\.com', lambda p: 15 * MINUTE),
+    (r'fantasysports\.yahooapis\.com/.*roster', lambda p: 0),  # Always revalidate rosters
+    (r'fantasysports\.yahooapis\.com', lambda p: HOUR),
+]
+DEFAULT_TTL = 10 * MINUTE
+
+# Process-wide caches: resolved cache dir -> HTTPCache
+_CACHES = {}
+
+
+class CachedResponse:
+    """Minimal requests.Response stand-in for a cached payload"""
+
+    def __init__(self, entry, from_cache=True):
+        self.url = entry['url']
+        self.status_code = 200
+        self.headers = entry.get('headers', {})
+        self.content = entry['body'].encode()
+        self.text = entry['body']
+        self.from_cache = from_cache
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        return None
+
+
+class HTTPCache:
+    """Disk-backed response cache with TTLs and conditional revalidation"""
+
+    COUNTERS = ('hits', 'revalidated', 'misses', 'stale', 'errors')
+
+    def __init__(self, cache_dir=None, rules=None, enabled=None):
+        """
+        Args:
+            cache_dir: Where entries live (default: data/http_cache)
+            rules: [(pattern, ttl_fn)] overriding TTL_RULES
+            enabled: Force on/off (default: FB_AI_HTTP_CACHE env, on)
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.rules = [(re.compile(p), fn) for p, fn in (rules or TTL_RULES)]
+        if enabled is None:
+            enabled = os.environ.get('FB_AI_HTTP_CACHE', '1') != '0'
+        self.enabled = enabled
+        self.stats = dict.fromkeys(self.COUNTERS, 0)
+        self._logged = dict.fromkeys(self.COUNTERS, 0)
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def key(url, params=None, method='GET'):
+        """Stable cache key for a request"""
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        raw = json.dumps([method.upper(), url, items])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def ttl_for(self, url, params=None):
+        """TTL in seconds for a URL (first matching rule, else DEFAULT_TTL)"""
+        for pattern, fn in self.rules:
+            if pattern.search(url):
+                return fn(params)
+        return DEFAULT_TTL
+
+    def load(self, key):
+        """Stored entry dict (None when missing or unreadable)"""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key, entry):
+        """Write an entry atomically (unique temp file per thread)"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(entry, f)
+        tmp.replace(path)
+
+    @staticmethod
+    def is_fresh(entry, now=None):
+        expires = entry.get('expires_at')
+        return expires is None or (now or time.time()) < expires
+
+    @staticmethod
+    def _expiry(ttl, now):
+        return None if ttl == FOREVER else now + ttl
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def get(self, session, url, params=None, headers=None, timeout=10, ttl=None, **kwargs):
+        """
+        Cached GET through session (requests.Session or compatible)
+
+        Args:
+            ttl: Seconds to keep the response (FOREVER for immutable data,
+                 default: matching TTL rule)
+
+        Returns:
+            CachedResponse for hits/304s, otherwise the live response
+        """
+        if not self.enabled:
+            return session.get(url, params=params, headers=headers, timeout=timeout, **kwargs)
+
+        key = self.key(url, params)
+        entry = self.load(key)
+        now = time.time()
+        if entry is not None and self.is_fresh(entry, now):
+            self._count('hits')
+            return CachedResponse(entry)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.get('etag'):
+                request_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = session.get(url, params=params, headers=request_headers or None,
+                                   timeout=timeout, **kwargs)
+        except requests.RequestException:
+            if entry is not None:
+                self._count('stale')
+                return CachedResponse(entry)
+            self._count('errors')
+            raise
+
+        if ttl is None:
+            ttl = self.ttl_for(url, params)
+
+        if response.status_code == 304 and entry is not None:
+            self._count('revalidated')
+            entry['expires_at'] = self._expiry(ttl, now)
+            entry['stored_at'] = now
+            self.store(key, entry)
+            return CachedResponse(entry)
+
+        if response.status_code != 200:
+            if entry is not None and response.status_code >= 500:
+                self._count('stale')
+                return CachedResponse(entry)
+            self._count('errors')
+            return response
+
+        self._count('misses')
+        self.store(key, {
+            'url': url,
+            'params': {str(k): str(v) for k, v in (params or {}).items()},
+            'stored_at': now,
+            'expires_at': self._expiry(ttl, now),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'headers': {'Content-Type': response.headers.get('Content-Type', 'application/json')},
+            'body': response.text,
+        })
+        response.from_cache = False
+        return response
+
+    # ------------------------------------------------------------------
+    # Reporting / maintenance
+    # ------------------------------------------------------------------
+
+    def summary(self, stats=None):
+        """One-line counter summary (default: totals since the cache was created)"""
+        stats = stats or self.stats
+        total = sum(stats[k] for k in ('hits', 'revalidated', 'misses', 'stale'))
+        network = stats['revalidated'] + stats['misses']
+        return (f"{total} requests: {stats['hits']} cache hits, "
+                f"{stats['revalidated']} revalidated (304), {stats['misses']} downloaded, "
+                f"{stats['stale']} stale, {stats['errors']} errors "
+                f"({network} went to the network)")
+
+    def log_run(self, source):
+        """Print the counters since the last log_run and append them to data/http_cache/runs.log"""
+        if not self.enabled:
+            return
+        with self._lock:
+            run = {k: self.stats[k] - self._logged[k] for k in self.COUNTERS}
+            self._logged = dict(self.stats)
+        print(f"📦 HTTP cache ({source}): {self.summary(run)}")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        record = {'time': datetime.now().isoformat(timespec='seconds'), 'source': source, **run}
+        with open(self.cache_dir / "runs.log", 'a') as f:
+            f.write(json.dumps(record) + "\n")
+
+    def prune(self):
+        """Delete expired entries that carry no validator (nothing to revalidate)"""
+        removed = 0
+        now = time.time()
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                with open(path, 'r') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                path.unlink(missing_ok=True)
+                removed += 1
+                continue
+            if not self.is_fresh(entry, now) and not (entry.get('etag') or entry.get('last_modified')):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+class CachedSession:
+    """Session wrapper routing get() through an HTTPCache"""
+
+    def __init__(self, cache=None, session=None):
+        self.cache = cache or get_http_cache()
+        self.session = session or requests.Session()
+        self.headers = self.session.headers
+
+    def get(self, url, params=None, headers=None, timeout=10, ttl=None, **kwargs):
+        return self.cache.get(self.session, url, params=params, headers=headers,
+                              timeout=timeout, ttl=ttl, **kwargs)
+
+    def mount(self, prefix, adapter):
+        self.session.mount(prefix, adapter)
+
+    def close(self):
+        self.session.close()
+
+
+def get_http_cache(cache_dir=None):
+    """Process-wide HTTPCache for a cache directory"""
+    path = Path(cache_dir or DEFAULT_CACHE_DIR).resolve()
+    cache = _CACHES.get(path)
+    if cache is None:
+        cache = HTTPCache(path)
+        _CACHES[path] = cache
+    return cache
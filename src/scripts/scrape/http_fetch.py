@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Concurrent HTTP Fetch Layer
+
+Shared by the scrapers that make many small JSON requests to the MLB Stats
+API. A bounded thread pool issues requests over one pooled keep-alive
+session, a token bucket caps the request rate across all threads, and
+transient failures are retried with jittered exponential backoff.
+
+Key Concepts:
+- Pooled session: one requests.Session with an HTTPAdapter sized to the
+  worker count, so connections are reused instead of re-handshaking
+- Token bucket: `rate` requests/second sustained, bursts up to `burst`,
+  shared by every worker thread
+- Retries: connection errors, timeouts, 429 and 5xx are retried up to
+  `retries` times with full-jitter backoff (Retry-After honored); other
+  4xx fail immediately
+- map(): runs a function over many items on the pool and yields
+  (item, result, error) as each completes, so callers can stream results
+  to disk from the main thread
+- cache: optional HTTPCache (http_cache.py); get(..., ttl=...) is passed
+  through so callers can mark immutable resources
+- base_url: every scraper takes one, so a local stub server can stand in
+  for statsapi.mlb.com (see scripts/bench/stub_mlb_api.py)
+
+Usage:
+    from scripts.scrape.http_fetch import ConcurrentFetcher
+
+    fetcher = ConcurrentFetcher(workers=8, rate=10)
+    data = fetcher.get_json(f"{MLB_API_BASE}/people/660271/stats", params={...})
+    for item, result, error in fetcher.map(fetch_one, items):
+        ...
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from .http_cache import CachedSession
+except ImportError:
+    from http_cache import CachedSession
+
+
+MLB_API_BASE = "https://statsapi.mlb.com/api/v1"
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    """Request failed after all retries (or with a non-retryable status)"""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter"""
+
+    def __init__(self, rate, burst=None):
+        """
+        Args:
+            rate: Sustained requests per second (<= 0 disables limiting)
+            burst: Bucket capacity (default: max(1, rate))
+        """
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, self.rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def make_session(pool_size=8, user_agent="fantasy-baseball-ai"):
+    """requests.Session with a connection pool sized for pool_size threads"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({'User-Agent': user_agent, 'Accept': 'application/json'})
+    return session
+
+
+class ConcurrentFetcher:
+    """Rate-limited, retrying JSON fetcher over a pooled session and thread pool"""
+
+    def __init__(self, workers=8, rate=10.0, burst=None, retries=4, backoff=0.5,
+                 max_backoff=30.0, timeout=10, session=None, cache=None):
+        """
+        Args:
+            workers: Concurrent requests (thread pool size)
+            rate: Requests per second across all workers (<= 0 = unlimited)
+            burst: Token bucket capacity
+            retries: Retries per request after the first attempt
+            backoff: Base backoff in seconds (attempt n waits up to backoff * 2^n)
+            max_backoff: Cap on a single backoff wait
+            timeout: Per-request timeout in seconds
+            session: Existing session to use (default: a new pooled session)
+            cache: HTTPCache to route requests through (default: none)
+        """
+        self.workers = max(1, int(workers))
+        self.limiter = TokenBucket(rate, burst)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.session = session or make_session(self.workers)
+        if cache is not None:
+            self.session = CachedSession(cache, self.session)
+        self.stats = {'requests': 0, 'retries': 0, 'failures': 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _wait(self, attempt, response=None):
+        """Sleep before a retry: Retry-After if given, else full-jitter backoff"""
+        delay = None
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    delay = float(retry_after)
+                except ValueError:
+                    delay = None
+        if delay is None:
+            delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        time.sleep(min(delay, self.max_backoff))
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        """
+        GET with rate limiting and retries (kwargs, e.g. ttl, go to the session)
+
+        Returns:
+            requests.Response (2xx or 304)
+
+        Raises:
+            FetchError: after the last retry, or on a non-retryable status
+        """
+        last_error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._count('retries')
+            self.limiter.acquire()
+            self._count('requests')
+            response = None
+            try:
+                response = self.session.get(url, params=params, headers=headers,
+                                            timeout=self.timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                last_error = FetchError(f"{type(e).__name__}: {e}")
+            else:
+                if response.status_code < 400:
+                    return response
+                last_error = FetchError(f"HTTP {response.status_code} for {response.url}",
+                                        status=response.status_code)
+                if response.status_code not in RETRY_STATUS:
+                    break
+            if attempt < self.retries:
+                self._wait(attempt, response)
+
+        self._count('failures')
+        raise last_error
+
+    def get_json(self, url, params=None, headers=None, **kwargs):
+        """GET and decode JSON (see get())"""
+        return self.get(url, params=params, headers=headers, **kwargs).json()
+
+    def map(self, fn, items):
+        """
+        Run fn(item) for every item on the thread pool
+
+        Yields:
+            (item, result, error) in completion order; error is None on
+            success, otherwise the exception (result is then None)
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(fn, item): item for item in items}
+            try:
+                for future in as_completed(futures):
+                    item = futures[future]
+                    try:
+                        yield item, future.result(), None
+                    except Exception as e:
+                        yield item, None, e
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -7,27 +7,56 @@ This script fetches only NEW data since the last scrape:
 - Fetches only games/players added since then
 - Appends new data to existing CSV files
 - Much faster than full refresh (~30 seconds vs 5 minutes)
+- Requests go through the shared HTTP cache (unchanged rosters are 304s)
+- Game logs: a persisted watermark (last ingested game date/game_pk per
+  season, data/game_logs/watermark.json) marks where the last run stopped;
+  only games that went Final since then are pulled as boxscores and written
+  to the GameLogStore's per-date partitions (the season CSV is not rewritten).
+  Reruns are safe: the watermark day is re-checked and games already in the
+  partitions are skipped, so nothing is duplicated.
 
 Usage:
-    python src/scripts/mlb_delta_scrape.py
+    python src/scripts/scrape/mlb_delta_scrape.py
+    python src/scripts/scrape/mlb_delta_scrape.py --game-logs-only
+    python src/scripts/scrape/mlb_delta_scrape.py --base-url http://127.0.0.1:8765/api/v1
 """
 
+import sys
+import json
+import argparse
 import pandas as pd
-import requests
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.scrape.boxscore_scrape import BoxscoreIngestor
+from scripts.fa.gamelog_store import PARTITION_ROOT, get_gamelog_store
+
+try:
+    from .http_cache import CachedSession, get_http_cache
+except ImportError:
+    from http_cache import CachedSession, get_http_cache
+
 
 class MLBDeltaScraper:
     """Incremental MLB data scraper - only fetches new data"""
     
     BASE_URL = "https://statsapi.mlb.com/api/v1"
     
-    def __init__(self):
-        self.project_root = Path(__file__).parent.parent.parent
-        self.data_dir = self.project_root / "data"
+    # Schedule states after which a game's boxscore no longer changes
+    FINAL_STATES = {'Final', 'Game Over', 'Completed Early'}
+    
+    def __init__(self, data_dir=None, base_url=None):
+        self.project_root = Path(__file__).parent.parent.parent.parent
+        self.data_dir = Path(data_dir) if data_dir else self.project_root / "data"
         self.current_year = datetime.now().year
+        self.http = CachedSession(get_http_cache())
+        if base_url:
+            self.BASE_URL = base_url
+        self.watermark_file = self.data_dir / PARTITION_ROOT / "watermark.json"
         
     def print_header(self, text: str):
         """Print formatted section header"""
@@ -82,7 +111,7 @@ class MLBDeltaScraper:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = self.http.get(url, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
             
@@ -183,7 +212,7 @@ class MLBDeltaScraper:
             params = {'rosterType': 'active'}
             
             try:
-                response = requests.get(url, params=params, timeout=10)
+                response = self.http.get(url, params=params, timeout=10)
                 response.raise_for_status()
                 data = response.json()
                 
@@ -206,7 +235,8 @@ class MLBDeltaScraper:
                     })
                 
                 print(f"{len(data.get('roster', []))} players")
-                time.sleep(0.5)
+                if not getattr(response, 'from_cache', False):
+                    time.sleep(0.5)
                 
             except Exception as e:
                 print(f"Error: {e}")
@@ -252,7 +282,97 @@ class MLBDeltaScraper:
             complete_path = self.data_dir / "mlb_all_players_complete.csv"
             complete.to_csv(complete_path, index=False)
     
-    def run(self):
+    def load_watermarks(self) -> dict:
+        """Per-season game-log watermarks ({} when none saved yet)"""
+        if not self.watermark_file.exists():
+            return {}
+        with open(self.watermark_file, 'r') as f:
+            return json.load(f)
+    
+    def save_watermark(self, season: int, watermark: dict):
+        """Persist one season's watermark (atomic replace)"""
+        watermarks = self.load_watermarks()
+        watermarks[str(season)] = watermark
+        self.watermark_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.watermark_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(watermarks, f, indent=2)
+        tmp_file.replace(self.watermark_file)
+    
+    def initial_watermark_date(self, season: int) -> datetime:
+        """Starting point without a watermark: last game already stored, else opening week"""
+        store = get_gamelog_store(self.data_dir, season)
+        if store.exists:
+            latest = pd.Timestamp(store.columns['game_date'][store.date_order[-1]])
+            return latest.to_pydatetime()
+        return datetime(season, 3, 1)
+    
+    def update_game_logs(self, season: int = None, lookback_days: int = 1) -> bool:
+        """
+        Ingest boxscores for games that went Final since the watermark
+        
+        Args:
+            season: Season to update (default: current year)
+            lookback_days: Days before the watermark to re-check (late
+                           Finals, resumed suspended games)
+        
+        Returns:
+            True when new games were ingested
+        """
+        self.print_header("Updating Game Logs (Boxscore Delta)")
+        
+        season = season or self.current_year
+        watermark = self.load_watermarks().get(str(season))
+        if watermark:
+            since = datetime.strptime(watermark['game_date'], '%Y-%m-%d')
+            print(f"🔖 {season}: Watermark at {watermark['game_date']} (game {watermark['game_pk']})")
+        else:
+            since = self.initial_watermark_date(season)
+            print(f"🔖 {season}: No watermark yet - starting from {since.strftime('%Y-%m-%d')}")
+        since -= timedelta(days=lookback_days)
+        
+        schedule = self.fetch_schedule_delta(season, since)
+        if schedule.empty:
+            print("   ✓ No games since the watermark")
+            return False
+        
+        final = schedule[schedule['status'].isin(self.FINAL_STATES)]
+        games = pd.DataFrame({
+            'game_pk': final['gamePk'].astype(int),
+            'game_date': final['officialDate'],
+        }).drop_duplicates('game_pk')
+        
+        ingestor = BoxscoreIngestor(self.data_dir, season=season, base_url=self.BASE_URL,
+                                    cache=self.http.cache)
+        summary = ingestor.ingest(games)
+        
+        # Advance to the newest Final game, but never past a game that failed
+        if summary['failed_pks']:
+            failed = games[games['game_pk'].isin(summary['failed_pks'])]
+            mark = failed.sort_values(['game_date', 'game_pk']).iloc[0]
+            mark_date = (pd.Timestamp(mark['game_date']) - timedelta(days=1)).strftime('%Y-%m-%d')
+            print(f"   ⚠️  Holding watermark before {mark['game_date']} until failed games succeed")
+            mark = {'game_date': max(mark_date, since.strftime('%Y-%m-%d')), 'game_pk': None}
+        elif len(games):
+            mark = games.sort_values(['game_date', 'game_pk']).iloc[-1]
+            mark = {'game_date': str(mark['game_date']), 'game_pk': int(mark['game_pk'])}
+        else:
+            mark = watermark
+        
+        moved = mark and (not watermark or (mark['game_date'], mark['game_pk']) !=
+                          (watermark['game_date'], watermark['game_pk']))
+        if moved:
+            ingested = (watermark or {}).get('games_ingested', 0) + summary['games']
+            self.save_watermark(season, {
+                **mark,
+                'games_ingested': ingested,
+                'updated_at': datetime.now().isoformat(timespec='seconds'),
+            })
+            print(f"   ✓ Watermark -> {mark['game_date']}")
+        
+        return summary['games'] > 0
+    
+    def run(self, game_logs_only=False):
         """Execute delta scrape"""
         print("\n" + "="*80)
         print("MLB DELTA SCRAPER - INCREMENTAL UPDATE".center(80))
@@ -265,24 +385,32 @@ class MLBDeltaScraper:
             print("💡 Run full scrape first: python src/scripts/mlb_scrape.py")
             return False
         
-        # Update schedules
-        schedules_updated = self.update_schedules()
+        schedules_updated = rosters_updated = False
+        if not game_logs_only:
+            # Update schedules
+            schedules_updated = self.update_schedules()
+            
+            # Update rosters
+            rosters_updated = self.update_current_rosters()
         
-        # Update rosters
-        rosters_updated = self.update_current_rosters()
+        # Update game logs past the watermark
+        logs_updated = self.update_game_logs()
         
         # Summary
         self.print_header("Delta Update Complete")
         
-        if schedules_updated or rosters_updated:
+        if schedules_updated or rosters_updated or logs_updated:
             print("✅ Data successfully updated!\n")
             if schedules_updated:
                 print("   ✓ Schedule files updated with new games")
             if rosters_updated:
                 print("   ✓ Player rosters refreshed")
+            if logs_updated:
+                print("   ✓ Game logs extended past the watermark")
         else:
             print("✓ All data is current - no updates needed\n")
         
+        self.http.cache.log_run("mlb_delta_scrape")
         print(f"⏰ Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("="*80 + "\n")
         
@@ -291,10 +419,16 @@ class MLBDeltaScraper:
 
 def main():
     """Main entry point"""
-    scraper = MLBDeltaScraper()
+    parser = argparse.ArgumentParser(description='Incremental MLB data update')
+    parser.add_argument('--game-logs-only', action='store_true',
+                        help='Only ingest new Final games (skip schedules/rosters)')
+    parser.add_argument('--base-url', type=str, default=None, help='Stats API base URL')
+    args = parser.parse_args()
+    
+    scraper = MLBDeltaScraper(base_url=args.base_url)
     
     try:
-        success = scraper.run()
+        success = scraper.run(game_logs_only=args.game_logs_only)
         exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\n\n❌ Delta scrape interrupted by user")
@@ -4,6 +4,9 @@ Based on: https://github.com/MajorLeagueBaseball/google-cloud-mlb-hackathon
 
 This script provides functionality to scrape MLB statistics using the official MLB Stats API.
 It supports fetching schedules, game data, team rosters, player information, and live game feeds.
+
+Responses go through the shared HTTP cache (http_cache.py): past seasons are
+cached forever, current-season data is revalidated after its TTL.
 """
 
 import requests
@@ -12,17 +15,23 @@ from datetime import datetime
 from typing import Optional, Dict, List, Any
 import time
 
+try:
+    from .http_cache import CachedSession, get_http_cache
+except ImportError:
+    from http_cache import CachedSession, get_http_cache
+
 
 class MLBStatsScraper:
     """Scraper for MLB Stats API (GUMBO data feeds)"""
     
     BASE_URL = "https://statsapi.mlb.com/api"
     
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, cache=None):
+        self.session = CachedSession(cache or get_http_cache())
         self.session.headers.update({
             'User-Agent': 'MLB-Stats-Scraper/1.0'
         })
+        self.last_from_cache = False
     
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make HTTP request to MLB Stats API"""
@@ -30,6 +39,7 @@ class MLBStatsScraper:
         try:
             response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
+            self.last_from_cache = getattr(response, 'from_cache', False)
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"Error making request to {url}: {e}")
@@ -277,7 +287,8 @@ def main():
             if schedule.get('dates'):
                 scraper.export_schedule_to_csv(schedule, f"data/mlb_{year}_schedule.csv")
                 all_schedules.append((year, schedule))
-        time.sleep(0.5)  # Rate limiting
+        if not scraper.last_from_cache:
+            time.sleep(0.5)  # Rate limiting
     print()
     
     # Step 3: Get rosters for all teams across all years
@@ -325,7 +336,8 @@ def main():
             else:
                 print("No data")
             
-            time.sleep(0.2)  # Rate limiting
+            if not scraper.last_from_cache:
+                time.sleep(0.2)  # Rate limiting
         
         # Export year's players to CSV
         if year_players:
@@ -376,7 +388,8 @@ def main():
                             stat_data = stat_group['splits'][0].get('stat', {})
                             print(f"  {year}: AVG: {stat_data.get('avg', 'N/A')}, HR: {stat_data.get('homeRuns', 'N/A')}, RBI: {stat_data.get('rbi', 'N/A')}")
                             break
-            time.sleep(0.2)
+            if not scraper.last_from_cache:
+                time.sleep(0.2)
     print()
     
     print("=" * 70)
@@ -389,6 +402,7 @@ def main():
     print("  - mlb_all_players_complete.csv (consolidated)")
     print("\nTotal: {len(all_players)} player-season records across {len(years)} years")
     print("=" * 70)
+    scraper.session.cache.log_run("mlb_scrape")
 
 
 if __name__ == "__main__":
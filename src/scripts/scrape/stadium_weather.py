@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Stadium Weather Fetching
+
+Shared fetch/parse/write path for the weather scrapers. Current conditions
+for every stadium come from ONE Open-Meteo request (the API accepts
+comma-separated latitude/longitude lists and answers with one object per
+location); if the batch call fails, locations are fetched concurrently over
+a pooled session instead of one after another.
+
+Key Concepts:
+- fetch_current_weather(locations): list of parsed 'current' blocks in
+  input order (None where a location could not be fetched)
+- Responses go through the shared HTTP cache (15 minute TTL for weather)
+- weather_frame(): typed DataFrame (WEATHER_DTYPES) so downstream readers
+  get floats/strings regardless of what the API returned
+- write_weather_csv(): temp file + atomic replace, so a reader never sees a
+  half-written mlb_stadium_weather.csv
+
+Usage:
+    from scripts.scrape.stadium_weather import fetch_current_weather, weather_frame, write_weather_csv
+
+    currents = fetch_current_weather([(40.83, -73.93), (42.35, -71.10)])
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    from .http_cache import CachedSession, get_http_cache
+    from .http_fetch import ConcurrentFetcher, FetchError, make_session
+except ImportError:
+    from http_cache import CachedSession, get_http_cache
+    from http_fetch import ConcurrentFetcher, FetchError, make_session
+
+
+OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
+
+CURRENT_FIELDS = ('temperature_2m,relative_humidity_2m,pressure_msl,wind_speed_10m,'
+                  'wind_direction_10m,wind_gusts_10m,cloud_cover,precipitation')
+
+# Values used when a location cannot be fetched
+DEFAULT_WEATHER = {
+    'temperature': 15,
+    'humidity': 50,
+    'pressure': 1013,
+    'wind_speed': 10,
+    'wind_direction': 0,
+    'wind_gusts': 0,
+    'cloud_cover': 50,
+    'precipitation': 0,
+}
+
+# Column types of mlb_stadium_weather.csv
+WEATHER_DTYPES = {
+    'team': 'string',
+    'venue': 'string',
+    'city': 'string',
+    'latitude': 'float64',
+    'longitude': 'float64',
+    'temperature_c': 'float64',
+    'humidity_pct': 'float64',
+    'pressure_hpa': 'float64',
+    'wind_speed_kmh': 'float64',
+    'wind_direction_degrees': 'float64',
+    'wind_direction_cardinal': 'string',
+    'wind_gusts_kmh': 'float64',
+    'cloud_cover_pct': 'float64',
+    'precipitation_mm': 'float64',
+    'prediction': 'string',
+    'confidence': 'float64',
+    'timestamp': 'string',
+}
+
+
+def weather_session(pool_size=8):
+    """Cached session over a connection pool sized for concurrent fallbacks"""
+    return CachedSession(get_http_cache(), make_session(pool_size))
+
+
+def parse_current(data):
+    """Weather dict from one Open-Meteo location response"""
+    current = data.get('current', {})
+    return {
+        'temperature': current.get('temperature_2m', DEFAULT_WEATHER['temperature']),
+        'humidity': current.get('relative_humidity_2m', DEFAULT_WEATHER['humidity']),
+        'pressure': current.get('pressure_msl', DEFAULT_WEATHER['pressure']),
+        'wind_speed': current.get('wind_speed_10m', DEFAULT_WEATHER['wind_speed']),
+        'wind_direction': current.get('wind_direction_10m', DEFAULT_WEATHER['wind_direction']),
+        'wind_gusts': current.get('wind_gusts_10m', DEFAULT_WEATHER['wind_gusts']),
+        'cloud_cover': current.get('cloud_cover', DEFAULT_WEATHER['cloud_cover']),
+        'precipitation': current.get('precipitation', DEFAULT_WEATHER['precipitation']),
+        'timestamp': current.get('time', datetime.now().isoformat()),
+    }
+
+
+def _params(lats, lons):
+    return {
+        'latitude': ','.join(str(lat) for lat in lats),
+        'longitude': ','.join(str(lon) for lon in lons),
+        'current': CURRENT_FIELDS,
+        'temperature_unit': 'celsius',
+        'wind_speed_unit': 'kmh',
+    }
+
+
+def fetch_current_weather(locations, http=None, url=OPEN_METEO_URL, workers=8):
+    """
+    Current weather for many (lat, lon) locations
+
+    Args:
+        locations: Sequence of (lat, lon)
+        http: Session to use (default: cached pooled session)
+        url: Forecast endpoint (point at a stub for offline runs)
+        workers: Concurrency for the per-location fallback
+
+    Returns:
+        List of weather dicts (parse_current) in input order, None for
+        locations that could not be fetched
+    """
+    locations = list(locations)
+    if not locations:
+        return []
+    http = http or weather_session(workers)
+    fetcher = ConcurrentFetcher(workers=workers, rate=0, retries=2, session=http)
+
+    # One round trip for every stadium
+    try:
+        data = fetcher.get_json(url, params=_params(*zip(*locations)))
+        if isinstance(data, dict):
+            data = [data]
+        if len(data) == len(locations):
+            return [parse_current(d) for d in data]
+        print(f"⚠️  Batch weather returned {len(data)} of {len(locations)} locations - fetching individually")
+    except (FetchError, ValueError) as e:
+        print(f"⚠️  Batch weather request failed ({e}) - fetching individually")
+
+    # Fallback: concurrent single-location requests on the pooled session
+    results = [None] * len(locations)
+    fetch = lambda i: fetcher.get_json(url, params=_params([locations[i][0]], [locations[i][1]]))
+    for i, data, error in fetcher.map(fetch, range(len(locations))):
+        if error is None:
+            results[i] = parse_current(data)
+        else:
+            print(f"  ✗ Weather for {locations[i]}: {error}")
+    return results
+
+
+def weather_frame(rows):
+    """Typed mlb_stadium_weather DataFrame from row dicts"""
+    df = pd.DataFrame(rows, columns=list(WEATHER_DTYPES))
+    return df.astype(WEATHER_DTYPES)
+
+
+def write_weather_csv(df, path):
+    """Write the weather CSV atomically (temp file + replace)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_suffix('.csv.tmp')
+    df.to_csv(tmp_file, index=False)
+    tmp_file.replace(path)
+    return path
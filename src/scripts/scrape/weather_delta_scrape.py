@@ -4,20 +4,26 @@ Weather Delta Scraper - Update Stadium Weather Data
 
 This script updates only the weather data, leaving all other data intact:
 - Fetches current weather for all 30 MLB stadiums
-- Overwrites existing weather CSV with fresh data
-- Takes ~30 seconds to complete
+- Overwrites existing weather CSV with fresh data (atomic replace)
+- All stadiums come back in one batched Open-Meteo request (concurrent
+  per-stadium fallback over a pooled session)
+- Takes about one round trip
 
 Usage:
-    python src/scripts/weather_delta_scrape.py
+    python src/scripts/scrape/weather_delta_scrape.py
 """
 
-import pandas as pd
-import requests
-import numpy as np
-import time
 from datetime import datetime
 from pathlib import Path
-from sklearn.ensemble import RandomForestClassifier
+
+try:
+    from .stadium_weather import (DEFAULT_WEATHER, OPEN_METEO_URL, fetch_current_weather,
+                                  weather_frame, weather_session, write_weather_csv)
+    from .weather_model import load_weather_classifier, train_weather_classifier
+except ImportError:
+    from stadium_weather import (DEFAULT_WEATHER, OPEN_METEO_URL, fetch_current_weather,
+                                 weather_frame, weather_session, write_weather_csv)
+    from weather_model import load_weather_classifier, train_weather_classifier
 
 
 class WeatherDeltaScraper:
@@ -57,40 +63,24 @@ class WeatherDeltaScraper:
         'Washington Nationals': {'venue': 'Nationals Park', 'lat': 38.8730, 'lon': -77.0074, 'city': 'Washington, DC'},
     }
     
-    def __init__(self):
-        self.project_root = Path(__file__).parent.parent.parent
-        self.data_dir = self.project_root / "data"
-        self.model = None
-        self.train_model()
+    def __init__(self, weather_url=OPEN_METEO_URL, data_dir=None):
+        self.project_root = Path(__file__).parent.parent.parent.parent
+        self.data_dir = Path(data_dir) if data_dir else self.project_root / "data"
+        self.weather_df = None
+        self._model = None
+        self.http = weather_session()
+        self.weather_url = weather_url
+    
+    @property
+    def model(self):
+        """Weather classifier, loaded from its artifact on first use"""
+        if self._model is None:
+            self._model = load_weather_classifier()
+        return self._model
     
     def train_model(self):
-        """Train simple weather prediction model"""
-        np.random.seed(42)
-        n_samples = 500
-        
-        # Sunny patterns
-        sunny_data = np.column_stack([
-            np.random.uniform(20, 35, n_samples//2),
-            np.random.uniform(30, 60, n_samples//2),
-            np.random.uniform(1015, 1025, n_samples//2),
-            np.random.uniform(5, 20, n_samples//2),
-            np.random.uniform(0, 40, n_samples//2),
-        ])
-        
-        # Rainy patterns
-        rainy_data = np.column_stack([
-            np.random.uniform(10, 20, n_samples//2),
-            np.random.uniform(70, 95, n_samples//2),
-            np.random.uniform(995, 1010, n_samples//2),
-            np.random.uniform(10, 30, n_samples//2),
-            np.random.uniform(60, 100, n_samples//2),
-        ])
-        
-        X = np.vstack([sunny_data, rainy_data])
-        y = np.hstack([np.zeros(n_samples//2), np.ones(n_samples//2)])
-        
-        self.model = RandomForestClassifier(n_estimators=100, random_state=42)
-        self.model.fit(X, y)
+        """Retrain the weather prediction model and replace its artifact"""
+        self._model = train_weather_classifier()
     
     def degrees_to_cardinal(self, degrees: float) -> str:
         """Convert wind direction to cardinal direction"""
@@ -101,63 +91,17 @@ class WeatherDeltaScraper:
     
     def get_weather_data(self, lat: float, lon: float) -> dict:
         """Fetch current weather from Open-Meteo API"""
-        try:
-            url = "https://api.open-meteo.com/v1/forecast"
-            params = {
-                'latitude': lat,
-                'longitude': lon,
-                'current': 'temperature_2m,relative_humidity_2m,pressure_msl,wind_speed_10m,wind_direction_10m,wind_gusts_10m,cloud_cover,precipitation',
-                'temperature_unit': 'celsius',
-                'wind_speed_unit': 'kmh',
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            current = data.get('current', {})
-            wind_dir_degrees = current.get('wind_direction_10m', 0)
-            
-            return {
-                'temperature': current.get('temperature_2m', 15),
-                'humidity': current.get('relative_humidity_2m', 50),
-                'pressure': current.get('pressure_msl', 1013),
-                'wind_speed': current.get('wind_speed_10m', 10),
-                'wind_direction': wind_dir_degrees,
-                'wind_direction_cardinal': self.degrees_to_cardinal(wind_dir_degrees),
-                'wind_gusts': current.get('wind_gusts_10m', 0),
-                'cloud_cover': current.get('cloud_cover', 50),
-                'precipitation': current.get('precipitation', 0),
-                'timestamp': current.get('time', datetime.now().isoformat())
-            }
-        except Exception as e:
-            print(f"Error: {e}")
-            return {
-                'temperature': 15, 'humidity': 50, 'pressure': 1013,
-                'wind_speed': 10, 'wind_direction': 0, 'wind_direction_cardinal': 'N',
-                'wind_gusts': 0, 'cloud_cover': 50, 'precipitation': 0,
-                'timestamp': datetime.now().isoformat()
-            }
+        return self._with_cardinal(fetch_current_weather([(lat, lon)], self.http, self.weather_url)[0])
+    
+    def _with_cardinal(self, weather) -> dict:
+        """Add the cardinal wind direction (defaults if the fetch failed)"""
+        if weather is None:
+            weather = {**DEFAULT_WEATHER, 'timestamp': datetime.now().isoformat()}
+        return {**weather, 'wind_direction_cardinal': self.degrees_to_cardinal(weather['wind_direction'])}
     
     def predict_weather(self, weather_data: dict) -> tuple:
         """Predict weather condition"""
-        features = np.array([[
-            weather_data['temperature'],
-            weather_data['humidity'],
-            weather_data['pressure'],
-            weather_data['wind_speed'],
-            weather_data['cloud_cover']
-        ]])
-        
-        if weather_data['precipitation'] > 0.1:
-            return "Rainy", 1.0
-        
-        prediction = self.model.predict(features)[0]
-        probability = self.model.predict_proba(features)[0]
-        confidence = max(probability)
-        
-        condition = "Rainy" if prediction == 1 else "Sunny"
-        return condition, confidence
+        return self.model.predict(weather_data)
     
     def run(self):
         """Execute weather delta update"""
@@ -168,10 +112,15 @@ class WeatherDeltaScraper:
         
         results = []
         
-        for team_name, location in self.STADIUMS.items():
+        # All stadiums in one request (concurrent fallback)
+        currents = fetch_current_weather(
+            [(loc['lat'], loc['lon']) for loc in self.STADIUMS.values()], self.http, self.weather_url
+        )
+        
+        for (team_name, location), current in zip(self.STADIUMS.items(), currents):
             print(f"  → {team_name:30s}", end=" ")
             
-            weather = self.get_weather_data(location['lat'], location['lon'])
+            weather = self._with_cardinal(current)
             condition, confidence = self.predict_weather(weather)
             
             wind_info = f"{weather['wind_speed']:.1f} km/h {weather['wind_direction_cardinal']}"
@@ -196,14 +145,13 @@ class WeatherDeltaScraper:
                 'confidence': confidence,
                 'timestamp': weather['timestamp']
             })
-            
-            time.sleep(0.3)
         
         # Save to CSV
-        df = pd.DataFrame(results)
-        output_path = self.data_dir / "mlb_stadium_weather.csv"
-        df.to_csv(output_path, index=False)
+        df = weather_frame(results)
+        output_path = write_weather_csv(df, self.data_dir / "mlb_stadium_weather.csv")
+        self.weather_df = df
         
+        self.http.cache.log_run("weather_delta_scrape")
         print("\n✅ Weather data updated for all 30 stadiums")
         print(f"📁 Saved to: {output_path}")
         print(f"⏰ Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
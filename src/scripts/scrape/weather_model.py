@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Stadium Weather Classifier Artifact
+
+The Sunny/Rainy classifier used by the weather scrapers, trained once into a
+versioned artifact (models/weather/weather_classifier_v<N>.npz) and loaded on
+demand instead of being retrained on every run.
+
+Key Concepts:
+- Two model kinds, both evaluated with NumPy only:
+  - 'forest': the RandomForestClassifier (100 trees, random_state=42) the
+    scrapers always used, exported as flat node arrays; predictions match
+    sklearn's predict_proba
+  - 'rule': per-feature threshold votes (midpoints between the class means),
+    vote share = confidence; needs no scikit-learn at all
+- scikit-learn is imported only inside train_forest(), so the daily weather
+  delta never pays for it once the artifact exists
+- MODEL_VERSION is part of the file name and stored in the artifact; bump it
+  when the features or training data change and stale artifacts are ignored
+- If no artifact exists it is trained (forest when scikit-learn is installed,
+  otherwise rule) and saved; FB_AI_WEATHER_MODEL=rule|forest picks the kind
+
+Usage:
+    python src/scripts/scrape/weather_model.py              # (re)train forest artifact
+    python src/scripts/scrape/weather_model.py --kind rule
+
+    from scripts.scrape.weather_model import load_weather_classifier
+    model = load_weather_classifier()
+    condition, confidence = model.predict(weather_dict)
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+import numpy as np
+
+
+MODEL_VERSION = 1
+MODEL_DIR = Path(__file__).parent.parent.parent.parent / "models" / "weather"
+MODEL_KINDS = ('forest', 'rule')
+
+# Feature order of the classifier input
+FEATURES = ['temperature', 'humidity', 'pressure', 'wind_speed', 'cloud_cover']
+
+
+def model_path(kind='forest', model_dir=None):
+    """Artifact path for a model kind at the current MODEL_VERSION"""
+    return Path(model_dir or MODEL_DIR) / f"weather_classifier_{kind}_v{MODEL_VERSION}.npz"
+
+
+def training_data(n_samples=500, seed=42):
+    """
+    Synthetic training set (features in FEATURES order, 1 = Rainy, 0 = Sunny)
+
+    Same draws as the original in-scraper training (np.random.seed(42)).
+    """
+    rng = np.random.RandomState(seed)
+    half = n_samples // 2
+
+    # Sunny day patterns: high temp, low humidity, high pressure, low clouds
+    sunny_data = np.column_stack([
+        rng.uniform(20, 35, half),      # temp
+        rng.uniform(30, 60, half),      # humidity
+        rng.uniform(1015, 1025, half),  # pressure
+        rng.uniform(5, 20, half),       # wind speed
+        rng.uniform(0, 40, half),       # cloud cover
+    ])
+
+    # Rainy day patterns: lower temp, high humidity, low pressure, high clouds
+    rainy_data = np.column_stack([
+        rng.uniform(10, 20, half),
+        rng.uniform(70, 95, half),
+        rng.uniform(995, 1010, half),
+        rng.uniform(10, 30, half),
+        rng.uniform(60, 100, half),
+    ])
+
+    X = np.vstack([sunny_data, rainy_data])
+    y = np.hstack([np.zeros(half), np.ones(half)])
+    return X, y
+
+
+class WeatherClassifier:
+    """Sunny/Rainy classifier evaluated with NumPy (forest or rule arrays)"""
+
+    def __init__(self, kind, arrays, version=MODEL_VERSION):
+        """
+        Args:
+            kind: 'forest' or 'rule'
+            arrays: Model arrays (see train_forest / train_rule)
+            version: MODEL_VERSION the arrays were built with
+        """
+        if kind not in MODEL_KINDS:
+            raise ValueError(f"Unknown weather model kind: {kind}")
+        self.kind = kind
+        self.arrays = arrays
+        self.version = version
+
+    def predict_proba(self, X):
+        """Rainy probability for each row of X (n x len(FEATURES))"""
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        if self.kind == 'rule':
+            a = self.arrays
+            votes = np.where(a['rainy_above'], X > a['threshold'], X <= a['threshold'])
+            return votes.mean(axis=1)
+
+        # Walk every tree at once; sklearn compares float32 features to the thresholds
+        a = self.arrays
+        X = X.astype(np.float32).astype(np.float64)
+        nodes = np.repeat(a['roots'][:, None], len(X), axis=1)
+        rows = np.arange(len(X))[None, :]
+        while True:
+            internal = a['left'][nodes] >= 0
+            if not internal.any():
+                break
+            go_left = X[rows, a['feature'][nodes]] <= a['threshold'][nodes]
+            nodes = np.where(internal, np.where(go_left, a['left'][nodes], a['right'][nodes]), nodes)
+        return a['rainy'][nodes].mean(axis=0)
+
+    def predict(self, weather_data):
+        """(condition, confidence) for one weather dict"""
+        if weather_data['precipitation'] > 0.1:
+            return "Rainy", 1.0
+        rainy = float(self.predict_proba([[weather_data[f] for f in FEATURES]])[0])
+        return ("Rainy", rainy) if rainy > 0.5 else ("Sunny", 1.0 - rainy)
+
+    def save(self, path):
+        """Write the artifact atomically"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_suffix('.tmp.npz')
+        np.savez_compressed(tmp_file, kind=np.array(self.kind), version=np.array(self.version),
+                            features=np.array(FEATURES), **self.arrays)
+        tmp_file.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """Artifact from disk, or None if missing, unreadable or from another version"""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data['version']) != MODEL_VERSION or list(data['features']) != FEATURES:
+                    return None
+                arrays = {k: data[k] for k in data.files if k not in ('kind', 'version', 'features')}
+                return cls(str(data['kind']), arrays, int(data['version']))
+        except (OSError, KeyError, ValueError):
+            return None
+
+
+def train_rule(X=None, y=None):
+    """Threshold-vote classifier built from the class means (NumPy only)"""
+    if X is None:
+        X, y = training_data()
+    sunny_mean = X[y == 0].mean(axis=0)
+    rainy_mean = X[y == 1].mean(axis=0)
+    return WeatherClassifier('rule', {
+        'threshold': (sunny_mean + rainy_mean) / 2,
+        'rainy_above': rainy_mean > sunny_mean,
+    })
+
+
+def train_forest(X=None, y=None, n_estimators=100, random_state=42):
+    """Fit the RandomForestClassifier and export its trees as flat arrays"""
+    from sklearn.ensemble import RandomForestClassifier
+
+    if X is None:
+        X, y = training_data()
+    forest = RandomForestClassifier(n_estimators=n_estimators, random_state=random_state)
+    forest.fit(X, y)
+
+    rainy_col = list(forest.classes_).index(1.0)
+    roots, left, right, feature, threshold, rainy = [], [], [], [], [], []
+    offset = 0
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        is_leaf = tree.children_left < 0
+        value = tree.value[:, 0, :]
+        roots.append(offset)
+        left.append(np.where(is_leaf, -1, tree.children_left + offset))
+        right.append(np.where(is_leaf, -1, tree.children_right + offset))
+        feature.append(np.where(is_leaf, 0, tree.feature))
+        threshold.append(tree.threshold)
+        rainy.append(value[:, rainy_col] / value.sum(axis=1))
+        offset += tree.node_count
+
+    return WeatherClassifier('forest', {
+        'roots': np.array(roots, dtype=np.int64),
+        'left': np.concatenate(left).astype(np.int64),
+        'right': np.concatenate(right).astype(np.int64),
+        'feature': np.concatenate(feature).astype(np.int64),
+        'threshold': np.concatenate(threshold),
+        'rainy': np.concatenate(rainy),
+    })
+
+
+def train_weather_classifier(kind='forest', model_dir=None):
+    """Train a model kind and save its artifact"""
+    model = train_forest() if kind == 'forest' else train_rule()
+    model.save(model_path(kind, model_dir))
+    return model
+
+
+def load_weather_classifier(kind=None, model_dir=None):
+    """
+    Load the classifier artifact, training it once if needed
+
+    Args:
+        kind: 'forest' or 'rule' (default: FB_AI_WEATHER_MODEL env, else forest)
+        model_dir: Artifact directory (default: models/weather)
+
+    Returns:
+        WeatherClassifier
+    """
+    kind = kind or os.environ.get('FB_AI_WEATHER_MODEL', 'forest')
+    model = WeatherClassifier.load(model_path(kind, model_dir))
+    if model is not None:
+        return model
+
+    if kind == 'forest':
+        try:
+            import sklearn  # noqa: F401
+        except ImportError:
+            print("⚠️  scikit-learn not installed - using the rule weather model")
+            kind = 'rule'
+            model = WeatherClassifier.load(model_path(kind, model_dir))
+            if model is not None:
+                return model
+
+    print(f"Training weather prediction model ({kind})...")
+    model = train_weather_classifier(kind, model_dir)
+    print(f"✓ Model saved to {model_path(kind, model_dir)}")
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the stadium weather classifier artifact')
+    parser.add_argument('--kind', choices=MODEL_KINDS, default='forest', help='Model kind (default: forest)')
+    parser.add_argument('--model-dir', type=str, default=None, help='Artifact directory (default: models/weather)')
+    args = parser.parse_args()
+
+    model = train_weather_classifier(args.kind, args.model_dir)
+    X, y = training_data()
+    accuracy = ((model.predict_proba(X) > 0.5) == y).mean()
+    print(f"✓ {args.kind} weather model v{MODEL_VERSION} trained "
+          f"(training accuracy {accuracy:.1%}) -> {model_path(args.kind, args.model_dir)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,15 +7,19 @@ and uses machine learning to predict weather conditions (Rainy/Sunny).
 """
 
 import pandas as pd
-import numpy as np
-import requests
 from datetime import datetime
 from typing import Dict, Tuple
-import time
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import LabelEncoder
 import os
 
+try:
+    from .stadium_weather import (DEFAULT_WEATHER, OPEN_METEO_URL, fetch_current_weather,
+                                  weather_frame, weather_session, write_weather_csv)
+    from .weather_model import load_weather_classifier, train_weather_classifier
+except ImportError:
+    from stadium_weather import (DEFAULT_WEATHER, OPEN_METEO_URL, fetch_current_weather,
+                                 weather_frame, weather_session, write_weather_csv)
+    from weather_model import load_weather_classifier, train_weather_classifier
+
 
 class MLBWeatherPredictor:
     """Weather prediction for MLB stadiums"""
@@ -54,99 +58,35 @@ class MLBWeatherPredictor:
         'Washington Nationals': {'venue': 'Nationals Park', 'lat': 38.8730, 'lon': -77.0074, 'city': 'Washington, DC'},
     }
     
-    def __init__(self):
-        self.model = None
-        self.wind_encoder = LabelEncoder()
-        self.train_simple_model()
+    def __init__(self, weather_url=OPEN_METEO_URL):
+        self._model = None
+        self.http = weather_session()
+        self.weather_url = weather_url
+    
+    @property
+    def model(self):
+        """Weather classifier, loaded from its artifact on first use"""
+        if self._model is None:
+            self._model = load_weather_classifier()
+        return self._model
     
     def train_simple_model(self):
-        """Train a simple weather prediction model"""
+        """Retrain the weather prediction model and replace its artifact"""
         print("Training weather prediction model...")
-        
-        # Simple training data based on weather patterns
-        # Features: [temp, humidity, pressure, wind_speed, cloud_cover]
-        # 1 = Rainy, 0 = Sunny
-        np.random.seed(42)
-        
-        # Generate synthetic training data
-        n_samples = 500
-        
-        # Sunny day patterns: high temp, low humidity, high pressure, low clouds
-        sunny_data = np.column_stack([
-            np.random.uniform(20, 35, n_samples//2),  # temp
-            np.random.uniform(30, 60, n_samples//2),  # humidity
-            np.random.uniform(1015, 1025, n_samples//2),  # pressure
-            np.random.uniform(5, 20, n_samples//2),  # wind speed
-            np.random.uniform(0, 40, n_samples//2),  # cloud cover
-        ])
-        
-        # Rainy day patterns: lower temp, high humidity, low pressure, high clouds
-        rainy_data = np.column_stack([
-            np.random.uniform(10, 20, n_samples//2),  # temp
-            np.random.uniform(70, 95, n_samples//2),  # humidity
-            np.random.uniform(995, 1010, n_samples//2),  # pressure
-            np.random.uniform(10, 30, n_samples//2),  # wind speed
-            np.random.uniform(60, 100, n_samples//2),  # cloud cover
-        ])
-        
-        X = np.vstack([sunny_data, rainy_data])
-        y = np.hstack([np.zeros(n_samples//2), np.ones(n_samples//2)])
-        
-        # Train Random Forest model
-        self.model = RandomForestClassifier(n_estimators=100, random_state=42)
-        self.model.fit(X, y)
-        
+        self._model = train_weather_classifier()
         print("✓ Model trained successfully")
     
     def get_weather_data(self, lat: float, lon: float) -> Dict:
         """
         Fetch weather data from Open-Meteo API (free, no API key needed)
         """
-        try:
-            url = "https://api.open-meteo.com/v1/forecast"
-            params = {
-                'latitude': lat,
-                'longitude': lon,
-                'current': 'temperature_2m,relative_humidity_2m,pressure_msl,wind_speed_10m,wind_direction_10m,wind_gusts_10m,cloud_cover,precipitation',
-                'temperature_unit': 'celsius',
-                'wind_speed_unit': 'kmh',
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            current = data.get('current', {})
-            
-            wind_dir_degrees = current.get('wind_direction_10m', 0)
-            
-            return {
-                'temperature': current.get('temperature_2m', 15),
-                'humidity': current.get('relative_humidity_2m', 50),
-                'pressure': current.get('pressure_msl', 1013),
-                'wind_speed': current.get('wind_speed_10m', 10),
-                'wind_direction': wind_dir_degrees,
-                'wind_direction_cardinal': self.degrees_to_cardinal(wind_dir_degrees),
-                'wind_gusts': current.get('wind_gusts_10m', 0),
-                'cloud_cover': current.get('cloud_cover', 50),
-                'precipitation': current.get('precipitation', 0),
-                'timestamp': current.get('time', datetime.now().isoformat())
-            }
-        except Exception as e:
-            print(f"Error fetching weather data: {e}")
-            # Return default values if API fails
-            return {
-                'temperature': 15,
-                'humidity': 50,
-                'pressure': 1013,
-                'wind_speed': 10,
-                'wind_direction': 0,
-                'wind_direction_cardinal': 'N',
-                'wind_gusts': 0,
-                'cloud_cover': 50,
-                'precipitation': 0,
-                'timestamp': datetime.now().isoformat()
-            }
+        return self._with_cardinal(fetch_current_weather([(lat, lon)], self.http, self.weather_url)[0])
+    
+    def _with_cardinal(self, weather) -> Dict:
+        """Add the cardinal wind direction (defaults if the fetch failed)"""
+        if weather is None:
+            weather = {**DEFAULT_WEATHER, 'timestamp': datetime.now().isoformat()}
+        return {**weather, 'wind_direction_cardinal': self.degrees_to_cardinal(weather['wind_direction'])}
     
     def degrees_to_cardinal(self, degrees: float) -> str:
         """Convert wind direction in degrees to cardinal direction"""
@@ -162,26 +102,7 @@ class MLBWeatherPredictor:
         Returns:
             Tuple of (prediction, confidence)
         """
-        # Extract features
-        features = np.array([[
-            weather_data['temperature'],
-            weather_data['humidity'],
-            weather_data['pressure'],
-            weather_data['wind_speed'],
-            weather_data['cloud_cover']
-        ]])
-        
-        # If there's actual precipitation, it's definitely rainy
-        if weather_data['precipitation'] > 0.1:
-            return "Rainy", 1.0
-        
-        # Make prediction
-        prediction = self.model.predict(features)[0]
-        probability = self.model.predict_proba(features)[0]
-        confidence = max(probability)
-        
-        condition = "Rainy" if prediction == 1 else "Sunny"
-        return condition, confidence
+        return self.model.predict(weather_data)
     
     def get_weather_for_all_stadiums(self) -> pd.DataFrame:
         """Get weather predictions for all MLB stadiums"""
@@ -191,11 +112,15 @@ class MLBWeatherPredictor:
         print(f"Fetching weather for all MLB stadiums on {datetime.now().strftime('%Y-%m-%d %H:%M')}")
         print(f"{'='*80}\n")
         
-        for team_name, location in self.STADIUMS.items():
-            print(f"Fetching: {team_name} - {location['venue']}...", end=" ")
+        # All stadiums in one request (concurrent fallback)
+        currents = fetch_current_weather(
+            [(loc['lat'], loc['lon']) for loc in self.STADIUMS.values()], self.http, self.weather_url
+        )
+        
+        for (team_name, location), current in zip(self.STADIUMS.items(), currents):
+            print(f"Fetched: {team_name} - {location['venue']}...", end=" ")
             
-            # Get weather data
-            weather = self.get_weather_data(location['lat'], location['lon'])
+            weather = self._with_cardinal(current)
             
             # Predict condition
             condition, confidence = self.predict_weather(weather)
@@ -226,14 +151,12 @@ class MLBWeatherPredictor:
                 'confidence': confidence,
                 'timestamp': weather['timestamp']
             })
-            
-            time.sleep(0.5)  # Rate limiting
         
-        return pd.DataFrame(results)
+        return weather_frame(results)
     
     def export_to_csv(self, df: pd.DataFrame, filename: str = "mlb_stadium_weather.csv"):
-        """Export weather predictions to CSV"""
-        df.to_csv(filename, index=False)
+        """Export weather predictions to CSV (atomic replace)"""
+        write_weather_csv(df, filename)
         print(f"\n✓ Exported {len(df)} stadium predictions to {filename}")
     
     def print_summary(self, df: pd.DataFrame):
@@ -308,6 +231,7 @@ def main():
     # Export to CSV
     os.makedirs('data', exist_ok=True)
     predictor.export_to_csv(weather_df, 'data/mlb_stadium_weather.csv')
+    predictor.http.cache.log_run("weather_scrape")
     
     # Optional: Compare with today's games
     print("\n💡 TIP: Compare this data with today's MLB schedule to see")
@@ -24,6 +24,11 @@ from datetime import datetime
 from pathlib import Path
 import pandas as pd
 
+try:
+    from .http_cache import get_http_cache
+except ImportError:
+    from http_cache import get_http_cache
+
 try:
     from yahoo_oauth import OAuth2
 except ImportError:
@@ -37,11 +42,14 @@ class YahooFantasyAPI:
     BASE_URL = "https://fantasysports.yahooapis.com/fantasy/v2"
     TARGET_TEAMS = ["I Like BIG Bunts", "Pure Uncut Adam West"]
     
-    def __init__(self):
+    def __init__(self, data_dir=None):
         self.oauth = None
         self.project_root = Path(__file__).parent.parent.parent.parent
-        self.data_dir = self.project_root / "data"
+        self.data_dir = Path(data_dir) if data_dir else self.project_root / "data"
+        self.roster_df = None
+        self.roster_file = None
         self.oauth_file = self.project_root / "oauth2.json"
+        self.cache = get_http_cache()
         
     def print_header(self, text):
         print(f"\n{'='*80}\n{text.center(80)}\n{'='*80}\n")
@@ -80,7 +88,7 @@ class YahooFantasyAPI:
     def request(self, endpoint):
         """Make API request"""
         url = f"{self.BASE_URL}/{endpoint}"
-        return self.oauth.session.get(url, params={'format': 'json'}).json()
+        return self.cache.get(self.oauth.session, url, params={'format': 'json'}).json()
     
     def get_teams(self):
         """Get user's teams for the current/most recent MLB season"""
@@ -287,6 +295,7 @@ class YahooFantasyAPI:
             filename = f"yahoo_fantasy_rosters_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             filepath = self.data_dir / filename
             df.to_csv(filepath, index=False)
+            self.roster_df, self.roster_file = df, filepath
             
             print(f"\n✅ Exported {len(all_rosters)} players to:")
             print(f"   {filepath}")
@@ -296,6 +305,7 @@ class YahooFantasyAPI:
                 count = len(df[df['fantasy_team'] == team_name])
                 print(f"   {team_name}: {count} players")
         
+        self.cache.log_run("yahoo_scrape")
         return True
 
 
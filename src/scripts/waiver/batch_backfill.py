@@ -5,6 +5,10 @@ Daily Batch Processor for Factor Analysis Backfill
 Processes factor analysis in daily batches with better error handling
 and memory management. Designed for long-running operations.
 
+Each date is scored in-process by backfill_factor_analysis.py and written to
+the feature store (data/feature_store/<season>/<date>.csv), which the weight
+tuner and ensemble trainer read instead of recomputing factors.
+
 Usage:
     # Process single day
     python src/scripts/batch_backfill.py --date 2023-04-15
@@ -21,12 +25,20 @@ Usage:
 
 import sys
 import argparse
+import contextlib
 from pathlib import Path
 from datetime import datetime, timedelta
-import subprocess
 import time
 
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.fa.backfill_factor_analysis import run_factor_analysis_for_date
+
 # Constants
+DATA_DIR = Path("data")
 CHECKPOINT_FILE = Path("data/batch_checkpoint.txt")
 LOG_DIR = Path("data/backfill_logs")
 
@@ -49,7 +61,7 @@ def save_checkpoint(date):
 
 
 def process_single_date(date):
-    """Process factor analysis for a single date using daily_sitstart.py
+    """Process factor analysis for a single date into the feature store
     
     Args:
         date: datetime object
@@ -70,33 +82,19 @@ def process_single_date(date):
     start_time = time.time()
     
     try:
-        # Run daily_sitstart.py for this date
-        cmd = [
-            'python3',
-            'src/scripts/daily_sitstart.py',
-            '--date', date_str,
-            '--skip-tune'  # Skip weight tuning for faster processing
-        ]
-        
-        print(f"Command: {' '.join(cmd)}")
         print(f"Log file: {log_file}\n")
         
-        with open(log_file, 'w') as log:
-            result = subprocess.run(
-                cmd,
-                stdout=log,
-                stderr=subprocess.STDOUT,
-                text=True
-            )
+        with open(log_file, 'w') as log, contextlib.redirect_stdout(log):
+            result = run_factor_analysis_for_date(pd.Timestamp(date), DATA_DIR)
         
         elapsed = time.time() - start_time
         
-        if result.returncode == 0:
-            print(f"\n✅ Success! Completed in {elapsed:.1f}s")
+        if result is not None:
+            print(f"\n✅ Success! {len(result)} player-game rows in {elapsed:.1f}s")
             save_checkpoint(date)
             return True
         else:
-            print(f"\n❌ Failed with exit code {result.returncode}")
+            print(f"\n❌ Failed")
             print(f"   Check log: {log_file}")
             return False
             
@@ -145,9 +143,6 @@ def process_date_range(start_date, end_date):
                 break
         
         current += timedelta(days=1)
-        
-        # Brief pause between dates
-        time.sleep(1)
     
     print(f"\n{'='*80}")
     print(f"Batch Complete!")
@@ -20,6 +20,12 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.fa.score_matrix import FactorScoreMatrix, FACTORS
 
 
 class WaiverWireAnalyzer:
@@ -33,72 +39,20 @@ class WaiverWireAnalyzer:
         Load factor analysis results for all MLB players
         
         Reads from the *_all_players_*.csv files generated by run_all_fa.py --all-players
-        Combines all 20 factor analyses into a single DataFrame
+        Combines all 20 factor analyses into one row per player (see score_matrix.py)
         
         Returns:
-            DataFrame with all players and their factor scores
+            DataFrame with player_name, team and one <factor>_score column per factor
         """
-        # Get the most recent all_players analysis files
-        all_players_files = {}
-        
-        factor_patterns = [
-            'wind_analysis_all_players_*.csv',
-            'matchup_analysis_all_players_*.csv',
-            'home_away_analysis_all_players_*.csv',
-            'rest_day_analysis_all_players_*.csv',
-            'injury_analysis_all_players_*.csv',
-            'umpire_analysis_all_players_*.csv',
-            'platoon_analysis_all_players_*.csv',
-            'temperature_analysis_all_players_*.csv',
-            'pitch_mix_analysis_all_players_*.csv',
-            'park_factors_analysis_all_players_*.csv',
-            'lineup_position_analysis_all_players_*.csv',
-            'time_of_day_analysis_all_players_*.csv',
-            'defensive_positions_analysis_all_players_*.csv',
-            'recent_form_analysis_all_players_*.csv',
-            'bullpen_fatigue_analysis_all_players_*.csv',
-            'humidity_elevation_analysis_all_players_*.csv',
-            'monthly_splits_analysis_all_players_*.csv',
-            'team_momentum_analysis_all_players_*.csv',
-            'statcast_metrics_analysis_all_players_*.csv',
-            'vegas_odds_analysis_all_players_*.csv',
-        ]
+        scores_df = FactorScoreMatrix(self.data_dir, scope='all_players').build()
         
-        combined_df = None
-        
-        for pattern in factor_patterns:
-            files = sorted(self.data_dir.glob(pattern), 
-                          key=lambda x: x.stat().st_mtime, reverse=True)
-            
-            if files:
-                factor_name = pattern.split('_analysis_')[0]
-                try:
-                    df = pd.read_csv(files[0])
-                    
-                    if combined_df is None:
-                        combined_df = df
-                    else:
-                        # Merge on player_name and team
-                        merge_cols = ['player_name', 'team']
-                        # Only keep merge columns if they exist
-                        actual_merge_cols = [c for c in merge_cols if c in df.columns and c in combined_df.columns]
-                        
-                        if actual_merge_cols:
-                            combined_df = combined_df.merge(
-                                df,
-                                on=actual_merge_cols,
-                                how='outer',
-                                suffixes=('', f'_{factor_name}')
-                            )
-                except Exception as e:
-                    print(f"Warning: Could not load {pattern}: {e}")
-        
-        if combined_df is None or len(combined_df) == 0:
+        if scores_df.empty:
             print("❌ No all-player analysis files found!")
             print("   Run: python src/scripts/run_all_fa.py --all-players")
             return pd.DataFrame()
         
-        return combined_df
+        scores_df = scores_df.rename(columns={f: f'{f}_score' for f in FACTORS})
+        return scores_df.reset_index()
     
     def load_free_agents(self, rostered_players: list = None) -> pd.DataFrame:
         """
@@ -188,7 +142,7 @@ class WaiverWireAnalyzer:
         # Average all factor scores and normalize
         factor_scores = []
         for factor, score in player_fa_scores.items():
-            if factor.endswith('_score'):
+            if factor.endswith('_score') and pd.notna(score):
                 factor_scores.append(score)
         
         if factor_scores:
@@ -252,7 +206,7 @@ class WaiverWireAnalyzer:
             player_name = fa_player.get('player_name', 'Unknown')
             team = fa_player.get('team', None)
             
-            if not team:
+            if not team or pd.isna(team):
                 continue
             
             # Analyze upcoming schedule
@@ -292,8 +246,9 @@ class WaiverWireAnalyzer:
                 'coors_games': schedule_analysis['coors_games'],
                 'favorable_parks': schedule_analysis['favorable_parks'],
                 'avg_factor_score': np.mean([s for k, s in fa_player_scores.items() 
-                                            if k.endswith('_score')]) if any(k.endswith('_score') 
-                                            for k in fa_player_scores.keys()) else 0,
+                                            if k.endswith('_score') and pd.notna(s)]) if any(
+                                            k.endswith('_score') and pd.notna(s)
+                                            for k, s in fa_player_scores.items()) else 0,
             }
             
             # Add reason for pickup
@@ -6,13 +6,52 @@ This script analyzes historical game performance from 2022 onwards using all fac
 to determine optimal weights for sit/start recommendations. It compares predictions against
 actual game results to tune weights for individual players on your roster.
 
+Key Concepts:
+- Score matrix: each player's games are scored once into a (games x factors)
+  matrix of raw factor scores (columns in FACTORS order) plus an actuals
+  vector; a weight vector's predictions are then one matrix-vector product
+- Optimization: differential evolution maximizes the correlation between
+  predictions and normalized actuals; the whole population is scored per
+  generation as one (games x factors) @ (factors x candidates) product
+- Parallel tuning: --workers N tunes players on a process pool (each worker
+  holds the historical games once); every player uses the same seed, so the
+  weights do not depend on worker count or order
+- Time budget: --time-budget S stops each search at its current best once S
+  seconds have passed since the suite started (budget-cut results then
+  depend on machine speed)
+- Solvers: --solver de (default) is the evolutionary search above;
+  --solver nnls solves for non-negative, sum-to-one weights on standardized
+  factor scores in closed form, shrunk toward the global weights with the
+  strength picked by cross-validation (see weight_solver.py) - milliseconds
+  per player and the same answer every run
+- Incremental tuning (--incremental, nnls): per-player sums over the
+  score matrix are kept in config/player_weight_stats.json; each run scores
+  only the games played since the last one, adds them and re-solves
+  (optional --half-life DAYS down-weights older games) - see weight_stats.py
+- Feature store: a player's games come from data/feature_store (written by
+  fa/backfill_factor_analysis.py) - the real factor scores they had going
+  into each game and the fantasy points they scored; only the game/date,
+  the 13 tuned score columns and fantasy_points are read
+- Players without stored history fall back to scoring schedule games on the
+  fly with placeholder factors (matchup, umpire, pitch mix, defense use
+  keyed draws per player/game, so a game scores the same in every evaluation)
+
 Usage:
     python src/scripts/backtest_weights.py                    # Run for entire roster
     python src/scripts/backtest_weights.py --player "Ohtani"  # Run for specific player
     python src/scripts/backtest_weights.py --save             # Save tuned weights
+    python src/scripts/backtest_weights.py --optimize --workers 4 --time-budget 120
+    python src/scripts/backtest_weights.py --optimize --solver nnls --save
+    python src/scripts/backtest_weights.py --incremental --half-life 60 --save
 """
 
+import io
 import sys
+import time
+import hashlib
+import inspect
+import contextlib
+import multiprocessing
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -21,9 +60,50 @@ import json
 from typing import Dict, List
 import argparse
 from scipy.optimize import differential_evolution
+from concurrent.futures import ProcessPoolExecutor
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.fa.feature_store import FeatureStore, TARGET_COLUMN
+from scripts.fa.keyed_random import keyed_uniform
+from scripts.weight.weight_solver import (CV_FOLDS, add_moments, assign_folds, fit_weights, fold_moments,
+                                          moment_correlation, scale_moments, total_moments)
+from scripts.weight.weight_stats import WeightStatsStore, decay_weights
+
+
+# Score matrix column order (and the order of every weight vector)
+FACTORS = ('wind', 'matchup', 'home_away', 'platoon', 'park_factors', 'rest_day', 'injury',
+           'umpire', 'temperature', 'pitch_mix', 'lineup_position', 'time_of_day',
+           'defensive_positions')
+
+# Feature store columns holding the factor scores, in FACTORS order
+SCORE_COLUMNS = [f"{factor}_score" for factor in FACTORS]
+
+DE_SEED = 42
+
+SOLVERS = ('de', 'nnls')
+
+# Per-process state of pool workers (set once by _init_worker, read-only afterwards)
+_WORKER = {}
+
+
+def _init_worker(project_root, games_df, feature_history):
+    """Pool initializer: receive the tuner root, historical games and stored features once per worker"""
+    _WORKER['tuner'] = WeightTuner(project_root)
+    _WORKER['tuner'].feature_history = feature_history
+    _WORKER['games_df'] = games_df
+
+
+def _tune_task(player, deadline, solver):
+    """Worker task: optimize and backtest one player; returns (weights, results, output, error)"""
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            weights, results = _WORKER['tuner'].tune_player(player, _WORKER['games_df'], deadline, solver)
+        return weights, results, output.getvalue(), None
+    except Exception as e:
+        return None, None, output.getvalue(), f"{type(e).__name__}: {e}"
 
 
 class WeightTuner:
@@ -59,6 +139,10 @@ class WeightTuner:
         self.global_weights = self.load_weights(self.weights_file, self.default_weights)
         self.player_weights = self.load_player_weights()
         
+        # Historical factor scores per player-game (load_feature_history)
+        self.feature_store = FeatureStore(self.data_dir)
+        self.feature_history = None
+        
     def load_weights(self, file_path: Path, default: Dict) -> Dict:
         """Load weights from JSON file or return default"""
         if file_path.exists():
@@ -128,6 +212,19 @@ class WeightTuner:
         print(f"\n✓ Loaded {len(games_df)} completed games from {start_year}-{current_year}")
         return games_df
     
+    def load_feature_history(self, players: List[str], start_date=None) -> pd.DataFrame:
+        """Stored factor scores and fantasy points for players (only the tuned columns are read)"""
+        columns = ['game_date', 'game_pk', 'player_name'] + SCORE_COLUMNS + [TARGET_COLUMN]
+        history = self.feature_store.read(columns=columns, start_date=start_date, players=players)
+        self.feature_history = history.sort_values(['game_date', 'game_pk'], kind='mergesort')
+        
+        if len(history):
+            print(f"  Loaded {len(history)} stored player-games for "
+                  f"{history['player_name'].nunique()} players from the feature store")
+        else:
+            print("  ℹ️  No stored factor history - run fa/backfill_factor_analysis.py to build it")
+        return self.feature_history
+    
     def load_player_stats(self) -> pd.DataFrame:
         """Load historical player statistics"""
         stats_file = self.data_dir / "mlb_all_players_complete.csv"
@@ -137,72 +234,49 @@ class WeightTuner:
         
         return pd.read_csv(stats_file)
     
+    def factor_vector(self, player: str, game_data: Dict) -> List[float]:
+        """Raw factor scores for a player/game in FACTORS order"""
+        # Each factor returns a score between -1 and 1
+        # Positive = favorable, Negative = unfavorable
+        return [
+            self.analyze_wind(game_data),
+            self.analyze_matchup(player, game_data),
+            self.analyze_home_away(player, game_data),
+            self.analyze_platoon(player, game_data),
+            self.analyze_park_factors(player, game_data),
+            self.analyze_rest_days(player, game_data),
+            self.analyze_injury(player, game_data),
+            self.analyze_umpire(game_data),
+            self.analyze_temperature(game_data),
+            self.analyze_pitch_mix(player, game_data),
+            self.analyze_lineup_position(player, game_data),
+            self.analyze_time_of_day(player, game_data),
+            self.analyze_defensive_positions(game_data),
+        ]
+
+    def weight_vector(self, weights: Dict) -> np.ndarray:
+        """Weights dict -> vector in FACTORS order (defaults for missing factors)"""
+        return np.array([weights.get(f, self.default_weights[f]) for f in FACTORS], dtype=float)
+
     def calculate_factor_scores(self, player: str, game_data: Dict, weights: Dict) -> Dict:
         """Calculate all factor analysis scores for a player/game"""
         scores = {}
-        
-        # Each factor returns a score between -1 and 1
-        # Positive = favorable, Negative = unfavorable
-        
         try:
-            # Wind analysis
-            wind_score = self.analyze_wind(game_data)
-            scores['wind'] = wind_score * weights.get('wind', 0.10)
-            
-            # Matchup analysis (pitcher vs hitter history)
-            matchup_score = self.analyze_matchup(player, game_data)
-            scores['matchup'] = matchup_score * weights.get('matchup', 0.15)
-            
-            # Home/Away performance
-            home_away_score = self.analyze_home_away(player, game_data)
-            scores['home_away'] = home_away_score * weights.get('home_away', 0.12)
-            
-            # Platoon advantage
-            platoon_score = self.analyze_platoon(player, game_data)
-            scores['platoon'] = platoon_score * weights.get('platoon', 0.10)
-            
-            # Park factors
-            park_score = self.analyze_park_factors(player, game_data)
-            scores['park_factors'] = park_score * weights.get('park_factors', 0.08)
-            
-            # Rest days
-            rest_score = self.analyze_rest_days(player, game_data)
-            scores['rest_day'] = rest_score * weights.get('rest_day', 0.08)
-            
-            # Injury/recovery
-            injury_score = self.analyze_injury(player, game_data)
-            scores['injury'] = injury_score * weights.get('injury', 0.12)
-            
-            # Umpire
-            umpire_score = self.analyze_umpire(game_data)
-            scores['umpire'] = umpire_score * weights.get('umpire', 0.05)
-            
-            # Temperature
-            temp_score = self.analyze_temperature(game_data)
-            scores['temperature'] = temp_score * weights.get('temperature', 0.05)
-            
-            # Pitch mix
-            pitch_mix_score = self.analyze_pitch_mix(player, game_data)
-            scores['pitch_mix'] = pitch_mix_score * weights.get('pitch_mix', 0.05)
-            
-            # Lineup position
-            lineup_score = self.analyze_lineup_position(player, game_data)
-            scores['lineup_position'] = lineup_score * weights.get('lineup_position', 0.05)
-            
-            # Time of day
-            time_score = self.analyze_time_of_day(player, game_data)
-            scores['time_of_day'] = time_score * weights.get('time_of_day', 0.03)
-            
-            # Defensive positions
-            defense_score = self.analyze_defensive_positions(game_data)
-            scores['defensive_positions'] = defense_score * weights.get('defensive_positions', 0.02)
-            
+            raw = self.factor_vector(player, game_data)
+            scores = dict(zip(FACTORS, np.array(raw) * self.weight_vector(weights)))
         except Exception as e:
             print(f"⚠️  Error calculating factor scores: {e}")
         
         return scores
     
     # Placeholder analysis functions (simplified for backtesting)
+    @staticmethod
+    def _game_key(game_data: Dict):
+        """Key identifying a game for keyed placeholder draws"""
+        if game_data.get('game_pk') is not None and not pd.isna(game_data.get('game_pk')):
+            return game_data['game_pk']
+        return f"{game_data.get('game_date', '')}|{game_data.get('home_team', '')}"
+
     def analyze_wind(self, game_data: Dict) -> float:
         """Analyze wind conditions"""
         wind_speed = game_data.get('wind_speed', 0)
@@ -220,7 +294,8 @@ class WeightTuner:
         """Analyze historical matchup performance"""
         # Simplified: check if pitcher/hitter has faced each other
         # In real implementation, use actual historical stats
-        return np.random.uniform(-0.3, 0.3)  # Placeholder
+        u = keyed_uniform(player, self._game_key(game_data), salt='bt_matchup')
+        return -0.3 + 0.6 * u  # Placeholder
     
     def analyze_home_away(self, player: str, game_data: Dict) -> float:
         """Analyze home vs away performance"""
@@ -279,7 +354,8 @@ class WeightTuner:
     def analyze_umpire(self, game_data: Dict) -> float:
         """Analyze umpire tendencies"""
         # Simplified: some umpires favor pitchers/hitters
-        return np.random.uniform(-0.1, 0.1)  # Placeholder
+        u = keyed_uniform(self._game_key(game_data), salt='bt_umpire')
+        return -0.1 + 0.2 * u  # Placeholder
     
     def analyze_temperature(self, game_data: Dict) -> float:
         """Analyze temperature impact"""
@@ -294,7 +370,8 @@ class WeightTuner:
     
     def analyze_pitch_mix(self, player: str, game_data: Dict) -> float:
         """Analyze pitcher's pitch mix vs player strength"""
-        return np.random.uniform(-0.2, 0.2)  # Placeholder
+        u = keyed_uniform(player, self._game_key(game_data), salt='bt_pitch_mix')
+        return -0.2 + 0.4 * u  # Placeholder
     
     def analyze_lineup_position(self, player: str, game_data: Dict) -> float:
         """Analyze batting order position"""
@@ -319,7 +396,8 @@ class WeightTuner:
     
     def analyze_defensive_positions(self, game_data: Dict) -> float:
         """Analyze defensive matchup"""
-        return np.random.uniform(-0.1, 0.1)  # Placeholder
+        u = keyed_uniform(self._game_key(game_data), salt='bt_defense')
+        return -0.1 + 0.2 * u  # Placeholder
     
     def calculate_composite_score(self, scores: Dict) -> float:
         """Calculate composite score from all factors"""
@@ -350,9 +428,93 @@ class WeightTuner:
         
         return fantasy_points
     
+    def find_player_games(self, player: str, games_df: pd.DataFrame) -> pd.DataFrame:
+        """Games involving a player"""
+        if games_df.empty:
+            return games_df
+        return games_df[
+            (games_df['home_team'].str.contains(player, case=False, na=False)) |
+            (games_df['away_team'].str.contains(player, case=False, na=False))
+        ]
+    
+    def stored_games(self, player: str, after=None) -> pd.DataFrame:
+        """A player's feature store rows (loaded by load_feature_history) after a date"""
+        if self.feature_history is None or self.feature_history.empty:
+            return pd.DataFrame()
+        rows = self.feature_history[self.feature_history['player_name'] == player]
+        if after is not None:
+            rows = rows[rows['game_date'] > after]
+        return rows
+    
+    def build_backtest_data(self, player: str, games_df: pd.DataFrame, after=None,
+                            fallback: bool = True) -> Dict:
+        """
+        Score a player's games once
+        
+        Args:
+            player: Player name (feature store), else matched against home/away team
+            games_df: Historical games (used only without stored history)
+            after: Only games after this date
+            fallback: Score schedule games with placeholder factors when the
+                      player has no stored history (else return no games)
+        
+        Returns:
+            Dict with 'X' (games x factors raw score matrix, FACTORS order),
+            'actuals' (fantasy points per game), 'actuals_normalized'
+            (z-scored actuals; the raw actuals when they have no spread),
+            'game_keys' (one per row, for cross-validation folds),
+            'game_dates' and 'source' ('feature_store' or 'placeholder')
+        """
+        stored = self.stored_games(player, after)
+        if len(stored):
+            X = np.nan_to_num(stored[SCORE_COLUMNS].to_numpy(dtype=float))  # missing score = neutral
+            actuals = stored[TARGET_COLUMN].fillna(0).to_numpy(dtype=float)
+            keys = stored['game_pk'].tolist()
+            dates = stored['game_date'].tolist()
+            source = 'feature_store'
+        else:
+            games = self.find_player_games(player, games_df) if fallback else games_df.iloc[0:0]
+            if after is not None and len(games):
+                games = games[pd.to_datetime(games['game_date']) > after]
+            rows, actuals, keys, dates = [], [], [], []
+            for game_data in games.to_dict('records'):
+                try:
+                    row = self.factor_vector(player, game_data)
+                    actual = self.get_actual_performance(player, game_data)
+                except Exception as e:
+                    print(f"⚠️  Error processing game {game_data.get('game_pk', '')}: {e}")
+                    continue
+                rows.append(row)
+                actuals.append(actual)
+                keys.append(self._game_key(game_data))
+                dates.append(game_data.get('game_date'))
+            
+            X = np.array(rows, dtype=float).reshape(len(rows), len(FACTORS))
+            actuals = np.array(actuals, dtype=float)
+            source = 'placeholder'
+        
+        # Normalize actual performance to -1 to 1 scale for comparison
+        if len(actuals) and actuals.std() > 0:
+            actuals_normalized = (actuals - actuals.mean()) / actuals.std()
+        else:
+            actuals_normalized = actuals
+        
+        return {'player': player, 'X': X, 'actuals': actuals, 'actuals_normalized': actuals_normalized,
+                'game_keys': keys, 'game_dates': dates, 'source': source}
+    
+    @staticmethod
+    def score_correlation(predictions: np.ndarray, actuals_normalized: np.ndarray) -> float:
+        """Pearson correlation (0.0 when either side has no variance)"""
+        if len(predictions) < 2:
+            return 0.0
+        p = predictions - predictions.mean()
+        a = actuals_normalized - actuals_normalized.mean()
+        denom = np.sqrt((p @ p) * (a @ a))
+        return float(p @ a / denom) if denom > 0 else 0.0
+    
     def backtest_player(self, player: str, games_df: pd.DataFrame, 
-                       weights: Dict) -> Dict:
-        """Backtest predictions for a single player"""
+                       weights: Dict, data: Dict = None) -> Dict:
+        """Backtest predictions for a single player (data: prebuilt build_backtest_data)"""
         
         print(f"\n{'='*60}")
         print(f"Backtesting: {player}")
@@ -369,60 +531,30 @@ class WeightTuner:
             'rmse': 0.0
         }
         
-        # Filter games for this player
-        player_games = games_df[
-            (games_df['home_team'].str.contains(player, case=False, na=False)) |
-            (games_df['away_team'].str.contains(player, case=False, na=False))
-        ].copy()
+        if data is None:
+            data = self.build_backtest_data(player, games_df)
+        X = data['X']
         
-        if len(player_games) == 0:
+        if len(X) == 0:
             print(f"⚠️  No games found for {player}")
             return results
         
-        print(f"Found {len(player_games)} games for {player}")
+        print(f"Found {len(X)} games for {player} ({data['source']})")
         
-        for idx, game in player_games.iterrows():
-            try:
-                # Create game data dict
-                game_data = game.to_dict()
-                
-                # Calculate factor scores
-                factor_scores = self.calculate_factor_scores(player, game_data, weights)
-                
-                # Calculate composite score
-                composite_score = self.calculate_composite_score(factor_scores)
-                
-                # Get actual performance
-                actual_performance = self.get_actual_performance(player, game_data)
-                
-                # Store results
-                results['predictions'].append(composite_score)
-                results['actuals'].append(actual_performance)
-                results['scores'].append(factor_scores)
-                results['games_analyzed'] += 1
-                
-            except Exception as e:
-                print(f"⚠️  Error processing game {idx}: {e}")
-                continue
+        # Composite score per game = weighted sum of its factor scores
+        weighted = X * self.weight_vector(weights)
+        predictions = weighted.sum(axis=1)
+        actuals_normalized = data['actuals_normalized']
         
-        # Calculate metrics
-        if results['games_analyzed'] > 0:
-            predictions = np.array(results['predictions'])
-            actuals = np.array(results['actuals'])
-            
-            # Normalize actual performance to -1 to 1 scale for comparison
-            if actuals.std() > 0:
-                actuals_normalized = (actuals - actuals.mean()) / actuals.std()
-            else:
-                actuals_normalized = actuals
-            
-            # Calculate correlation (accuracy)
-            if len(predictions) > 1:
-                results['accuracy'] = np.corrcoef(predictions, actuals_normalized)[0, 1]
-            
-            # Calculate error metrics
-            results['mae'] = np.mean(np.abs(predictions - actuals_normalized))
-            results['rmse'] = np.sqrt(np.mean((predictions - actuals_normalized) ** 2))
+        results['predictions'] = predictions.tolist()
+        results['actuals'] = data['actuals'].tolist()
+        results['scores'] = [dict(zip(FACTORS, row)) for row in weighted.tolist()]
+        results['games_analyzed'] = len(X)
+        
+        # Calculate correlation (accuracy) and error metrics
+        results['accuracy'] = self.score_correlation(predictions, actuals_normalized)
+        results['mae'] = np.mean(np.abs(predictions - actuals_normalized))
+        results['rmse'] = np.sqrt(np.mean((predictions - actuals_normalized) ** 2))
         
         print(f"\n✓ Analyzed {results['games_analyzed']} games")
         print(f"  Accuracy (correlation): {results['accuracy']:.3f}")
@@ -431,27 +563,53 @@ class WeightTuner:
         
         return results
     
-    def optimize_weights(self, player: str, games_df: pd.DataFrame) -> Dict:
-        """Optimize weights for a specific player using differential evolution"""
+    def optimize_weights(self, player: str, games_df: pd.DataFrame, data: Dict = None,
+                         deadline: float = None) -> Dict:
+        """
+        Optimize weights for a specific player using differential evolution
+        
+        Args:
+            player: Player to tune
+            games_df: Historical games
+            data: Prebuilt build_backtest_data (built here if omitted)
+            deadline: time.time() after which the search stops early
+        """
         
         print(f"\n{'='*60}")
         print(f"Optimizing weights for: {player}")
         print(f"{'='*60}")
         
+        if data is None:
+            data = self.build_backtest_data(player, games_df)
+        X = data['X']
+        print(f"  Scored {len(X)} games x {len(FACTORS)} factors")
+        
+        # Centered actuals are fixed, so each generation is one matrix product
+        a = data['actuals_normalized'] - data['actuals_normalized'].mean() if len(X) else np.zeros(0)
+        a_norm = np.sqrt(a @ a)
+        
         def objective_function(weight_values):
-            """Objective function to minimize (negative correlation)"""
-            weights = dict(zip(self.default_weights.keys(), weight_values))
-            results = self.backtest_player(player, games_df, weights)
+            """Negative correlation per candidate (weight_values: factors x candidates)"""
+            if len(X) < 2 or a_norm == 0:
+                return np.zeros(weight_values.shape[1])
+            P = X @ weight_values
+            P = P - P.mean(axis=0)
+            p_norm = np.sqrt(np.einsum('ij,ij->j', P, P))
+            corr = np.divide(a @ P, p_norm * a_norm, out=np.zeros(P.shape[1]), where=p_norm > 0)
             # Return negative accuracy (we want to maximize correlation)
-            return -results['accuracy']
+            return -corr
+        
+        def out_of_time(xk, convergence=None):
+            """Stop the search at its current best once the deadline passes"""
+            return deadline is not None and time.time() >= deadline
         
         # Define bounds for each weight (0.0 to 0.3)
-        bounds = [(0.0, 0.3) for _ in range(len(self.default_weights))]
+        bounds = [(0.0, 0.3) for _ in range(len(FACTORS))]
         
         # Constraint: weights should sum to approximately 1.0
         # We'll handle this by normalizing after optimization
         
-        print("\n🔧 Running optimization (this may take a few minutes)...")
+        print("\n🔧 Running optimization...")
         
         result = differential_evolution(
             objective_function,
@@ -459,10 +617,13 @@ class WeightTuner:
             maxiter=20,  # Reduced for faster testing
             popsize=10,
             tol=0.01,
-            workers=1,
             updating='deferred',
-            seed=42
+            vectorized=True,
+            callback=out_of_time,
+            seed=DE_SEED
         )
+        if deadline is not None and time.time() >= deadline:
+            print("  ⏱  Time budget reached - using best weights so far")
         
         # Extract and normalize optimized weights
         optimized_values = result.x
@@ -470,16 +631,183 @@ class WeightTuner:
         if weight_sum > 0:
             optimized_values = optimized_values / weight_sum
         
-        optimized_weights = dict(zip(self.default_weights.keys(), optimized_values))
+        optimized_weights = dict(zip(FACTORS, optimized_values.tolist()))
         
         print("\n✓ Optimization complete!")
         print(f"  Best accuracy: {-result.fun:.3f}")
         
         return optimized_weights
     
+    def weights_from_moments(self, moments: Dict) -> Dict:
+        """Cross-validated nnls weights from per-fold moments; global weights if no signal"""
+        started = time.perf_counter()
+        fit = fit_weights(moments, self.weight_vector(self.global_weights))
+        elapsed = (time.perf_counter() - started) * 1000
+        
+        if fit is None:
+            print(f"⚠️  No performance signal in {int(total_moments(moments)['n'])} games - keeping global weights")
+            return {f: float(w) for f, w in zip(FACTORS, self.weight_vector(self.global_weights))}
+        
+        cv = f"CV error {fit['cv_error']:.3f}" if fit['cv_error'] is not None else "too few games for CV"
+        print(f"\n✓ Solved over {fit['games']} games in {elapsed:.1f} ms")
+        print(f"  Shrinkage lambda: {fit['lambda']:.4g} ({cv})")
+        
+        return dict(zip(FACTORS, fit['weights'].tolist()))
+    
+    def solve_weights(self, player: str, games_df: pd.DataFrame, data: Dict = None) -> Dict:
+        """Closed-form weights for a specific player (--solver nnls); global weights if no signal"""
+        
+        print(f"\n{'='*60}")
+        print(f"Solving weights for: {player}")
+        print(f"{'='*60}")
+        
+        if data is None:
+            data = self.build_backtest_data(player, games_df)
+        
+        moments = fold_moments(data['X'], data['actuals'], assign_folds(data['game_keys']))
+        return self.weights_from_moments(moments)
+    
+    def scorer_version(self) -> str:
+        """Hash of the code that scores games (stored statistics are only valid for it)"""
+        return hashlib.sha256(Path(inspect.getfile(type(self))).read_bytes()).hexdigest()[:16]
+    
+    def load_weight_stats(self, half_life: float = None) -> WeightStatsStore:
+        """Per-player tuning statistics built with the current scoring code and settings"""
+        return WeightStatsStore(self.config_dir, {
+            'factors': list(FACTORS),
+            'folds': CV_FOLDS,
+            'half_life_days': half_life,
+            'scorer': self.scorer_version(),
+        })
+    
+    def tune_player_incremental(self, player: str, games_df: pd.DataFrame, stats: WeightStatsStore,
+                                half_life: float = None):
+        """
+        Add a player's games since the last run to their statistics and re-solve
+        
+        Args:
+            player: Player to tune
+            games_df: Historical games (only those after the stored 'through' date are scored)
+            stats: WeightStatsStore (updated in place; caller saves)
+            half_life: Days after which a game counts half (None = no decay)
+        
+        Returns:
+            (weights, results) like tune_player; accuracy is the in-sample
+            correlation over all games in the statistics (MAE/RMSE not tracked)
+        """
+        print(f"\n{'='*60}")
+        print(f"Updating weights for: {player}")
+        print(f"{'='*60}")
+        
+        entry = stats.get(player)
+        if entry is not None and entry['source'] == 'placeholder' and len(self.stored_games(player)):
+            print("  ℹ️  Statistics were built from placeholder scores - rebuilding from the feature store")
+            entry = None
+        moments = entry['moments'] if entry else None
+        through = entry['through'] if entry else None
+        total_games = entry['games'] if entry else 0
+        
+        # Statistics built from stored history only ever take stored games
+        stored_only = entry is not None and entry['source'] == 'feature_store'
+        data = self.build_backtest_data(player, games_df, after=through, fallback=not stored_only)
+        
+        if len(data['X']):
+            dates = pd.to_datetime(pd.Series(data['game_dates'])).dt.normalize()
+            latest = dates.max() if through is None else max(through, dates.max())
+            new = fold_moments(data['X'], data['actuals'], assign_folds(data['game_keys']),
+                               sample_weight=decay_weights((latest - dates).dt.days, half_life))
+            if moments is not None:
+                # Age the stored games to the new latest date before adding
+                moments = add_moments(scale_moments(moments, decay_weights((latest - through).days, half_life)), new)
+            else:
+                moments = new
+            through = latest
+            total_games += len(data['X'])
+            stats.put(player, moments, through, total_games, source=data['source'])
+        
+        results = {
+            'player': player,
+            'games_analyzed': total_games,
+            'predictions': [],
+            'actuals': [],
+            'scores': [],
+            'accuracy': 0.0,
+            'mae': float('nan'),
+            'rmse': float('nan')
+        }
+        
+        if moments is None:
+            print(f"⚠️  No games found for {player}")
+            return dict(self.global_weights), results
+        
+        print(f"  ♻️  {len(data['X'])} new games scored ({total_games} total through {through:%Y-%m-%d})")
+        weights = self.weights_from_moments(moments)
+        results['accuracy'] = moment_correlation(total_moments(moments), self.weight_vector(weights))
+        print(f"  Accuracy (correlation): {results['accuracy']:.3f}")
+        return weights, results
+    
+    def tune_player(self, player: str, games_df: pd.DataFrame, deadline: float = None,
+                    solver: str = 'de'):
+        """Optimize one player's weights and backtest them; returns (weights, results)"""
+        # Score this player's games once for every backtest/evaluation
+        data = self.build_backtest_data(player, games_df)
+        if solver == 'nnls':
+            weights = self.solve_weights(player, games_df, data=data)
+        else:
+            weights = self.optimize_weights(player, games_df, data=data, deadline=deadline)
+        results = self.backtest_player(player, games_df, weights, data=data)
+        return weights, results
+    
+    def tune_players_parallel(self, players: List[str], games_df: pd.DataFrame,
+                              workers: int, deadline: float = None, solver: str = 'de'):
+        """Tune players on a process pool; output is printed per player in roster order"""
+        print(f"\n⚙️  Tuning {len(players)} players on {workers} worker processes")
+        all_results = {}
+        optimized_weights = {}
+        
+        # Spawned, not forked: daily_sitstart tunes on a pipeline thread while other steps run
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker,
+                                 initargs=(self.project_root, games_df, self.feature_history)) as pool:
+            futures = [(player, pool.submit(_tune_task, player, deadline, solver)) for player in players]
+            for player, future in futures:
+                try:
+                    weights, results, output, error = future.result()
+                except Exception as e:  # Worker died
+                    weights, results, output, error = None, None, '', str(e)
+                print(output, end='')
+                if error:
+                    print(f"❌ Error processing {player}: {error}")
+                    continue
+                optimized_weights[player] = weights
+                all_results[player] = results
+        
+        return all_results, optimized_weights
+    
     def run_backtest_suite(self, players: List[str], optimize: bool = False, 
-                          save: bool = False):
-        """Run backtesting for multiple players"""
+                          save: bool = False, workers: int = 1, time_budget: float = None,
+                          solver: str = 'de', incremental: bool = False, half_life: float = None):
+        """
+        Run backtesting for multiple players
+        
+        Args:
+            players: Players to run (default: entire roster)
+            optimize: Tune weights instead of backtesting the saved ones
+            save: Persist tuned weights
+            workers: Processes tuning players in parallel (1 = in-process)
+            time_budget: Seconds after which every search stops at its best
+            solver: 'de' (differential evolution) or 'nnls' (closed form)
+            incremental: Update stored per-player statistics with new games
+                         only and re-solve (nnls; implies optimize)
+            half_life: Incremental mode: days after which a game counts half
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"Unknown solver {solver!r} (choose from {', '.join(SOLVERS)})")
+        deadline = time.time() + time_budget if time_budget else None
+        if incremental:
+            if solver != 'nnls':
+                print("ℹ️  Incremental tuning re-solves from statistics - using the nnls solver")
+            optimize, solver = True, 'nnls'
         
         print("\n" + "="*80)
         print("FANTASY BASEBALL AI - WEIGHT BACKTESTING & TUNING".center(80))
@@ -488,12 +816,6 @@ class WeightTuner:
         # Load data
         print("\n📊 Loading historical data...")
         roster_df = self.load_roster()
-        games_df = self.load_historical_games(start_year=2022)
-        _ = self.load_player_stats()
-        
-        if games_df.empty:
-            print("❌ No historical data available. Run data refresh first.")
-            return
         
         # If no players specified, use entire roster
         if not players:
@@ -504,18 +826,48 @@ class WeightTuner:
                 print("❌ No roster data available. Specify players manually.")
                 return
         
+        # Incremental runs only need the games not yet in the statistics
+        stats = self.load_weight_stats(half_life) if incremental else None
+        start_year = 2022
+        if stats is not None and stats.earliest_through(players) is not None:
+            start_year = max(start_year, stats.earliest_through(players).year)
+        feature_start = f"{start_year}-01-01"
+        if stats is not None and stats.earliest_through(players, source='feature_store') is not None:
+            feature_start = stats.earliest_through(players, source='feature_store') + pd.Timedelta(days=1)
+        
+        self.load_feature_history(players, start_date=feature_start)
+        games_df = self.load_historical_games(start_year=start_year)
+        _ = self.load_player_stats()
+        
+        if games_df.empty and self.feature_history.empty:
+            print("❌ No historical data available. Run data refresh first.")
+            return
+        
         all_results = {}
         optimized_weights = {}
         
+        if incremental:
+            for player in players:
+                try:
+                    player_weights, results = self.tune_player_incremental(player, games_df, stats, half_life)
+                    optimized_weights[player] = player_weights
+                    all_results[player] = results
+                except Exception as e:
+                    print(f"❌ Error processing {player}: {e}")
+            print(f"\n📁 Weight statistics → {stats.save()}")
+            players = []
+        
+        if optimize and workers > 1 and len(players) > 1:
+            all_results, optimized_weights = self.tune_players_parallel(
+                players, games_df, min(workers, len(players)), deadline, solver)
+            players = []
+        
         for player in players:
             try:
                 if optimize:
-                    # Optimize weights for this player
-                    player_weights = self.optimize_weights(player, games_df)
+                    # Optimize weights for this player and backtest them
+                    player_weights, results = self.tune_player(player, games_df, deadline, solver)
                     optimized_weights[player] = player_weights
-                    
-                    # Run backtest with optimized weights
-                    results = self.backtest_player(player, games_df, player_weights)
                 else:
                     # Use existing weights
                     weights = self.player_weights.get(player, self.global_weights)
@@ -552,8 +904,8 @@ class WeightTuner:
                 'Player': player,
                 'Games': result['games_analyzed'],
                 'Accuracy': f"{result['accuracy']:.3f}",
-                'MAE': f"{result['mae']:.3f}",
-                'RMSE': f"{result['rmse']:.3f}"
+                'MAE': f"{result['mae']:.3f}" if not np.isnan(result['mae']) else '-',
+                'RMSE': f"{result['rmse']:.3f}" if not np.isnan(result['rmse']) else '-'
             })
         
         summary_df = pd.DataFrame(summary_data)
@@ -593,6 +945,9 @@ Examples:
   python src/scripts/backtest_weights.py --player "Ohtani"  # Backtest one player
   python src/scripts/backtest_weights.py --optimize         # Optimize weights
   python src/scripts/backtest_weights.py --optimize --save  # Optimize and save
+  python src/scripts/backtest_weights.py --optimize --workers 4 --time-budget 120
+  python src/scripts/backtest_weights.py --optimize --solver nnls --save
+  python src/scripts/backtest_weights.py --incremental --half-life 60 --save
         """
     )
     
@@ -605,7 +960,15 @@ Examples:
     parser.add_argument(
         '--optimize',
         action='store_true',
-        help='Optimize weights using differential evolution'
+        help='Optimize weights (see --solver)'
+    )
+    
+    parser.add_argument(
+        '--solver',
+        choices=SOLVERS,
+        default='de',
+        help='Weight optimizer: de = differential evolution, nnls = closed-form '
+             'constrained least squares with cross-validated shrinkage (default: de)'
     )
     
     parser.add_argument(
@@ -614,6 +977,32 @@ Examples:
         help='Save optimized weights to config file'
     )
     
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Add games since the last run to stored per-player statistics and '
+             're-solve (nnls; implies --optimize)'
+    )
+    
+    parser.add_argument(
+        '--half-life',
+        type=float,
+        help='With --incremental: days after which a game counts half (default: no decay)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Worker processes tuning players in parallel (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--time-budget',
+        type=float,
+        help='Seconds after which weight searches stop at their best so far (default: no limit)'
+    )
+    
     args = parser.parse_args()
     
     # Get project root
@@ -630,12 +1019,17 @@ Examples:
         tuner.run_backtest_suite(
             players=players,
             optimize=args.optimize,
-            save=args.save
+            save=args.save,
+            workers=args.workers,
+            time_budget=args.time_budget,
+            solver=args.solver,
+            incremental=args.incremental,
+            half_life=args.half_life
         )
         
         print("\n✅ Backtesting complete!")
         
-        if not args.save and args.optimize:
+        if not args.save and (args.optimize or args.incremental):
             print("\n💡 Tip: Add --save flag to persist optimized weights")
         
     except KeyboardInterrupt:
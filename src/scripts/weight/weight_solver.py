@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Closed-Form Constrained Weight Solver
+
+Fast alternative to the differential evolution search in backtest_weights.py
+(--solver nnls). Per player it finds non-negative factor weights summing to
+one that best predict actual performance from standardized factor scores,
+shrunk toward the global default weights, in milliseconds and with a single
+reproducible optimum.
+
+Key Concepts:
+- Moments: everything is computed from per-fold sums (n, sum x, sum y,
+  sum xx', sum xy, sum yy) of the (games x factors) score matrix X and the
+  actuals y, so the solver never needs the game rows themselves
+- Standardized problem: with z-scored factors Z and z-scored actuals,
+  minimize (1/n)|y - Zw|^2 + lambda * |w - d|^2 over the simplex
+  (w >= 0, sum w = 1); d is the global defaults in standardized units.
+  Solved by accelerated projected gradient (FISTA), batched over problems
+- Back to raw units: w_raw = w / sd(x), renormalized to sum to one - the
+  same predictions (up to scale/shift) when applied to raw factor scores,
+  which is how the backtester and sit/start combiner use weights
+- lambda: chosen from LAMBDAS by K-fold cross-validation; games are assigned
+  to folds by a keyed hash of the game (stable as history grows), and all
+  folds x lambdas are solved as one batch
+- Moments add: statistics of new games (optionally down-weighted by age,
+  sample_weight) can be added to stored ones (add_moments / scale_moments)
+  and the weights re-solved without the old games - see weight_stats.py
+- No signal (actuals without spread, or no factor varies): no fit, callers
+  keep the global weights
+
+Usage:
+    from scripts.weight.weight_solver import assign_folds, fold_moments, fit_weights
+
+    folds = assign_folds(game_keys)
+    fit = fit_weights(fold_moments(X, y, folds), default_weights)
+    weights = fit['weights'] if fit else default_weights
+"""
+
+import numpy as np
+
+from scripts.fa.keyed_random import keyed_integers
+
+
+CV_FOLDS = 5
+LAMBDAS = np.logspace(-4, 2, 13)
+DEFAULT_LAMBDA = 1.0       # Used when there are too few games to cross-validate
+MAX_ITER = 2000
+TOL = 1e-10
+
+MOMENT_KEYS = ('n', 'sx', 'sy', 'sxx', 'sxy', 'syy')
+
+
+def assign_folds(game_keys, k=CV_FOLDS):
+    """Cross-validation fold per game (keyed by game, independent of row order)"""
+    if len(game_keys) == 0:
+        return np.zeros(0, dtype=np.int64)
+    return np.asarray(keyed_integers(list(game_keys), low=0, high=k, salt='cv_fold'))
+
+
+def fold_moments(X, y, folds, k=CV_FOLDS, sample_weight=None):
+    """
+    Per-fold sufficient statistics of a score matrix and actuals
+
+    Args:
+        X: (games x factors) raw factor scores
+        y: Actual performance per game
+        folds: Fold index per game (assign_folds)
+        k: Number of folds
+        sample_weight: Weight per game (default 1; n is then the weight sum)
+
+    Returns:
+        Dict of arrays with a leading fold axis: n (k,), sx (k, p), sy (k,),
+        sxx (k, p, p), sxy (k, p), syy (k,)
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+    onehot = (np.asarray(folds)[:, None] == np.arange(k)).astype(float)
+    if sample_weight is not None:
+        onehot *= np.asarray(sample_weight, dtype=float)[:, None]
+    return {
+        'n': onehot.sum(axis=0),
+        'sx': onehot.T @ X,
+        'sy': onehot.T @ y,
+        'sxx': np.einsum('ik,ip,iq->kpq', onehot, X, X),
+        'sxy': np.einsum('ik,ip,i->kp', onehot, X, y),
+        'syy': onehot.T @ (y * y),
+    }
+
+
+def total_moments(moments):
+    """Sum per-fold moments over the fold axis"""
+    return {key: moments[key].sum(axis=0) for key in MOMENT_KEYS}
+
+
+def add_moments(a, b):
+    """Moments of the union of two sets of games"""
+    return {key: np.asarray(a[key]) + np.asarray(b[key]) for key in MOMENT_KEYS}
+
+
+def scale_moments(moments, factor):
+    """Moments with every game's weight multiplied by factor (e.g. decay)"""
+    return {key: np.asarray(moments[key]) * factor for key in MOMENT_KEYS}
+
+
+def moment_correlation(moments, weights):
+    """Correlation of X @ weights with the actuals, from (total) moments"""
+    n = max(float(moments['n']), 1.0)
+    cxx, cxy, cyy = _centered(moments, moments['sx'] / n, moments['sy'] / n)
+    weights = np.asarray(weights, dtype=float)
+    denom = np.sqrt(max(weights @ cxx @ weights, 0.0) * max(float(cyy), 0.0))
+    return float(weights @ cxy / denom) if denom > 1e-12 else 0.0
+
+
+def _centered(moments, mx, my):
+    """Sums of squares/products about (mx, my); batched over leading axes"""
+    n = moments['n'][..., None]
+    sx, sy = moments['sx'], moments['sy'][..., None]
+    cxx = (moments['sxx'] - mx[..., :, None] * sx[..., None, :] - sx[..., :, None] * mx[..., None, :]
+           + n[..., None] * mx[..., :, None] * mx[..., None, :])
+    cxy = moments['sxy'] - mx * sy - my[..., None] * sx + n * mx * my[..., None]
+    cyy = moments['syy'] - 2 * my * moments['sy'] + moments['n'] * my * my
+    return cxx, cxy, cyy
+
+
+def standardize(moments):
+    """
+    Means, standard deviations and correlation moments of the standardized problem
+
+    Returns:
+        Dict with mx, sdx, my, sdy, R (factor correlations; 0 for constant
+        factors) and r (factor/actual correlations)
+    """
+    n = np.maximum(moments['n'], 1)
+    mx = moments['sx'] / n[..., None]
+    my = moments['sy'] / n
+    cxx, cxy, cyy = _centered(moments, mx, my)
+    sdx = np.sqrt(np.maximum(np.diagonal(cxx, axis1=-2, axis2=-1), 0) / n[..., None])
+    sdy = np.sqrt(np.maximum(cyy, 0) / n)
+
+    inv_x = np.divide(1.0, sdx, out=np.zeros_like(sdx), where=sdx > 1e-12)
+    inv_y = np.divide(1.0, sdy, out=np.zeros_like(sdy), where=sdy > 1e-12)
+    R = cxx * inv_x[..., :, None] * inv_x[..., None, :] / n[..., None, None]
+    r = cxy * inv_x * (inv_y / n)[..., None]
+    return {'mx': mx, 'sdx': sdx, 'my': my, 'sdy': sdy, 'inv_x': inv_x, 'R': R, 'r': r}
+
+
+def project_simplex(V):
+    """Euclidean projection of each row of V onto {w >= 0, sum w = 1}"""
+    p = V.shape[-1]
+    U = -np.sort(-V, axis=-1)
+    css = np.cumsum(U, axis=-1) - 1.0
+    ind = np.arange(1, p + 1)
+    rho = np.count_nonzero(U - css / ind > 0, axis=-1)
+    theta = np.take_along_axis(css, (rho - 1)[..., None], axis=-1) / rho[..., None]
+    return np.maximum(V - theta, 0.0)
+
+
+def solve_simplex(R, r, d, lam, max_iter=MAX_ITER, tol=TOL):
+    """
+    Batched minimize w'Rw - 2w'r + lam|w - d|^2 over the simplex (FISTA)
+
+    Args:
+        R: (B, p, p) factor correlation matrices
+        r: (B, p) factor/actual correlations
+        d: (B, p) shrinkage targets (on the simplex)
+        lam: (B,) ridge strengths
+
+    Returns:
+        (B, p) weights
+    """
+    lam = np.asarray(lam, dtype=float)
+    step = 1.0 / (2.0 * (np.linalg.eigvalsh(R)[..., -1] + lam) + 1e-12)
+    w = project_simplex(d)
+    z, t = w.copy(), 1.0
+    for _ in range(max_iter):
+        grad = 2.0 * (np.einsum('bpq,bq->bp', R, z) - r) + 2.0 * lam[:, None] * (z - d)
+        w_next = project_simplex(z - step[:, None] * grad)
+        t_next = (1.0 + np.sqrt(1.0 + 4.0 * t * t)) / 2.0
+        z = w_next + ((t - 1.0) / t_next) * (w_next - w)
+        done = np.max(np.abs(w_next - w)) < tol
+        w, t = w_next, t_next
+        if done:
+            break
+    return w
+
+
+def _standardized_defaults(defaults, sdx):
+    """Default raw weights expressed as standardized weights (on the simplex)"""
+    d = np.asarray(defaults, dtype=float) * sdx
+    total = d.sum(axis=-1, keepdims=True)
+    uniform = np.full_like(d, 1.0 / d.shape[-1])
+    return np.divide(d, total, out=uniform, where=total > 0)
+
+
+def _validation_error(train, val, W):
+    """Sum of squared errors on validation folds in each train fold's standardized units"""
+    cxx, cxy, cyy = _centered(val, train['mx'], train['my'])
+    U = W * train['inv_x'][:, None, :]  # (k, L, p): raw-unit coefficients
+    inv_y = np.divide(1.0, train['sdy'], out=np.zeros_like(train['sdy']), where=train['sdy'] > 1e-12)
+    return (cyy[:, None] * inv_y[:, None] ** 2
+            - 2.0 * inv_y[:, None] * np.einsum('klp,kp->kl', U, cxy)
+            + np.einsum('klp,kpq,klq->kl', U, cxx, U))
+
+
+def cross_validate(moments, defaults, lambdas=LAMBDAS):
+    """
+    K-fold CV error per lambda (all folds x lambdas solved as one batch)
+
+    Returns:
+        (lambdas, mean squared validation error per lambda), or None when
+        fewer than two folds can be used
+    """
+    k = len(moments['n'])
+    total = total_moments(moments)
+    train_m = {key: total[key][None] - moments[key] for key in MOMENT_KEYS}
+    train = standardize(train_m)
+    usable = (moments['n'] > 0) & (train_m['n'] > 1) & (train['sdy'] > 1e-12)
+    if usable.sum() < 2:
+        return None
+
+    lambdas = np.asarray(lambdas, dtype=float)
+    L, p = len(lambdas), train['R'].shape[-1]
+    d = _standardized_defaults(defaults, train['sdx'])
+    W = solve_simplex(
+        np.repeat(train['R'], L, axis=0),
+        np.repeat(train['r'], L, axis=0),
+        np.repeat(d, L, axis=0),
+        np.tile(lambdas, k),
+    ).reshape(k, L, p)
+
+    errors = _validation_error(train, moments, W)
+    return lambdas, errors[usable].sum(axis=0) / moments['n'][usable].sum()
+
+
+def fit_weights(moments, defaults, lambdas=LAMBDAS):
+    """
+    Cross-validated simplex weights in raw factor units
+
+    Args:
+        moments: Per-fold moments (fold_moments)
+        defaults: Global default weight vector (shrinkage target)
+        lambdas: Candidate ridge strengths
+
+    Returns:
+        Dict with weights (sum to one), lambda, cv_error (None without CV) and
+        games; None when the data carries no signal to fit
+    """
+    total = total_moments(moments)
+    stats = standardize(total)
+    if total['n'] < 2 or stats['sdy'] <= 1e-12 or not np.any(stats['sdx'] > 1e-12):
+        return None
+
+    cv = cross_validate(moments, defaults, lambdas)
+    if cv is None:
+        lam, cv_error = DEFAULT_LAMBDA, None
+    else:
+        best = int(np.argmin(cv[1]))
+        lam, cv_error = float(cv[0][best]), float(cv[1][best])
+
+    d = _standardized_defaults(defaults, stats['sdx'])
+    w = solve_simplex(stats['R'][None], stats['r'][None], d[None], np.array([lam]))[0]
+
+    raw = w * stats['inv_x']
+    if raw.sum() <= 0:
+        return None
+    return {'weights': raw / raw.sum(), 'lambda': lam, 'cv_error': cv_error, 'games': int(total['n'])}
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Per-Player Weight Tuning Statistics
+
+Daily re-tuning used to re-score every game since 2022 although only the
+previous day's games are new. The nnls solver (weight_solver.py) only needs
+sums over games, so those sums are kept per player and each run adds the
+games played since the last one and re-solves.
+
+Key Concepts:
+- Entry per player: per-fold moments (n, sum x, sum y, sum xx', sum xy,
+  sum yy of the score matrix and actuals), the date of the last game
+  included ('through'), the number of games and where the scores came from
+  ('feature_store' or 'placeholder'); stored in
+  config/player_weight_stats.json next to player_weights.json
+- Update: score only games after 'through', add their moments, re-solve -
+  cost proportional to the new games, not the history
+- Decay (optional half-life in days): a game's weight is
+  0.5 ** (age / half_life) with age counted from the player's latest game;
+  moving 'through' forward scales the stored moments by the same factor,
+  so recent games dominate without keeping any game rows
+- Signature: stats version, factor order, CV folds, half-life and a hash of
+  the scoring code; when it differs from the stored one every entry is
+  dropped and rebuilt from the full history
+
+Usage:
+    from scripts.weight.weight_stats import WeightStatsStore
+
+    store = WeightStatsStore(config_dir, signature)
+    entry = store.get("Yankees")      # None -> score the full history
+    store.put("Yankees", moments, through, games)
+    store.save()
+"""
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from scripts.weight.weight_solver import MOMENT_KEYS
+
+
+STATS_FILE = "player_weight_stats.json"
+STATS_VERSION = 1
+
+
+def decay_weights(age_days, half_life_days=None):
+    """Weight per game age (1.0 everywhere without a half-life)"""
+    age_days = np.asarray(age_days, dtype=float)
+    if not half_life_days:
+        return np.ones_like(age_days)
+    return 0.5 ** (age_days / half_life_days)
+
+
+class WeightStatsStore:
+    """Per-player moments for incremental weight solving"""
+
+    def __init__(self, config_dir, signature):
+        """
+        Args:
+            config_dir: Directory holding player_weights.json
+            signature: JSON-able description of how the moments were built
+        """
+        self.path = Path(config_dir) / STATS_FILE
+        self.signature = {'version': STATS_VERSION, **signature}
+        self.players = self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Error loading weight statistics: {e}")
+            return {}
+        if stored.get('signature') != self.signature:
+            print("  ℹ️  Weight statistics were built with other scoring code/settings - rebuilding")
+            return {}
+        return stored.get('players', {})
+
+    def get(self, player):
+        """{'moments', 'through' (Timestamp), 'games', 'source'} for a player, or None"""
+        entry = self.players.get(player)
+        if entry is None:
+            return None
+        return {
+            'moments': {key: np.asarray(entry['moments'][key], dtype=float) for key in MOMENT_KEYS},
+            'through': pd.Timestamp(entry['through']),
+            'games': entry['games'],
+            'source': entry.get('source', 'placeholder'),
+        }
+
+    def put(self, player, moments, through, games, source='placeholder'):
+        """Replace a player's entry (through: date of the last included game)"""
+        self.players[player] = {
+            'through': pd.Timestamp(through).strftime('%Y-%m-%d'),
+            'games': int(games),
+            'source': source,
+            'moments': {key: np.asarray(moments[key]).tolist() for key in MOMENT_KEYS},
+        }
+
+    def earliest_through(self, players, source=None):
+        """Oldest 'through' date over players (None if any player lacks an entry from source)"""
+        dates = [self.players[p]['through'] for p in players if p in self.players
+                 and source in (None, self.players[p].get('source', 'placeholder'))]
+        if len(dates) < len(players) or not dates:
+            return None
+        return pd.Timestamp(min(dates))
+
+    def save(self):
+        """Write every entry atomically"""
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, 'w') as f:
+            json.dump({'signature': self.signature, 'players': self.players}, f)
+        tmp.replace(self.path)
+        return self.path